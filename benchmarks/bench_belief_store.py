@@ -0,0 +1,82 @@
+"""Microbenchmark: dict-of-dicts beliefs vs the array-backed BeliefStore.
+
+Times one selection turn (bounds refresh + UCB pick) at 10/100/1000 skills:
+
+- ``dict loop``: ``compute_uncertainty`` per skill, then the scalar UCB loop
+  (``select_skill_ucb_with_log`` forced below the vectorisation threshold).
+- ``store``: ``BeliefStore.refresh`` + ``BeliefStore.select`` on a resident store.
+- ``store+convert``: ``from_dict`` + ``select``, i.e. what
+  ``select_skill_ucb_with_log`` pays per call on large pools.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_belief_store.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Dict
+
+from app.agents.interviewer.utils import stats
+from app.agents.interviewer.utils.belief_store import BeliefStore
+
+SIZES = (10, 100, 1000)
+Z = 1.96
+C = 1.0
+
+
+def make_beliefs(count: int, seed: int = 0) -> Dict[str, Dict]:
+    rng = random.Random(seed)
+    beliefs: Dict[str, Dict] = {}
+    for idx in range(count):
+        belief: Dict = {}
+        stats.ensure_prior(belief)
+        for _ in range(rng.randint(0, 3)):
+            stats.welford_update(belief, float(rng.randint(1, 5)))
+        stats.compute_uncertainty(belief, Z)
+        beliefs[f"skill-{idx}"] = belief
+    return beliefs
+
+
+def dict_turn(beliefs: Dict[str, Dict]) -> str:
+    for belief in beliefs.values():
+        stats.compute_uncertainty(belief, Z)
+    skill, _ = stats.select_skill_ucb_with_log(beliefs, C)
+    return skill
+
+
+def store_turn(store: BeliefStore) -> str:
+    store.refresh(Z)
+    return store.select(C)[0]
+
+
+def convert_turn(beliefs: Dict[str, Dict]) -> str:
+    return BeliefStore.from_dict(beliefs).select(C)[0]
+
+
+def _per_call_us(fn, repeat: int = 5) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main() -> None:
+    threshold = stats.VECTORIZE_MIN_SKILLS
+    print(f"{'skills':>7} {'dict loop':>12} {'store':>12} {'store+convert':>14}")
+    for size in SIZES:
+        beliefs = make_beliefs(size)
+        store = BeliefStore.from_dict(beliefs)
+        stats.VECTORIZE_MIN_SKILLS = size + 1  # force the scalar path
+        try:
+            dict_us = _per_call_us(lambda: dict_turn(beliefs))
+        finally:
+            stats.VECTORIZE_MIN_SKILLS = threshold
+        store_us = _per_call_us(lambda: store_turn(store))
+        convert_us = _per_call_us(lambda: convert_turn(beliefs))
+        print(f"{size:>7} {dict_us:>10.1f}us {store_us:>10.1f}us {convert_us:>12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Microbenchmark: per-skill history index and incremental skill summaries.
+
+Builds a session at 10/100/1000 skills with every skill answered twice, then
+times what one turn pays for bookkeeping:
+
+- ``scan``: the previous ``history_snippet`` — a reverse scan of the shared
+  ``question_history`` window — for every skill, as ``generate_questions_node``
+  does. ``hit`` is the share of answered skills the window still has context for.
+- ``scan all``: the same scan over an uncapped history, i.e. what keeping
+  context for every skill would cost without an index.
+- ``index``: ``history_snippet`` through the per-skill ``skill_history`` buffers.
+- ``full``: ``summarise_skills`` over every skill, as ``update_node`` used to.
+- ``refresh``: ``refresh_skill_summaries`` for the one skill a turn scores.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_history.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Dict, List, Tuple
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.utils import stats
+from app.agents.interviewer.utils.state import (
+    history_snippet,
+    record_question,
+    refresh_skill_summaries,
+    summarise_skills,
+    update_latest_history_entry,
+)
+from app.schema.models import Grade, InterviewState, Question
+
+SIZES = (10, 100, 1000)
+ANSWERS_PER_SKILL = 2
+
+
+def make_session(count: int, seed: int = 0) -> Tuple[InterviewState, List[Dict]]:
+    rng = random.Random(seed)
+    skills = [f"skill-{idx}" for idx in range(count)]
+    state = build_state(skills, 10_000, 2, 3.75, 1.96, 1.0, {}, priors={})
+    order = skills * ANSWERS_PER_SKILL
+    rng.shuffle(order)
+    full_history: List[Dict] = []
+    for turn, skill in enumerate(order):
+        state["turn"] = turn
+        score = rng.randint(1, 5)
+        record_question(state, Question(skill=skill, text=f"Explain {skill}.", difficulty=3), "bench")
+        update_latest_history_entry(state, f"An answer about {skill}.", Grade(score=score))
+        stats.welford_update(state["belief_state"][skill], float(score))
+        stats.compute_uncertainty(state["belief_state"][skill], 1.96)
+        full_history.append(state["question_history"][-1])
+    state["skill_summaries"] = summarise_skills(state)
+    return state, full_history
+
+
+def scan_snippet(history: List[Dict], skill: str, limit: int = 3) -> str:
+    entries = []
+    for record in reversed(history):
+        if record.get("skill") != skill or not record.get("answer"):
+            continue
+        entries.append(f"Q: {record.get('question')} | A: {record.get('answer')}")
+        if len(entries) >= limit:
+            break
+    return "\n".join(reversed(entries))
+
+
+def _per_call_us(fn, repeat: int = 5) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main() -> None:
+    print(
+        f"{'skills':>7} {'scan':>11} {'hit':>5} {'scan all':>11} {'index':>11} "
+        f"{'full':>11} {'refresh':>10}"
+    )
+    for size in SIZES:
+        state, full_history = make_session(size)
+        skills = state["skills"]
+        window = state["question_history"]
+        scan_us = _per_call_us(lambda: [scan_snippet(window, skill) for skill in skills])
+        scan_hit = sum(bool(scan_snippet(window, skill)) for skill in skills) / size
+        scan_all_us = _per_call_us(
+            lambda: [scan_snippet(full_history, skill) for skill in skills], repeat=3
+        )
+        index_us = _per_call_us(lambda: [history_snippet(state, skill) for skill in skills])
+        full_us = _per_call_us(lambda: summarise_skills(state))
+        refresh_us = _per_call_us(lambda: refresh_skill_summaries(state, [skills[-1]]))
+        print(
+            f"{size:>7} {scan_us:>9.1f}us {scan_hit:>5.0%} {scan_all_us:>9.1f}us "
+            f"{index_us:>9.1f}us {full_us:>9.1f}us {refresh_us:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
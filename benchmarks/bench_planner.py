@@ -0,0 +1,82 @@
+"""Turns saved by the lookahead planner, and the cost of one plan.
+
+Runs the policy simulator (``app.simulation``) with and without
+``planner=True`` at each ``--max-turns`` and times ``rollout_plan`` on pools
+of different sizes (all skills × rollouts advance as one array per step).
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_planner.py --candidates 1000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from app.agents.interviewer.utils.planner import rollout_plan
+from app.agents.interviewer.utils.stats import ensure_prior, welford_update
+from app.simulation.simulator import PolicyConfig, Population, simulate
+
+
+def time_plan(skills: int, remaining: int, rollouts: int, repeats: int = 20) -> float:
+    """Milliseconds per ``rollout_plan`` call over ``skills`` two-answer beliefs."""
+    beliefs = {}
+    for idx in range(skills):
+        belief: dict = {}
+        ensure_prior(belief)
+        welford_update(belief, 3.0 + idx % 3)
+        welford_update(belief, 4.0)
+        beliefs[f"skill-{idx}"] = belief
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        rollout_plan(
+            beliefs,
+            remaining=remaining,
+            threshold=3.75,
+            z=1.96,
+            min_q=2,
+            rng=rng,
+            rollouts=rollouts,
+        )
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max-turns", type=int, action="append", default=None)
+    parser.add_argument("--rollouts", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'policy':>38} {'turns':>7} {'false_verify':>13} {'miss':>7}")
+    for max_turns in args.max_turns or [12, 20]:
+        rows = simulate(
+            [PolicyConfig(max_turns=max_turns), PolicyConfig(max_turns=max_turns, planner=True)],
+            Population(),
+            candidates=args.candidates,
+            seed=args.seed,
+            workers=args.workers,
+        )
+        for row in rows:
+            print(
+                f"{row['policy']:>38} {row['avg_turns']:>7.2f} "
+                f"{row['false_verify_rate']:>13.1%} {row['miss_rate']:>7.1%}"
+            )
+        greedy, planned = rows
+        print(f"{'':>38} planner saves {greedy['avg_turns'] - planned['avg_turns']:+.2f} turns")
+
+    print(f"\n{'skills':>7} {'remaining':>10} {'ms/plan':>9}")
+    for skills in (5, 20, 64):
+        for remaining in (5, 20):
+            print(f"{skills:>7} {remaining:>10} {time_plan(skills, remaining, args.rollouts):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
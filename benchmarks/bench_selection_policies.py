@@ -0,0 +1,144 @@
+"""Simulated turns-to-decision: UCB1 vs SE-UCB vs Thompson sampling (NIG).
+
+Each simulated candidate has a few skills with a hidden true level; every
+answer is graded as ``round(true + noise)`` clipped to 1..5. Interviews run
+through the real ``update_node``/``decide_node`` with the given selection
+policy (no LLM involved) and stop when ``decide_node`` ends them.
+
+Reported per policy:
+
+- ``turns``: mean turns until ``decide_node`` ends the interview.
+- ``decided``: share of interviews that ended before ``max_turns``.
+- ``to_verify``: mean turn at which a truly strong skill was first verified
+  (``max_turns`` when it never was) — the turns-to-decision that matters when
+  middling skills keep the interview running to the turn limit.
+- ``precision``/``recall``: verified skills vs skills whose true level clears
+  the verification threshold.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_selection_policies.py --candidates 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Dict, List
+
+import numpy as np
+from langgraph.graph import END
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.decide import decide_node
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.stats import (
+    select_skill_thompson_with_log,
+    select_skill_ucb_with_log,
+)
+from app.schema.models import Grade, Question
+
+POLICIES = ("ucb1", "se", "thompson")
+
+
+def run_interview(
+    policy: str,
+    true_levels: Dict[str, float],
+    rng: np.random.Generator,
+    *,
+    max_turns: int,
+    min_q: int,
+    threshold: float,
+    noise: float,
+) -> Dict[str, object]:
+    state = build_state(
+        list(true_levels),
+        max_turns,
+        min_q,
+        threshold,
+        1.96,
+        1.0,
+        {},
+        thread_id="bench",
+        selection_policy=policy,
+    )
+    first_verified: Dict[str, int] = {}
+    while decide_node(state).goto != END:
+        decided = set(state["inactive_skills"]) | set(state["verified_skills"])
+        pool = {
+            skill: belief
+            for skill, belief in state["belief_state"].items()
+            if skill not in decided
+        } or state["belief_state"]
+        if policy == "thompson":
+            skill, _ = select_skill_thompson_with_log(pool, rng)
+        else:
+            skill, _ = select_skill_ucb_with_log(pool, state["ucb_C"], mode=policy)  # type: ignore[arg-type]
+        score = int(np.clip(np.rint(rng.normal(true_levels[skill], noise)), 1, 5))
+        state["current_question"] = Question(skill=skill, text="(simulated turn)", difficulty=3)
+        state["last_grade"] = Grade(score=score, reasoning="simulated")
+        update_node(state)
+        for verified in state["verified_skills"]:
+            first_verified.setdefault(verified, state["turn"])
+    return {
+        "turns": state["turn"],
+        "verified": set(state["verified_skills"]),
+        "first_verified": first_verified,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=300)
+    parser.add_argument("--skills", type=int, default=5)
+    parser.add_argument("--max-turns", type=int, default=30)
+    parser.add_argument("--min-q", type=int, default=2)
+    parser.add_argument("--threshold", type=float, default=3.75)
+    parser.add_argument("--noise", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    population = np.random.default_rng(args.seed)
+    candidates = [
+        {f"skill-{idx}": float(level) for idx, level in enumerate(population.uniform(2.0, 5.0, args.skills))}
+        for _ in range(args.candidates)
+    ]
+
+    print(
+        f"{'policy':>9} {'turns':>7} {'decided':>8} {'to_verify':>10} "
+        f"{'precision':>10} {'recall':>7}"
+    )
+    for policy in POLICIES:
+        rng = np.random.default_rng(args.seed + 1)
+        turns: List[int] = []
+        verify_turns: List[int] = []
+        true_pos = false_pos = positives = 0
+        for true_levels in candidates:
+            result = run_interview(
+                policy,
+                true_levels,
+                rng,
+                max_turns=args.max_turns,
+                min_q=args.min_q,
+                threshold=args.threshold,
+                noise=args.noise,
+            )
+            turns.append(int(result["turns"]))  # type: ignore[arg-type]
+            strong = {skill for skill, level in true_levels.items() if level >= args.threshold}
+            verified = result["verified"]
+            true_pos += len(verified & strong)  # type: ignore[operator]
+            false_pos += len(verified - strong)  # type: ignore[operator]
+            positives += len(strong)
+            first = result["first_verified"]
+            verify_turns.extend(first.get(skill, args.max_turns) for skill in strong)  # type: ignore[attr-defined]
+        decided = sum(1 for count in turns if count < args.max_turns) / len(turns)
+        precision = true_pos / max(true_pos + false_pos, 1)
+        recall = true_pos / max(positives, 1)
+        print(
+            f"{policy:>9} {np.mean(turns):>7.2f} {decided:>8.1%} "
+            f"{np.mean(verify_turns) if verify_turns else 0.0:>10.2f} "
+            f"{precision:>10.1%} {recall:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Microbenchmark: session state codec and per-turn service overhead.
+
+Plays a session of ``TURNS`` graded turns over 10/50/200 skills, stores it,
+and then measures what the service pays per turn outside the nodes:
+
+- ``load``: decoding the stored row into a live state.
+- ``save``: encoding the state for the ``sessions`` row and the memory store.
+- ``respond``: building the ``/interviewer/invoke`` body.
+- ``payload``: the SSE ``state`` payload (``_state_payload``).
+- ``state``: bytes held by the decoded state (``tracemalloc``).
+- ``stored``: bytes a session keeps in ``_memory_store`` between turns.
+
+``before`` replays the previous code paths (kept below): ``json.loads`` plus a
+Python walk rebuilding questions and grades, ``json.dumps`` of a re-walked
+copy that the memory store also kept as a dict tree, ``model_dump`` plus
+``json.dumps`` for the response, and an eagerly evaluated
+``summarise_skills`` default. ``after`` is the pydantic-core codec in
+``app.storage.store`` (the memory store keeps the encoded text) and the
+current service helpers.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_state.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.agent_log import log_lines
+from app.agents.interviewer.utils.state import record_question, summarise_skills
+from app.schema.models import AspectBreakdown, Grade, InvokeResponse, Question
+from app.service.service import _state_payload
+from app.storage.store import _deserialize_state, _encode_state
+
+SIZES = (10, 50, 200)
+TURNS = 20
+
+
+def make_stored(count: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    skills = [f"skill-{idx}" for idx in range(count)]
+    state = build_state(skills, 100, 2, 3.75, 1.96, 1.0, {}, priors={})
+    state["question_pool"] = [
+        Question(skill=skill, text=f"Describe a project that used {skill}.", difficulty=3)
+        for skill in skills
+    ]
+    for _ in range(TURNS):
+        skill = rng.choice(skills)
+        question = Question(skill=skill, text=f"How would you debug {skill}?", difficulty=3)
+        record_question(state, question, "select_question")
+        score = rng.randint(2, 5)
+        state["last_answer"] = "A detailed answer. " * 8
+        state["last_grade"] = Grade(
+            score=score,
+            reasoning="Covers the main points with one concrete example.",
+            aspects={
+                name: AspectBreakdown(score=score, notes="Reasonable.")
+                for name in ("coverage", "technical_depth", "evidence", "communication")
+            },
+        )
+        update_node(state)
+    return _encode_state(state)
+
+
+def legacy_serialize(state: Dict[str, Any]) -> Dict[str, Any]:
+    s = dict(state)
+    if s.get("current_question") is not None and isinstance(s["current_question"], Question):
+        s["current_question"] = s["current_question"].model_dump()
+    if isinstance(s.get("question_pool"), list):
+        s["question_pool"] = [
+            q.model_dump() if isinstance(q, Question) else q for q in s["question_pool"]
+        ]
+    if s.get("last_grade") is not None and isinstance(s["last_grade"], Grade):
+        s["last_grade"] = s["last_grade"].model_dump()
+    return s
+
+
+def legacy_deserialize(state: Dict[str, Any]) -> Dict[str, Any]:
+    def to_question(obj: Any) -> Any:
+        if isinstance(obj, dict) and {"skill", "text", "difficulty"}.issubset(obj.keys()):
+            try:
+                return Question(**obj)
+            except Exception:
+                return obj
+        return obj
+
+    s = dict(state)
+    if s.get("current_question") is not None:
+        s["current_question"] = to_question(s["current_question"])
+    if isinstance(s.get("question_pool"), list):
+        s["question_pool"] = [to_question(q) for q in s["question_pool"]]
+    if s.get("last_grade") is not None:
+        try:
+            s["last_grade"] = Grade(**s["last_grade"])
+        except Exception:
+            pass
+    return s
+
+
+def legacy_save(state: Dict[str, Any]) -> Dict[str, Any]:
+    payload_obj = legacy_serialize(state)
+    json.dumps(payload_obj)
+    return payload_obj
+
+
+def legacy_payload(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "belief_state": state.get("belief_state", {}),
+        "skill_summaries": state.get("skill_summaries", summarise_skills(state)),
+        "logs": log_lines(state.get("logs", []), last=50),
+        "thread_id": state.get("thread_id"),
+    }
+
+
+CODECS: Dict[str, Dict[str, Callable]] = {
+    "before": {
+        "load": lambda text: legacy_deserialize(json.loads(text)),
+        "save": legacy_save,
+        "respond": lambda state: json.dumps(InvokeResponse(state=state).model_dump()),
+        "payload": legacy_payload,
+    },
+    "after": {
+        "load": _deserialize_state,
+        "save": _encode_state,
+        "respond": lambda state: InvokeResponse(state=state).model_dump_json(),
+        "payload": _state_payload,
+    },
+}
+
+
+def _per_call_us(fn, repeat: int = 5) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def _held_bytes(codec: Dict[str, Callable], text: str) -> Tuple[int, int]:
+    tracemalloc.start()
+    state = codec["load"](text)
+    state_size, _ = tracemalloc.get_traced_memory()
+    stored = codec["save"](state)
+    del state
+    stored_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stored
+    return state_size, stored_size
+
+
+def main() -> None:
+    print(
+        f"{'skills':>7} {'code':>6} {'load':>9} {'save':>9} {'respond':>9} "
+        f"{'payload':>9} {'turn total':>11} {'state':>7} {'stored':>7}"
+    )
+    for size in SIZES:
+        text = make_stored(size)
+        for name, codec in CODECS.items():
+            state = codec["load"](text)
+            load_us = _per_call_us(lambda: codec["load"](text))
+            save_us = _per_call_us(lambda: codec["save"](state))
+            respond_us = _per_call_us(lambda: codec["respond"](state))
+            payload_us = _per_call_us(lambda: codec["payload"](state))
+            state_size, stored_size = _held_bytes(codec, text)
+            total = load_us + save_us + respond_us + payload_us
+            print(
+                f"{size:>7} {name:>6} {load_us:>7.0f}us {save_us:>7.0f}us "
+                f"{respond_us:>7.0f}us {payload_us:>7.0f}us {total:>9.0f}us "
+                f"{state_size / 1024:>5.0f}KB {stored_size / 1024:>5.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
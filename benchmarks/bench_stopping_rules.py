@@ -0,0 +1,62 @@
+"""Turns saved by the SPRT stopping rule at an equal false-verify rate.
+
+Runs the policy simulator (``app.simulation``) with ``stopping_rule="sprt"``
+and with the LCB rule over a sweep of ``z_value``. The LCB rule's turns and
+miss rate are interpolated at the SPRT run's false-verify rate, so both rules
+are compared at the same error rate.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_stopping_rules.py --candidates 1000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import List
+
+import numpy as np
+
+from app.simulation.simulator import PolicyConfig, Population, simulate
+
+Z_SWEEP = (0.3, 0.5, 0.8, 1.1, 1.5, 1.96)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max-turns", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    configs = [PolicyConfig(stopping_rule="sprt", max_turns=args.max_turns)] + [
+        PolicyConfig(max_turns=args.max_turns, z_value=z) for z in Z_SWEEP
+    ]
+    rows = simulate(
+        configs, Population(), candidates=args.candidates, seed=args.seed, workers=args.workers
+    )
+    print(f"{'rule':>38} {'turns':>7} {'false_verify':>13} {'miss':>7}")
+    for row in rows:
+        print(
+            f"{row['policy']:>38} {row['avg_turns']:>7.2f} "
+            f"{row['false_verify_rate']:>13.1%} {row['miss_rate']:>7.1%}"
+        )
+
+    sprt, lcb = rows[0], sorted(rows[1:], key=lambda row: row["false_verify_rate"])
+    rates = [row["false_verify_rate"] for row in lcb]
+    target = sprt["false_verify_rate"]
+    if not rates[0] <= target <= rates[-1]:
+        print(f"SPRT false-verify rate {target:.1%} is outside the LCB sweep; widen Z_SWEEP.")
+        return
+    turns = float(np.interp(target, rates, [row["avg_turns"] for row in lcb]))
+    miss = float(np.interp(target, rates, [row["miss_rate"] for row in lcb]))
+    print(
+        f"at false-verify {target:.1%}: LCB {turns:.2f} turns / {miss:.1%} miss, "
+        f"SPRT {sprt['avg_turns']:.2f} turns / {sprt['miss_rate']:.1%} miss "
+        f"({turns - sprt['avg_turns']:+.2f} turns saved)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Per-turn latency over SSE (stream/resume per turn) and one WebSocket.
+
+Serves the app with uvicorn on a local port, with the simulator's stub LLM
+(``app.simulation``, no model latency), memory checkpoints and a SQLite store,
+and plays the same interviews through ``AgentClient``:
+
+- ``sse``: ``/interviewer/stream`` once, then ``/interviewer/resume`` per
+  answer, each a new HTTP connection whose request reloads the session from
+  the checkpointer.
+- ``ws``: one ``/interviewer/ws`` connection per interview, with the session
+  held in memory and checkpointed every ``WS_FLUSH_TURNS`` answers.
+
+A turn is timed from sending the answer to its ``done`` event. What remains
+is the transport and the service, since the LLM answers instantly;
+``--llm-ms`` adds a fixed delay per LLM call to compare against.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_transport.py --interviews 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+import numpy as np
+import uvicorn
+
+import app.simulation.simulator as simulator
+from app.client.client import AgentClient
+from app.core.config import get_settings
+from app.simulation.simulator import Population, SimulatedLLM
+
+SKILLS = ("PyTorch", "Pandas", "SQL", "Docker", "Kubernetes")
+
+
+def _payload(max_turns: int) -> Dict[str, Any]:
+    return {
+        "profile": {
+            "ID": "bench",
+            "NAME": "Candidate",
+            "SKILLS": [
+                {
+                    "taxonomy_id": f"ML/Frameworks/{skill}",
+                    "evidence_sources": [{"source": "cv", "span": f"Used {skill}."}],
+                }
+                for skill in SKILLS
+            ],
+        },
+        "max_turns": max_turns,
+        "min_q": 2,
+        "verify_lcb": 4.5,
+    }
+
+
+def _serve() -> str:
+    from app.service.service import app
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def _drain(events: Iterator[Dict[str, Any]]) -> None:
+    for event in events:
+        if event["event"] == "done":
+            return
+
+
+def play_sse(
+    client: AgentClient, payload: Dict[str, Any], answer: Callable[[], str], session: str
+) -> List[float]:
+    _drain(client.stream(payload, session_id=session))
+    turns = []
+    for _ in range(payload["max_turns"]):
+        start = time.perf_counter()
+        events = list(client.resume(dict(payload, answer=answer()), session_id=session))
+        turns.append(time.perf_counter() - start)
+        if '"awaiting_answer"' not in events[-1]["data"]:
+            break
+    return turns
+
+
+def play_ws(
+    client: AgentClient, payload: Dict[str, Any], answer: Callable[[], str], session: str
+) -> List[float]:
+    turns = []
+    with client.connect(session_id=session) as connection:
+        _drain(connection.start(payload))
+        for _ in range(payload["max_turns"]):
+            start = time.perf_counter()
+            events = list(connection.answer(answer()))
+            turns.append(time.perf_counter() - start)
+            if '"awaiting_answer"' not in events[-1]["data"]:
+                break
+    return turns
+
+
+def _delayed(llm: SimulatedLLM, delay: float) -> None:
+    if delay <= 0:
+        return
+    respond = llm.respond
+
+    async def slow(schema: type) -> Any:
+        await asyncio.sleep(delay)
+        return respond(schema)
+
+    class _Slow(simulator._StructuredCall):
+        async def ainvoke(self, prompt: Any) -> Any:
+            return await slow(self._schema)
+
+    llm.with_structured_output = lambda schema: _Slow(llm, schema)  # type: ignore[method-assign]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--interviews", type=int, default=20)
+    parser.add_argument("--max-turns", type=int, default=10)
+    parser.add_argument("--llm-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.checkpoint_url = "memory"
+    settings.database_url = f"sqlite:///{Path(tempfile.mkdtemp()) / 'bench.sqlite'}"
+    settings.api_key = None
+
+    population = Population(skills=len(SKILLS))
+    rng = np.random.default_rng(0)
+    llm = SimulatedLLM(population.sample(rng), population, rng)
+    _delayed(llm, args.llm_ms / 1000)
+    # Grades follow the candidate's ability on one skill; only timing matters here.
+    skill = population.skill_names()[0]
+
+    def answer() -> str:
+        return llm.answer(skill)
+
+    simulator.llm_module.get_llm = lambda *a, **k: llm  # type: ignore[assignment]
+
+    client = AgentClient(base_url=_serve())
+    payload = _payload(args.max_turns)
+    players: Dict[str, Callable[..., List[float]]] = {"sse": play_sse, "ws": play_ws}
+
+    print(f"{'transport':>9} {'turns':>6} {'median':>9} {'p95':>9} {'mean':>9}")
+    for name, play in players.items():
+        play(client, payload, answer, f"warmup-{name}")
+        turns: List[float] = []
+        for idx in range(args.interviews):
+            turns.extend(play(client, payload, answer, f"{name}-{idx}"))
+        ms = sorted(turn * 1000 for turn in turns)
+        print(
+            f"{name:>9} {len(ms):>6} {statistics.median(ms):>7.2f}ms "
+            f"{ms[int(0.95 * (len(ms) - 1))]:>7.2f}ms {statistics.fmean(ms):>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from uuid import uuid4
 
-from langgraph.graph import START, StateGraph
+from langgraph.graph import END, START, StateGraph
 from langgraph.types import Command
 
 from app.agents.interviewer.nodes.ask import ask_node
@@ -12,17 +13,72 @@ from app.agents.interviewer.nodes.generate import generate_questions_node
 from app.agents.interviewer.nodes.grade import grade_node
 from app.agents.interviewer.nodes.select import select_question_node
 from app.agents.interviewer.nodes.update import update_node
-from app.agents.interviewer.utils.state import append_log, summarise_skills
-from app.agents.interviewer.utils.stats import compute_uncertainty, ensure_prior
+from app.agents.interviewer.utils.agent_log import log_event
+from app.agents.interviewer.utils.skill_graph import get_skill_graph
+from app.agents.interviewer.utils.state import summarise_skills
+from app.agents.interviewer.utils.stats import (
+    Evidence,
+    SkillPrior,
+    belief_model,
+    compute_uncertainty,
+    ensure_prior,
+)
+from app.agents.interviewer.utils.warm_start import (
+    PastSession,
+    apply_carried,
+    carried_evidence,
+    session_age_days,
+)
+from app.core.config import get_settings
 from app.schema.models import InterviewState
+from app.storage.items import latest_item_version
+from app.storage.priors import get_prior_table
+from app.storage.store import candidate_sessions
 
 
-def _initial_belief(skills: List[str], z_value: float) -> Dict[str, Dict[str, float]]:
+def _published_priors() -> Tuple[Optional[int], Dict[str, SkillPrior]]:
+    """Latest fitted per-skill priors, when enabled and published."""
+    if not get_settings().stats_empirical_priors:
+        return None, {}
+    version, table = get_prior_table()
+    priors = {
+        skill: SkillPrior(float(row["mean"]), float(row["variance"]), float(row["strength"]))
+        for skill, row in table.items()
+    }
+    return version, priors
+
+
+def _warm_start_evidence(
+    candidate_id: str, exclude: str
+) -> Tuple[List[str], Dict[str, Evidence]]:
+    """Decayed evidence from the candidate's most recent earlier sessions."""
+    settings = get_settings()
+    rows = candidate_sessions(
+        candidate_id, exclude=exclude, limit=settings.warm_start_max_sessions
+    )
+    past = [
+        PastSession(session_id, state.get("belief_state", {}), session_age_days(updated_at))
+        for session_id, state, updated_at in rows
+    ]
+    carried = carried_evidence(
+        past,
+        half_life_days=settings.warm_start_half_life_days,
+        weight=settings.warm_start_weight,
+    )
+    return [session.session_id for session in past], carried
+
+
+def _initial_belief(
+    skills: List[str],
+    z_value: float,
+    model: str = "normal",
+    priors: Mapping[str, SkillPrior] | None = None,
+) -> Dict[str, Dict[str, float]]:
     beliefs: Dict[str, Dict[str, float]] = {}
     for skill in skills:
         belief: Dict[str, float] = {}
-        ensure_prior(belief)
-        compute_uncertainty(belief, z_value, add_ucb=False)
+        ensure_prior(belief, (priors or {}).get(skill))
+        compute_uncertainty(belief, z_value, add_ucb=False, model=model)
         beliefs[skill] = belief
     return beliefs
 
@@ -37,11 +93,49 @@ def build_state(
     spans_map: Dict[str, List[str]],
     *,
     thread_id: str | None = None,
+    pipelined_grading: bool = False,
+    grading_mode: str = "single",
+    extra_grade_budget: int = 0,
+    multi_skill_questions: bool = False,
+    skill_groups: Dict[str, str] | None = None,
+    selection_policy: str = "ucb1",
+    stopping_rule: str = "lcb",
+    difficulty_policy: str = "nudge",
+    priors: Mapping[str, SkillPrior] | None = None,
+    candidate_id: str | None = None,
+    warm_start: bool = False,
+    carried: Mapping[str, Evidence] | None = None,
+    skill_graph: bool = False,
+    skill_links: Mapping[str, Mapping[str, float]] | None = None,
+    planner: bool = False,
+    token_budget: int | None = None,
+    cost_budget: float | None = None,
 ) -> InterviewState:
+    """Bootstrap a fresh interview ledger.
+
+    ``priors`` overrides the per-skill prior table (``{}`` forces the global
+    ``stats_prior_*`` prior); by default the latest published table is used.
+    With ``warm_start`` the candidate's earlier sessions seed the beliefs;
+    ``carried`` supplies that evidence directly instead (replays).
+    With ``skill_graph`` the published skill graph links the session's skills;
+    ``skill_links`` supplies the adjacency directly instead.
+    """
     tid = thread_id or f"thread-{uuid4()}"
+    prior_version: Optional[int] = None
+    if priors is None:
+        prior_version, priors = _published_priors()
+    warm_started_from: List[str] = []
+    if carried is None and warm_start and candidate_id:
+        warm_started_from, carried = _warm_start_evidence(candidate_id, tid)
+    skill_graph_version: Optional[int] = None
+    if skill_links is None and skill_graph:
+        graph = get_skill_graph()
+        skill_graph_version, skill_links = graph.version, graph.links_for(skills)
     state: InterviewState = {
         "skills": skills,
-        "belief_state": _initial_belief(skills, z_value),
+        "belief_state": _initial_belief(
+            skills, z_value, belief_model(selection_policy), priors
+        ),
         "question_pool": [],
         "current_question": None,
         "last_grade": None,
@@ -59,37 +153,176 @@ def build_state(
         "verified_skills": [],
         "logs": [],
         "skill_summaries": [],
+        "skill_rows": {skill: row for row, skill in enumerate(skills)},
         "question_history": [],
+        "skill_history": {},
+        "pipelined_grading": pipelined_grading,
+        "grading_mode": grading_mode,
+        "extra_grade_budget": extra_grade_budget,
+        "extra_grade_samples": 0,
+        "llm_calls_avoided": 0,
+        "flagged_answers": [],
+        "multi_skill_questions": multi_skill_questions,
+        "skill_groups": dict(skill_groups or {}),
+        "selection_policy": selection_policy,
+        "stopping_rule": stopping_rule,
+        "difficulty_policy": difficulty_policy,
+        "item_version": latest_item_version() if difficulty_policy == "irt" else None,
+        "prior_version": prior_version,
+        "candidate_id": candidate_id,
+        "warm_started_from": warm_started_from,
+        "skill_links": {
+            skill: dict(related) for skill, related in (skill_links or {}).items()
+        },
+        "skill_graph_version": skill_graph_version,
+        "planner": planner,
+        "plan": {},
+        "token_budget": token_budget,
+        "cost_budget": cost_budget,
+        "spend": {},
     }
-    append_log(
+    log_event(
         state,
-        f"init → thread={tid} skills={skills}, max_turns={max_turns}, threshold={verify_lcb}, z={z_value}, C={ucb_C}",
+        "init",
+        "thread={thread} skills={skills}, max_turns={max_turns}, threshold={threshold}, "
+        "z={z}, C={C}",
+        thread=tid,
+        skills=list(skills),
+        max_turns=max_turns,
+        threshold=verify_lcb,
+        z=z_value,
+        C=ucb_C,
     )
+    if state["skill_links"]:
+        edges = sum(len(related) for related in state["skill_links"].values()) // 2
+        log_event(
+            state,
+            "skill_graph",
+            "version={version} edges={edges}",
+            version=skill_graph_version,
+            edges=edges,
+        )
+    if token_budget or cost_budget:
+        log_event(
+            state, "budget", "tokens={tokens} cost={cost}", tokens=token_budget, cost=cost_budget
+        )
+    if carried:
+        apply_carried(state, carried)
     state["skill_summaries"] = summarise_skills(state)
     return state  # type: ignore[return-value]
 
 
+# State keys each node writes. The graph returns only these from a node, so a
+# checkpoint step stores the channels it changed instead of the whole state.
+# Nodes mutate nested values in place: whatever a node touches must be listed
+# here or it is lost on resume (tests/test_graph.py checks this). ``logs`` is
+# an append channel (``append_logs``): a step writes only the events it added.
+NODE_WRITES: Dict[str, Tuple[str, ...]] = {
+    "generate": ("question_pool", "logs", "spend"),
+    "select": ("current_question", "question_pool", "question_history", "logs", "spend"),
+    "ask": ("logs",),
+    "grade": (
+        "last_grade",
+        "last_answer",
+        "pending_answer",
+        "extra_grade_budget",
+        "extra_grade_samples",
+        "llm_calls_avoided",
+        "flagged_answers",
+        "logs",
+        "spend",
+    ),
+    "update": (
+        "belief_state",
+        "inactive_skills",
+        "verified_skills",
+        "question_history",
+        "skill_history",
+        "skill_summaries",
+        "skill_rows",
+        "plan",
+        "turn",
+        "logs",
+    ),
+    "decide": ("logs",),
+}
+
+
+def detach_logs(state: InterviewState) -> int:
+    """Give ``state`` its own ``logs`` list; returns how many events it already holds.
+
+    Pass the count to :func:`state_delta` as ``logged`` once the nodes ran.
+    """
+    state["logs"] = list(state.get("logs", []))
+    return len(state["logs"])
+
+
+def state_delta(
+    state: Mapping[str, Any], nodes: Iterable[str], *, logged: int = 0
+) -> Dict[str, Any]:
+    """The keys ``nodes`` write, as a partial state update.
+
+    ``logs`` carries only the events from index ``logged`` on (see
+    :func:`detach_logs`); the channel appends them.
+    """
+    keys = dict.fromkeys(key for node in nodes for key in NODE_WRITES[node])
+    delta = {key: state[key] for key in keys if key in state}
+    if "logs" in delta:
+        delta["logs"] = delta["logs"][logged:]
+    return delta
+
+
+def _partial(node: str, fn: Callable[[InterviewState], Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(fn):
+
+        async def run_async(state: InterviewState) -> Dict[str, Any]:
+            logged = detach_logs(state)
+            return state_delta(await fn(state), [node], logged=logged)
+
+        return run_async
+
+    def run(state: InterviewState) -> Dict[str, Any]:
+        logged = detach_logs(state)
+        return state_delta(fn(state), [node], logged=logged)
+
+    return run
+
+
+def _decide(state: InterviewState) -> Command:
+    """``decide_node``, refilling an exhausted question pool before selecting."""
+    logged = detach_logs(state)
+    goto = decide_node(state).goto
+    if goto == "select" and not state.get("question_pool"):
+        goto = "generate"
+    return Command(goto=goto, update=state_delta(state, ["decide"], logged=logged))
+
+
 def build_graph(
     *,
     checkpointer: Any | None = None,
     interrupt_before: Sequence[str] | None = None,
     interrupt_after: Sequence[str] | None = None,
 ):
-    g = StateGraph(InterviewState)
-    g.add_node("generate", generate_questions_node)
-    g.add_node("select", select_question_node)
-    g.add_node("ask", ask_node)
-    g.add_node("grade", grade_node)
-    g.add_node("update", update_node)
+    """Compile ``generate → select → ask → grade → update → decide``.
 
-    def route(state: InterviewState) -> Command:
-        return decide_node(state)
+    The service compiles it with a durable checkpointer and
+    ``interrupt_before=["grade"]``: a run pauses once the question is asked and
+    resumes from the checkpoint when the answer arrives.
+    """
+    g = StateGraph(InterviewState)
+    g.add_node("generate", _partial("generate", generate_questions_node))
+    g.add_node("select", _partial("select", select_question_node))
+    g.add_node("ask", _partial("ask", ask_node))
+    g.add_node("grade", _partial("grade", grade_node))
+    g.add_node("update", _partial("update", update_node))
+    g.add_node("decide", _decide, destinations=("generate", "select", END))
 
     g.add_edge(START, "generate")
     g.add_edge("generate", "select")
     g.add_edge("select", "ask")
+    g.add_edge("ask", "grade")
     g.add_edge("grade", "update")
-    g.add_conditional_edges("update", route)
+    g.add_edge("update", "decide")
 
     return g.compile(
         checkpointer=checkpointer,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from app.agents.interviewer.utils.state import append_log
+from app.agents.interviewer.utils.agent_log import log_event
 from app.schema.models import InterviewState
 
 
@@ -8,5 +8,5 @@ def ask_node(state: InterviewState) -> InterviewState:
     """Log the outgoing question. The UI handles actually asking the user."""
     q = state["current_question"]
     assert q is not None
-    append_log(state, f"ask → {q.skill}: {q.text[:80]}")
+    log_event(state, "ask", "{skill}: {text}", skill=q.skill, text=q.text[:80])
     return state
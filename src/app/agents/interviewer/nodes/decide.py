@@ -1,27 +1,52 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from langgraph.graph import END
 from langgraph.types import Command
 
-from app.agents.interviewer.utils.state import append_log
+from app.agents.interviewer.utils.agent_log import log_event
+from app.agents.interviewer.utils.budget import budget_exhausted
+from app.agents.interviewer.utils.planner import hopeless_skills
 from app.schema.models import InterviewState
 
 
-def decide_node(state: InterviewState) -> Command:
-    """Decide whether to continue the interview."""
+def end_reason(state: InterviewState) -> Optional[str]:
+    """Why the interview is over, or None while it should continue."""
     if state["turn"] >= state["max_turns"]:
-        append_log(state, "decide → END (max turns)")
-        return Command(goto=END)
+        return "max turns"
 
     if set(state["verified_skills"]) == set(state["skills"]):
-        append_log(state, "decide → END (all verified)")
-        return Command(goto=END)
+        return "all verified"
 
     inactive = set(state.get("inactive_skills", []))
     active = [skill for skill in state.get("skills", []) if skill not in inactive]
     if not active:
-        append_log(state, "decide → END (no active skills)")
+        return "no active skills"
+
+    # Every remaining skill is verified (e.g. warm-started from earlier sessions).
+    verified = set(state.get("verified_skills", []))
+    if all(skill in verified for skill in active):
+        return "all decided"
+
+    # Token/cost budget: not even a pooled question's grade fits any more.
+    if budget_exhausted(state):
+        return "budget exhausted"
+
+    # Planner: no open skill can still reach the bar in the turns left.
+    if state.get("planner") and state.get("plan"):
+        undecided = {skill for skill in active if skill not in verified}
+        if undecided <= hopeless_skills(state):
+            return "nothing left to verify"
+    return None
+
+
+def decide_node(state: InterviewState) -> Command:
+    """Decide whether to continue the interview."""
+    reason = end_reason(state)
+    if reason is not None:
+        log_event(state, "decide", "END ({reason})", reason=reason)
         return Command(goto=END)
 
-    append_log(state, "decide → continue")
+    log_event(state, "decide", "continue")
     return Command(goto="select")
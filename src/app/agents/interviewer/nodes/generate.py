@@ -5,13 +5,16 @@ from __future__ import annotations
 from typing import Any, List
 
 from app.agents.interviewer.prompts.generate import QUESTION_PROMPT
-from app.agents.interviewer.utils.state import append_log, history_snippet
+from app.agents.interviewer.utils.agent_log import WARNING, log_event
+from app.agents.interviewer.utils.budget import spend_recorder
+from app.agents.interviewer.utils.state import history_snippet
+from app.agents.interviewer.utils.streaming import StructuredLLM
 import app.core.llm as llm_module
 from app.schema.models import InterviewState, Question
 
 
 async def _draft_question(
-    structured_llm: Any,
+    structured_llm: StructuredLLM,
     skill: str,
     evidence: List[str],
     previous_question: str,
@@ -65,9 +68,9 @@ async def generate_questions_node(state: InterviewState) -> InterviewState:
     thread_id = state.get("thread_id")
     if thread_id:
         run_config["metadata"] = {"session_id": thread_id, "thread_id": thread_id}
-    structured_llm = llm.with_structured_output(Question)
-    if hasattr(structured_llm, "with_config"):
-        structured_llm = structured_llm.with_config(**run_config)
+    structured_llm = StructuredLLM(
+        llm, Question, run_config, on_usage=spend_recorder(state, "question")
+    )
     questions: List[Question] = []
     for skill in state.get("skills", []):
         evidence = spans_map.get(skill, [])
@@ -85,7 +88,14 @@ async def generate_questions_node(state: InterviewState) -> InterviewState:
                 )
             )
         except Exception as exc:  # pragma: no cover - network dependent
-            append_log(state, f"generate_questions → failed for {skill}: {exc}")
+            log_event(
+                state,
+                "generate_questions",
+                "failed for {skill}: {error}",
+                level=WARNING,
+                skill=skill,
+                error=str(exc),
+            )
     state["question_pool"] = questions
-    append_log(state, f"generate_questions → seeded {len(questions)} questions")
+    log_event(state, "generate_questions", "seeded {count} questions", count=len(questions))
     return state
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import math
-from typing import Dict, Any
+import statistics
+from typing import Dict, Any, List, Optional
 
-from app.agents.interviewer.prompts.grade import GRADE_PROMPT
-from app.agents.interviewer.utils.state import append_log
+from app.agents.interviewer.prompts.grade import GRADE_PROMPT, MULTI_SKILL_GRADE_PROMPT
+from app.agents.interviewer.utils.agent_log import DEBUG, WARNING, log_event
+from app.agents.interviewer.utils.budget import budget_tight, spend_recorder
+from app.agents.interviewer.utils.pregrade import pregrade_answer
+from app.agents.interviewer.utils.stats import (
+    belief_model,
+    compute_uncertainty,
+    welford_update,
+)
+from app.agents.interviewer.utils.streaming import StructuredLLM, emit
+from app.core.config import get_settings
 import app.core.llm as llm_module
-from app.schema.models import AspectBreakdown, Grade, GradeDraft, InterviewState
+from app.storage.answer_index import DuplicateMatch, get_answer_index
+from app.schema.models import (
+    AspectBreakdown,
+    Grade,
+    GradeDraft,
+    InterviewState,
+    MultiSkillGradeDraft,
+    Question,
+)
 
 
 _ASPECT_WEIGHTS: Dict[str, float] = {
@@ -48,29 +67,8 @@ def _compute_final_score(
     return final_score
 
 
-async def grade_node(state: InterviewState) -> InterviewState:
-    """Call the grading LLM on the latest answer."""
-    question = state["current_question"]
-    assert question is not None
-    answer = state.get("pending_answer") or ""
-
-    llm = llm_module.get_llm()
-    run_config: Dict[str, Any] = {"run_name": "grade_answer"}
-    thread_id = state.get("thread_id")
-    if thread_id:
-        run_config["metadata"] = {"session_id": thread_id, "thread_id": thread_id}
-    structured_llm = llm.with_structured_output(GradeDraft)
-    if hasattr(structured_llm, "with_config"):
-        structured_llm = structured_llm.with_config(**run_config)
-    draft = await structured_llm.ainvoke(
-        GRADE_PROMPT.format(
-            skill=question.skill,
-            difficulty=question.difficulty,
-            question=question.text,
-            response=answer,
-        )
-    )
-
+def _grade_from_draft(draft: GradeDraft) -> Grade:
+    """Apply the factual-error override and weighted aggregation to one draft."""
     aspect_map: Dict[str, AspectBreakdown] = {
         "coverage": draft.coverage,
         "technical_depth": draft.technical_depth,
@@ -89,17 +87,353 @@ async def grade_node(state: InterviewState) -> InterviewState:
 
     final_score = _compute_final_score(draft, aspect_map)
 
-    grade = Grade(score=final_score, reasoning=draft.reasoning, aspects=aspect_map)
+    return Grade(score=final_score, reasoning=draft.reasoning, aspects=aspect_map)
+
+
+def _aspect_spread(grade: Grade) -> int:
+    scores = [detail.score for detail in grade.aspects.values()]
+    return max(scores) - min(scores) if scores else 0
+
+
+def _projected_lcb(state: InterviewState, skill: str, score: float) -> Optional[float]:
+    """LCB the skill would have after applying ``score`` (None without a belief)."""
+    belief = state.get("belief_state", {}).get(skill)
+    if belief is None:
+        return None
+    projected = dict(belief)
+    welford_update(projected, score)
+    compute_uncertainty(
+        projected,
+        state.get("z_value", 1.96),
+        add_ucb=False,
+        model=belief_model(state.get("selection_policy")),
+    )
+    return float(projected["lcb"])
+
+
+def _uncertainty_reason(state: InterviewState, skill: str, samples: List[Grade]) -> Optional[str]:
+    """Why another grading sample would be worth its cost, or None."""
+    settings = get_settings()
+    scores = [sample.score for sample in samples]
+    if len(samples) > 1:
+        # Early stop once a majority of samples sit within one point of the median.
+        aggregate = _aggregate_score(scores)
+        close = sum(1 for score in scores if abs(score - aggregate) <= 1)
+        if close * 2 <= len(scores):
+            return "samples_disagree"
+    elif _aspect_spread(samples[0]) >= settings.grade_adaptive_disagreement:
+        return "aspects_disagree"
+    threshold = state.get("verification_threshold")
+    lcb = _projected_lcb(state, skill, _aggregate_score(scores))
+    if (
+        len(samples) == 1
+        and threshold is not None
+        and lcb is not None
+        and abs(lcb - float(threshold)) <= settings.grade_adaptive_lcb_margin
+    ):
+        return "near_threshold"
+    return None
+
+
+def _aggregate_score(scores: List[int]) -> int:
+    return max(1, min(5, _round_half_up(statistics.median(scores))))
+
+
+def _aggregate_grades(samples: List[Grade]) -> Grade:
+    """Median-aggregate samples; notes and reasoning come from the most typical sample."""
+    score = _aggregate_score([sample.score for sample in samples])
+    representative = min(samples, key=lambda sample: abs(sample.score - score))
+    aspects: Dict[str, AspectBreakdown] = {}
+    for name, detail in representative.aspects.items():
+        aspect_scores = [
+            sample.aspects[name].score for sample in samples if name in sample.aspects
+        ]
+        aspects[name] = AspectBreakdown(
+            score=_aggregate_score(aspect_scores), notes=detail.notes
+        )
+    return Grade(score=score, reasoning=representative.reasoning, aspects=aspects)
+
+
+async def _refine_adaptively(
+    state: InterviewState,
+    structured_llm: StructuredLLM,
+    prompt: Any,
+    skill: str,
+    first: Grade,
+) -> Grade:
+    """Draw extra grading samples only while the grade is decision-relevant.
+
+    Extra calls are spent when the aspects of a single sample disagree or the
+    resulting LCB would land within ``grade_adaptive_lcb_margin`` of the
+    verification threshold. Samples are drawn in parallel batches and sampling
+    stops as soon as they agree, the per-turn cap is hit, the session budget
+    (``extra_grade_budget``) runs out, or the token/cost budget is tight.
+    """
+    settings = get_settings()
+    samples = [first]
+    drawn = 0
+    reason = _uncertainty_reason(state, skill, samples)
+    trigger = reason
+    while reason is not None:
+        budget = int(state.get("extra_grade_budget", 0))
+        batch = min(
+            settings.grade_adaptive_batch,
+            budget,
+            settings.grade_adaptive_max_extra - drawn,
+        )
+        if batch <= 0:
+            break
+        if budget_tight(state):
+            log_event(state, "grade_samples", "{skill}: skipped, budget tight", skill=skill)
+            break
+        drafts = await asyncio.gather(
+            *(structured_llm.ainvoke(prompt) for _ in range(batch))
+        )
+        samples.extend(_grade_from_draft(draft) for draft in drafts)
+        drawn += batch
+        state["extra_grade_budget"] = budget - batch
+        state["extra_grade_samples"] = int(state.get("extra_grade_samples", 0)) + batch
+        reason = _uncertainty_reason(state, skill, samples)
+
+    if drawn == 0:
+        return first
+    grade = _aggregate_grades(samples)
+    log_event(
+        state,
+        "grade_samples",
+        "{skill}: trigger={trigger} n={n} scores={scores} → {score}",
+        skill=skill,
+        trigger=trigger,
+        n=len(samples),
+        scores=[sample.score for sample in samples],
+        score=grade.score,
+    )
+    return grade
+
+
+def _partial_grade_emitter(skill: str):
+    """Build a handler that publishes aspects as soon as their scores arrive."""
+    last: Dict[str, Any] = {}
+
+    def on_partial(partial: Dict[str, Any]) -> None:
+        aspects = {
+            name: {"score": detail["score"], "notes": detail.get("notes", "")}
+            for name in _ASPECTS_ORDER
+            if isinstance(detail := partial.get(name), dict)
+            and isinstance(detail.get("score"), int)
+        }
+        reasoning = partial.get("reasoning")
+        payload = {
+            "type": "grade_partial",
+            "skill": skill,
+            "reasoning": reasoning if isinstance(reasoning, str) else "",
+            "aspects": aspects,
+        }
+        if payload != last and (aspects or payload["reasoning"]):
+            last.clear()
+            last.update(payload)
+            emit(dict(payload))
+
+    return on_partial
+
+
+def _flag_duplicate(
+    state: InterviewState, question: Question, answer: str
+) -> Optional[DuplicateMatch]:
+    """Look the answer up in the cross-session index and record any hit."""
+    settings = get_settings()
+    match = get_answer_index().query(
+        question.skill,
+        question.text,
+        answer,
+        threshold=settings.dedup_threshold,
+        exclude_session=state.get("thread_id"),
+    )
+    if match is None:
+        return None
+    state.setdefault("flagged_answers", []).append(
+        {
+            "turn": state.get("turn", 0),
+            "skill": question.skill,
+            "duplicate_of": match.key,
+            "similarity": round(match.similarity, 3),
+            "same_question": match.same_question,
+            "prior_score": match.score,
+        }
+    )
+    log_event(
+        state,
+        "dedup",
+        "{skill}: near-duplicate of {key} (similarity={similarity:.2f}, "
+        "same_question={same_question})",
+        skill=question.skill,
+        key=match.key,
+        similarity=match.similarity,
+        same_question=match.same_question,
+    )
+    return match
+
+
+def _reused_grade(match: DuplicateMatch) -> Grade:
+    aspects = {
+        name: AspectBreakdown(score=detail["score"], notes=detail.get("notes", ""))
+        for name, detail in match.aspects.items()
+    }
+    reasoning = (
+        f"Reused grade of near-duplicate answer {match.key} "
+        f"(similarity {match.similarity:.2f})."
+    )
+    if match.reasoning:
+        reasoning = f"{reasoning} {match.reasoning}"
+    return Grade(score=int(match.score or 1), reasoning=reasoning, aspects=aspects)
+
+
+async def _grade_single_skill(
+    state: InterviewState,
+    llm: Any,
+    run_config: Dict[str, Any],
+    question: Question,
+    answer: str,
+) -> Grade:
+    structured_llm = StructuredLLM(
+        llm, GradeDraft, run_config, on_usage=spend_recorder(state, "grade")
+    )
+    prompt = GRADE_PROMPT.format(
+        skill=question.skill,
+        difficulty=question.difficulty,
+        question=question.text,
+        response=answer,
+    )
+    draft = await structured_llm.ainvoke(
+        prompt, on_partial=_partial_grade_emitter(question.skill)
+    )
+
+    grade = _grade_from_draft(draft)
+    if state.get("grading_mode") == "adaptive":
+        grade = await _refine_adaptively(state, structured_llm, prompt, question.skill, grade)
+
+    return grade
+
+
+async def _grade_multi_skill(
+    state: InterviewState,
+    llm: Any,
+    run_config: Dict[str, Any],
+    question: Question,
+    answer: str,
+) -> Grade:
+    """Grade every targeted skill from one call; co-skill grades go to ``co_grades``.
+
+    Adaptive sampling does not apply here. If the grader skips the primary
+    skill, it is graded on its own; skipped co-skills are left ungraded.
+    """
+    skills = [question.skill, *question.co_skills]
+    structured_llm = StructuredLLM(
+        llm, MultiSkillGradeDraft, run_config, on_usage=spend_recorder(state, "grade")
+    )
+    draft = await structured_llm.ainvoke(
+        MULTI_SKILL_GRADE_PROMPT.format(
+            skills=", ".join(skills),
+            difficulty=question.difficulty,
+            question=question.text,
+            response=answer,
+        )
+    )
+    by_skill = {item.skill.strip().lower(): item for item in draft.grades}
+    grades = {
+        skill: _grade_from_draft(by_skill[skill.lower()])
+        for skill in skills
+        if skill.lower() in by_skill
+    }
+    missing = [skill for skill in skills if skill not in grades]
+    if missing:
+        log_event(
+            state, "grade_multi", "no grade returned for {skills}", level=WARNING, skills=missing
+        )
+    primary = grades.pop(question.skill, None)
+    if primary is None:
+        primary = await _grade_single_skill(state, llm, run_config, question, answer)
+    log_event(
+        state,
+        "grade_multi",
+        "{scores!j}",
+        scores={
+            skill: grade.score for skill, grade in [(question.skill, primary), *grades.items()]
+        },
+    )
+    return primary.model_copy(update={"co_grades": grades})
+
+
+async def grade_answer(
+    state: InterviewState, question: Question, answer: str, *, dedup: bool = True
+) -> Grade:
+    """Screen the answer locally, falling back to the grading LLM.
+
+    Does not touch ``last_grade``/``pending_answer`` so offline jobs can grade
+    historical answers against a minimal state. ``dedup=False`` skips the
+    near-duplicate lookup (re-grading must not copy earlier verdicts).
+    Multi-skill questions (``question.co_skills``) return one grade per skill.
+    """
+    settings = get_settings()
+    if settings.pregrade_enabled:
+        evidence = state.get("spans_map", {}).get(question.skill, [])
+        screened = pregrade_answer(question, answer, evidence)
+        if screened is not None:
+            state["llm_calls_avoided"] = int(state.get("llm_calls_avoided", 0)) + 1
+            log_event(
+                state,
+                "pregrade",
+                "{skill}: {reason} (LLM skipped)",
+                skill=question.skill,
+                reason=screened.reason,
+            )
+            return screened.grade.model_copy(
+                update={"co_grades": {skill: screened.grade for skill in question.co_skills}}
+            )
+
+    if dedup and settings.dedup_mode != "off":
+        match = _flag_duplicate(state, question, answer)
+        # Grades only transfer between answers to the same single-skill question.
+        if (
+            match is not None
+            and settings.dedup_mode == "reuse"
+            and match.same_question
+            and match.score is not None
+            and not question.co_skills
+        ):
+            state["llm_calls_avoided"] = int(state.get("llm_calls_avoided", 0)) + 1
+            return _reused_grade(match)
+
+    llm = llm_module.get_llm()
+    run_config: Dict[str, Any] = {"run_name": "grade_answer"}
+    thread_id = state.get("thread_id")
+    if thread_id:
+        run_config["metadata"] = {"session_id": thread_id, "thread_id": thread_id}
+    if question.co_skills:
+        return await _grade_multi_skill(state, llm, run_config, question, answer)
+    return await _grade_single_skill(state, llm, run_config, question, answer)
+
+
+async def grade_node(state: InterviewState) -> InterviewState:
+    """Call the grading LLM on the latest answer."""
+    question = state["current_question"]
+    assert question is not None
+    answer = state.get("pending_answer") or ""
+
+    grade = await grade_answer(state, question, answer)
 
     state["last_grade"] = grade
     state["last_answer"] = answer
     state["pending_answer"] = None
-    append_log(state, f"grade → {grade.score} ({grade.reasoning})")
+    log_event(
+        state, "grade", "{score} ({reasoning})", score=grade.score, reasoning=grade.reasoning
+    )
     if getattr(grade, "aspects", None):
-        aspect_bits = ", ".join(
-            f"{name}:{detail.score}"
-            for name, detail in grade.aspects.items()
+        log_event(
+            state,
+            "grade_aspects",
+            "{aspects!j}",
+            level=DEBUG,
+            aspects={name: detail.score for name, detail in grade.aspects.items()},
         )
-        if aspect_bits:
-            append_log(state, f"grade_aspects → {aspect_bits}")
     return state
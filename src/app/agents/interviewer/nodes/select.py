@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.agents.interviewer.prompts.generate import QUESTION_PROMPT
-from app.agents.interviewer.utils.state import (
-    append_log,
-    history_snippet,
-    record_question,
+import numpy as np
+
+from app.agents.interviewer.prompts.generate import (
+    MULTI_SKILL_QUESTION_PROMPT,
+    QUESTION_PROMPT,
+)
+from app.agents.interviewer.utils.agent_log import DEBUG, log_enabled, log_event
+from app.agents.interviewer.utils.budget import budget_tight, spend_recorder
+from app.agents.interviewer.utils.irt import (
+    BANK_MIN_INFO_RATIO,
+    best_bank_item,
+    best_level,
+    calibration_for,
 )
-from app.agents.interviewer.utils.stats import select_skill_ucb_with_log
+from app.agents.interviewer.utils.planner import hopeless_skills
+from app.agents.interviewer.utils.skill_graph import spillover
+from app.agents.interviewer.utils.state import history_snippet, record_question
+from app.agents.interviewer.utils.stats import (
+    TraceRow,
+    real_sample_count,
+    select_skill_thompson,
+    select_skill_ucb,
+)
+from app.agents.interviewer.utils.streaming import StructuredLLM, emit
 import app.core.llm as llm_module
 from app.schema.models import InterviewState, Question
 
@@ -35,8 +52,111 @@ def _pop_existing_question(state: InterviewState, skill: str) -> Optional[Questi
     return None
 
 
+def _pop_informative_question(
+    state: InterviewState, skill: str, use_bank: bool = True
+) -> Tuple[int, Optional[Question]]:
+    """IRT pick: the most informative level, plus a bank question close enough to it."""
+    belief = state["belief_state"][skill]
+    calibration = calibration_for(state.get("item_version"))
+    level, level_info = best_level(belief, calibration)
+    pool = state.get("question_pool", [])
+    positions = [idx for idx, question in enumerate(pool) if question.skill == skill]
+    bank = (
+        best_bank_item(belief, calibration, [pool[idx] for idx in positions])
+        if use_bank
+        else None
+    )
+    log_event(
+        state,
+        "select_irt",
+        "{skill}: level={item_level} info={info:.3f} bank_info={bank_info}",
+        level=DEBUG,
+        skill=skill,
+        item_level=level,
+        info=level_info,
+        bank_info=round(bank[1], 3) if bank is not None else None,
+    )
+    if bank is not None and bank[1] >= BANK_MIN_INFO_RATIO * level_info:
+        return level, pool.pop(positions[bank[0]])
+    return level, None
+
+
+def _pick_partner(
+    state: InterviewState, pool: Dict[str, Dict], skill: str
+) -> Optional[str]:
+    """Related skill to probe alongside ``skill`` in multi-skill mode.
+
+    Both skills must still be under-sampled (fewer than ``min_questions_per_skill``
+    real answers) and share a taxonomy parent; the least-sampled, most uncertain
+    sibling wins.
+    """
+    groups = state.get("skill_groups", {})
+    group = groups.get(skill)
+    min_q = int(state.get("min_questions_per_skill", 1))
+    if group is None or real_sample_count(pool[skill]) >= min_q:
+        return None
+    related = [
+        other
+        for other, belief in pool.items()
+        if other != skill
+        and groups.get(other) == group
+        and real_sample_count(belief) < min_q
+    ]
+    if not related:
+        return None
+    return min(
+        related,
+        key=lambda other: (
+            real_sample_count(pool[other]),
+            -float(pool[other].get("se", 0.0)),
+        ),
+    )
+
+
+def _question_delta_emitter(skill: str):
+    """Build a handler that publishes the question text as it streams in."""
+    streamed = ""
+
+    def on_partial(partial: dict) -> None:
+        nonlocal streamed
+        text = partial.get("text")
+        if not isinstance(text, str) or text == streamed:
+            return
+        delta = text[len(streamed):] if text.startswith(streamed) else text
+        streamed = text
+        emit({"type": "question_delta", "skill": skill, "text": text, "delta": delta})
+
+    return on_partial
+
+
+async def _draft_multi_skill(
+    structured_llm: StructuredLLM,
+    skills: List[str],
+    difficulty: int,
+    evidence: str,
+    previous_question: str,
+    previous_answer: str,
+    history_snippet: str,
+) -> Question:
+    """Ask the LLM for one question that probes every skill in ``skills``."""
+    question = await structured_llm.ainvoke(
+        MULTI_SKILL_QUESTION_PROMPT.format(
+            skills=" and ".join(skills),
+            difficulty=difficulty,
+            evidence_spans=evidence,
+            previous_question=previous_question,
+            previous_answer=previous_answer,
+            recent_history=history_snippet,
+        ),
+        on_partial=_question_delta_emitter(skills[0]),
+    )
+    return Question(
+        skill=skills[0], text=question.text, difficulty=difficulty, co_skills=skills[1:]
+    )
+
+
 async def _draft_follow_up(
-    structured_llm: Any,
+    structured_llm: StructuredLLM,
     skill: str,
     difficulty: int,
     last_score: Optional[int],
@@ -57,7 +177,8 @@ async def _draft_follow_up(
             previous_answer=previous_answer,
             previous_reasoning=previous_reasoning,
             recent_history=history_snippet,
-        )
+        ),
+        on_partial=_question_delta_emitter(skill),
     )
     if getattr(question, "skill", None) != skill:
         try:
@@ -68,34 +189,104 @@ async def _draft_follow_up(
     return question
 
 
-async def select_question_node(state: InterviewState) -> InterviewState:
-    """Select the next skill via UCB and prepare the follow-up question."""
-    last_score = (
-        state["last_grade"].score
-        if state.get("last_grade") and state.get("current_question")
-        else None
-    )
+def pick_skill(
+    state: InterviewState,
+    exclude: Sequence[str] = (),
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[str, Dict[str, Dict]]:
+    """Choose the next skill under the session's selection policy.
+
+    Returns the skill and the candidate pool it was chosen from (open skills,
+    or every skill once none is open). With ``planner`` open skills the last
+    plan cannot verify in time are skipped while others remain, and under a
+    tight budget skills with a pooled question are preferred. ``rng`` seeds
+    Thompson sampling.
+    """
     # Prefer selecting among active skills only
     inactive = set(state.get("inactive_skills", []))
     verified = set(state.get("verified_skills", []))
+    skipped = set(exclude)
     active_beliefs = {
         k: v
         for k, v in state.get("belief_state", {}).items()
-        if k not in inactive and k not in verified
+        if k not in inactive and k not in verified and k not in skipped
     }
+    if state.get("planner"):
+        hopeless = hopeless_skills(state) & set(active_beliefs)
+        if hopeless and len(hopeless) < len(active_beliefs):
+            log_event(
+                state,
+                "select_plan",
+                "skip {skills} (cannot verify in time)",
+                skills=sorted(hopeless),
+            )
+            active_beliefs = {k: v for k, v in active_beliefs.items() if k not in hopeless}
+    if budget_tight(state):
+        # A pooled question costs no drafting call.
+        pooled = {question.skill for question in state.get("question_pool", [])}
+        cheap = {k: v for k, v in active_beliefs.items() if k in pooled}
+        if cheap and len(cheap) < len(active_beliefs):
+            log_event(state, "select_budget", "prefer pooled {skills}", skills=sorted(cheap))
+            active_beliefs = cheap
     pool = active_beliefs if active_beliefs else state.get("belief_state", {})
-    skill, logs = select_skill_ucb_with_log(pool, state["ucb_C"])
-    for entry in logs:
-        append_log(state, f"select_ucb → {entry}")
+    policy = state.get("selection_policy", "ucb1")
+    # Per-skill scores are only collected when debug traces are recorded.
+    trace: Optional[List[TraceRow]] = [] if log_enabled(state, DEBUG) else None
+    if policy == "thompson":
+        node = "select_ts"
+        skill, draw = select_skill_thompson(pool, rng, trace)
+        chosen = ("select {skill} (draw={draw:.3f})", {"skill": skill, "draw": draw})
+    else:
+        node = "select_ucb"
+        links = state.get("skill_links", {})
+        skill, ucb = select_skill_ucb(
+            pool,
+            state["ucb_C"],
+            mode=policy,
+            spillover=spillover(links, pool) if links else None,
+            trace=trace,
+        )
+        chosen = ("select {skill} (UCB={ucb:.3f})", {"skill": skill, "ucb": ucb})
+    for template, fields in trace or ():
+        log_event(state, node, template, level=DEBUG, **fields)
+    log_event(state, node, chosen[0], **chosen[1])
+    return skill, pool
+
 
+async def select_question_node(
+    state: InterviewState, exclude: Sequence[str] = ()
+) -> InterviewState:
+    """Select the next skill (UCB or Thompson sampling) and prepare the follow-up question.
+
+    ``exclude`` removes skills from the candidate pool for this pick only (the
+    pipelined resume path uses it to avoid the skill whose grade is in flight).
+    """
+    last_score = (
+        state["last_grade"].score
+        if state.get("last_grade") and state.get("current_question")
+        else None
+    )
+    skill, pool = pick_skill(state, exclude)
     difficulty = _next_difficulty(last_score)
+    partner = (
+        _pick_partner(state, pool, skill)
+        if state.get("multi_skill_questions") and not budget_tight(state)
+        else None
+    )
 
     # Prefer cached questions first; they give deterministic coverage and keep the flow moving
-    # even if the LLM cannot be reached.
-    candidate = _pop_existing_question(state, skill)
+    # even if the LLM cannot be reached. Cached questions are single-skill, so a
+    # paired pick always drafts a fresh one.
     source = "pool"
-    if candidate and candidate.difficulty != difficulty:
-        candidate.difficulty = difficulty
+    if state.get("difficulty_policy") == "irt":
+        # Bank questions keep their own (calibrated) difficulty.
+        difficulty, candidate = _pop_informative_question(
+            state, skill, use_bank=partner is None
+        )
+    else:
+        candidate = _pop_existing_question(state, skill) if partner is None else None
+        if candidate and candidate.difficulty != difficulty:
+            candidate.difficulty = difficulty
 
     if candidate is None:
         source = "llm"
@@ -104,10 +295,9 @@ async def select_question_node(state: InterviewState) -> InterviewState:
         thread_id = state.get("thread_id")
         if thread_id:
             run_config["metadata"] = {"session_id": thread_id, "thread_id": thread_id}
-        structured_llm = llm.with_structured_output(Question)
-        if hasattr(structured_llm, "with_config"):
-            structured_llm = structured_llm.with_config(**run_config)
-        evidence = "\n".join(state.get("spans_map", {}).get(skill, []))
+        structured_llm = StructuredLLM(
+            llm, Question, run_config, on_usage=spend_recorder(state, "question")
+        )
         prev_q = (
             getattr(state.get("current_question"), "text", "")
             if state.get("current_question")
@@ -119,19 +309,37 @@ async def select_question_node(state: InterviewState) -> InterviewState:
             else ""
         )
         prev_ans = state.get("last_answer") or ""
-        history_ctx = history_snippet(state, skill)
-        candidate = await _draft_follow_up(
-            structured_llm,
-            skill,
-            difficulty,
-            last_score,
-            evidence,
-            previous_question=prev_q,
-            previous_answer=prev_ans,
-            previous_reasoning=prev_reason,
-            history_snippet=history_ctx,
-        )
+        if partner is not None:
+            source = "llm_multi"
+            pair = [skill, partner]
+            spans_map = state.get("spans_map", {})
+            candidate = await _draft_multi_skill(
+                structured_llm,
+                pair,
+                difficulty,
+                "\n".join(
+                    f"[{name}] {span}" for name in pair for span in spans_map.get(name, [])
+                ),
+                previous_question=prev_q,
+                previous_answer=prev_ans,
+                history_snippet="\n".join(history_snippet(state, name) for name in pair),
+            )
+            log_event(state, "select_multi", "{skill} + {partner}", skill=skill, partner=partner)
+        else:
+            evidence = "\n".join(state.get("spans_map", {}).get(skill, []))
+            history_ctx = history_snippet(state, skill)
+            candidate = await _draft_follow_up(
+                structured_llm,
+                skill,
+                difficulty,
+                last_score,
+                evidence,
+                previous_question=prev_q,
+                previous_answer=prev_ans,
+                previous_reasoning=prev_reason,
+                history_snippet=history_ctx,
+            )
 
     record_question(state, candidate, "select_question")
-    append_log(state, f"select_question → source={source}")
+    log_event(state, "select_question", "source={source}", source=source)
     return state
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from typing import List
+
+from app.agents.interviewer.utils.agent_log import DEBUG, log_event
+from app.agents.interviewer.utils.irt import calibration_for, irt_update, item_difficulty
+from app.agents.interviewer.utils.planner import update_plan
+from app.agents.interviewer.utils.sequential import sprt_decision
+from app.agents.interviewer.utils.skill_graph import share_weight
 from app.agents.interviewer.utils.state import (
     add_unique,
-    append_log,
-    summarise_skills,
+    refresh_skill_summaries,
     update_latest_history_entry,
 )
 from app.agents.interviewer.utils.stats import (
+    PRIOR_MEAN,
+    belief_model,
+    borrow_evidence,
     compute_uncertainty,
     effective_sample_count,
     ensure_prior,
@@ -32,35 +41,62 @@ def _belief_for_skill(state: InterviewState, skill: str):
     return belief
 
 
-def update_node(state: InterviewState) -> InterviewState:
-    """Update posterior belief for the current skill and derive verification status.
+def _apply_score(
+    state: InterviewState, skill: str, score: int, difficulty: float | None = None
+) -> List[str]:
+    """Fold one score into ``skill``'s belief and refresh its status.
 
-    This node:
-    1. Updates statistical measures for the skill based on latest grade
-    2. Marks skills as inactive if score is too low
-    3. Marks skills as verified if confidence threshold is met
-    4. Updates turn counter and logs the new state
+    With an IRT ``difficulty`` (logit ``b``) the bounds come from the ability
+    posterior instead of the Welford statistics. Returns the neighbours the
+    score was shared with.
     """
-    question: Question | None = state["current_question"]
-    grade = state["last_grade"]
-    assert question is not None and grade is not None
-
-    # Get current skill and update statistical measures
-    skill = question.skill
     beliefs = _belief_for_skill(state, skill)
-    welford_update(beliefs, float(grade.score))  # Update running statistics
-    compute_uncertainty(beliefs, state["z_value"])  # Refresh SE / LCB (and UCB)
+    welford_update(beliefs, float(score))  # Update running statistics
+    # Refresh SE / LCB (and UCB)
+    compute_uncertainty(
+        beliefs, state["z_value"], model=belief_model(state.get("selection_policy"))
+    )
+    if difficulty is not None:
+        irt_update(beliefs, difficulty, score, state["z_value"])
+        log_event(
+            state,
+            "irt",
+            "{skill}: b={b:.2f} theta={theta:.2f} sd={sd:.2f}",
+            level=DEBUG,
+            skill=skill,
+            b=difficulty,
+            theta=beliefs["theta"],
+            sd=beliefs["theta_sd"],
+        )
 
     # Mark skill as inactive if score is below threshold
-    if grade.score < 2:
+    if score < 2:
         add_unique(state["inactive_skills"], skill)
 
     # Check if skill meets verification criteria
-    verified = verify_status(
-        beliefs,
-        state["verification_threshold"],
-        state["min_questions_per_skill"],
-    )
+    if state.get("stopping_rule", "lcb") == "sprt":
+        decision, llr, bounds = sprt_decision(
+            beliefs, state["verification_threshold"], state["min_questions_per_skill"]
+        )
+        verified = decision == "verify"
+        if decision == "reject":
+            add_unique(state["inactive_skills"], skill)
+        log_event(
+            state,
+            "sprt",
+            "{skill}: llr={llr:.2f} bounds=[{futility:.2f}, {efficacy:.2f}] → {decision}",
+            skill=skill,
+            llr=llr,
+            futility=bounds.futility,
+            efficacy=bounds.efficacy,
+            decision=decision or "continue",
+        )
+    else:
+        verified = verify_status(
+            beliefs,
+            state["verification_threshold"],
+            state["min_questions_per_skill"],
+        )
     if verified:
         add_unique(state["verified_skills"], skill)
     else:
@@ -68,24 +104,102 @@ def update_node(state: InterviewState) -> InterviewState:
             s for s in state.get("verified_skills", []) if s != skill
         ]
 
-    # Increment turn counter and log updates
-    state["turn"] += 1
-    real_n = effective_sample_count(beliefs)
-    append_log(
+    log_event(
         state,
-        (
-            f"update → {skill}: n={real_n} mean={beliefs['mean']:.2f} "
-            f"SE={beliefs.get('se', 0.0):.3f} LCB={beliefs.get('lcb', 0.0):.2f}"
-        ),
+        "update",
+        "{skill}: n={n} mean={mean:.2f} SE={se:.3f} LCB={lcb:.2f}",
+        skill=skill,
+        n=effective_sample_count(beliefs),
+        mean=beliefs["mean"],
+        se=beliefs.get("se", 0.0),
+        lcb=beliefs.get("lcb", 0.0),
     )
-    append_log(
+    log_event(
         state,
-        f"status → verified={skill in state['verified_skills']} "
-        f"inactive={skill in state['inactive_skills']}",
+        "status",
+        "verified={verified} inactive={inactive}",
+        verified=skill in state["verified_skills"],
+        inactive=skill in state["inactive_skills"],
     )
+    return _share_evidence(state, skill, score)
+
+
+def _share_evidence(state: InterviewState, skill: str, score: int) -> List[str]:
+    """Pass down-weighted evidence from ``skill`` to its undecided neighbours.
+
+    Only bounds move: a neighbour's verification is re-checked when it is
+    next answered directly. IRT bounds come from the ability posterior, which
+    has no weighted observations, so nothing is shared under ``irt``.
+    """
+    links = state.get("skill_links", {}).get(skill, {})
+    if not links or state.get("difficulty_policy") == "irt":
+        return []
+    shared: List[str] = []
+    beliefs = state["belief_state"]
+    decided = set(state.get("verified_skills", [])) | set(state.get("inactive_skills", []))
+    source_prior = float(beliefs[skill].get("prior_mean", PRIOR_MEAN))
+    for neighbour, rho in links.items():
+        if neighbour in decided or neighbour not in beliefs:
+            continue
+        belief = _belief_for_skill(state, neighbour)
+        value = float(belief.get("prior_mean", PRIOR_MEAN)) + rho * (score - source_prior)
+        weight = share_weight(rho)
+        borrow_evidence(belief, value, weight)
+        shared.append(neighbour)
+        compute_uncertainty(
+            belief, state["z_value"], model=belief_model(state.get("selection_policy"))
+        )
+        log_event(
+            state,
+            "share",
+            "{skill}→{neighbour}: rho={rho:.2f} w={weight:.2f} x={value:.2f} "
+            "mean={mean:.2f} LCB={lcb:.2f}",
+            level=DEBUG,
+            skill=skill,
+            neighbour=neighbour,
+            rho=rho,
+            weight=weight,
+            value=value,
+            mean=belief["mean"],
+            lcb=belief["lcb"],
+        )
+    return shared
+
+
+def update_node(state: InterviewState) -> InterviewState:
+    """Update posterior belief for the current skill and derive verification status.
+
+    This node:
+    1. Updates statistical measures for the skill based on latest grade
+    2. Marks skills as inactive if score is too low
+    3. Marks skills as verified if confidence threshold is met
+    4. Updates turn counter and logs the new state
+
+    Multi-skill questions apply one update per graded skill in the same turn
+    (``grade.co_grades``); co-skills the grader did not score are left as is.
+    With ``planner`` the open skills are re-planned over the turns left.
+    """
+    question: Question | None = state["current_question"]
+    grade = state["last_grade"]
+    assert question is not None and grade is not None
+
+    difficulty = (
+        item_difficulty(calibration_for(state.get("item_version")), question)
+        if state.get("difficulty_policy") == "irt"
+        else None
+    )
+    changed = [question.skill, *_apply_score(state, question.skill, grade.score, difficulty)]
+    for co_skill in question.co_skills:
+        co_grade = grade.co_grades.get(co_skill)
+        if co_grade is not None:
+            changed += [co_skill, *_apply_score(state, co_skill, co_grade.score, difficulty)]
+
+    state["turn"] += 1
+    if state.get("planner"):
+        update_plan(state)
 
     update_latest_history_entry(state, state.get("last_answer"), grade)
 
-    # Update skill summaries for reporting
-    state["skill_summaries"] = summarise_skills(state)
+    # Refresh the summaries of the scored skills and the neighbours they shared with
+    refresh_skill_summaries(state, changed)
     return state
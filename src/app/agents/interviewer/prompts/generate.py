@@ -23,3 +23,24 @@ QUESTION_PROMPT = ChatPromptTemplate.from_template(
     Return only the question text.
     """
 )
+
+MULTI_SKILL_QUESTION_PROMPT = ChatPromptTemplate.from_template(
+    """
+    You are having a friendly technical conversation to learn about the candidate's experience with {skills}.
+
+    Difficulty: {difficulty} on a 1-5 scale (1=easy, 5=expert).
+    Previous question: {previous_question}
+    Previous answer summary: {previous_answer}
+    Recent turn history for these skills:
+    {recent_history}
+
+    Evidence from candidate profile:
+    {evidence_spans}
+
+    Ask ONE follow-up question whose answer naturally shows how the candidate uses {skills} together, so every one of these skills can be judged from the same answer. Do not ask a compound question with separate parts per skill. Keep the tone warm and collaborative.
+
+    The question should be concise and focused - something they can answer comfortably in under 3 minutes.
+
+    Return only the question text.
+    """
+)
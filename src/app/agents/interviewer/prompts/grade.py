@@ -33,3 +33,42 @@ GRADE_PROMPT = ChatPromptTemplate.from_template(
     Do not include any additional text outside the JSON object.
     """
 )
+
+MULTI_SKILL_GRADE_PROMPT = ChatPromptTemplate.from_template(
+    """
+    You are a rigorous technical examiner. One answer is used to assess several skills: {skills}.
+
+    Question (difficulty {difficulty}/5):
+    {question}
+
+    Candidate response:
+    {response}
+
+    Assess each skill separately, judging only the parts of the response that demonstrate that skill.
+    For every skill, score each aspect on a 1–5 scale and give a short note citing concrete evidence (or the lack of it):
+       - coverage: Does the answer address what the question asks of this skill?
+       - technical_depth: Are the skill's APIs, mechanisms, or implementation details described accurately? Require code-level insight for ≥4.
+       - evidence: Are there specific examples, metrics, trade-offs, or results for this skill? Without real evidence the score must be ≤3.
+       - communication: Is the explanation structured, precise, and does it note limitations or uncertainties?
+       Aspect guide: 1 = incorrect/off-topic, 2 = partial with major gaps, 3 = baseline accurate but light on detail, 4 = strong with concrete steps, 5 = exemplary and exhaustive.
+
+    If the response contains a factual or safety-critical error about a skill, set factual_error to true for that skill and score its aspects as 1.
+
+    Output strict JSON only (do NOT compute final scores), with one entry per skill in {skills}:
+    {{
+        "grades": [
+            {{
+                "skill": "<skill name>",
+                "reasoning": "<1-2 sentence justification>",
+                "factual_error": <true | false>,
+                "coverage": {{"score": <int>, "notes": "<coverage note>"}},
+                "technical_depth": {{"score": <int>, "notes": "<depth note>"}},
+                "evidence": {{"score": <int>, "notes": "<evidence note>"}},
+                "communication": {{"score": <int>, "notes": "<communication note>"}}
+            }}
+        ]
+    }}
+
+    Do not include any additional text outside the JSON object.
+    """
+)
@@ -0,0 +1,107 @@
+"""Structured, levelled agent log (``state["logs"]``).
+
+Nodes record typed events with ``log_event(state, node, template, **fields)``.
+An event is stored as ``{"level", "node", "turn", "msg", "fields"}``. The
+template is a constant and the fields are raw values, so recording formats
+nothing. Text is produced only when the log is viewed (``log_lines``: the SSE
+``state``/``done`` payloads and the Streamlit "Agent Logs" expander), and only
+for the lines shown. A line renders as ``"<node> → <template.format(**fields)>"``.
+The ``!j`` conversion joins a mapping as ``k:v, …`` or a sequence as ``a, b``.
+Plain strings, as written by older sessions, render unchanged.
+
+Levels:
+
+- ``DEBUG``: per-skill traces, such as UCB/Thompson scores, aspect
+  breakdowns, IRT levels and shared evidence.
+- ``INFO``: per-turn decisions.
+- ``WARNING``: degraded paths.
+
+``agent_log_level`` drops events below it before they are built.
+``agent_log_debug_sample`` keeps debug traces for that share of turns. The
+choice is made per (thread, turn), so a sampled turn keeps its whole trace.
+"""
+
+from __future__ import annotations
+
+import string
+import zlib
+from typing import Any, Iterable, List, Mapping, Optional, Union
+
+from app.core.config import get_settings
+from app.schema.models import InterviewState, LogEvent
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING}
+
+LogEntry = Union[str, LogEvent]
+
+
+class _Formatter(string.Formatter):
+    def convert_field(self, value: Any, conversion: Optional[str]) -> Any:
+        if conversion != "j":
+            return super().convert_field(value, conversion)
+        if isinstance(value, Mapping):
+            return ", ".join(f"{key}:{item}" for key, item in value.items())
+        return ", ".join(str(item) for item in value)
+
+
+_FORMATTER = _Formatter()
+
+
+def _threshold() -> int:
+    return LEVELS.get(get_settings().agent_log_level.lower(), DEBUG)
+
+
+def log_enabled(state: InterviewState, level: int) -> bool:
+    """Whether an event at ``level`` would be recorded for the current turn."""
+    if level < _threshold():
+        return False
+    if level == DEBUG:
+        rate = get_settings().agent_log_debug_sample
+        if rate < 1.0:
+            key = f"{state.get('thread_id', '')}:{state.get('turn', 0)}".encode()
+            return zlib.crc32(key) / 2**32 < rate
+    return True
+
+
+def log_event(
+    state: InterviewState, node: str, template: str, *, level: int = INFO, **fields: Any
+) -> None:
+    """Record one event; ``template`` is formatted with ``fields`` only when viewed."""
+    if not log_enabled(state, level):
+        return
+    state.setdefault("logs", []).append(
+        {
+            "level": level,
+            "node": node,
+            "turn": state.get("turn", 0),
+            "msg": template,
+            "fields": fields,
+        }
+    )
+
+
+def render(entry: LogEntry) -> str:
+    if isinstance(entry, str):
+        return entry
+    try:
+        text = _FORMATTER.format(entry["msg"], **entry["fields"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        text = f"{entry['msg']} {entry['fields']}"
+    return f"{entry['node']} → {text}"
+
+
+def entry_level(entry: LogEntry) -> int:
+    return INFO if isinstance(entry, str) else int(entry.get("level", INFO))
+
+
+def log_lines(
+    entries: Iterable[LogEntry], *, level: int = DEBUG, last: Optional[int] = None
+) -> List[str]:
+    """Render entries at or above ``level``; ``last`` renders only the newest ones."""
+    kept = [entry for entry in entries if entry_level(entry) >= level]
+    if last is not None:
+        kept = kept[-last:] if last > 0 else []
+    return [render(entry) for entry in kept]
@@ -0,0 +1,271 @@
+"""Array-backed belief store for large skill taxonomies.
+
+``belief_state`` is a dict of per-skill dicts, which is convenient to persist
+but costs a Python-level walk over every skill for each UCB pick and summary.
+``BeliefStore`` keeps the same statistics as NumPy columns behind a skill index
+so bounds and selection scores are computed in one vectorised pass, and keeps
+the total of real samples up to date incrementally.
+
+Conversion is lossless: ``BeliefStore.from_dict(beliefs).to_dict() == beliefs``
+— keys a belief did not have are not invented, integer counts stay integers and
+keys the store does not know about are carried through untouched. Beliefs still
+missing their prior are computed as if ``ensure_prior`` had run and exported
+unchanged until they are updated or refreshed.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.agents.interviewer.utils.stats import (
+    PRIOR_MEAN,
+    PRIOR_STRENGTH,
+    PRIOR_VARIANCE,
+    SE_FLOOR,
+    SE_FLOOR_MIN_REAL,
+)
+
+COLUMNS: Tuple[str, ...] = (
+    "n", "mean", "m2", "prior_var", "prior_n", "borrowed_n", "se", "lcb", "ucb"
+)
+_COLUMN_SET = frozenset(COLUMNS)
+_PRIOR_COLUMNS = ("n", "mean", "m2", "prior_var")
+
+
+class BeliefStore:
+    """Columnar n/mean/m2/prior_var/prior_n/borrowed_n/se/lcb/ucb arrays indexed by skill."""
+
+    def __init__(self, skills: Iterable[str] = (), capacity: int = 16) -> None:
+        self._index: Dict[str, int] = {}
+        self._skills: List[str] = []
+        self._capacity = max(1, capacity)
+        self._cols: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=np.float64) for name in COLUMNS
+        }
+        self._present: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=bool) for name in COLUMNS
+        }
+        self._int_n = np.zeros(self._capacity, dtype=bool)
+        self._extras: Dict[int, Dict] = {}
+        # Rows loaded without a prior: original dict, until first update/refresh.
+        self._raw: Dict[int, Dict] = {}
+        self._total_real = 0
+        for skill in skills:
+            self.add_skill(skill)
+
+    # ------------------------------------------------------------------ shape
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, skill: object) -> bool:
+        return skill in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._skills)
+
+    @property
+    def skills(self) -> List[str]:
+        return list(self._skills)
+
+    def index_of(self, skill: str) -> int:
+        return self._index[skill]
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of one column for the stored skills."""
+        view = self._cols[name][: len(self._skills)]
+        view.flags.writeable = False
+        return view
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for table in (self._cols, self._present):
+            for name, values in table.items():
+                grown = np.zeros(self._capacity, dtype=values.dtype)
+                grown[: values.size] = values
+                table[name] = grown
+        int_n = np.zeros(self._capacity, dtype=bool)
+        int_n[: self._int_n.size] = self._int_n
+        self._int_n = int_n
+
+    def add_skill(self, skill: str) -> int:
+        """Register ``skill`` with the prior pseudo-counts (no-op when present)."""
+        if skill in self._index:
+            return self._index[skill]
+        if len(self._skills) == self._capacity:
+            self._grow()
+        row = len(self._skills)
+        self._index[skill] = row
+        self._skills.append(skill)
+        self._set_prior(row)
+        return row
+
+    def _set_prior(self, row: int, mark: bool = True) -> None:
+        cols = self._cols
+        cols["n"][row] = PRIOR_STRENGTH
+        cols["mean"][row] = PRIOR_MEAN
+        cols["m2"][row] = PRIOR_STRENGTH * PRIOR_VARIANCE
+        if mark or not self._present["prior_var"][row]:
+            cols["prior_var"][row] = PRIOR_VARIANCE
+        if mark:
+            self._mark_primed(row)
+
+    def _mark_primed(self, row: int) -> None:
+        for name in _PRIOR_COLUMNS:
+            self._present[name][row] = True
+        self._int_n[row] = True
+        self._raw.pop(row, None)
+
+    # ------------------------------------------------------------ conversion
+    @classmethod
+    def from_dict(cls, beliefs: Dict[str, Dict]) -> "BeliefStore":
+        """Load the JSON-shaped ``belief_state`` without mutating it."""
+        count = len(beliefs)
+        store = cls(capacity=max(16, count))
+        values = list(beliefs.values())
+        store._skills = list(beliefs)
+        store._index = {skill: row for row, skill in enumerate(store._skills)}
+        for name in COLUMNS:
+            store._present[name][:count] = np.fromiter(
+                (name in belief for belief in values), dtype=bool, count=count
+            )
+            store._cols[name][:count] = np.fromiter(
+                (belief.get(name, 0.0) for belief in values), dtype=np.float64, count=count
+            )
+        store._int_n[:count] = np.fromiter(
+            (isinstance(belief.get("n"), int) for belief in values), dtype=bool, count=count
+        )
+        for row, belief in enumerate(values):
+            if not _COLUMN_SET.issuperset(belief):
+                store._extras[row] = {
+                    key: value for key, value in belief.items() if key not in _COLUMN_SET
+                }
+        for row in np.flatnonzero(store._cols["n"][:count] == 0).tolist():
+            store._raw[row] = dict(values[row])
+            store._set_prior(row, mark=False)
+        store._total_real = int(store.effective_counts().sum())
+        return store
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Export in the ``belief_state`` shape (only keys that were set)."""
+        out: Dict[str, Dict] = {}
+        for row, skill in enumerate(self._skills):
+            if row in self._raw:
+                out[skill] = dict(self._raw[row])
+                continue
+            belief: Dict = {}
+            for name in COLUMNS:
+                if self._present[name][row]:
+                    value = float(self._cols[name][row])
+                    belief[name] = int(value) if name == "n" and self._int_n[row] else value
+            belief.update(self._extras.get(row, {}))
+            out[skill] = belief
+        return out
+
+    # ------------------------------------------------------------ statistics
+    def _prior_counts(self, idx: slice | np.ndarray) -> np.ndarray:
+        """Per-row pseudo-counts (``prior_n`` when set, else the global strength)."""
+        return np.where(
+            self._present["prior_n"][idx], self._cols["prior_n"][idx], PRIOR_STRENGTH
+        )
+
+    def effective_counts(self) -> np.ndarray:
+        """Real samples beyond the prior pseudo-counts (``effective_sample_count``)."""
+        rows = slice(0, len(self._skills))
+        real = np.rint(self._cols["n"][rows] - self._prior_counts(rows))
+        return np.maximum(real, 0).astype(np.int64)
+
+    @property
+    def total_effective(self) -> int:
+        """Running ``total_effective_questions`` (updated by ``update``)."""
+        return self._total_real
+
+    def update(self, skill: str, score: float) -> None:
+        """Welford update of one skill, mirroring ``welford_update``."""
+        row = self.add_skill(skill)
+        cols = self._cols
+        if row in self._raw:
+            self._mark_primed(row)
+        prior_n = self._prior_counts(np.array([row]))[0]
+        before = max(0, int(round(cols["n"][row] - prior_n)))
+        n1 = cols["n"][row] + 1
+        delta = score - cols["mean"][row]
+        mean1 = cols["mean"][row] + delta / n1
+        cols["m2"][row] = max(cols["m2"][row] + delta * (score - mean1), 0.0)
+        cols["mean"][row] = mean1
+        cols["n"][row] = n1
+        self._total_real += max(0, int(round(n1 - prior_n))) - before
+
+    def refresh(
+        self, z: float, add_ucb: bool = True, rows: Optional[Sequence[int]] = None
+    ) -> None:
+        """Vectorised ``compute_uncertainty`` over ``rows`` (default: all skills)."""
+        idx = (
+            np.arange(len(self._skills))
+            if rows is None
+            else np.asarray(rows, dtype=np.int64)
+        )
+        cols, present = self._cols, self._present
+        if self._raw:
+            wanted = set(idx.tolist())
+            for row in [row for row in self._raw if row in wanted]:
+                self._mark_primed(row)
+        n = cols["n"][idx]
+        var = np.maximum(cols["m2"][idx] / np.maximum(n - 1, 1), 0.0)
+        se = np.sqrt(var / np.maximum(n, 1))
+        # Real answers only (``real_sample_count``); borrowed_n is 0 where unset.
+        real = np.maximum(np.rint(n - self._prior_counts(idx) - cols["borrowed_n"][idx]), 0)
+        se = np.where(real < SE_FLOOR_MIN_REAL, np.maximum(se, SE_FLOOR), se)
+        mean = cols["mean"][idx]
+        cols["se"][idx] = se
+        cols["lcb"][idx] = mean - z * se
+        present["se"][idx] = True
+        present["lcb"][idx] = True
+        if add_ucb:
+            cols["ucb"][idx] = mean + z * se
+            present["ucb"][idx] = True
+
+    def selection_scores(
+        self,
+        exploration_c: float,
+        mode: Literal["ucb1", "se"] = "ucb1",
+        boost: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Per-skill selection bound, as computed by ``select_skill_ucb_with_log``.
+
+        ``boost`` (one entry per skill) scales the exploration bonus by ``1 + boost``.
+        """
+        size = len(self._skills)
+        mean = self._cols["mean"][:size]
+        if mode == "se":
+            missing = ~self._present["se"][:size]
+            if missing.any():
+                self.refresh(1.96, add_ucb=False, rows=np.flatnonzero(missing))
+            exploration = exploration_c * self._cols["se"][:size]
+        else:
+            t = max(2, max(1, self._total_real) + 1)
+            real_n = np.maximum(self.effective_counts(), 1)
+            exploration = exploration_c * np.sqrt(math.log(t) / real_n)
+        if boost is not None:
+            exploration = exploration * (1.0 + boost)
+        return mean + exploration
+
+    def select(
+        self,
+        exploration_c: float,
+        mode: Literal["ucb1", "se"] = "ucb1",
+        exclude: Iterable[str] = (),
+        boost: Optional[np.ndarray] = None,
+    ) -> Tuple[str, float]:
+        """Skill with the highest selection bound (first one wins ties)."""
+        scores = self.selection_scores(exploration_c, mode, boost)
+        blocked = [self._index[skill] for skill in exclude if skill in self._index]
+        if blocked:
+            scores = scores.copy()
+            scores[blocked] = -np.inf
+        if not scores.size or not np.isfinite(scores).any():
+            raise ValueError("no selectable skills")
+        row = int(np.argmax(scores))
+        return self._skills[row], float(scores[row])
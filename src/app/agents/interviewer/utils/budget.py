@@ -0,0 +1,178 @@
+"""Per-session token and dollar budget (``token_budget`` / ``cost_budget``).
+
+Every LLM call made for a session is metered. ``StructuredLLM`` reads the
+provider's usage metadata and, when the provider reports none (the
+simulator's scripted model, some JSON-mode endpoints), estimates about four
+characters per token from the prompt and the parsed result. Calls are booked
+in ``state["spend"]`` by kind — ``question`` (seed and follow-up drafting),
+``grade`` (adaptive extra samples included) and ``simulate_answer`` — and
+priced at ``llm_input_cost_per_1k`` / ``llm_output_cost_per_1k``.
+
+The next turn's expected spend comes from the session's own averages: tokens
+per drafting call, grading tokens per graded turn and, once the simulated
+candidate has been used, tokens per simulated answer (``budget_*_tokens``
+until a kind has been observed). A pooled question costs no drafting call,
+so the cheapest turn is a grade alone. With a budget set:
+
+- while what is left covers fewer than ``budget_tight_turns`` drafted turns
+  the session is *tight*: selection prefers skills with a pooled question,
+  multi-skill drafting is skipped and adaptive grading draws no extra
+  samples;
+- the planner's horizon is capped at the turns the budget can still pay for,
+  so skills that cannot verify before the money runs out are skipped;
+- once the cheapest turn no longer fits the interview ends with
+  "budget exhausted".
+
+Budgets are checked between calls, so a session can overrun by at most the
+calls of the turn in flight.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+from app.schema.models import InterviewState
+
+CHARS_PER_TOKEN = 4
+
+
+class Usage(NamedTuple):
+    input_tokens: int
+    output_tokens: int
+    estimated: bool = False
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count of a prompt or result (about four characters per token)."""
+    if isinstance(value, BaseModel):
+        text = value.model_dump_json()
+    elif isinstance(value, str):
+        text = value
+    else:
+        text = str(value)
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def call_usage(reported: Mapping[str, Mapping[str, Any]], prompt: Any, result: Any) -> Usage:
+    """Provider usage summed over models, or an estimate when none was reported."""
+    input_tokens = sum(int(usage.get("input_tokens", 0)) for usage in reported.values())
+    output_tokens = sum(int(usage.get("output_tokens", 0)) for usage in reported.values())
+    if input_tokens or output_tokens:
+        return Usage(input_tokens, output_tokens)
+    return Usage(estimate_tokens(prompt), estimate_tokens(result), estimated=True)
+
+
+def usage_cost(usage: Usage) -> float:
+    settings = get_settings()
+    return (
+        usage.input_tokens * settings.llm_input_cost_per_1k
+        + usage.output_tokens * settings.llm_output_cost_per_1k
+    ) / 1000.0
+
+
+def record_spend(state: InterviewState, kind: str, usage: Usage) -> None:
+    """Book one call of ``kind`` against the session."""
+    row = state.setdefault("spend", {}).setdefault(
+        kind, {"calls": 0, "input_tokens": 0, "output_tokens": 0, "estimated": 0, "cost": 0.0}
+    )
+    row["calls"] += 1
+    row["input_tokens"] += usage.input_tokens
+    row["output_tokens"] += usage.output_tokens
+    row["estimated"] += int(usage.estimated)
+    row["cost"] = round(row["cost"] + usage_cost(usage), 8)
+
+
+def spend_recorder(state: InterviewState, kind: str) -> Callable[[Usage], None]:
+    """``on_usage`` callback for ``StructuredLLM`` that books calls as ``kind``."""
+    return partial(record_spend, state, kind)
+
+
+def spend_totals(state: InterviewState) -> Dict[str, Any]:
+    rows = (state.get("spend") or {}).values()
+    input_tokens = sum(row["input_tokens"] for row in rows)
+    output_tokens = sum(row["output_tokens"] for row in rows)
+    return {
+        "calls": sum(row["calls"] for row in rows),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "tokens": input_tokens + output_tokens,
+        "cost": round(sum(row["cost"] for row in rows), 6),
+    }
+
+
+def has_budget(state: InterviewState) -> bool:
+    return bool(state.get("token_budget") or state.get("cost_budget"))
+
+
+def _expected(state: InterviewState, kind: str) -> Tuple[float, float]:
+    """Expected ``(tokens, cost)`` of one ``kind`` step in this session."""
+    settings = get_settings()
+    row = (state.get("spend") or {}).get(kind)
+    if kind == "grade":
+        # Per graded turn, so adaptive extras and pre-graded turns are averaged in.
+        turns = int(state.get("turn", 0))
+        if row and turns:
+            return (row["input_tokens"] + row["output_tokens"]) / turns, row["cost"] / turns
+        tokens = float(settings.budget_grade_tokens)
+    elif row and row["calls"]:
+        calls = row["calls"]
+        return (row["input_tokens"] + row["output_tokens"]) / calls, row["cost"] / calls
+    elif kind == "question":
+        tokens = float(settings.budget_question_tokens)
+    else:
+        return 0.0, 0.0
+    return tokens, tokens * settings.llm_input_cost_per_1k / 1000.0
+
+
+def expected_turn(state: InterviewState, *, drafted: bool = True) -> Tuple[float, float]:
+    """Expected ``(tokens, cost)`` of the next turn; ``drafted=False`` for a pooled question."""
+    kinds = ["grade", "simulate_answer"] + (["question"] if drafted else [])
+    steps = [_expected(state, kind) for kind in kinds]
+    return sum(tokens for tokens, _ in steps), sum(cost for _, cost in steps)
+
+
+def affordable_turns(state: InterviewState, *, drafted: bool = True) -> Optional[int]:
+    """Turns the remaining budget pays for, or ``None`` without a budget."""
+    if not has_budget(state):
+        return None
+    totals = spend_totals(state)
+    per_tokens, per_cost = expected_turn(state, drafted=drafted)
+    limits = []
+    if state.get("token_budget"):
+        left = int(state["token_budget"]) - totals["tokens"]
+        limits.append(left / per_tokens if per_tokens > 0 else math.inf)
+    if state.get("cost_budget"):
+        left_cost = float(state["cost_budget"]) - totals["cost"]
+        limits.append(left_cost / per_cost if per_cost > 0 else math.inf)
+    turns = min(limits)
+    return max(int(turns), 0) if math.isfinite(turns) else int(state.get("max_turns", 0))
+
+
+def budget_tight(state: InterviewState) -> bool:
+    turns = affordable_turns(state, drafted=True)
+    return turns is not None and turns < get_settings().budget_tight_turns
+
+
+def budget_exhausted(state: InterviewState) -> bool:
+    turns = affordable_turns(state, drafted=False)
+    return turns is not None and turns < 1
+
+
+def spend_report(state: InterviewState) -> Dict[str, Any]:
+    """Spend so far, per kind, against the session's budget (``done`` payload)."""
+    totals = spend_totals(state)
+    token_budget = state.get("token_budget")
+    cost_budget = state.get("cost_budget")
+    return {
+        **totals,
+        "by_kind": {kind: dict(row) for kind, row in (state.get("spend") or {}).items()},
+        "token_budget": token_budget,
+        "cost_budget": cost_budget,
+        "tokens_left": token_budget - totals["tokens"] if token_budget else None,
+        "cost_left": round(cost_budget - totals["cost"], 6) if cost_budget else None,
+    }
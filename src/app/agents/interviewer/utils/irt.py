@@ -0,0 +1,160 @@
+"""Item response theory for difficulty-aware grading (``difficulty_policy: "irt"``).
+
+Grades are modelled with a Rasch-type binomial model: ``score - 1`` is
+Binomial(4, p) with ``p = sigmoid(theta - b)``, where ``theta`` is the
+candidate's ability on the skill and ``b`` the question's difficulty on the
+same logit scale. Nominal difficulty levels map to ``b = (level - 3) *
+LEVEL_STEP`` until ``app.jobs.calibrate_items`` publishes fitted values for the
+levels and for individual bank questions.
+
+- Ability: expected a posteriori (EAP) estimate on a fixed ``theta`` grid
+  under a Normal prior centred on the belief's prior mean. The observations
+  ``(b, score)`` are kept on the belief (``irt_obs``) so the posterior is exact.
+- Bounds: ``se``/``lcb``/``ucb`` are reported on the 1..5 score scale as the
+  expected score at reference difficulty (level 3, ``b = 0``), so the
+  verification threshold keeps its meaning; the Welford fields stay as-is.
+- Difficulty: the level (or bank question) with the largest posterior-expected
+  Fisher information ``4 p (1 - p)``, i.e. the question whose outcome is least
+  predictable for this candidate.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.agents.interviewer.utils.stats import PRIOR_MEAN
+from app.schema.models import Question
+from app.storage.answer_index import question_key
+from app.storage.items import load_items
+
+GRADE_STEPS = 4
+LEVEL_STEP = 1.0
+THETA_PRIOR_SD = 1.5
+THETA_GRID = np.linspace(-5.0, 5.0, 101)
+# A bank question is reused when it carries at least this share of the
+# information of the best freshly drafted level (reuse saves an LLM call).
+BANK_MIN_INFO_RATIO = 0.8
+LEVELS = (1, 2, 3, 4, 5)
+
+_LOG_BINOMIAL = np.log([math.comb(GRADE_STEPS, k) for k in range(GRADE_STEPS + 1)])
+
+
+class ItemCalibration(NamedTuple):
+    """Difficulty (logit ``b``) per nominal level and per calibrated bank question."""
+
+    levels: Dict[int, float]
+    items: Dict[str, float]
+    version: Optional[int] = None
+
+
+NOMINAL = ItemCalibration({level: (level - 3) * LEVEL_STEP for level in LEVELS}, {})
+
+
+def item_key(skill: str, text: str) -> str:
+    """Stable bank key for a question (skill plus normalised text)."""
+    return f"{skill}:{question_key(text)}"
+
+
+@lru_cache(maxsize=8)
+def _calibration(version: int) -> ItemCalibration:
+    _, levels, items = load_items(version)
+    return ItemCalibration({**NOMINAL.levels, **levels}, items, version)
+
+
+def calibration_for(version: Optional[int]) -> ItemCalibration:
+    """Calibration the session started with (nominal levels without one)."""
+    return NOMINAL if version is None else _calibration(int(version))
+
+
+def clear_calibration_cache() -> None:
+    _calibration.cache_clear()
+
+
+def item_difficulty(calibration: ItemCalibration, question: Question) -> float:
+    """Calibrated ``b`` of ``question``, falling back to its nominal level."""
+    calibrated = calibration.items.get(item_key(question.skill, question.text))
+    if calibrated is not None:
+        return calibrated
+    return calibration.levels.get(question.difficulty, (question.difficulty - 3) * LEVEL_STEP)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def expected_score(theta: float) -> float:
+    """Expected grade at reference difficulty for ability ``theta``."""
+    return 1.0 + GRADE_STEPS / (1.0 + math.exp(-theta))
+
+
+def _theta_prior_mean(belief: Dict) -> float:
+    share = (float(belief.get("prior_mean", PRIOR_MEAN)) - 1.0) / GRADE_STEPS
+    share = min(max(share, 0.02), 0.98)
+    return math.log(share / (1.0 - share))
+
+
+def log_likelihood(grid: np.ndarray, b: float, score: int) -> np.ndarray:
+    """Log-probability of ``score`` at every ability on ``grid``."""
+    k = min(max(int(score), 1), GRADE_STEPS + 1) - 1
+    p = np.clip(_sigmoid(grid - b), 1e-9, 1.0 - 1e-9)
+    return _LOG_BINOMIAL[k] + k * np.log(p) + (GRADE_STEPS - k) * np.log1p(-p)
+
+
+def _posterior(belief: Dict) -> np.ndarray:
+    log_post = -0.5 * ((THETA_GRID - _theta_prior_mean(belief)) / THETA_PRIOR_SD) ** 2
+    for b, score in belief.get("irt_obs", []):
+        log_post = log_post + log_likelihood(THETA_GRID, float(b), int(score))
+    weights = np.exp(log_post - log_post.max())
+    return weights / weights.sum()
+
+
+def irt_posterior(belief: Dict) -> Tuple[float, float]:
+    """EAP ability estimate and posterior standard deviation."""
+    weights = _posterior(belief)
+    mean = float(weights @ THETA_GRID)
+    sd = float(np.sqrt(weights @ (THETA_GRID - mean) ** 2))
+    return mean, sd
+
+
+def irt_update(belief: Dict, b: float, score: int, z: float) -> None:
+    """Record one graded answer at difficulty ``b`` and refresh the IRT bounds."""
+    belief.setdefault("irt_obs", []).append([float(b), int(score)])
+    theta, theta_sd = irt_posterior(belief)
+    slope = GRADE_STEPS * math.exp(-theta) / (1.0 + math.exp(-theta)) ** 2
+    belief["theta"] = theta
+    belief["theta_sd"] = theta_sd
+    belief["se"] = slope * theta_sd
+    belief["lcb"] = expected_score(theta - z * theta_sd)
+    belief["ucb"] = expected_score(theta + z * theta_sd)
+
+
+def expected_information(belief: Dict, b: float) -> float:
+    """Fisher information of a question at ``b``, averaged over the posterior."""
+    p = _sigmoid(THETA_GRID - b)
+    return float(_posterior(belief) @ (GRADE_STEPS * p * (1.0 - p)))
+
+
+def best_level(belief: Dict, calibration: ItemCalibration) -> Tuple[int, float]:
+    """Nominal difficulty level with the most expected information."""
+    scored = [
+        (expected_information(belief, calibration.levels[level]), level) for level in LEVELS
+    ]
+    info, level = max(scored)
+    return level, info
+
+
+def best_bank_item(
+    belief: Dict, calibration: ItemCalibration, questions: Iterable[Question]
+) -> Optional[Tuple[int, float]]:
+    """Index and information of the most informative question in ``questions``."""
+    best: Optional[Tuple[int, float]] = None
+    for idx, question in enumerate(questions):
+        info = expected_information(belief, item_difficulty(calibration, question))
+        if best is None or info > best[1]:
+            best = (idx, info)
+    return best
+
@@ -0,0 +1,188 @@
+"""Budget-aware lookahead over the remaining turns (``planner: true``).
+
+UCB picks one turn at a time and ignores ``max_turns``. After every update the
+planner simulates the rest of the interview for each open skill as if every
+remaining turn went to it, which bounds what that skill can still achieve:
+
+- future grades: a per-rollout true mean drawn from Normal(mean, sd² / m),
+  then answers from Normal(true mean, sd²), rounded and clipped to 1..5, where
+  ``sd`` is the belief's spread (floored at the prior's) and ``m`` the
+  evidence beyond the prior (at least 1);
+- the production rules, vectorised: Welford updates, the normal LCB with its
+  SE floor (or the SPRT efficacy boundary under ``stopping_rule: "sprt"``),
+  ``min_questions_per_skill``, and a grade below 2 ending the skill.
+
+All skills and rollouts advance together as ``skills × rollouts`` arrays, one
+step per remaining turn. Per skill the plan records ``p_verify``, the share of
+rollouts that verify within the budget, and ``needed``, the median number of
+questions those rollouts took. Skills with ``p_verify`` below
+``planner_min_p_verify`` and at least ``min_questions_per_skill`` answers are
+hopeless (the prior alone never writes a skill off): selection skips them,
+and once every open skill is hopeless the interview ends, since no further
+answer can change which skills are verified. With a token or cost budget the
+horizon is the turns the budget still pays for, if fewer. Thompson (NIG) and IRT bounds are approximated by
+the normal LCB.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set
+
+import numpy as np
+
+from app.agents.interviewer.utils.agent_log import log_event
+from app.agents.interviewer.utils.budget import affordable_turns
+from app.agents.interviewer.utils.sequential import sprt_bounds
+from app.agents.interviewer.utils.stats import (
+    PRIOR_MEAN,
+    PRIOR_VARIANCE,
+    SE_FLOOR,
+    SE_FLOOR_MIN_REAL,
+    ensure_prior,
+    prior_strength,
+    real_sample_count,
+)
+from app.core.config import get_settings
+from app.schema.models import InterviewState
+
+
+class SkillPlan(NamedTuple):
+    """Chance to verify within the budget and median questions it takes."""
+
+    p_verify: float
+    needed: Optional[int]
+
+
+def _column(
+    beliefs: Dict[str, Dict], skills: Sequence[str], key: str, default: float = 0.0
+) -> np.ndarray:
+    return np.array([[float(beliefs[skill].get(key, default))] for skill in skills])
+
+
+def rollout_plan(
+    beliefs: Dict[str, Dict],
+    *,
+    remaining: int,
+    threshold: float,
+    z: float,
+    min_q: int,
+    rng: np.random.Generator,
+    rollouts: int = 256,
+    stopping_rule: str = "lcb",
+) -> Dict[str, SkillPlan]:
+    """Monte-Carlo plan for ``beliefs`` over ``remaining`` turns."""
+    skills = list(beliefs)
+    if not skills:
+        return {}
+    if remaining <= 0:
+        return {skill: SkillPlan(0.0, None) for skill in skills}
+    for belief in beliefs.values():
+        ensure_prior(belief)
+    n = np.repeat(_column(beliefs, skills, "n"), rollouts, axis=1)
+    mean = np.repeat(_column(beliefs, skills, "mean"), rollouts, axis=1)
+    m2 = np.repeat(_column(beliefs, skills, "m2"), rollouts, axis=1)
+    k0 = np.array([[prior_strength(beliefs[skill])] for skill in skills])
+    borrowed = _column(beliefs, skills, "borrowed_n", 0.0)
+    prior_mean = _column(beliefs, skills, "prior_mean", PRIOR_MEAN)
+    prior_sd = np.sqrt(_column(beliefs, skills, "prior_var", PRIOR_VARIANCE))
+
+    var = m2[:, :1] / np.maximum(n[:, :1] - 1.0, 1.0)
+    spread = np.maximum(np.sqrt(var), prior_sd)
+    se = spread / np.sqrt(np.maximum(n[:, :1] - k0, 1.0))
+    truth = rng.normal(mean, np.broadcast_to(se, mean.shape))
+
+    settings = get_settings()
+    sprt = stopping_rule == "sprt"
+    efficacy = sprt_bounds(settings.sprt_alpha, settings.sprt_beta).efficacy if sprt else 0.0
+    open_ = np.ones_like(n, dtype=bool)
+    first = np.full(n.shape, -1, dtype=np.int64)
+    for step in range(1, remaining + 1):
+        score = np.clip(np.rint(rng.normal(truth, spread)), 1.0, 5.0)
+        n1 = n + 1.0
+        delta = score - mean
+        mean1 = mean + delta / n1
+        m2 = np.where(open_, np.maximum(m2 + delta * (score - mean1), 0.0), m2)
+        mean = np.where(open_, mean1, mean)
+        n = np.where(open_, n1, n)
+
+        real = np.rint(n - k0 - borrowed)
+        if sprt:
+            count = n - k0
+            data_mean = (n * mean - k0 * prior_mean) / np.maximum(count, 1e-9)
+            llr = (
+                settings.sprt_delta
+                / settings.sprt_sigma**2
+                * count
+                * (data_mean - threshold)
+            )
+            verified = llr >= efficacy
+        else:
+            se_now = np.sqrt(np.maximum(m2 / np.maximum(n - 1.0, 1.0), 0.0) / n)
+            se_now = np.where(real < SE_FLOOR_MIN_REAL, np.maximum(se_now, SE_FLOOR), se_now)
+            verified = mean - z * se_now >= threshold
+        verified &= open_ & (real >= min_q)
+        first[verified] = step
+        open_ &= ~verified & (score >= 2.0)
+        if not open_.any():
+            break
+
+    plans: Dict[str, SkillPlan] = {}
+    for row, skill in enumerate(skills):
+        hits = first[row][first[row] > 0]
+        plans[skill] = SkillPlan(
+            round(hits.size / rollouts, 4),
+            int(math.ceil(float(np.median(hits)))) if hits.size else None,
+        )
+    return plans
+
+
+def open_skills(state: InterviewState) -> List[str]:
+    decided = set(state.get("verified_skills", [])) | set(state.get("inactive_skills", []))
+    return [skill for skill in state.get("skills", []) if skill not in decided]
+
+
+def update_plan(state: InterviewState) -> None:
+    """Re-plan the open skills after an update and log the result (``state["plan"]``)."""
+    settings = get_settings()
+    remaining = int(state["max_turns"]) - int(state.get("turn", 0))
+    affordable = affordable_turns(state, drafted=False)
+    if affordable is not None:
+        remaining = min(remaining, affordable)
+    skills = open_skills(state)
+    # Seeded from the thread and turn so a replayed session plans identically.
+    seed = zlib.crc32(f"{state.get('thread_id', '')}:{state.get('turn', 0)}".encode())
+    plans = rollout_plan(
+        {skill: state["belief_state"][skill] for skill in skills},
+        remaining=remaining,
+        threshold=float(state["verification_threshold"]),
+        z=float(state["z_value"]),
+        min_q=int(state["min_questions_per_skill"]),
+        rng=np.random.default_rng(seed),
+        rollouts=settings.planner_rollouts,
+        stopping_rule=state.get("stopping_rule", "lcb"),
+    )
+    state["plan"] = {skill: plan._asdict() for skill, plan in plans.items()}
+    log_event(
+        state,
+        "plan",
+        "remaining={remaining} p_verify={p_verify!j} needed={needed!j}",
+        remaining=remaining,
+        p_verify={skill: plan.p_verify for skill, plan in plans.items()},
+        needed={skill: plan.needed for skill, plan in plans.items()},
+    )
+
+
+def hopeless_skills(state: InterviewState) -> Set[str]:
+    """Answered open skills the last plan gives less than ``planner_min_p_verify``."""
+    plan = state.get("plan") or {}
+    floor = get_settings().planner_min_p_verify
+    min_q = int(state.get("min_questions_per_skill", 1))
+    beliefs = state.get("belief_state", {})
+    return {
+        skill
+        for skill, row in plan.items()
+        if float(row["p_verify"]) < floor
+        and real_sample_count(beliefs.get(skill, {})) >= min_q
+    }
@@ -0,0 +1,141 @@
+"""Cheap in-process screening for answers that do not need an LLM grade.
+
+Only clear-cut failures are decided here — empty answers, short refusals, the
+question or the candidate's own profile evidence pasted back, and filler replies with no substantive terms at all.
+Everything else returns ``None`` and goes to the LLM grader. One-word answers
+such as "DataLoader." are deliberately left to the LLM: lexically they cannot
+be told apart from an off-topic word. Precision matters more than recall: a false rejection costs
+the candidate a score of 1, a miss only costs one LLM call.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, NamedTuple, Optional, Set
+
+from app.schema.models import AspectBreakdown, Grade, Question
+
+_TOKEN_RE = re.compile(r"[a-z0-9_][a-z0-9_+#]*")
+
+_STOPWORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been
+    before being below between both but by can could did do does doing down
+    during each few for from further had has have having he her here hers him
+    his how i if in into is it its itself just let me more most my myself no nor
+    not now of off on once only or other our ours out over own please same she
+    should so some such sure than that the their them then there these they
+    this those through to too under until up us very was we were what when where
+    which while who whom why will with would yes you your yours answer question
+    tell describe explain walk through okay ok well sorry honestly unfortunately
+    """.split()
+)
+
+_REFUSAL_RE = re.compile(
+    r"""^\W*(
+        i\s*(really\s+)?(do\s*n[o']?t|dont|don't)\s+know
+      | i(\s+have|'?ve)\s+no\s+(idea|clue)
+      | no\s+(idea|clue)
+      | i\s+(have|'ve)\s+never\s+(used|worked\s+with|heard\s+of)
+      | i\s+can'?t\s+(answer|remember)
+    )\b""",
+    re.IGNORECASE | re.VERBOSE,
+)
+# Refusals and hedges open real answers too ("Not sure, maybe batch norm",
+# "No idea, probably gradient clipping"), so they only count when nothing
+# follows them but terms from the question ("I have never used PyTorch.").
+_HEDGE_RE = re.compile(r"^\W*(i'?m\s+not\s+sure|not\s+sure|unsure)\b", re.IGNORECASE)
+# Single words that also start answers ("Skip connections ...", "N/A handling
+# with fillna") count only as the whole answer.
+_BARE_REFUSAL_RE = re.compile(r"^\W*(pass|skip|n/?a|idk|dunno)\W*$", re.IGNORECASE)
+
+_ECHO_MIN_OVERLAP = 0.9
+# An echo restates the source: picking one option out of the question ("A
+# set.", "DistributedDataParallel.") is an answer, not an echo.
+_ECHO_MIN_TERMS = 5
+_ECHO_MAX_LENGTH_RATIO = 1.2
+
+_NOTES = {
+    "empty": "No answer was provided.",
+    "refusal": "The candidate declined to answer or said they do not know.",
+    "question_echo": "The answer repeats the question without adding content.",
+    "evidence_echo": "The answer restates the profile claim without demonstrating it.",
+    "no_content": "The answer contains no substantive content.",
+}
+
+
+class Pregrade(NamedTuple):
+    reason: str
+    grade: Grade
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _content(tokens: Iterable[str]) -> list[str]:
+    return [token for token in tokens if token not in _STOPWORDS]
+
+
+def _echoes(answer_terms: list[str], source_terms: list[str]) -> bool:
+    """True when the answer is (nearly) just the source text pasted back.
+
+    The answer must repeat at least ``_ECHO_MIN_TERMS`` of the source's
+    terms, or all of them when the source has fewer.
+    """
+    if not answer_terms or not source_terms:
+        return False
+    vocab: Set[str] = set(source_terms)
+    repeated = vocab.intersection(answer_terms)
+    if len(repeated) < min(_ECHO_MIN_TERMS, len(vocab)):
+        return False
+    overlap = sum(1 for term in answer_terms if term in vocab) / len(answer_terms)
+    return (
+        overlap >= _ECHO_MIN_OVERLAP
+        and len(answer_terms) <= _ECHO_MAX_LENGTH_RATIO * len(source_terms)
+    )
+
+
+def _screen(question: Question, answer: str, evidence: Iterable[str]) -> Optional[str]:
+    stripped = answer.strip()
+    if not stripped:
+        return "empty"
+
+    tokens = _tokens(stripped)
+    if not tokens:
+        return "empty"
+    if _BARE_REFUSAL_RE.match(stripped):
+        return "refusal"
+    question_terms = _content(_tokens(question.text))
+    for pattern in (_HEDGE_RE, _REFUSAL_RE):
+        opening = pattern.match(stripped)
+        if opening is not None:
+            trailing = _content(_tokens(stripped[opening.end():]))
+            if set(trailing) <= set(question_terms):
+                return "refusal"
+
+    answer_terms = _content(tokens)
+    if _echoes(answer_terms, question_terms):
+        return "question_echo"
+    if any(_echoes(answer_terms, _content(_tokens(span))) for span in evidence):
+        return "evidence_echo"
+
+    if not answer_terms:
+        return "no_content"
+    return None
+
+
+def pregrade_answer(
+    question: Question, answer: Optional[str], evidence: Iterable[str] = ()
+) -> Optional[Pregrade]:
+    """Return a templated score-1 grade for clear-cut answers, else None."""
+    reason = _screen(question, answer or "", evidence)
+    if reason is None:
+        return None
+    note = _NOTES[reason]
+    aspects = {
+        name: AspectBreakdown(score=1, notes=note)
+        for name in ("coverage", "technical_depth", "evidence", "communication")
+    }
+    grade = Grade(score=1, reasoning=f"Pre-graded ({reason}): {note}", aspects=aspects)
+    return Pregrade(reason=reason, grade=grade)
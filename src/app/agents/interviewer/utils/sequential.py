@@ -0,0 +1,86 @@
+"""Wald sequential probability ratio test (SPRT) per skill.
+
+Alternative to the LCB verification rule (``stopping_rule: "sprt"``). Each
+skill tests
+
+    H0: mu = threshold - delta / 2   (below the bar)
+    H1: mu = threshold + delta / 2   (at or above the bar)
+
+with grades treated as Normal(mu, sigma^2), ``delta`` the indifference region
+and ``sigma`` the per-answer grading spread. The log-likelihood ratio after
+``n`` answers with mean ``x̄`` is ``delta / sigma^2 * n * (x̄ - threshold)``.
+
+- efficacy: LLR >= log((1 - beta) / alpha) → verify; ``alpha`` bounds the
+  rate at which a skill at ``threshold - delta / 2`` is verified;
+- futility: LLR <= log(beta / (1 - alpha)) → reject (inactive); ``beta``
+  bounds the rate at which a skill at ``threshold + delta / 2`` is rejected.
+
+Evidence is everything beyond the prior pseudo-observations, so warm-start
+evidence counts with its decayed weight. Neither boundary is applied before
+``min_questions_per_skill`` answers; evidence borrowed through the skill graph
+moves the LLR but is not an answer.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Literal, NamedTuple, Optional, Tuple
+
+from app.agents.interviewer.utils.stats import (
+    PRIOR_MEAN,
+    ensure_prior,
+    prior_strength,
+    real_sample_count,
+)
+from app.core.config import get_settings
+
+StoppingRule = Literal["lcb", "sprt"]
+Decision = Literal["verify", "reject"]
+
+
+class SprtBounds(NamedTuple):
+    """LLR boundaries: reject at or below ``futility``, verify at or above ``efficacy``."""
+
+    futility: float
+    efficacy: float
+
+
+def sprt_bounds(alpha: float, beta: float) -> SprtBounds:
+    """Wald's approximate boundaries for error rates ``alpha`` and ``beta``."""
+    if not (0.0 < alpha < 1.0 and 0.0 < beta < 1.0):
+        raise ValueError("SPRT error rates must lie in (0, 1)")
+    return SprtBounds(math.log(beta / (1.0 - alpha)), math.log((1.0 - beta) / alpha))
+
+
+def data_summary(belief: Dict) -> Tuple[float, float]:
+    """``(count, mean)`` of the evidence beyond the prior pseudo-observations."""
+    ensure_prior(belief)
+    n = float(belief["n"])
+    k0 = prior_strength(belief)
+    count = n - k0
+    if count <= 1e-9:
+        return 0.0, float(belief.get("prior_mean", PRIOR_MEAN))
+    mean = (n * float(belief["mean"]) - k0 * float(belief.get("prior_mean", PRIOR_MEAN))) / count
+    return count, mean
+
+
+def sprt_llr(belief: Dict, threshold: float, delta: float, sigma: float) -> float:
+    """Log-likelihood ratio of H1 (at the bar) against H0 (below it)."""
+    count, mean = data_summary(belief)
+    return delta / (sigma * sigma) * count * (mean - threshold)
+
+
+def sprt_decision(
+    belief: Dict, threshold: float, min_samples: int
+) -> Tuple[Optional[Decision], float, SprtBounds]:
+    """Return ``(decision, llr, bounds)`` under the configured SPRT settings."""
+    settings = get_settings()
+    bounds = sprt_bounds(settings.sprt_alpha, settings.sprt_beta)
+    llr = sprt_llr(belief, threshold, settings.sprt_delta, settings.sprt_sigma)
+    decision: Optional[Decision] = None
+    if real_sample_count(belief) >= min_samples:
+        if llr >= bounds.efficacy:
+            decision = "verify"
+        elif llr <= bounds.futility:
+            decision = "reject"
+    return decision, llr, bounds
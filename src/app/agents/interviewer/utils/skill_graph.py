@@ -0,0 +1,147 @@
+"""Skill-correlation graph: evidence on one skill informs related skills.
+
+Edges carry a weight ``rho`` in (0, 1], read as the correlation between the
+two skills' abilities. They come from the latest ``skill_links`` version
+learned by ``app.jobs.fit_skill_graph`` plus an optional hand-authored JSON
+file (``skill_graph_path``: a list of ``[skill_a, skill_b, rho]`` triples, which
+override learned edges). The global graph is held in compressed sparse row
+form; a session keeps only the edges among its own skills (``skill_links``).
+
+After a graded answer ``x`` on skill ``a``, each undecided neighbour ``b``
+receives one pseudo-observation at the regression estimate
+``prior_b + rho * (x - prior_a)`` with weight ``skill_graph_strength * rho**2``
+(the share of ``b``'s variance that ``a`` explains). Neighbours are never
+verified by borrowed evidence alone; it only moves their bounds until they
+are asked. Nothing is shared under ``difficulty_policy: "irt"``, whose bounds
+come from the ability posterior. UCB selection scales a skill's exploration
+bonus by ``1 + spillover``, the borrowing weight its answer would send to
+open neighbours, so skills whose answers say more are probed first.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.storage.skill_links import latest_links_version, load_links
+
+Edge = Tuple[str, str, float]
+SkillLinks = Dict[str, Dict[str, float]]
+
+
+class SkillGraph:
+    """Symmetric sparse skill graph in compressed sparse row form."""
+
+    def __init__(
+        self,
+        skills: Sequence[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        version: Optional[int] = None,
+    ) -> None:
+        self.skills = list(skills)
+        self.index = {skill: row for row, skill in enumerate(self.skills)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.version = version
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge], version: Optional[int] = None) -> "SkillGraph":
+        """Build from undirected edges; a repeated pair keeps its last weight."""
+        pairs: Dict[Tuple[str, str], float] = {}
+        for skill_a, skill_b, weight in edges:
+            if skill_a == skill_b:
+                continue
+            if not 0.0 < float(weight) <= 1.0:
+                raise ValueError(f"edge weight for {skill_a}-{skill_b} must lie in (0, 1]")
+            pairs[tuple(sorted((skill_a, skill_b)))] = float(weight)  # type: ignore[index]
+        skills = sorted({skill for pair in pairs for skill in pair})
+        index = {skill: row for row, skill in enumerate(skills)}
+        rows = np.array(
+            [index[a] for a, _ in pairs] + [index[b] for _, b in pairs], dtype=np.int64
+        )
+        cols = np.array(
+            [index[b] for _, b in pairs] + [index[a] for a, _ in pairs], dtype=np.int64
+        )
+        values = np.array(list(pairs.values()) * 2, dtype=float)
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(len(skills) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(skills)), out=indptr[1:])
+        return cls(skills, indptr, cols[order], values[order], version)
+
+    def __len__(self) -> int:
+        """Number of undirected edges."""
+        return len(self.indices) // 2
+
+    def neighbors(self, skill: str) -> List[Tuple[str, float]]:
+        row = self.index.get(skill)
+        if row is None:
+            return []
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return [
+            (self.skills[col], float(weight))
+            for col, weight in zip(self.indices[start:end], self.weights[start:end])
+        ]
+
+    def links_for(self, skills: Iterable[str]) -> SkillLinks:
+        """Adjacency among ``skills`` only, as JSON-friendly nested dicts."""
+        wanted = set(skills)
+        links: SkillLinks = {}
+        for skill in sorted(wanted):
+            related = {other: weight for other, weight in self.neighbors(skill) if other in wanted}
+            if related:
+                links[skill] = related
+        return links
+
+
+def read_edge_file(path: str | Path) -> List[Edge]:
+    """Hand-authored edges: a JSON list of ``[skill_a, skill_b, rho]``."""
+    raw = json.loads(Path(path).read_text())
+    return [(str(a), str(b), float(weight)) for a, b, weight in raw]
+
+
+@lru_cache(maxsize=4)
+def _graph(version: Optional[int], path: Optional[str]) -> SkillGraph:
+    edges: List[Edge] = []
+    if version is not None:
+        _, rows = load_links(version)
+        edges.extend(
+            (str(row["skill_a"]), str(row["skill_b"]), float(row["weight"])) for row in rows
+        )
+    if path:
+        edges.extend(read_edge_file(path))
+    return SkillGraph.from_edges(edges, version)
+
+
+def get_skill_graph() -> SkillGraph:
+    """Latest learned edges merged with the hand-authored file, cached per version."""
+    return _graph(latest_links_version(), get_settings().skill_graph_path)
+
+
+def clear_skill_graph_cache() -> None:
+    _graph.cache_clear()
+
+
+def share_weight(rho: float) -> float:
+    """Pseudo-observation weight one answer passes along an edge of weight ``rho``."""
+    return get_settings().skill_graph_strength * rho * rho
+
+
+def spillover(
+    links: Mapping[str, Mapping[str, float]], open_skills: Iterable[str]
+) -> Dict[str, float]:
+    """Total sharing weight each open skill's next answer would send to open neighbours."""
+    pool = set(open_skills)
+    return {
+        skill: sum(
+            share_weight(rho) for other, rho in links.get(skill, {}).items() if other in pool
+        )
+        for skill in pool
+    }
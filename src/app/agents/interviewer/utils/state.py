@@ -1,26 +1,33 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+from app.agents.interviewer.utils.agent_log import log_event
 from app.agents.interviewer.utils.stats import (
+    belief_model,
+    borrowed_strength,
+    carried_strength,
     compute_uncertainty,
-    effective_sample_count,
     ensure_prior,
+    prior_strength,
+)
+from app.schema.models import (
+    Grade,
+    HistoryEntry,
+    InterviewState,
+    Question,
+    SkillSummary,
+    SkillTurn,
 )
-from app.schema.models import Grade, InterviewState, Question
 
 MAX_HISTORY = 10
+# Answered turns kept per skill in ``skill_history`` for prompt context.
+MAX_SKILL_HISTORY = 5
 
 # Compact helper utilities for maintaining interview state.
 # They keep the nodes focused on decision logic rather than bookkeeping.
 
 
-def append_log(state: InterviewState, message: str) -> None:
-    """Append a log entry, initialising the log buffer if needed."""
-    state.setdefault("logs", [])
-    state["logs"].append(message)
-
-
 def add_unique(collection: List[str], value: str) -> bool:
     """Add value to collection if absent. Returns True when appended."""
     if value not in collection:
@@ -45,14 +52,57 @@ def record_question(state: InterviewState, question: Question, source: str) -> N
             "reasoning": None,
         }
     )
+    if question.co_skills:
+        history[-1]["co_skills"] = list(question.co_skills)
     if len(history) > MAX_HISTORY:
         del history[0]
-    append_log(
+    log_event(
         state,
-        f"{source} → [{question.skill}] d={question.difficulty} {question.text[:60]}...",
+        source,
+        "[{skills}] d={difficulty} {text}...",
+        skills="+".join([question.skill, *question.co_skills]),
+        difficulty=question.difficulty,
+        text=question.text[:60],
     )
 
 
+def _index_answer(index: Dict[str, List[SkillTurn]], entry: HistoryEntry) -> None:
+    """Append an answered history entry to the buffer of every skill it graded."""
+    if not entry.get("answer"):
+        return
+    co_scores = entry.get("co_scores", {})
+    targets = [(entry.get("skill"), entry.get("score"))]
+    targets.extend((skill, co_scores.get(skill)) for skill in entry.get("co_skills", []))
+    for skill, score in targets:
+        buffer = index.setdefault(str(skill), [])
+        buffer.append(
+            {
+                "question": entry.get("question"),
+                "answer": entry.get("answer"),
+                "score": score,
+                "turn": entry.get("turn"),
+            }
+        )
+        if len(buffer) > MAX_SKILL_HISTORY:
+            del buffer[0]
+
+
+def skill_history(state: InterviewState) -> Dict[str, List[SkillTurn]]:
+    """Per-skill buffers of the last ``MAX_SKILL_HISTORY`` answered turns.
+
+    Unlike ``question_history`` the window is per skill, so a skill keeps its
+    context however many others were asked since. States stored before the
+    index existed are indexed once from their ``question_history``.
+    """
+    index = state.get("skill_history")
+    if index is None:
+        index = {}
+        for entry in state.get("question_history", []):
+            _index_answer(index, entry)
+        state["skill_history"] = index
+    return index
+
+
 def update_latest_history_entry(
     state: InterviewState, answer: Optional[str], grade: Optional[Grade]
 ) -> None:
@@ -60,6 +110,8 @@ def update_latest_history_entry(
     history = state.setdefault("question_history", [])
     if not history:
         return
+    # Index first: a rebuild must not see (and then re-add) this entry.
+    index = skill_history(state)
     entry = history[-1]
     entry["answer"] = answer
     if grade is not None:
@@ -70,55 +122,106 @@ def update_latest_history_entry(
                 name: {"score": detail.score, "notes": detail.notes}
                 for name, detail in grade.aspects.items()
             }
+        if grade.co_grades:
+            entry["co_scores"] = {
+                skill: co_grade.score for skill, co_grade in grade.co_grades.items()
+            }
+    _index_answer(index, entry)
 
 
 def history_snippet(state: InterviewState, skill: str, limit: int = 3) -> str:
     """Summarise recent Q&A turns for a given skill."""
+    records = skill_history(state).get(skill, [])[-limit:]
+    if not records:
+        return "None yet – this skill has not been answered."
     entries = []
-    for record in reversed(state.get("question_history", [])):
-        if record.get("skill") != skill:
-            continue
-        if not record.get("answer"):
-            continue
-        answer = record.get("answer", "")
+    for record in records:
+        answer = str(record.get("answer") or "")
         if len(answer) > 140:
             answer = f"{answer[:137]}..."
         score = record.get("score")
         score_txt = f"score={score}" if score is not None else "score=?"
         entries.append(f"Q: {record.get('question')} | A: {answer} | {score_txt}")
-        if len(entries) >= limit:
-            break
-    if not entries:
-        return "None yet – this skill has not been answered."
-    return "\n".join(reversed(entries))
-
-
-SkillSummary = Dict[str, object]
+    return "\n".join(entries)
+
+
+def _summarise_skill(
+    state: InterviewState, skill: str, verified: bool, inactive: bool
+) -> SkillSummary:
+    belief = state.get("belief_state", {}).setdefault(skill, {})
+    ensure_prior(belief)
+    if "se" not in belief or "lcb" not in belief:
+        compute_uncertainty(
+            belief,
+            state.get("z_value", 1.96),
+            add_ucb=False,
+            model=belief_model(state.get("selection_policy")),
+        )
+    status = "verified" if verified else "inactive" if inactive else "probing"
+    carried = carried_strength(belief)
+    borrowed = borrowed_strength(belief)
+    return {
+        "skill": skill,
+        "status": status,
+        "n": max(0, round(float(belief["n"]) - prior_strength(belief) - carried - borrowed)),
+        "carried_n": round(carried, 2),
+        "borrowed_n": round(borrowed, 2),
+        "mean": round(float(belief.get("mean", 0.0)), 2),
+        "se": round(float(belief.get("se", 0.0)), 3),
+        "lcb": round(float(belief.get("lcb", 0.0)), 2),
+    }
 
 
 def summarise_skills(state: InterviewState) -> List[SkillSummary]:
-    """Build a per-skill summary for UI and telemetry."""
+    """Build a per-skill summary for UI and telemetry.
+
+    ``n`` counts this session's answers; ``carried_n`` is the decayed evidence
+    brought over from the candidate's earlier sessions (warm start) and
+    ``borrowed_n`` the evidence shared by related skills (skill graph).
+    """
     verified = set(state.get("verified_skills", []))
     inactive = set(state.get("inactive_skills", []))
-    summaries: List[Dict[str, object]] = []
-    for skill in state.get("skills", []):
-        belief = state.get("belief_state", {}).setdefault(skill, {})
-        ensure_prior(belief)
-        if "se" not in belief or "lcb" not in belief:
-            compute_uncertainty(belief, state.get("z_value", 1.96), add_ucb=False)
-        status = (
-            "verified"
-            if skill in verified
-            else "inactive" if skill in inactive else "probing"
-        )
-        summaries.append(
-            {
-                "skill": skill,
-                "status": status,
-                "n": effective_sample_count(belief),
-                "mean": round(float(belief.get("mean", 0.0)), 2),
-                "se": round(float(belief.get("se", 0.0)), 3),
-                "lcb": round(float(belief.get("lcb", 0.0)), 2),
-            }
-        )
-    return summaries
+    return [
+        _summarise_skill(state, skill, skill in verified, skill in inactive)
+        for skill in state.get("skills", [])
+    ]
+
+
+def skill_rows(state: InterviewState) -> Dict[str, int]:
+    """Row of each skill in ``skills`` (and so in ``skill_summaries``).
+
+    States stored before the index existed, or whose skill list no longer
+    matches it, are indexed once.
+    """
+    skills = state.get("skills", [])
+    rows = state.get("skill_rows")
+    if rows is None or len(rows) != len(skills):
+        rows = {skill: row for row, skill in enumerate(skills)}
+        state["skill_rows"] = rows
+    return rows
+
+
+def refresh_skill_summaries(state: InterviewState, changed: Iterable[str]) -> None:
+    """Recompute the ``skill_summaries`` rows of ``changed`` skills in place.
+
+    Rows follow the order of ``skills`` and are found through ``skill_rows``;
+    when they are out of step (older states, edited skill lists) every row is
+    rebuilt instead.
+    """
+    skills = state.get("skills", [])
+    summaries = state.get("skill_summaries")
+    if not summaries or len(summaries) != len(skills):
+        state["skill_summaries"] = summarise_skills(state)
+        return
+    rows = skill_rows(state)
+    verified = set(state.get("verified_skills", []))
+    inactive = set(state.get("inactive_skills", []))
+    for skill in dict.fromkeys(changed):
+        row = rows.get(skill)
+        if row is None:
+            continue
+        if summaries[row].get("skill") != skill:
+            state.pop("skill_rows", None)
+            state["skill_summaries"] = summarise_skills(state)
+            return
+        summaries[row] = _summarise_skill(state, skill, skill in verified, skill in inactive)
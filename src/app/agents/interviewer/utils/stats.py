@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Literal, Tuple
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 from app.core.config import get_settings
 
@@ -14,21 +16,170 @@ SE_FLOOR = float(_settings.stats_se_floor)
 SE_FLOOR_MIN_REAL = int(_settings.stats_se_floor_min_real)
 
 
-def ensure_prior(belief: Dict) -> None:
-    """Initialise belief dict with prior pseudo-counts if missing."""
+class SkillPrior(NamedTuple):
+    """Per-skill prior: pseudo-observations of ``variance`` around ``mean``."""
+
+    mean: float
+    variance: float
+    strength: float
+
+
+def ensure_prior(belief: Dict, prior: Optional[SkillPrior] = None) -> None:
+    """Initialise belief dict with prior pseudo-counts if missing.
+
+    Without ``prior`` the global ``stats_prior_*`` settings apply. A per-skill
+    prior is recorded on the belief (``prior_n``/``prior_mean``) so later
+    counts and posteriors subtract the right pseudo-observations.
+    """
     if "n" not in belief or belief.get("n", 0) == 0:
-        belief["n"] = int(PRIOR_STRENGTH)
-        belief["mean"] = float(PRIOR_MEAN)
-        # m2 = n * variance for the pseudo observations
-        belief["m2"] = float(PRIOR_STRENGTH * PRIOR_VARIANCE)
+        if prior is None:
+            belief["n"] = int(PRIOR_STRENGTH)
+            belief["mean"] = float(PRIOR_MEAN)
+            # m2 = n * variance for the pseudo observations
+            belief["m2"] = float(PRIOR_STRENGTH * PRIOR_VARIANCE)
+        else:
+            belief["n"] = float(prior.strength)
+            belief["mean"] = float(prior.mean)
+            belief["m2"] = float(prior.strength * prior.variance)
+            belief["prior_n"] = float(prior.strength)
+            belief["prior_mean"] = float(prior.mean)
+            belief["prior_var"] = float(prior.variance)
     if "prior_var" not in belief:
         belief["prior_var"] = float(PRIOR_VARIANCE)
 
 
+def prior_strength(belief: Dict) -> float:
+    """Pseudo-count the belief was initialised with."""
+    return float(belief.get("prior_n", PRIOR_STRENGTH))
+
+
+def carried_strength(belief: Dict) -> float:
+    """Decayed pseudo-count carried over from earlier sessions (warm start)."""
+    return float(belief.get("carried_n", 0.0))
+
+
+def borrowed_strength(belief: Dict) -> float:
+    """Pseudo-count borrowed from related skills through the skill graph."""
+    return float(belief.get("borrowed_n", 0.0))
+
+
+# (answers, their mean, their sum of squared deviations) folded into a belief.
+Evidence = Tuple[float, float, float]
+
+
+def _combine(a: Evidence, b: Evidence) -> Evidence:
+    """Chan et al. merge of two Welford groups."""
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    if n <= 0:
+        return 0.0, mean_a, 0.0
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+def _base_group(belief: Dict) -> Evidence:
+    """Prior pseudo-observations plus any carried-over or borrowed evidence."""
+    k0 = prior_strength(belief)
+    group = (
+        k0,
+        float(belief.get("prior_mean", PRIOR_MEAN)),
+        k0 * float(belief.get("prior_var", PRIOR_VARIANCE)),
+    )
+    for key in ("carried", "borrowed"):
+        count = float(belief.get(f"{key}_n", 0.0))
+        if count > 0:
+            group = _combine(
+                group,
+                (count, float(belief[f"{key}_mean"]), float(belief.get(f"{key}_m2", 0.0))),
+            )
+    return group
+
+
+def seed_evidence(belief: Dict, evidence: Evidence) -> None:
+    """Fold down-weighted evidence from earlier sessions into a fresh belief.
+
+    The pseudo-observations are recorded as ``carried_n``/``carried_mean``/
+    ``carried_m2`` so they can be told apart from this session's answers.
+    """
+    ensure_prior(belief)
+    count, mean, m2 = evidence
+    if count <= 0:
+        return
+    if carried_strength(belief) > 0:
+        raise ValueError("belief already carries evidence from earlier sessions")
+    n, mu, total_m2 = _combine(
+        (float(belief["n"]), float(belief["mean"]), float(belief["m2"])), evidence
+    )
+    belief["n"] = n
+    belief["mean"] = mu
+    belief["m2"] = max(total_m2, 0.0)
+    belief["carried_n"] = float(count)
+    belief["carried_mean"] = float(mean)
+    belief["carried_m2"] = float(m2)
+
+
+def borrow_evidence(belief: Dict, value: float, weight: float) -> None:
+    """Fold one pseudo-observation of ``weight`` at ``value`` into ``belief``.
+
+    Used for evidence shared by a related skill; the running total is kept as
+    ``borrowed_n``/``borrowed_mean``/``borrowed_m2``.
+    """
+    ensure_prior(belief)
+    if weight <= 0:
+        return
+    point: Evidence = (float(weight), float(value), 0.0)
+    n, mu, m2 = _combine((float(belief["n"]), float(belief["mean"]), float(belief["m2"])), point)
+    belief["n"] = n
+    belief["mean"] = mu
+    belief["m2"] = max(m2, 0.0)
+    count, mean, ss = _combine(
+        (
+            borrowed_strength(belief),
+            float(belief.get("borrowed_mean", value)),
+            float(belief.get("borrowed_m2", 0.0)),
+        ),
+        point,
+    )
+    belief["borrowed_n"] = count
+    belief["borrowed_mean"] = mean
+    belief["borrowed_m2"] = max(ss, 0.0)
+
+
+def session_evidence(belief: Dict) -> Optional[Evidence]:
+    """Recover this session's real grades (count, mean, SS) from a Welford belief.
+
+    The prior pseudo-observations and any carried-over or borrowed evidence
+    are subtracted back out, so warm-started sessions never count twice.
+    """
+    if not belief.get("n"):
+        return None
+    n = float(belief["n"])
+    k, mu0, m2_base = _base_group(belief)
+    real = int(round(n - k))
+    if real < 1:
+        return None
+    data_mean = (n * float(belief["mean"]) - k * mu0) / real
+    data_ss = float(belief["m2"]) - m2_base - k * real / n * (data_mean - mu0) ** 2
+    return real, data_mean, max(data_ss, 0.0)
+
+
 def effective_sample_count(belief: Dict) -> int:
-    """Real samples collected beyond the prior pseudo-counts."""
+    """Samples collected beyond the prior pseudo-counts (carried and borrowed included)."""
+    ensure_prior(belief)
+    return max(0, int(round(float(belief["n"]) - prior_strength(belief))))
+
+
+def real_sample_count(belief: Dict) -> int:
+    """Answers behind the belief: ``n`` less the prior and borrowed pseudo-counts.
+
+    Carried evidence counts, since it is the candidate's own earlier answers.
+    Evidence borrowed from related skills does not, so ``min_questions_per_skill``
+    and the SE floor still need answers on the skill itself.
+    """
     ensure_prior(belief)
-    return max(0, int(belief["n"]) - PRIOR_STRENGTH)
+    extra = float(belief["n"]) - prior_strength(belief) - borrowed_strength(belief)
+    return max(0, int(round(extra)))
 
 
 def total_effective_questions(beliefs: Dict[str, Dict]) -> int:
@@ -39,7 +190,7 @@ def total_effective_questions(beliefs: Dict[str, Dict]) -> int:
 def welford_update(belief: Dict, score: float) -> None:
     """Single-pass streaming update of mean and M2."""
     ensure_prior(belief)
-    n0 = int(belief["n"])
+    n0 = belief["n"]
     mu0 = float(belief["mean"])
     m20 = float(belief["m2"])
 
@@ -53,10 +204,20 @@ def welford_update(belief: Dict, score: float) -> None:
     belief["m2"] = max(m21, 0.0)  # numerical safety: variance never negative
 
 
-def compute_uncertainty(belief: Dict, z: float, add_ucb: bool = True) -> None:
-    """Compute standard error, LCB, and optionally UCB for the belief."""
+def compute_uncertainty(
+    belief: Dict, z: float, add_ucb: bool = True, model: str = "normal"
+) -> None:
+    """Compute standard error, LCB, and optionally UCB for the belief.
+
+    ``model="nig"`` reports the Normal-Inverse-Gamma posterior instead: ``se``
+    is the scale of the mean's Student-t marginal and the bounds are its
+    quantiles at the level of ``z``.
+    """
+    if model == "nig":
+        _compute_uncertainty_nig(belief, z, add_ucb)
+        return
     ensure_prior(belief)
-    n = int(belief["n"])
+    n = float(belief["n"])
     mean = float(belief["mean"])
     m2 = float(belief["m2"])
 
@@ -64,7 +225,7 @@ def compute_uncertainty(belief: Dict, z: float, add_ucb: bool = True) -> None:
     var = max(var, 0.0)
     se = math.sqrt(var / max(n, 1))
 
-    if effective_sample_count(belief) < SE_FLOOR_MIN_REAL:
+    if real_sample_count(belief) < SE_FLOOR_MIN_REAL:
         se = max(se, SE_FLOOR)
 
     lcb = mean - z * se
@@ -74,25 +235,151 @@ def compute_uncertainty(belief: Dict, z: float, add_ucb: bool = True) -> None:
         belief["ucb"] = mean + z * se
 
 
+# Normal-Inverse-Gamma hyperparameters from the same prior settings: kappa0 is
+# the prior pseudo-count and alpha0/beta0 put E[sigma^2] at the prior variance.
+# Beliefs initialised from a per-skill prior use their own prior_n instead.
+NIG_KAPPA0 = float(PRIOR_STRENGTH)
+NIG_ALPHA0 = PRIOR_STRENGTH / 2.0 + 1.0
+
+BeliefModel = Literal["normal", "nig"]
+SelectionPolicy = Literal["ucb1", "se", "thompson"]
+
+
+def belief_model(policy: Optional[str]) -> BeliefModel:
+    """Belief model paired with a selection policy (Thompson sampling uses NIG)."""
+    return "nig" if policy == "thompson" else "normal"
+
+
+def nig_posterior(belief: Dict) -> Tuple[float, float, float, float]:
+    """Return ``(mu, kappa, alpha, beta)`` of the NIG posterior for a Welford belief.
+
+    The prior pseudo-observations sit at ``PRIOR_MEAN`` with weight
+    ``PRIOR_STRENGTH``, so the running mean already is the posterior location
+    and ``m2`` minus the prior's share equals the conjugate update of beta.
+    """
+    ensure_prior(belief)
+    kappa = float(belief["n"])
+    kappa0 = prior_strength(belief)
+    alpha0 = kappa0 / 2.0 + 1.0
+    prior_var = float(belief.get("prior_var", PRIOR_VARIANCE))
+    beta0 = prior_var * (alpha0 - 1.0)
+    data_m2 = max(float(belief["m2"]) - kappa0 * prior_var, 0.0)
+    return (
+        float(belief["mean"]),
+        kappa,
+        alpha0 + max(kappa - kappa0, 0.0) / 2.0,
+        beta0 + data_m2 / 2.0,
+    )
+
+
+def student_t_quantile(z: float, dof: float) -> float:
+    """Student-t quantile at the level of standard-normal quantile ``z``.
+
+    Cornish-Fisher expansion to third order; within ~1% of the exact value
+    for ``dof >= 3`` at the usual confidence levels.
+    """
+    z2 = z * z
+    g1 = (z2 + 1.0) * z / 4.0
+    g2 = ((5.0 * z2 + 16.0) * z2 + 3.0) * z / 96.0
+    g3 = (((3.0 * z2 + 19.0) * z2 + 17.0) * z2 - 15.0) * z / 384.0
+    return z + g1 / dof + g2 / dof**2 + g3 / dof**3
+
+
+def _compute_uncertainty_nig(belief: Dict, z: float, add_ucb: bool) -> None:
+    mu, kappa, alpha, beta = nig_posterior(belief)
+    # Marginal posterior of the mean: Student-t, 2*alpha dof, this scale.
+    scale = math.sqrt(beta / (alpha * kappa))
+    half_width = student_t_quantile(z, 2.0 * alpha) * scale
+    belief["se"] = scale
+    belief["lcb"] = mu - half_width
+    if add_ucb:
+        belief["ucb"] = mu + half_width
+
+
 def verify_status(belief: Dict, threshold: float, min_real_samples: int) -> bool:
     """Return True when the skill has enough evidence and the LCB clears the bar."""
-    real_n = effective_sample_count(belief)
+    real_n = real_sample_count(belief)
     lcb = float(belief.get("lcb", -1e9))
     return real_n >= min_real_samples and lcb >= threshold
 
 
-def select_skill_ucb_with_log(
+# Pools at least this large are scored through the array-backed BeliefStore.
+VECTORIZE_MIN_SKILLS = 64
+_VECTORIZED_LOG_TOP = 5
+
+# A selection trace row: a log template and the fields it is formatted with.
+TraceRow = Tuple[str, Dict[str, Any]]
+
+
+def _select_vectorized(
+    beliefs: Dict[str, Dict],
+    exploration_c: float,
+    mode: Literal["ucb1", "se"],
+    spillover: Optional[Dict[str, float]] = None,
+    trace: Optional[List[TraceRow]] = None,
+) -> Tuple[str, float]:
+    # Imported lazily: belief_store reads the prior constants from this module.
+    from app.agents.interviewer.utils.belief_store import BeliefStore
+
+    store = BeliefStore.from_dict(beliefs)
+    boost = (
+        np.array([spillover.get(skill, 0.0) for skill in store.skills])
+        if spillover
+        else None
+    )
+    if trace is not None:
+        scores = store.selection_scores(exploration_c, mode, boost)
+        t = max(2, max(1, store.total_effective) + 1)
+        trace.append(
+            (
+                "mode={mode} C={C} t={t} skills={skills} (vectorized)",
+                {"mode": mode, "C": exploration_c, "t": int(t), "skills": len(store)},
+            )
+        )
+        means = store.column("mean")
+        counts = store.effective_counts()
+        skills = store.skills
+        # Stable sort keeps the first skill on ties, like the scalar loop.
+        for row in np.argsort(-scores, kind="stable")[:_VECTORIZED_LOG_TOP]:
+            trace.append(
+                (
+                    "UCB[{skill}] mean={mean:.2f} real_n={real_n} -> {ucb:.3f}",
+                    {
+                        "skill": skills[row],
+                        "mean": float(means[row]),
+                        "real_n": int(counts[row]),
+                        "ucb": float(scores[row]),
+                    },
+                )
+            )
+    best_skill, best_ucb = store.select(exploration_c, mode, boost=boost)
+    return best_skill, float(best_ucb)
+
+
+def select_skill_ucb(
     beliefs: Dict[str, Dict],
     exploration_c: float,
     mode: Literal["ucb1", "se"] = "ucb1",
-) -> Tuple[str, List[str]]:
-    """Select next skill using either classic UCB1 or SE-based exploration."""
+    spillover: Optional[Dict[str, float]] = None,
+    trace: Optional[List[TraceRow]] = None,
+) -> Tuple[str, float]:
+    """Select next skill using either classic UCB1 or SE-based exploration.
+
+    Returns the skill and its bound. Pools of ``VECTORIZE_MIN_SKILLS`` or more
+    are scored in one vectorised pass and only the top candidates are traced.
+    ``spillover`` (skill graph) scales each skill's exploration bonus by
+    ``1 + spillover[skill]``. Per-skill scores are appended to ``trace`` as
+    unformatted rows when it is given.
+    """
+    if len(beliefs) >= VECTORIZE_MIN_SKILLS:
+        return _select_vectorized(beliefs, exploration_c, mode, spillover, trace)
     total_real = max(1, total_effective_questions(beliefs))
     t = max(2, total_real + 1)
 
     best_skill = None
     best_ucb = float("-inf")
-    logs: List[str] = [f"select_ucb mode={mode} C={exploration_c} t={t}"]
+    if trace is not None:
+        trace.append(("mode={mode} C={C} t={t}", {"mode": mode, "C": exploration_c, "t": t}))
 
     for skill, stats in beliefs.items():
         ensure_prior(stats)
@@ -105,14 +392,89 @@ def select_skill_ucb_with_log(
             exploration = exploration_c * float(stats["se"])
         else:  # default to classic UCB1 flavour
             exploration = exploration_c * math.sqrt(math.log(t) / max(real_n, 1))
+        if spillover:
+            exploration *= 1.0 + spillover.get(skill, 0.0)
 
         ucb = mean + exploration
-        logs.append(
-            f"UCB[{skill}] mean={mean:.2f} real_n={real_n} expl={exploration:.3f} -> {ucb:.3f}"
-        )
+        if trace is not None:
+            trace.append(
+                (
+                    "UCB[{skill}] mean={mean:.2f} real_n={real_n} expl={expl:.3f} -> {ucb:.3f}",
+                    {
+                        "skill": skill,
+                        "mean": mean,
+                        "real_n": real_n,
+                        "expl": exploration,
+                        "ucb": ucb,
+                    },
+                )
+            )
         if ucb > best_ucb:
             best_skill, best_ucb = skill, ucb
 
     assert best_skill is not None
-    logs.append(f"→ select {best_skill} (UCB={best_ucb:.3f})")
-    return best_skill, logs
+    return best_skill, best_ucb
+
+
+def select_skill_ucb_with_log(
+    beliefs: Dict[str, Dict],
+    exploration_c: float,
+    mode: Literal["ucb1", "se"] = "ucb1",
+    spillover: Optional[Dict[str, float]] = None,
+) -> Tuple[str, List[str]]:
+    """``select_skill_ucb`` with its trace rendered to text."""
+    trace: List[TraceRow] = []
+    skill, ucb = select_skill_ucb(beliefs, exploration_c, mode, spillover, trace)
+    lines = [template.format(**fields) for template, fields in trace]
+    lines.append(f"select {skill} (UCB={ucb:.3f})")
+    return skill, lines
+
+
+def select_skill_thompson(
+    beliefs: Dict[str, Dict],
+    rng: Optional[np.random.Generator] = None,
+    trace: Optional[List[TraceRow]] = None,
+) -> Tuple[str, float]:
+    """Select the next skill by Thompson sampling from the NIG posteriors.
+
+    Draws ``sigma^2 ~ InvGamma(alpha, beta)`` and ``mu ~ N(mu_n, sigma^2 / kappa)``
+    per skill and picks the largest draw, which is returned with the skill.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if trace is not None:
+        trace.append(("skills={skills}", {"skills": len(beliefs)}))
+    best_skill = None
+    best_draw = float("-inf")
+    for skill, stats in beliefs.items():
+        mu, kappa, alpha, beta = nig_posterior(stats)
+        sigma2 = beta / rng.gamma(alpha)
+        draw = float(rng.normal(mu, math.sqrt(sigma2 / kappa)))
+        if trace is not None:
+            trace.append(
+                (
+                    "TS[{skill}] mu={mu:.2f} kappa={kappa:.0f} alpha={alpha:.1f} draw={draw:.3f}",
+                    {
+                        "skill": skill,
+                        "mu": float(mu),
+                        "kappa": float(kappa),
+                        "alpha": float(alpha),
+                        "draw": draw,
+                    },
+                )
+            )
+        if draw > best_draw:
+            best_skill, best_draw = skill, draw
+    assert best_skill is not None
+    return best_skill, best_draw
+
+
+def select_skill_thompson_with_log(
+    beliefs: Dict[str, Dict],
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[str, List[str]]:
+    """``select_skill_thompson`` with its trace rendered to text."""
+    trace: List[TraceRow] = []
+    skill, draw = select_skill_thompson(beliefs, rng, trace)
+    lines = [template.format(**fields) for template, fields in trace]
+    lines.append(f"select {skill} (draw={draw:.3f})")
+    return skill, lines
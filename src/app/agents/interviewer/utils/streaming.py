@@ -0,0 +1,136 @@
+"""Partial-output streaming from nodes to the service event feed.
+
+Nodes never hold a reference to the HTTP response. Instead the service installs
+a writer for the duration of a node run (``stream_writer``) and nodes publish
+``message`` payloads through ``emit``. Without a writer every helper here
+degrades to the plain ``ainvoke`` path, so unit tests and the LangGraph runtime
+are unaffected.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from langchain_core.callbacks import get_usage_metadata_callback
+from langchain_core.utils.json import parse_partial_json
+from pydantic import BaseModel, ValidationError
+
+from app.agents.interviewer.utils.budget import Usage, call_usage
+
+Writer = Callable[[Dict[str, Any]], None]
+PartialHandler = Callable[[Dict[str, Any]], None]
+
+# Finish reasons (OpenAI / Anthropic) of a response cut off at the token limit.
+_TRUNCATED = frozenset({"length", "max_tokens"})
+
+_writer: ContextVar[Optional[Writer]] = ContextVar("interviewer_stream_writer", default=None)
+
+
+@contextmanager
+def stream_writer(writer: Writer) -> Iterator[None]:
+    """Route ``emit`` calls made in this context (and tasks spawned from it) to ``writer``."""
+    token = _writer.set(writer)
+    try:
+        yield
+    finally:
+        _writer.reset(token)
+
+
+def streaming_enabled() -> bool:
+    return _writer.get() is not None
+
+
+def emit(payload: Dict[str, Any]) -> None:
+    """Publish a ``message`` payload if a writer is installed."""
+    writer = _writer.get()
+    if writer is not None:
+        writer(payload)
+
+
+class StructuredLLM:
+    """``llm.with_structured_output`` with optional partial-result streaming.
+
+    ``ainvoke`` keeps the non-streaming contract. When a partial handler is
+    supplied and a writer is installed, the schema is bound as a forced tool call
+    and the argument JSON is parsed incrementally as tokens arrive — the same
+    request ``with_structured_output`` issues, but observable mid-flight.
+    With ``on_usage`` every completed call reports its token usage (see
+    :mod:`app.agents.interviewer.utils.budget`).
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        schema: type[BaseModel],
+        run_config: Dict[str, Any],
+        on_usage: Optional[Callable[[Usage], None]] = None,
+    ):
+        self._llm = llm
+        self._schema = schema
+        self._run_config = run_config
+        self._on_usage = on_usage
+        structured = llm.with_structured_output(schema)
+        if hasattr(structured, "with_config"):
+            structured = structured.with_config(**run_config)
+        self._structured = structured
+
+    async def ainvoke(self, prompt: Any, on_partial: Optional[PartialHandler] = None) -> Any:
+        if self._on_usage is None:
+            return await self._ainvoke(prompt, on_partial)
+        with get_usage_metadata_callback() as usage:
+            result = await self._ainvoke(prompt, on_partial)
+        self._on_usage(call_usage(usage.usage_metadata, prompt, result))
+        return result
+
+    async def _ainvoke(self, prompt: Any, on_partial: Optional[PartialHandler]) -> Any:
+        if (
+            on_partial is not None
+            and streaming_enabled()
+            and hasattr(self._llm, "bind_tools")
+        ):
+            result = await self._astream_tool_call(prompt, on_partial)
+            if result is not None:
+                return result
+        return await self._structured.ainvoke(prompt)
+
+    async def _astream_tool_call(
+        self, prompt: Any, on_partial: PartialHandler
+    ) -> Optional[BaseModel]:
+        bound = self._llm.bind_tools([self._schema], tool_choice=self._schema.__name__)
+        if hasattr(bound, "with_config"):
+            bound = bound.with_config(**self._run_config)
+        raw_args = ""
+        raw_text = ""
+        latest: Optional[Dict[str, Any]] = None
+        finish_reason = None
+        async for chunk in bound.astream(prompt):
+            metadata = getattr(chunk, "response_metadata", None) or {}
+            finish_reason = (
+                metadata.get("finish_reason") or metadata.get("stop_reason") or finish_reason
+            )
+            tool_chunks = getattr(chunk, "tool_call_chunks", None) or []
+            for tool_chunk in tool_chunks:
+                raw_args += tool_chunk.get("args") or ""
+            content = getattr(chunk, "content", "")
+            if not tool_chunks and isinstance(content, str):
+                # JSON-mode providers stream the object as plain content.
+                raw_text += content
+            raw = raw_args or raw_text
+            if not raw:
+                continue
+            parsed = parse_partial_json(raw)
+            if isinstance(parsed, dict) and parsed != latest:
+                latest = parsed
+                on_partial(parsed)
+        # A stream cut at max tokens can still validate, since the schemas'
+        # fields have defaults: only a finished, well-formed object counts.
+        # Anything else (truncated, out of range) is asked again without streaming.
+        if latest is None or finish_reason in _TRUNCATED:
+            return None
+        try:
+            return self._schema.model_validate(json.loads(raw_args or raw_text))
+        except (ValueError, ValidationError):
+            return None
@@ -0,0 +1,114 @@
+"""Carry a candidate's evidence from earlier interviews into a new session.
+
+Each earlier session contributes its real grades per skill (``session_evidence``,
+so evidence it carried itself is not counted again) as pseudo-observations
+worth ``weight * 0.5 ** (age / half_life)`` answers each. The pooled evidence
+is folded into the fresh belief with ``seed_evidence`` and recorded as
+``carried_n`` so summaries can tell it apart from this session's answers.
+
+Carried evidence counts toward ``min_questions_per_skill``: a skill whose
+seeded LCB already clears the bar starts verified, and one whose UCB already
+sits below it (confidently rejected) starts inactive, so neither spends turns.
+Under ``stopping_rule="sprt"`` the SPRT boundaries decide instead.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Mapping, NamedTuple
+
+from app.agents.interviewer.utils.agent_log import log_event
+from app.agents.interviewer.utils.sequential import sprt_decision
+from app.agents.interviewer.utils.state import add_unique
+from app.agents.interviewer.utils.stats import (
+    Evidence,
+    belief_model,
+    compute_uncertainty,
+    seed_evidence,
+    session_evidence,
+    verify_status,
+)
+from app.schema.models import InterviewState
+
+
+class PastSession(NamedTuple):
+    """An earlier session of the same candidate and how old it is."""
+
+    session_id: str
+    belief_state: Dict[str, Dict]
+    age_days: float
+
+
+def session_age_days(updated_at: str, now: datetime | None = None) -> float:
+    """Days between an ISO timestamp and ``now`` (never negative)."""
+    now = now or datetime.now(timezone.utc)
+    stamp = datetime.fromisoformat(updated_at)
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return max((now - stamp).total_seconds() / 86400.0, 0.0)
+
+
+def decay_weight(age_days: float, half_life_days: float, weight: float) -> float:
+    """Pseudo-count one earlier answer is worth after ``age_days``."""
+    if half_life_days <= 0:
+        return 0.0
+    return weight * 0.5 ** (age_days / half_life_days)
+
+
+def carried_evidence(
+    past: Iterable[PastSession], *, half_life_days: float, weight: float
+) -> Dict[str, Evidence]:
+    """Pool the decayed per-skill evidence of ``past`` sessions."""
+    groups: Dict[str, List[Evidence]] = {}
+    for session in past:
+        factor = decay_weight(session.age_days, half_life_days, weight)
+        if factor <= 0:
+            continue
+        for skill, belief in session.belief_state.items():
+            found = session_evidence(dict(belief))
+            if found is None:
+                continue
+            count, mean, ss = found
+            groups.setdefault(skill, []).append((factor * count, mean, factor * ss))
+    pooled: Dict[str, Evidence] = {}
+    for skill, rows in groups.items():
+        total = sum(count for count, _, _ in rows)
+        mean = sum(count * mean for count, mean, _ in rows) / total
+        ss = sum(ss + count * (row_mean - mean) ** 2 for count, row_mean, ss in rows)
+        pooled[skill] = (total, mean, ss)
+    return pooled
+
+
+def apply_carried(state: InterviewState, carried: Mapping[str, Evidence]) -> None:
+    """Seed ``state``'s beliefs with carried evidence and pre-decide confident skills."""
+    model = belief_model(state.get("selection_policy"))
+    for skill, evidence in carried.items():
+        belief = state["belief_state"].get(skill)
+        if belief is None:
+            continue
+        seed_evidence(belief, evidence)
+        compute_uncertainty(belief, state["z_value"], model=model)
+        threshold = state["verification_threshold"]
+        min_q = state["min_questions_per_skill"]
+        if state.get("stopping_rule", "lcb") == "sprt":
+            decision, _, _ = sprt_decision(belief, threshold, min_q)
+            verified, rejected = decision == "verify", decision == "reject"
+        else:
+            verified = verify_status(belief, threshold, min_q)
+            rejected = float(belief["ucb"]) < threshold
+        if verified:
+            add_unique(state["verified_skills"], skill)
+        elif rejected:
+            add_unique(state["inactive_skills"], skill)
+        log_event(
+            state,
+            "warm_start",
+            "{skill}: carried_n={carried_n:.2f} mean={mean:.2f} LCB={lcb:.2f} "
+            "verified={verified} inactive={inactive}",
+            skill=skill,
+            carried_n=belief["carried_n"],
+            mean=belief["mean"],
+            lcb=belief["lcb"],
+            verified=skill in state["verified_skills"],
+            inactive=skill in state["inactive_skills"],
+        )
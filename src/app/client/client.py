@@ -1,9 +1,89 @@
 from __future__ import annotations
 
+import json
 import os
 from typing import Any, Dict, Iterator, Optional
 
 import httpx
+from websockets.sync.client import ClientConnection, connect
+
+
+# Reconnects (with Last-Event-ID) per stream before giving up on it.
+MAX_RECONNECTS = 3
+
+
+def _iter_sse(response: httpx.Response) -> Iterator[Dict[str, Any]]:
+    """Yield ``{"event", "data"}`` dicts as soon as each SSE frame is complete.
+
+    Partial events (``question_delta``/``grade_partial`` messages) arrive many
+    times per turn, so frames are surfaced individually rather than buffered.
+    Frames carrying an ``id:`` line also get an ``"id"`` key.
+    """
+    event = None
+    event_id = None
+    data_parts = []
+    for raw in response.iter_lines():
+        if raw is None:
+            continue
+        if isinstance(raw, bytes):
+            line = raw.decode("utf-8", errors="ignore")
+        else:
+            line = raw
+        if line.startswith(":"):
+            # comment/heartbeat
+            continue
+        if line.startswith("id:"):
+            event_id = line.split(":", 1)[1].strip()
+        elif line.startswith("event:"):
+            event = line.split(":", 1)[1].strip()
+        elif line.startswith("data:"):
+            data_parts.append(line.split(":", 1)[1].strip())
+        elif line == "":
+            if event is not None:
+                data = "\n".join(data_parts) if data_parts else "{}"
+                frame = {"event": event, "data": data}
+                if event_id is not None:
+                    frame["id"] = event_id
+                yield frame
+            event = None
+            event_id = None
+            data_parts = []
+
+
+class InterviewConnection:
+    """One interview over ``/interviewer/ws`` (see ``AgentClient.connect``).
+
+    ``start`` and ``answer`` yield a turn's events as ``{"event", "data"}``
+    dicts, like ``AgentClient.stream``/``resume``, up to its ``done`` (or
+    ``error``) event.
+    """
+
+    def __init__(self, websocket: ClientConnection):
+        self._ws = websocket
+
+    def _events(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            message = json.loads(self._ws.recv())
+            yield {"event": message["event"], "data": json.dumps(message["data"])}
+            if message["event"] in ("done", "error"):
+                return
+
+    def start(self, payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        self._ws.send(json.dumps(payload))
+        yield from self._events()
+
+    def answer(self, answer: str) -> Iterator[Dict[str, Any]]:
+        self._ws.send(json.dumps({"answer": answer}))
+        yield from self._events()
+
+    def close(self) -> None:
+        self._ws.close()
+
+    def __enter__(self) -> "InterviewConnection":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 class AgentClient:
@@ -44,6 +124,46 @@ class AgentClient:
             r.raise_for_status()
             return r.json()
 
+    def _stream_events(
+        self, path: str, payload: Dict[str, Any], headers: Dict[str, str]
+    ) -> Iterator[Dict[str, Any]]:
+        """POST to an SSE endpoint, reconnecting with ``Last-Event-ID`` when it drops.
+
+        The service runs turns in the background and logs their events, so a
+        reconnect replays what was missed instead of running the turn again.
+        Without an id to resume from (no ``session-id``, or nothing received
+        yet) or after ``MAX_RECONNECTS``, a final ``done`` event lets the UI
+        recover.
+        """
+        last_id: Optional[str] = None
+        reconnects = 0
+        with httpx.Client(timeout=httpx.Timeout(None, read=None, connect=10)) as client:
+            while True:
+                request_headers = dict(headers)
+                if last_id is not None:
+                    request_headers["Last-Event-ID"] = last_id
+                try:
+                    with client.stream(
+                        "POST", f"{self.base_url}{path}", json=payload, headers=request_headers
+                    ) as r:
+                        r.raise_for_status()
+                        if last_id is None:
+                            last_id = r.headers.get("X-Last-Event-ID")
+                        for evt in _iter_sse(r):
+                            last_id = evt.get("id", last_id)
+                            yield evt
+                    return
+                except (httpx.RemoteProtocolError, httpx.ReadError):
+                    reconnects += 1
+                    if (
+                        "session-id" not in headers
+                        or last_id is None
+                        or reconnects > MAX_RECONNECTS
+                    ):
+                        # Surface a final done event so UI can recover
+                        yield {"event": "done", "data": '{"error":"remote_protocol_error"}'}
+                        return
+
     def stream(
         self, payload: Dict[str, Any], session_id: Optional[str] = None
     ) -> Iterator[Dict[str, Any]]:
@@ -51,42 +171,7 @@ class AgentClient:
         if session_id:
             # FastAPI converts underscores to hyphens in header names
             headers["session-id"] = session_id
-        try:
-            with httpx.Client(
-                timeout=httpx.Timeout(None, read=None, connect=10)
-            ) as client:
-                with client.stream(
-                    "POST",
-                    f"{self.base_url}/interviewer/stream",
-                    json=payload,
-                    headers=headers,
-                ) as r:
-                    r.raise_for_status()
-                    event = None
-                    data_parts = []
-                    for raw in r.iter_lines():
-                        if raw is None:
-                            continue
-                        if isinstance(raw, bytes):
-                            line = raw.decode("utf-8", errors="ignore")
-                        else:
-                            line = raw
-                        if line.startswith(":"):
-                            # comment/heartbeat
-                            continue
-                        if line.startswith("event:"):
-                            event = line.split(":", 1)[1].strip()
-                        elif line.startswith("data:"):
-                            data_parts.append(line.split(":", 1)[1].strip())
-                        elif line == "":
-                            if event is not None:
-                                data = "\n".join(data_parts) if data_parts else "{}"
-                                yield {"event": event, "data": data}
-                            event = None
-                            data_parts = []
-        except httpx.RemoteProtocolError:
-            # Surface a final done event so UI can recover
-            yield {"event": "done", "data": '{"error":"remote_protocol_error"}'}
+        yield from self._stream_events("/interviewer/stream", payload, headers)
 
     def resume(
         self, payload: Dict[str, Any], session_id: Optional[str] = None
@@ -96,41 +181,17 @@ class AgentClient:
 
         headers = self._headers()
         headers["session-id"] = session_id
+        yield from self._stream_events("/interviewer/resume", payload, headers)
 
-        try:
-            with httpx.Client(
-                timeout=httpx.Timeout(None, read=None, connect=10)
-            ) as client:
-                with client.stream(
-                    "POST",
-                    f"{self.base_url}/interviewer/resume",
-                    json=payload,
-                    headers=headers,
-                ) as r:
-                    r.raise_for_status()
-                    event = None
-                    data_parts = []
-                    for raw in r.iter_lines():
-                        if raw is None:
-                            continue
-                        if isinstance(raw, bytes):
-                            line = raw.decode("utf-8", errors="ignore")
-                        else:
-                            line = raw
-                        if line.startswith(":"):
-                            continue
-                        if line.startswith("event:"):
-                            event = line.split(":", 1)[1].strip()
-                        elif line.startswith("data:"):
-                            data_parts.append(line.split(":", 1)[1].strip())
-                        elif line == "":
-                            if event is not None:
-                                data = "\n".join(data_parts) if data_parts else "{}"
-                                yield {"event": event, "data": data}
-                            event = None
-                            data_parts = []
-        except httpx.RemoteProtocolError:
-            yield {"event": "done", "data": '{"error":"remote_protocol_error"}'}
+    def connect(self, session_id: Optional[str] = None) -> InterviewConnection:
+        """Open a WebSocket that carries a whole interview (one connection, no reloads)."""
+        headers: Dict[str, str] = {}
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+        if session_id:
+            headers["session-id"] = session_id
+        url = "ws" + self.base_url.removeprefix("http") + "/interviewer/ws"
+        return InterviewConnection(connect(url, additional_headers=headers))
 
     def simulate_answer(
         self, payload: Dict[str, Any], session_id: Optional[str] = None
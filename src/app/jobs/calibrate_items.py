@@ -0,0 +1,176 @@
+"""Calibrate IRT question difficulty from logged grades.
+
+Reads every graded ``question_history`` entry of every stored session and fits
+the binomial Rasch model of ``app.agents.interviewer.utils.irt`` by joint
+maximum a posteriori estimation: one ability per (session, skill), one
+difficulty per bank question (``irt.item_key``). A multi-skill answer is one
+response per graded skill to the same question. Abilities get the same
+Normal(0, ``THETA_PRIOR_SD``) prior as the live estimate, which fixes the
+scale. Each nominal level gets a difficulty first; each question's difficulty
+is then shrunk towards its level's with a unit-variance prior.
+
+Only levels and questions with at least ``--min-responses`` graded answers are
+published, as a new version of the ``item_calibration`` table; sessions started
+with ``difficulty_policy: "irt"`` afterwards use it. ``question_history`` keeps
+the last ``MAX_HISTORY`` turns per session, so long sessions contribute their
+most recent answers only.
+
+Usage::
+
+    python -m app.jobs.calibrate_items --report items_report.json [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.agents.interviewer.utils.irt import (
+    GRADE_STEPS,
+    NOMINAL,
+    THETA_PRIOR_SD,
+    item_key,
+)
+from app.storage.items import level_key, publish_items
+from app.storage.store import iter_sessions
+
+logger = logging.getLogger(__name__)
+
+_B_PRIOR_SD = 1.0
+_ITERATIONS = 50
+
+# (person, item key, nominal level, score) per graded answer.
+Response = Tuple[str, str, int, int]
+
+
+def collect_responses() -> List[Response]:
+    responses: List[Response] = []
+    for session_id, state in iter_sessions():
+        for entry in state.get("question_history", []):
+            if entry.get("score") is None or not entry.get("question"):
+                continue
+            # Co-skill grades are further responses to the same item.
+            key = item_key(str(entry["skill"]), str(entry["question"]))
+            scores = [(entry["skill"], entry["score"]), *(entry.get("co_scores") or {}).items()]
+            for skill, score in scores:
+                responses.append(
+                    (
+                        f"{session_id}:{skill}",
+                        key,
+                        int(entry.get("difficulty") or 3),
+                        int(score),
+                    )
+                )
+    return responses
+
+
+def fit_difficulties(
+    people: Sequence[str], keys: Sequence[str], scores: Sequence[int], b_prior: Dict[str, float]
+) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """Joint MAP fit of abilities and one difficulty per key.
+
+    Returns ``(key → b, key → responses)``; each ``b`` is shrunk towards
+    ``b_prior[key]``.
+    """
+    person_lookup = {person: idx for idx, person in enumerate(sorted(set(people)))}
+    key_lookup = {key: idx for idx, key in enumerate(sorted(set(keys)))}
+    person_idx = np.array([person_lookup[person] for person in people], dtype=int)
+    key_idx = np.array([key_lookup[key] for key in keys], dtype=int)
+    k = np.array([min(max(score, 1), GRADE_STEPS + 1) - 1 for score in scores], dtype=float)
+    center = np.array([b_prior[key] for key in key_lookup])
+
+    theta = np.zeros(len(person_lookup))
+    b = center.copy()
+    for _ in range(_ITERATIONS):
+        p = 1.0 / (1.0 + np.exp(-(theta[person_idx] - b[key_idx])))
+        resid = k - GRADE_STEPS * p
+        info = GRADE_STEPS * p * (1.0 - p)
+        grad = np.bincount(person_idx, resid, len(theta)) - theta / THETA_PRIOR_SD**2
+        hess = np.bincount(person_idx, info, len(theta)) + 1.0 / THETA_PRIOR_SD**2
+        theta += grad / hess
+
+        p = 1.0 / (1.0 + np.exp(-(theta[person_idx] - b[key_idx])))
+        resid = k - GRADE_STEPS * p
+        info = GRADE_STEPS * p * (1.0 - p)
+        grad = -np.bincount(key_idx, resid, len(b)) - (b - center) / _B_PRIOR_SD**2
+        hess = np.bincount(key_idx, info, len(b)) + 1.0 / _B_PRIOR_SD**2
+        b += grad / hess
+
+    counts = np.bincount(key_idx, minlength=len(b))
+    return (
+        {key: float(b[idx]) for key, idx in key_lookup.items()},
+        {key: int(counts[idx]) for key, idx in key_lookup.items()},
+    )
+
+
+def calibration_rows(
+    responses: Sequence[Response], min_responses: int
+) -> Dict[str, Dict[str, float]]:
+    """Publishable rows: calibrated levels and well-sampled bank questions.
+
+    Levels are fitted first (all questions of a level share one difficulty);
+    each question is then fitted with its level's value as the prior centre,
+    so rarely asked questions stay close to their level.
+    """
+    if not responses:
+        return {}
+    people = [person for person, _, _, _ in responses]
+    scores = [score for _, _, _, score in responses]
+    level_keys = [level_key(level) for _, _, level, _ in responses]
+    level_b, level_counts = fit_difficulties(
+        people,
+        level_keys,
+        scores,
+        {level_key(level): b for level, b in NOMINAL.levels.items()},
+    )
+    item_keys = [item for _, item, _, _ in responses]
+    item_level = dict(zip(item_keys, level_keys))
+    item_b, item_counts = fit_difficulties(
+        people, item_keys, scores, {item: level_b[item_level[item]] for item in item_level}
+    )
+    rows: Dict[str, Dict[str, float]] = {}
+    for table, counts in ((level_b, level_counts), (item_b, item_counts)):
+        for key, b in table.items():
+            if counts[key] >= min_responses:
+                rows[key] = {"b": round(b, 4), "responses": counts[key]}
+    return rows
+
+
+def run_calibration(min_responses: int, *, publish: bool = True) -> Dict[str, Any]:
+    responses = collect_responses()
+    rows = calibration_rows(responses, min_responses)
+    version = publish_items(rows) if publish and rows else None
+    return {
+        "version": version,
+        "responses": len(responses),
+        "levels": {key: row for key, row in rows.items() if key.startswith("level:")},
+        "items": sum(1 for key in rows if not key.startswith("level:")),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here.")
+    parser.add_argument(
+        "--min-responses",
+        type=int,
+        default=5,
+        help="Graded answers a level or question needs before it is published.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Fit and report without publishing.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    report = run_calibration(args.min_responses, publish=not args.dry_run)
+    text = json.dumps(report, indent=2)
+    if args.report is not None:
+        args.report.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
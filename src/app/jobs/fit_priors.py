@@ -0,0 +1,156 @@
+"""Fit empirical-Bayes per-skill priors from completed sessions.
+
+Every skill otherwise starts from the global ``stats_prior_*`` prior, so skills
+that are hard for most candidates spend turns pulling the mean down from 3.0.
+This job reads the real grades folded into each completed session's belief
+(the prior and any warm-start pseudo-observations are subtracted back out),
+fits a one-way random-effects model per skill and publishes the result as a
+new version of the ``skill_priors`` table:
+
+- ``mean``: average of per-session means.
+- ``variance``: pooled within-session grade variance (per observation).
+- ``strength``: within / between-candidate variance, i.e. how many answers
+  one candidate's evidence is worth relative to the population — clamped to
+  ``[0.5, 10]``.
+
+Skills seen in fewer than ``--min-sessions`` sessions keep the global prior.
+The report replays each session's retained turns under the global prior and
+under the fitted table and compares the average turn of first verification
+(in-sample, so read it as an upper bound on the gain).
+
+Usage::
+
+    python -m app.jobs.fit_priors --report priors_report.json [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.agents.interviewer.nodes.decide import end_reason
+from app.agents.interviewer.utils.stats import PRIOR_VARIANCE, Evidence, session_evidence
+from app.core.config import get_settings
+from app.jobs.regrade import graded_turns, replay_params, replay_turn, replay_verification
+from app.schema.models import InterviewState
+from app.storage.priors import publish_priors
+from app.storage.store import iter_sessions
+
+logger = logging.getLogger(__name__)
+
+_MIN_VARIANCE = 0.05
+_MIN_BETWEEN = 0.01
+_STRENGTH_RANGE = (0.5, 10.0)
+
+
+def fit_skill_prior(evidence: Sequence[Evidence], min_sessions: int) -> Optional[Dict[str, float]]:
+    """Method-of-moments random-effects fit; None when there is too little data."""
+    sessions = len(evidence)
+    if sessions < max(2, min_sessions):
+        return None
+    answers = sum(count for count, _, _ in evidence)
+    within = (
+        sum(ss for _, _, ss in evidence) / (answers - sessions)
+        if answers > sessions
+        else PRIOR_VARIANCE
+    )
+    within = max(within, _MIN_VARIANCE)
+    means = [mean for _, mean, _ in evidence]
+    grand_mean = statistics.fmean(means)
+    between = statistics.variance(means) - within * statistics.fmean(
+        1.0 / count for count, _, _ in evidence
+    )
+    between = max(between, _MIN_BETWEEN)
+    low, high = _STRENGTH_RANGE
+    return {
+        "mean": round(grand_mean, 3),
+        "variance": round(within, 3),
+        "strength": round(min(max(within / between, low), high), 2),
+        "sessions": sessions,
+    }
+
+
+def _completed_sessions() -> Iterable[Tuple[str, InterviewState]]:
+    for session_id, state in iter_sessions():
+        if state.get("skills") and end_reason(state) is not None:  # type: ignore[arg-type]
+            yield session_id, state  # type: ignore[misc]
+
+
+def fit_priors(min_sessions: int) -> Tuple[Dict[str, Dict[str, float]], int]:
+    """Fit priors over all completed sessions; returns ``(table, sessions_used)``."""
+    evidence: Dict[str, List[Evidence]] = defaultdict(list)
+    used = 0
+    for _, state in _completed_sessions():
+        used += 1
+        for skill, belief in state.get("belief_state", {}).items():
+            found = session_evidence(belief)
+            if found is not None:
+                evidence[skill].append(found)
+    table = {}
+    for skill, rows in sorted(evidence.items()):
+        fitted = fit_skill_prior(rows, min_sessions)
+        if fitted is not None:
+            table[skill] = fitted
+    return table, used
+
+
+def turns_to_verification(table: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Average first-verification turn when replaying sessions before/after ``table``."""
+    fitted = {
+        skill: (row["mean"], row["variance"], row["strength"]) for skill, row in table.items()
+    }
+    first: Dict[str, List[int]] = {"before": [], "after": []}
+    for _, state in _completed_sessions():
+        turns = [replay_turn(entry) for entry in graded_turns(state)]
+        if not turns:
+            continue
+        params = replay_params(state)
+        for label, priors in (("before", {}), ("after", fitted)):
+            outcome = replay_verification({**params, "priors": priors}, turns)
+            first[label].extend(outcome["first_verified"].values())
+    return {
+        label: {
+            "verified": len(values),
+            "mean_turns": round(statistics.fmean(values), 2) if values else None,
+        }
+        for label, values in first.items()
+    }
+
+
+def run_fit(min_sessions: int, *, publish: bool = True) -> Dict[str, Any]:
+    table, used = fit_priors(min_sessions)
+    version = publish_priors(table) if publish and table else None
+    return {
+        "version": version,
+        "sessions": used,
+        "priors": table,
+        "turns_to_verification": turns_to_verification(table),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here.")
+    parser.add_argument(
+        "--min-sessions",
+        type=int,
+        default=get_settings().prior_fit_min_sessions,
+        help="Sessions a skill needs before it gets its own prior.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Fit and report without publishing.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    report = run_fit(args.min_sessions, publish=not args.dry_run)
+    text = json.dumps(report, indent=2)
+    if args.report is not None:
+        args.report.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
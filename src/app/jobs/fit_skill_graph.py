@@ -0,0 +1,140 @@
+"""Learn the skill-correlation graph from grade co-occurrence.
+
+For every completed session the real grades folded into each skill's belief
+are recovered (prior, warm-start and borrowed evidence subtracted back out)
+and reduced to a per-skill session mean. For each pair of skills the Pearson
+correlation of those means is taken over the sessions that answered both:
+all pairs at once, from masked matrix products over a sessions × skills grid.
+
+Per-session means carry grading noise, so the correlation is attenuated
+towards zero; the learned weights therefore err on the side of sharing too
+little. Pairs answered together in fewer than ``--min-sessions`` sessions or
+correlating below ``--min-weight`` are dropped; the rest are published as a new
+version of the ``skill_links`` table.
+
+Usage::
+
+    python -m app.jobs.fit_skill_graph --report skill_graph_report.json [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.agents.interviewer.nodes.decide import end_reason
+from app.agents.interviewer.utils.stats import session_evidence
+from app.core.config import get_settings
+from app.storage.skill_links import LinkRow, publish_links
+from app.storage.store import iter_sessions
+
+logger = logging.getLogger(__name__)
+
+_MIN_VARIANCE = 1e-6
+
+
+def session_means() -> Tuple[List[str], np.ndarray]:
+    """``(skills, sessions × skills means)``; NaN where a session has no grade."""
+    rows: List[Dict[str, float]] = []
+    for _, state in iter_sessions():
+        if not state.get("skills") or end_reason(state) is None:  # type: ignore[arg-type]
+            continue
+        means = {}
+        for skill, belief in state.get("belief_state", {}).items():
+            found = session_evidence(belief)
+            if found is not None:
+                means[skill] = found[1]
+        if len(means) >= 2:
+            rows.append(means)
+    skills = sorted({skill for row in rows for skill in row})
+    grid = np.full((len(rows), len(skills)), np.nan)
+    column = {skill: idx for idx, skill in enumerate(skills)}
+    for row_idx, row in enumerate(rows):
+        for skill, mean in row.items():
+            grid[row_idx, column[skill]] = mean
+    return skills, grid
+
+
+def pairwise_correlation(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairwise-complete Pearson correlations and the session count behind each."""
+    mask = (~np.isnan(grid)).astype(float)
+    x = np.nan_to_num(grid)
+    counts = mask.T @ mask
+    n = np.maximum(counts, 1.0)
+    sum_a = (x * mask).T @ mask  # [a, b]: sum of a over sessions with both
+    sum_sq = (x * x).T @ mask
+    cross = x.T @ x
+    mean_a, mean_b = sum_a / n, sum_a.T / n
+    cov = cross / n - mean_a * mean_b
+    var_a = sum_sq / n - mean_a**2
+    var_b = sum_sq.T / n - mean_b**2
+    denom = np.sqrt(np.maximum(var_a, _MIN_VARIANCE) * np.maximum(var_b, _MIN_VARIANCE))
+    corr = np.clip(cov / denom, -1.0, 1.0)
+    return corr, counts.astype(int)
+
+
+def fit_links(
+    skills: Sequence[str], grid: np.ndarray, min_sessions: int, min_weight: float
+) -> List[LinkRow]:
+    if len(skills) < 2:
+        return []
+    corr, counts = pairwise_correlation(grid)
+    links: List[LinkRow] = []
+    for a, b in zip(*np.triu_indices(len(skills), k=1)):
+        if counts[a, b] >= max(min_sessions, 3) and corr[a, b] >= min_weight:
+            links.append(
+                {
+                    "skill_a": skills[a],
+                    "skill_b": skills[b],
+                    "weight": round(float(corr[a, b]), 3),
+                    "sessions": int(counts[a, b]),
+                }
+            )
+    return links
+
+
+def run_fit(min_sessions: int, min_weight: float, *, publish: bool = True) -> Dict[str, Any]:
+    skills, grid = session_means()
+    links = fit_links(skills, grid, min_sessions, min_weight)
+    version = publish_links(links) if publish and links else None
+    return {
+        "version": version,
+        "sessions": int(grid.shape[0]),
+        "skills": len(skills),
+        "links": links,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here.")
+    parser.add_argument(
+        "--min-sessions",
+        type=int,
+        default=settings.skill_graph_min_sessions,
+        help="Sessions that must answer both skills before a link is learned.",
+    )
+    parser.add_argument(
+        "--min-weight",
+        type=float,
+        default=settings.skill_graph_min_weight,
+        help="Smallest correlation kept as a link.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Fit and report without publishing.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    report = run_fit(args.min_sessions, args.min_weight, publish=not args.dry_run)
+    text = json.dumps(report, indent=2)
+    if args.report is not None:
+        args.report.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
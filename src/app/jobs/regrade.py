@@ -0,0 +1,338 @@
+"""Re-grade stored sessions after a rubric change and diff verification outcomes.
+
+When ``GRADE_PROMPT`` or ``_ASPECT_WEIGHTS`` change, past verdicts were produced
+under the old rubric. This job streams stored sessions, re-grades every answered
+``question_history`` entry, replays the ``welford_update`` →
+``compute_uncertainty`` → ``verify_status`` chain (via ``update_node``) under the
+old and new scores, and appends one JSON line per session to a diff report.
+
+- LLM calls share one ``asyncio.Semaphore`` (``--concurrency``).
+- Stats replays run in a ``ProcessPoolExecutor`` (``--workers``).
+- The report doubles as the checkpoint: sessions already present are skipped,
+  so an interrupted run resumes where it stopped. Failed sessions are not
+  written and are retried on the next run.
+
+Replays only see the retained ``question_history`` window, so both sides of
+the diff are replayed from the same turns rather than compared against the
+stored ``verified_skills``. A multi-skill turn is replayed whole: its main and
+co-skill scores update the ledger in the same turn, as they did live.
+
+Usage::
+
+    python -m app.jobs.regrade --report regrade.jsonl --concurrency 8 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.grade import grade_answer
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.stats import SkillPrior
+from app.schema.models import Grade, InterviewState, Question
+from app.storage.priors import load_priors
+from app.storage.store import iter_sessions
+
+logger = logging.getLogger(__name__)
+
+# (skill, score, co-skill scores) of one graded turn.
+ReplayTurn = Tuple[str, int, Dict[str, int]]
+
+
+def graded_turns(state: InterviewState) -> List[Dict[str, Any]]:
+    """History entries that carry both an answer and a recorded score."""
+    return [
+        entry
+        for entry in state.get("question_history", [])
+        if entry.get("answer") is not None and entry.get("score") is not None
+    ]
+
+
+def replay_turn(entry: Dict[str, Any]) -> ReplayTurn:
+    """A graded history entry as a replay turn, with its co-skill scores."""
+    co_scores = entry.get("co_scores") or {}
+    return (
+        str(entry["skill"]),
+        int(entry["score"]),
+        {str(skill): int(score) for skill, score in co_scores.items()},
+    )
+
+
+def turn_scores(turn: ReplayTurn) -> List[Tuple[str, int]]:
+    """Every ``(skill, score)`` a replay turn graded, main skill first."""
+    skill, score, co_scores = turn
+    return [(skill, score), *co_scores.items()]
+
+
+def replay_params(state: InterviewState) -> Dict[str, Any]:
+    """Interview settings needed to rebuild a fresh ledger for replay."""
+    return {
+        "skills": list(state.get("skills", [])),
+        "max_turns": int(state.get("max_turns", 0)),
+        "min_q": int(state.get("min_questions_per_skill", 1)),
+        "verify_lcb": float(state.get("verification_threshold", 0.0)),
+        "z_value": float(state.get("z_value", 1.96)),
+        "ucb_C": float(state.get("ucb_C", 1.0)),
+        "selection_policy": state.get("selection_policy", "ucb1"),
+        "stopping_rule": state.get("stopping_rule", "lcb"),
+        "priors": session_priors(state),
+        "carried": session_carried(state),
+        "skill_links": state.get("skill_links", {}),
+        "planner": bool(state.get("planner", False)),
+    }
+
+
+def session_carried(state: InterviewState) -> Dict[str, Tuple[float, float, float]]:
+    """Warm-start evidence the session's beliefs were seeded with."""
+    return {
+        skill: (
+            float(belief["carried_n"]),
+            float(belief["carried_mean"]),
+            float(belief.get("carried_m2", 0.0)),
+        )
+        for skill, belief in state.get("belief_state", {}).items()
+        if belief.get("carried_n")
+    }
+
+
+def session_priors(state: InterviewState) -> Dict[str, Tuple[float, float, float]]:
+    """Per-skill priors the session started from (empty: the global prior)."""
+    version = state.get("prior_version")
+    if version is None:
+        return {}
+    _, table = load_priors(int(version))
+    return {
+        skill: (float(row["mean"]), float(row["variance"]), float(row["strength"]))
+        for skill, row in table.items()
+    }
+
+
+def replay_state(
+    params: Dict[str, Any], skills: Sequence[str], thread_id: str = "replay"
+) -> InterviewState:
+    """Fresh ledger under ``params`` (``replay_params`` output) for ``skills``."""
+    return build_state(
+        list(skills),
+        params["max_turns"],
+        params["min_q"],
+        params["verify_lcb"],
+        params["z_value"],
+        params["ucb_C"],
+        {},
+        thread_id=thread_id,
+        selection_policy=params.get("selection_policy", "ucb1"),
+        stopping_rule=params.get("stopping_rule", "lcb"),
+        priors={
+            skill: SkillPrior(*values) for skill, values in params.get("priors", {}).items()
+        },
+        carried={skill: tuple(values) for skill, values in params.get("carried", {}).items()},
+        skill_links=params.get("skill_links", {}),
+        planner=params.get("planner", False),
+    )
+
+
+def replay_verification(params: Dict[str, Any], turns: Sequence[ReplayTurn]) -> Dict[str, Any]:
+    """Replay graded turns through ``update_node`` and return the outcome.
+
+    Module-level and pure so it can run in a worker process. ``first_verified``
+    maps each skill to the replayed turn (1-based) on which it was first verified.
+    """
+    skills = list(params["skills"])
+    for turn in turns:
+        for skill, _ in turn_scores(turn):
+            if skill not in skills:
+                skills.append(skill)
+    state = replay_state(params, skills)
+    first_verified: Dict[str, int] = {}
+    for number, turn in enumerate(turns, start=1):
+        skill, score, co_scores = turn
+        state["current_question"] = Question(
+            skill=skill, text="(replayed turn)", difficulty=3, co_skills=list(co_scores)
+        )
+        state["last_grade"] = Grade(
+            score=score,
+            reasoning="replay",
+            co_grades={
+                co_skill: Grade(score=co_score, reasoning="replay")
+                for co_skill, co_score in co_scores.items()
+            },
+        )
+        update_node(state)
+        for graded, _ in turn_scores(turn):
+            if graded in state["verified_skills"]:
+                first_verified.setdefault(graded, number)
+    return {
+        "first_verified": first_verified,
+        "verified": sorted(state["verified_skills"]),
+        "inactive": sorted(state["inactive_skills"]),
+        "skill_summaries": state["skill_summaries"],
+    }
+
+
+async def _regrade_turns(
+    session_id: str,
+    state: InterviewState,
+    turns: List[Dict[str, Any]],
+    semaphore: asyncio.Semaphore,
+) -> List[ReplayTurn]:
+    async def regrade(entry: Dict[str, Any]) -> ReplayTurn:
+        question = Question(
+            skill=str(entry["skill"]),
+            text=str(entry["question"]),
+            difficulty=int(entry.get("difficulty") or 3),
+            co_skills=list(entry.get("co_skills") or []),
+        )
+        context: Dict[str, Any] = {
+            "thread_id": session_id,
+            "spans_map": state.get("spans_map", {}),
+            "logs": [],
+        }
+        async with semaphore:
+            grade = await grade_answer(  # type: ignore[arg-type]
+                context, question, str(entry["answer"]), dedup=False
+            )
+        co_scores = {skill: co_grade.score for skill, co_grade in grade.co_grades.items()}
+        return question.skill, grade.score, co_scores
+
+    return list(await asyncio.gather(*(regrade(entry) for entry in turns)))
+
+
+async def regrade_session(
+    session_id: str,
+    state: InterviewState,
+    semaphore: asyncio.Semaphore,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """Re-grade one session and return its diff record."""
+    turns = graded_turns(state)
+    new_turns = await _regrade_turns(session_id, state, turns, semaphore)
+    params = replay_params(state)
+    old_turns = [replay_turn(entry) for entry in turns]
+
+    loop = asyncio.get_running_loop()
+    before, after = await asyncio.gather(
+        loop.run_in_executor(executor, replay_verification, params, old_turns),
+        loop.run_in_executor(executor, replay_verification, params, new_turns),
+    )
+    changed_scores: List[Dict[str, Any]] = []
+    for entry, old_turn, new_turn in zip(turns, old_turns, new_turns):
+        old, new = dict(turn_scores(old_turn)), dict(turn_scores(new_turn))
+        for skill in dict.fromkeys([*old, *new]):
+            if old.get(skill) != new.get(skill):
+                changed_scores.append(
+                    {
+                        "turn": entry.get("turn"),
+                        "skill": skill,
+                        "old": old.get(skill),
+                        "new": new.get(skill),
+                    }
+                )
+    newly_verified = sorted(set(after["verified"]) - set(before["verified"]))
+    no_longer_verified = sorted(set(before["verified"]) - set(after["verified"]))
+    return {
+        "session_id": session_id,
+        "turns": len(turns),
+        "changed_scores": changed_scores,
+        "verified_before": before["verified"],
+        "verified_after": after["verified"],
+        "newly_verified": newly_verified,
+        "no_longer_verified": no_longer_verified,
+        "verification_changed": bool(newly_verified or no_longer_verified),
+    }
+
+
+def load_checkpoint(report_path: Path) -> Set[str]:
+    """Session ids already present in the report (a torn last line is ignored)."""
+    if not report_path.exists():
+        return set()
+    done: Set[str] = set()
+    with report_path.open() as handle:
+        for line in handle:
+            try:
+                done.add(json.loads(line)["session_id"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return done
+
+
+async def run_regrade(
+    report_path: Path,
+    *,
+    concurrency: int = 8,
+    workers: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, int]:
+    """Re-grade every stored session not yet in ``report_path``."""
+    done = load_checkpoint(report_path)
+    semaphore = asyncio.Semaphore(concurrency)
+    # Bound how many sessions are held in memory while their grades are pending.
+    max_in_flight = max(1, concurrency * 2)
+    summary = {"skipped": len(done), "processed": 0, "changed": 0, "failed": 0}
+    pending: Set[asyncio.Task] = set()
+
+    def record(tasks: Set[asyncio.Task], report: Any) -> None:
+        for task in tasks:
+            try:
+                result = task.result()
+            except Exception:  # pragma: no cover - network dependent
+                logger.exception("regrade failed for %s", task.get_name())
+                summary["failed"] += 1
+                continue
+            report.write(json.dumps(result) + "\n")
+            report.flush()
+            summary["processed"] += 1
+            summary["changed"] += int(result["verification_changed"])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, report_path.open("a") as report:
+        started = 0
+        for session_id, state in iter_sessions():
+            if session_id in done:
+                continue
+            if limit is not None and started >= limit:
+                break
+            started += 1
+            pending.add(
+                asyncio.create_task(
+                    regrade_session(session_id, state, semaphore, executor),
+                    name=session_id,
+                )
+            )
+            if len(pending) >= max_in_flight:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                record(finished, report)
+        if pending:
+            finished, _ = await asyncio.wait(pending)
+            record(finished, report)
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", type=Path, default=Path("regrade_report.jsonl"))
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent LLM calls.")
+    parser.add_argument("--workers", type=int, default=None, help="Replay processes.")
+    parser.add_argument("--limit", type=int, default=None, help="Max sessions this run.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    summary = asyncio.run(
+        run_regrade(
+            args.report,
+            concurrency=args.concurrency,
+            workers=args.workers,
+            limit=args.limit,
+        )
+    )
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
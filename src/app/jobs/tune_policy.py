@@ -0,0 +1,300 @@
+"""Counterfactual replay of logged interviews under alternative policy parameters.
+
+The ``InvokeRequest`` defaults (``ucb_C``, ``z_value``, ``verify_lcb``, ``min_q``,
+``max_turns``) are otherwise tuned by guesswork. This job replays every stored,
+completed session under candidate parameter sets and reports which ones trade
+turns against verification agreement best.
+
+- Grade model: a per-session bootstrap. When the counterfactual policy asks
+  skill ``s``, the grade is drawn with replacement from the grades ``s``
+  actually received in that session. Skills the session never asked draw
+  from every session's grades for ``s``, and skills nobody asked draw from
+  the session's own grades.
+- Policy: the production ``pick_skill`` → ``update_node`` → ``decide_node``
+  chain, on a ledger rebuilt from the session's settings, priors, warm-start
+  evidence and skill links (``regrade.replay_params``), with the searched
+  parameters overriding them.
+- Reference: the session's logged turns replayed under its own settings
+  (``regrade.replay_verification``). Agreement is the share of (session,
+  skill) verify/not-verify decisions that match it. ``false_verify_rate`` and
+  ``miss_rate`` split the disagreements.
+- Search: a ``--grid`` of values per parameter, or ``--samples`` random draws
+  from ``--range`` bounds. Every parameter set sees the same bootstrap draws
+  (common random numbers), and parameter sets are spread across
+  ``--workers`` processes. The report lists every evaluated set and the Pareto
+  frontier of average turns against agreement; the logged settings (``{}``)
+  are always evaluated as the baseline.
+
+Replays only see the retained ``question_history`` window (see
+``app.jobs.regrade``), so long sessions are judged on their recent turns.
+
+Usage::
+
+    python -m app.jobs.tune_policy --grid ucb_C=0.5,1,2 --grid z_value=1.64,1.96 \\
+        --workers 4 --report tune_report.json
+    python -m app.jobs.tune_policy --range verify_lcb=3.25:4.25 --range min_q=1:3 \\
+        --samples 40 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import statistics
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.agents.interviewer.nodes.decide import decide_node, end_reason
+from app.agents.interviewer.nodes.select import pick_skill
+from app.agents.interviewer.nodes.update import update_node
+from app.jobs.regrade import (
+    graded_turns,
+    replay_params,
+    replay_state,
+    replay_turn,
+    replay_verification,
+    turn_scores,
+)
+from app.schema.models import Grade, Question
+from app.storage.store import iter_sessions
+
+logger = logging.getLogger(__name__)
+
+TUNABLE: Dict[str, type] = {
+    "ucb_C": float,
+    "z_value": float,
+    "verify_lcb": float,
+    "min_q": int,
+    "max_turns": int,
+}
+
+Overrides = Dict[str, Any]
+
+
+class ReplaySession(NamedTuple):
+    session_id: str
+    params: Dict[str, Any]
+    grades: Dict[str, List[int]]
+    reference: List[str]
+
+
+def load_sessions(limit: Optional[int] = None) -> List[ReplaySession]:
+    """Completed sessions with at least one graded turn, ready for replay."""
+    sessions: List[ReplaySession] = []
+    for session_id, state in iter_sessions():
+        if not state.get("skills") or end_reason(state) is None:  # type: ignore[arg-type]
+            continue
+        turns = [replay_turn(entry) for entry in graded_turns(state)]
+        if not turns:
+            continue
+        params = replay_params(state)
+        grades: Dict[str, List[int]] = defaultdict(list)
+        for turn in turns:
+            for skill, score in turn_scores(turn):
+                grades[skill].append(score)
+        reference = replay_verification(params, turns)["verified"]
+        sessions.append(ReplaySession(session_id, params, dict(grades), reference))
+        if limit is not None and len(sessions) >= limit:
+            break
+    return sessions
+
+
+def pooled_grades(sessions: Sequence[ReplaySession]) -> Dict[str, List[int]]:
+    pooled: Dict[str, List[int]] = defaultdict(list)
+    for session in sessions:
+        for skill, scores in session.grades.items():
+            pooled[skill].extend(scores)
+    return dict(pooled)
+
+
+def counterfactual_run(
+    session: ReplaySession,
+    overrides: Overrides,
+    pooled: Dict[str, List[int]],
+    rng: np.random.Generator,
+) -> Tuple[int, List[str]]:
+    """Run one bootstrapped interview; returns ``(turns, verified skills)``."""
+    params = {**session.params, **overrides}
+    state = replay_state(params, params["skills"], thread_id=f"counterfactual-{session.session_id}")
+    own = [score for scores in session.grades.values() for score in scores]
+    while True:
+        skill, _ = pick_skill(state, rng=rng)
+        scores = session.grades.get(skill) or pooled.get(skill) or own
+        state["current_question"] = Question(
+            skill=skill, text="(counterfactual turn)", difficulty=3
+        )
+        state["last_grade"] = Grade(score=int(rng.choice(scores)), reasoning="bootstrap")
+        update_node(state)
+        if decide_node(state).goto != "select":
+            break
+    return state["turn"], sorted(state["verified_skills"])
+
+
+# Set once per worker process by ``_init_worker`` so sessions are pickled once.
+_SESSIONS: List[ReplaySession] = []
+_POOLED: Dict[str, List[int]] = {}
+
+
+def _init_worker(sessions: List[ReplaySession], pooled: Dict[str, List[int]]) -> None:
+    global _SESSIONS, _POOLED
+    _SESSIONS, _POOLED = sessions, pooled
+
+
+def evaluate(overrides: Overrides, replicates: int, seed: int) -> Dict[str, Any]:
+    """Average turns and agreement with the reference for one parameter set."""
+    turns: List[int] = []
+    agree = decisions = false_verify = negatives = missed = positives = 0
+    for idx, session in enumerate(_SESSIONS):
+        reference = set(session.reference)
+        for replicate in range(replicates):
+            rng = np.random.default_rng([seed, idx, replicate])
+            used, verified = counterfactual_run(session, overrides, _POOLED, rng)
+            turns.append(used)
+            for skill in session.params["skills"]:
+                expected, got = skill in reference, skill in verified
+                decisions += 1
+                agree += expected == got
+                positives += expected
+                negatives += not expected
+                missed += expected and not got
+                false_verify += got and not expected
+    return {
+        "params": dict(overrides),
+        "avg_turns": round(statistics.fmean(turns), 3) if turns else None,
+        "agreement": round(agree / decisions, 4) if decisions else None,
+        "false_verify_rate": round(false_verify / negatives, 4) if negatives else 0.0,
+        "miss_rate": round(missed / positives, 4) if positives else 0.0,
+    }
+
+
+def grid_configs(grid: Dict[str, Sequence[Any]]) -> List[Overrides]:
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def random_configs(
+    ranges: Dict[str, Tuple[float, float]], samples: int, seed: int
+) -> List[Overrides]:
+    """Uniform draws within ``ranges``; integer parameters draw integers."""
+    rng = np.random.default_rng(seed)
+    configs: List[Overrides] = []
+    for _ in range(samples):
+        config: Overrides = {}
+        for name, (low, high) in sorted(ranges.items()):
+            if TUNABLE[name] is int:
+                config[name] = int(rng.integers(int(low), int(high) + 1))
+            else:
+                config[name] = round(float(rng.uniform(low, high)), 3)
+        configs.append(config)
+    return configs
+
+
+def pareto_frontier(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Results no other result beats on both fewer turns and higher agreement."""
+    frontier = [
+        row
+        for row in results
+        if not any(
+            other["avg_turns"] <= row["avg_turns"]
+            and other["agreement"] >= row["agreement"]
+            and (other["avg_turns"], other["agreement"]) != (row["avg_turns"], row["agreement"])
+            for other in results
+        )
+    ]
+    return sorted(frontier, key=lambda row: row["avg_turns"])
+
+
+def run_search(
+    configs: Sequence[Overrides],
+    *,
+    replicates: int = 4,
+    seed: int = 0,
+    workers: int = 1,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    sessions = load_sessions(limit)
+    pooled = pooled_grades(sessions)
+    configs = [{}] + [dict(config) for config in configs if config]
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(sessions, pooled)
+        ) as pool:
+            futures = [pool.submit(evaluate, config, replicates, seed) for config in configs]
+            results = [future.result() for future in futures]
+    else:
+        _init_worker(sessions, pooled)
+        results = [evaluate(config, replicates, seed) for config in configs]
+    results = [row for row in results if row["avg_turns"] is not None]
+    return {
+        "sessions": len(sessions),
+        "replicates": replicates,
+        "results": results,
+        "frontier": pareto_frontier(results),
+    }
+
+
+def _parse_assignment(raw: str) -> Tuple[str, str]:
+    name, sep, values = raw.partition("=")
+    if not sep or name not in TUNABLE:
+        raise argparse.ArgumentTypeError(
+            f"expected one of {sorted(TUNABLE)} as name=values, got {raw!r}"
+        )
+    return name, values
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--grid", action="append", default=[], help="name=v1,v2,... (repeatable)."
+    )
+    parser.add_argument(
+        "--range", action="append", default=[], help="name=low:high for random search."
+    )
+    parser.add_argument("--samples", type=int, default=20, help="Random-search draws.")
+    parser.add_argument("--replicates", type=int, default=4, help="Bootstrap runs per session.")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=None, help="Max sessions to replay.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    grid: Dict[str, List[Any]] = {}
+    for raw in args.grid:
+        name, values = _parse_assignment(raw)
+        grid[name] = [TUNABLE[name](value) for value in values.split(",")]
+    ranges: Dict[str, Tuple[float, float]] = {}
+    for raw in args.range:
+        name, values = _parse_assignment(raw)
+        low, _, high = values.partition(":")
+        ranges[name] = (float(low), float(high))
+    if grid and ranges:
+        parser.error("use either --grid or --range")
+    configs = grid_configs(grid) if grid else random_configs(ranges, args.samples, args.seed)
+
+    report = run_search(
+        configs,
+        replicates=args.replicates,
+        seed=args.seed,
+        workers=args.workers,
+        limit=args.limit,
+    )
+    if args.report is not None:
+        args.report.write_text(json.dumps(report, indent=2))
+    print(f"{'params':>48} {'turns':>7} {'agreement':>10} {'false_verify':>13} {'miss':>7}")
+    for row in report["frontier"]:
+        label = ",".join(f"{k}={v}" for k, v in row["params"].items()) or "(logged)"
+        print(
+            f"{label:>48} {row['avg_turns']:>7.2f} {row['agreement']:>10.1%} "
+            f"{row['false_verify_rate']:>13.1%} {row['miss_rate']:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
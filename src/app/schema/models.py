@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated, TypedDict
+
+from app.core.config import get_settings
 
 
 class Question(BaseModel):
     skill: str = Field(description="Canonical skill this question targets.")
     text: str = Field(min_length=5, description="The question content.")
     difficulty: int = Field(ge=1, le=5, description="1=easiest … 5=hardest")
+    co_skills: List[str] = Field(
+        default_factory=list,
+        description="Further skills the question probes alongside `skill` (multi-skill mode).",
+    )
 
 
 class AspectBreakdown(BaseModel):
@@ -32,6 +39,16 @@ class GradeDraft(BaseModel):
     communication: AspectBreakdown = Field(default_factory=_default_aspect_breakdown)
 
 
+class SkillGradeDraft(GradeDraft):
+    skill: str = Field(description="Skill this assessment refers to.")
+
+
+class MultiSkillGradeDraft(BaseModel):
+    grades: List[SkillGradeDraft] = Field(
+        default_factory=list, description="One assessment per targeted skill."
+    )
+
+
 class Grade(BaseModel):
     score: int = Field(ge=1, le=5, description="Rubric score 1..5")
     reasoning: str = Field(default="simulated")
@@ -39,11 +56,104 @@ class Grade(BaseModel):
         default_factory=dict,
         description="Per-aspect scores and notes used to arrive at the final grade.",
     )
+    co_grades: Dict[str, "Grade"] = Field(
+        default_factory=dict,
+        description="Grades for the question's co_skills, keyed by skill.",
+    )
+
+
+# Typed records held inside ``InterviewState``. They are plain dicts at
+# runtime (``total=False``: rows written by older versions lack newer keys);
+# the annotations let the session codec in ``app.storage.store`` and type
+# checkers see their shape. ``typing_extensions.TypedDict`` is what pydantic
+# accepts on Python < 3.12.
+
+
+class Belief(TypedDict, total=False):
+    """Per-skill belief: Welford moments plus the bounds derived from them."""
+
+    n: float
+    mean: float
+    m2: float
+    se: float
+    lcb: float
+    ucb: float
+    prior_n: float
+    prior_mean: float
+    prior_var: float
+    carried_n: float
+    carried_mean: float
+    carried_m2: float
+    borrowed_n: float
+    borrowed_mean: float
+    borrowed_m2: float
+    theta: float
+    theta_sd: float
+    irt_obs: List[List[float]]
+
+
+class HistoryEntry(TypedDict, total=False):
+    """One asked question in ``question_history``, annotated once graded."""
+
+    skill: str
+    question: str
+    difficulty: int
+    source: str
+    turn: int
+    answer: Optional[str]
+    score: Optional[int]
+    reasoning: Optional[str]
+    co_skills: List[str]
+    co_scores: Dict[str, int]
+    aspects: Dict[str, Dict[str, Any]]
+
+
+class SkillTurn(TypedDict, total=False):
+    """One answered turn in a skill's ``skill_history`` buffer."""
+
+    question: Optional[str]
+    answer: Optional[str]
+    score: Optional[int]
+    turn: Optional[int]
+
+
+class SkillSummary(TypedDict, total=False):
+    """One row of ``skill_summaries`` as shown in the UI and telemetry."""
+
+    skill: str
+    status: str
+    n: int
+    carried_n: float
+    borrowed_n: float
+    mean: float
+    se: float
+    lcb: float
+
+
+class LogEvent(TypedDict, total=False):
+    """A structured ``logs`` event; see ``utils.agent_log``."""
+
+    level: int
+    node: str
+    turn: int
+    msg: str
+    fields: Dict[str, Any]
+
+
+def append_logs(
+    left: List[Union[str, LogEvent]], right: List[Union[str, LogEvent]]
+) -> List[Union[str, LogEvent]]:
+    """``logs`` reducer: append new events, keeping the latest ``agent_log_max_events``.
+
+    Every checkpoint version stores the whole channel, so the cap bounds what a
+    session stores per step.
+    """
+    return (left + right)[-get_settings().agent_log_max_events :]
 
 
 class InterviewState(TypedDict):
     skills: List[str]
-    belief_state: Dict[str, Dict]
+    belief_state: Dict[str, Belief]
     question_pool: List[Question]
     current_question: Optional[Question]
     last_grade: Optional[Grade]
@@ -59,9 +169,33 @@ class InterviewState(TypedDict):
     ucb_C: float
     inactive_skills: List[str]
     verified_skills: List[str]
-    logs: List[str]
-    skill_summaries: List[Dict[str, object]]
-    question_history: List[Dict[str, object]]
+    logs: Annotated[List[Union[str, LogEvent]], append_logs]
+    skill_summaries: List[SkillSummary]
+    skill_rows: Dict[str, int]
+    question_history: List[HistoryEntry]
+    skill_history: Dict[str, List[SkillTurn]]
+    pipelined_grading: bool
+    grading_mode: str
+    extra_grade_budget: int
+    extra_grade_samples: int
+    llm_calls_avoided: int
+    flagged_answers: List[Dict[str, object]]
+    multi_skill_questions: bool
+    skill_groups: Dict[str, str]
+    selection_policy: str
+    prior_version: Optional[int]
+    candidate_id: Optional[str]
+    stopping_rule: str
+    difficulty_policy: str
+    item_version: Optional[int]
+    warm_started_from: List[str]
+    skill_links: Dict[str, Dict[str, float]]
+    skill_graph_version: Optional[int]
+    planner: bool
+    plan: Dict[str, Dict[str, Any]]
+    token_budget: Optional[int]
+    cost_budget: Optional[float]
+    spend: Dict[str, Dict[str, Any]]
 
 
 class InvokeRequest(BaseModel):
@@ -71,6 +205,57 @@ class InvokeRequest(BaseModel):
     verify_lcb: float = 3.75
     z_value: float = 1.96
     ucb_C: float = 1.0
+    pipelined: bool = Field(
+        default=False,
+        description="Select the next question while the previous answer is graded.",
+    )
+    grading_mode: Literal["single", "adaptive"] = Field(
+        default="single",
+        description="'adaptive' draws extra grading samples when the grade is uncertain.",
+    )
+    extra_grade_budget: int = Field(
+        default=6,
+        ge=0,
+        description="Extra grading calls the adaptive mode may spend per session.",
+    )
+    selection_policy: Literal["ucb1", "se", "thompson"] = Field(
+        default="ucb1",
+        description="Skill selection: UCB1, SE-scaled UCB, or Thompson sampling (NIG posterior).",
+    )
+    stopping_rule: Literal["lcb", "sprt"] = Field(
+        default="lcb",
+        description="Per-skill stopping: LCB bound, or SPRT with efficacy/futility boundaries.",
+    )
+    difficulty_policy: Literal["nudge", "irt"] = Field(
+        default="nudge",
+        description="Question difficulty: ±1 nudge on the last score, or IRT maximum information.",
+    )
+    multi_skill: bool = Field(
+        default=False,
+        description="Let one question probe two related, under-sampled skills.",
+    )
+    warm_start: bool = Field(
+        default=False,
+        description="Seed beliefs from the candidate's earlier sessions (profile ``ID``).",
+    )
+    skill_graph: bool = Field(
+        default=False,
+        description="Share down-weighted evidence between correlated skills.",
+    )
+    planner: bool = Field(
+        default=False,
+        description="Plan over the remaining turns: skip skills that cannot verify in time.",
+    )
+    token_budget: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="LLM tokens the session may spend; stops or switches to cheaper paths near it.",
+    )
+    cost_budget: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="LLM spend in USD the session may incur (priced per 1k tokens).",
+    )
     answer: Optional[str] = None
 
 
@@ -1,41 +1,88 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, AsyncGenerator, Dict
+import logging
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
-from fastapi import FastAPI, Header, HTTPException
+from fastapi import FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse, StreamingResponse
-
-from app.agents.interviewer.graph import build_state
+from langchain_core.callbacks import get_usage_metadata_callback
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.types import Overwrite, StateSnapshot
+from pydantic import ValidationError
+from starlette.responses import Response, StreamingResponse
+
+from app.agents.interviewer.graph import build_graph, build_state, detach_logs, state_delta
 from app.agents.interviewer.nodes.ask import ask_node
 from app.agents.interviewer.nodes.decide import decide_node
 from app.agents.interviewer.nodes.generate import generate_questions_node
-from app.agents.interviewer.nodes.grade import grade_node
 from app.agents.interviewer.nodes.select import select_question_node
-from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.agent_log import log_event, log_lines
+from app.agents.interviewer.utils.budget import call_usage, record_spend, spend_report
 from app.agents.interviewer.utils.state import summarise_skills
+from app.agents.interviewer.utils.streaming import stream_writer
+from app.service import turns
+from app.service.utils.pipeline import (
+    answered_skills,
+    apply_deferred_grade,
+    can_pipeline,
+    detach_for_grading,
+    grade_detached,
+    speculative_exclusions,
+    withdraw_speculative_question,
+)
 from app.service.utils.profile import (
     build_spans_map_from_profile,
+    candidate_id_from_profile,
+    derive_skill_groups_from_profile,
     derive_skills_from_profile,
 )
 
 from ..core.config import get_settings
 from ..core.llm import get_llm
 from ..schema.models import (
+    Grade,
     InterviewState,
     InvokeRequest,
     InvokeResponse,
+    Question,
     SimulateAnswerRequest,
     SimulateAnswerResponse,
+    SkillSummary,
 )
+from ..storage.answer_index import index_session_answers
+from ..storage.checkpoints import get_checkpointer
+from ..storage.leases import acquire_lease, release_lease
 from ..storage.store import load_state, save_state
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
 app = FastAPI(title=settings.app_name)
 
+# Compiled interview graph per checkpointer (see ``_interview_graph``).
+_graphs: "WeakKeyDictionary[BaseCheckpointSaver, Any]" = WeakKeyDictionary()
+# Nodes a pipelined turn stands in for when it checkpoints its writes.
+_TURN_NODES = ("grade", "update", "decide", "generate", "select", "ask")
+
 origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
@@ -56,17 +103,89 @@ def _encode_event(event: str, payload: Dict[str, Any]) -> bytes:
     return f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
 
 
-def _load_or_init_state(
-    request: InvokeRequest, session_id: str | None
-) -> InterviewState:
-    """Reuse an existing interview state or bootstrap a brand new ledger."""
-    if session_id and (existing := load_state(session_id)):
-        existing.setdefault("thread_id", session_id)
-        existing.setdefault("skill_summaries", summarise_skills(existing))
-        return existing
+def _event_stream(
+    chunks: Union[AsyncIterator[bytes], Iterable[bytes]], turn: Optional[turns.Turn] = None
+) -> StreamingResponse:
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # disable nginx buffering when present
+    }
+    if turn is not None:
+        # Where to resume from when the stream drops before its first event.
+        headers["X-Last-Event-ID"] = str(turn.after)
+    return StreamingResponse(chunks, media_type="text/event-stream", headers=headers)
+
+
+def _start_turn(
+    session_id: str, events: AsyncIterator[bytes], lease: Optional[str] = None
+) -> StreamingResponse:
+    """Run a turn on a background worker and stream its events as they are logged."""
+    turn = turns.submit(session_id, _failed_as_done(events), lease)
+    return _event_stream(turn.follow(), turn)
+
+
+async def _single_flight(
+    session_id: str,
+    open_turn: Callable[[], Awaitable[Union[List[bytes], AsyncGenerator[bytes, None]]]],
+) -> StreamingResponse:
+    """Start the session's next turn, or attach to the one already in flight.
+
+    Concurrent requests in this process wait on the session's lock while the
+    first one loads the thread, then follow the turn it submitted. Across
+    replicas the session's lease decides: a turn running elsewhere is followed
+    through the event log instead of being started again.
+    """
+    async with turns.session_lock(session_id):
+        running = turns.live(session_id)
+        if running is not None:
+            return _event_stream(running.follow(), running)
+        token = turns.lease_token()
+        holder = acquire_lease(session_id, token, "turn", settings.session_lease_seconds)
+        if holder.owner != token:
+            if holder.kind == "connection":
+                raise HTTPException(
+                    status_code=409, detail="session is open on a WebSocket connection"
+                )
+            return _event_stream(turns.follow_elsewhere(session_id))
+        try:
+            opened = await open_turn()
+        except BaseException:
+            release_lease(session_id, token)
+            raise
+        if isinstance(opened, list):
+            release_lease(session_id, token)
+            return _event_stream(opened)
+        return _start_turn(session_id, opened, token)
+
+
+def _replayed(session_id: str, last_event_id: str | None) -> Optional[StreamingResponse]:
+    """Replay the events a reconnecting client missed, if its turn was started."""
+    if last_event_id is None:
+        return None
+    try:
+        after = int(last_event_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Last-Event-ID must be an event id")
+    events = turns.replay(session_id, after)
+    return _event_stream(events) if events is not None else None
+
+
+async def _failed_as_done(events: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """End a failed turn with a ``done`` event carrying the error."""
+    try:
+        async for chunk in events:
+            yield chunk
+    except Exception as exc:
+        logger.exception("interview turn failed")
+        detail = exc.detail if isinstance(exc, HTTPException) else "internal error"
+        yield _encode_event("done", {"error": "turn_failed", "detail": detail})
+
+
+def _new_state(request: InvokeRequest, thread_id: str) -> InterviewState:
+    """Bootstrap a brand new ledger from the request's profile and settings."""
     skills = derive_skills_from_profile(request.profile)
     spans_map = build_spans_map_from_profile(request.profile)
-    thread_id = session_id or f"thread-{uuid4()}"
     state = build_state(
         skills,
         request.max_turns,
@@ -76,245 +195,703 @@ def _load_or_init_state(
         request.ucb_C,
         spans_map,
         thread_id=thread_id,
+        pipelined_grading=request.pipelined,
+        grading_mode=request.grading_mode,
+        extra_grade_budget=request.extra_grade_budget,
+        multi_skill_questions=request.multi_skill,
+        skill_groups=derive_skill_groups_from_profile(request.profile),
+        selection_policy=request.selection_policy,
+        stopping_rule=request.stopping_rule,
+        difficulty_policy=request.difficulty_policy,
+        candidate_id=candidate_id_from_profile(request.profile),
+        warm_start=request.warm_start,
+        skill_graph=request.skill_graph,
+        planner=request.planner,
+        token_budget=request.token_budget,
+        cost_budget=request.cost_budget,
     )
     state["skill_summaries"] = summarise_skills(state)
     return state
 
 
-def _persist_state(session_id: str | None, state: InterviewState) -> None:
-    """Persist state for resumable runs when a session id is provided."""
-    if session_id:
-        save_state(session_id, state)
+async def _interview_graph() -> Any:
+    """The interview graph compiled against this event loop's checkpointer."""
+    saver = await get_checkpointer()
+    graph = _graphs.get(saver)
+    if graph is None:
+        graph = _graphs[saver] = build_graph(checkpointer=saver, interrupt_before=["grade"])
+    return graph
 
 
-@app.get("/info")
-async def info() -> Dict[str, Any]:
-    return {
-        "app": settings.app_name,
-        "agents": ["interviewer"],
-        "models": [settings.openai_model],
-        "streaming": "sse",
+def _thread_config(thread_id: str) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _awaiting_answer(state: InterviewState) -> bool:
+    history = state.get("question_history", [])
+    return (
+        state.get("current_question") is not None
+        and bool(history)
+        and history[-1].get("answer") is None
+    )
+
+
+async def _thread_snapshot(
+    graph: Any, config: Dict[str, Any], session_id: str | None
+) -> Optional[StateSnapshot]:
+    """The session's checkpointed thread, or None when there is none yet.
+
+    Sessions stored before the service ran the graph (a ``sessions`` row but no
+    checkpoint) are imported on first use, paused before ``grade`` when their
+    question is still unanswered and before ``decide`` otherwise.
+    """
+    snapshot = await graph.aget_state(config)
+    if snapshot.values:
+        return snapshot
+    if not session_id or not (stored := load_state(session_id)):
+        return None
+    stored.setdefault("thread_id", session_id)
+    if "skill_summaries" not in stored:
+        stored["skill_summaries"] = summarise_skills(stored)
+    as_node = "ask" if _awaiting_answer(stored) else "update"
+    await graph.aupdate_state(config, stored, as_node=as_node)
+    return await graph.aget_state(config)
+
+
+class _EventPump:
+    """Forward partial ``message`` payloads emitted by node tasks to the SSE feed.
+
+    Tasks started through ``spawn`` inherit a stream writer bound to this pump;
+    ``until`` yields encoded events as they arrive and returns once the given
+    task has finished (its result is then read with ``task.result()``).
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Union[Dict[str, Any], bytes]] = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        with stream_writer(self._queue.put_nowait):
+            task = asyncio.create_task(coro)
+        self._tasks.append(task)
+        return task
+
+    def put(self, chunk: bytes) -> None:
+        """Queue an encoded event behind the partial messages received so far."""
+        self._queue.put_nowait(chunk)
+
+    @staticmethod
+    def _encode(item: Union[Dict[str, Any], bytes]) -> bytes:
+        return item if isinstance(item, bytes) else _encode_event("message", item)
+
+    async def until(self, task: asyncio.Task) -> AsyncGenerator[bytes, None]:
+        while not task.done():
+            getter = asyncio.ensure_future(self._queue.get())
+            done, _ = await asyncio.wait(
+                {task, getter}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                yield self._encode(getter.result())
+            else:
+                getter.cancel()
+        while not self._queue.empty():
+            yield self._encode(self._queue.get_nowait())
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def _run_node(
+    pump: _EventPump, coro: Coroutine[Any, Any, InterviewState], out: List[InterviewState]
+) -> AsyncGenerator[bytes, None]:
+    """Run a node under ``pump``, streaming its partial output; the result lands in ``out``."""
+    task = pump.spawn(coro)
+    async for chunk in pump.until(task):
+        yield chunk
+    out.append(task.result())
+
+
+def _node_events(node: str, state: InterviewState) -> List[bytes]:
+    """SSE events announcing what a finished graph node produced."""
+    if node == "generate":
+        return [_encode_event("node_end", {"node": "generate"})]
+    if node == "select":
+        return [_encode_event("message", _question_payload(state["current_question"]))]
+    if node == "grade":
+        grade = state.get("last_grade")
+        if grade is None:
+            raise HTTPException(status_code=500, detail="grading failed to produce a score")
+        return [_encode_event("message", _grade_payload(grade))]
+    if node == "update":
+        return [_encode_event("state", _state_payload(state))]
+    return []
+
+
+async def _run_graph(
+    graph: Any, graph_input: Optional[InterviewState], config: Dict[str, Any]
+) -> AsyncGenerator[bytes, None]:
+    """Run the graph to its next pause, streaming node output as SSE events.
+
+    ``graph_input`` starts a new thread; None resumes the checkpointed one.
+    """
+    pump = _EventPump()
+
+    async def drive() -> None:
+        node: Optional[str] = None
+        async for mode, chunk in graph.astream(
+            graph_input, config, stream_mode=["updates", "values"]
+        ):
+            if mode == "updates":
+                node = next((name for name in chunk if not name.startswith("__")), None)
+            elif node is not None:
+                for event in _node_events(node, chunk):
+                    pump.put(event)
+                node = None
+
+    task = pump.spawn(drive())
+    try:
+        async for chunk in pump.until(task):
+            yield chunk
+    finally:
+        pump.cancel()
+    task.result()
+
+
+async def _finish_turn(
+    graph: Any, config: Dict[str, Any], session_id: str | None
+) -> AsyncGenerator[bytes, None]:
+    """Close the stream: wait for the answer, or report the finished interview."""
+    snapshot = await graph.aget_state(config)
+    state = snapshot.values
+    if snapshot.next:
+        _publish(session_id, state, finished=False)
+        yield _encode_event("interrupt", {"schema": {"answer": "string"}})
+        yield _encode_event(
+            "done", {"status": "awaiting_answer", "thread_id": state.get("thread_id")}
+        )
+        return
+    _publish(session_id, state, finished=True)
+    yield _encode_event("done", _final_payload(state))
+
+
+async def _graph_turn(
+    graph: Any,
+    config: Dict[str, Any],
+    session_id: str | None,
+    graph_input: Optional[InterviewState] = None,
+    answer: Optional[str] = None,
+) -> AsyncGenerator[bytes, None]:
+    """One turn through the graph: record ``answer`` if given, run to the next pause."""
+    if answer is not None:
+        await graph.aupdate_state(config, {"pending_answer": answer}, as_node="ask")
+    async for chunk in _run_graph(graph, graph_input, config):
+        yield chunk
+    async for chunk in _finish_turn(graph, config, session_id):
+        yield chunk
+
+
+def _question_payload(question: Question) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"type": "question", "skill": question.skill, "text": question.text}
+    if question.co_skills:
+        payload["co_skills"] = list(question.co_skills)
+    return payload
+
+
+def _grade_payload(grade: Grade) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "type": "grade",
+        "score": grade.score,
+        "reason": grade.reasoning,
+        "aspects": {
+            name: {"score": detail.score, "notes": detail.notes}
+            for name, detail in grade.aspects.items()
+        },
     }
+    if grade.co_grades:
+        payload["co_grades"] = {
+            skill: {"score": co_grade.score, "reason": co_grade.reasoning}
+            for skill, co_grade in grade.co_grades.items()
+        }
+    return payload
 
 
-@app.post("/interviewer/invoke")
-async def invoke(
-    request: InvokeRequest,
-    x_api_key: str | None = Header(default=None),
-    session_id: str | None = Header(default=None),
-) -> JSONResponse:
-    """Run a single synchronous interview turn (useful for smoke tests)."""
-    verify_api_key(x_api_key)
-    state = _load_or_init_state(request, session_id)
+def _skill_summaries(state: InterviewState) -> List[SkillSummary]:
+    summaries = state.get("skill_summaries")
+    return summaries if summaries is not None else summarise_skills(state)
 
-    state = await generate_questions_node(state)
-    state = await select_question_node(state)
-    state = ask_node(state)
-    state["pending_answer"] = request.answer or ""
-    state = await grade_node(state)
-    state = update_node(state)
 
-    _persist_state(session_id, state)
-    return JSONResponse(InvokeResponse(state=state).model_dump())
+def _state_payload(state: InterviewState) -> Dict[str, Any]:
+    return {
+        "belief_state": state.get("belief_state", {}),
+        "skill_summaries": _skill_summaries(state),
+        "logs": log_lines(state.get("logs", []), last=50),
+        "thread_id": state.get("thread_id"),
+    }
 
 
-@app.post("/interviewer/stream")
-async def stream(
-    request: InvokeRequest,
-    x_api_key: str | None = Header(default=None),
-    session_id: str | None = Header(default=None),
-) -> StreamingResponse:
-    """Kick off a turn and pause once the candidate must respond."""
-    verify_api_key(x_api_key)
+def _final_payload(state: InterviewState) -> Dict[str, Any]:
+    return {
+        "verified": state.get("verified_skills", []),
+        "inactive": state.get("inactive_skills", []),
+        "skill_summaries": _skill_summaries(state),
+        "turn": state.get("turn", 0),
+        "extra_grade_samples": state.get("extra_grade_samples", 0),
+        "llm_calls_avoided": state.get("llm_calls_avoided", 0),
+        "flagged_answers": state.get("flagged_answers", []),
+        "spend": spend_report(state),
+        "logs": log_lines(state.get("logs", []), last=50),
+        "thread_id": state.get("thread_id"),
+    }
 
-    async def event_gen() -> AsyncGenerator[bytes, None]:
-        state = _load_or_init_state(request, session_id)
 
-        # If interview is already finished per policy, end early
-        cmd0 = decide_node(state)
-        if cmd0.goto != "select":
+async def _resume_pipelined(
+    graph: Any, config: Dict[str, Any], state: InterviewState, session_id: str | None
+) -> AsyncGenerator[bytes, None]:
+    """Resume with the next question selected while the grade is in flight.
+
+    Grading and selection overlap, so this turn runs outside the graph; its
+    writes are checkpointed afterwards as if the nodes had run in order.
+    See :mod:`app.service.utils.pipeline` for the reconciliation rules applied
+    when the late grade changes the decision.
+    """
+    answered = state["current_question"]
+    assert answered is not None
+    logged = detach_logs(state)
+    detached = detach_for_grading(state, answered)
+    pump = _EventPump()
+    grading = pump.spawn(grade_detached(detached))
+    try:
+        if not state.get("question_pool"):
+            state = await generate_questions_node(state)
+            yield _encode_event("node_end", {"node": "generate"})
+        selected: List[InterviewState] = []
+        async for chunk in _run_node(
+            pump,
+            select_question_node(
+                state, exclude=speculative_exclusions(state, answered)
+            ),
+            selected,
+        ):
+            yield chunk
+        state = selected[-1]
+        log_event(
+            state, "pipeline", "speculative {skill}", skill=state["current_question"].skill
+        )
+        yield _encode_event("message", _question_payload(state["current_question"]))
+
+        async for chunk in pump.until(grading):
+            yield chunk
+        graded = grading.result()
+    finally:
+        pump.cancel()
+
+    grade = graded.get("last_grade")
+    if grade is None:
+        raise HTTPException(status_code=500, detail="grading failed to produce a score")
+    yield _encode_event("message", _grade_payload(grade))
+
+    status_changed = apply_deferred_grade(state, graded, answered)
+    yield _encode_event("state", _state_payload(state))
+
+    cmd = decide_node(state)
+    if cmd.goto != "select":
+        withdrawn = withdraw_speculative_question(state, answered)
+        if withdrawn is not None:
+            yield _encode_event(
+                "message", {**_question_payload(withdrawn), "type": "question_withdrawn"}
+            )
+        await graph.aupdate_state(
+            config, state_delta(state, _TURN_NODES, logged=logged), as_node="decide"
+        )
+        _publish(session_id, state, finished=True)
+        yield _encode_event("done", _final_payload(state))
+        return
+
+    if status_changed and set(answered_skills(state["current_question"])) & set(
+        answered_skills(answered)
+    ):
+        withdrawn = withdraw_speculative_question(state, answered)
+        if withdrawn is not None:
             yield _encode_event(
+                "message", {**_question_payload(withdrawn), "type": "question_withdrawn"}
+            )
+        reselected: List[InterviewState] = []
+        async for chunk in _run_node(_EventPump(), select_question_node(state), reselected):
+            yield chunk
+        state = reselected[-1]
+        yield _encode_event("message", _question_payload(state["current_question"]))
+
+    state = ask_node(state)
+    await graph.aupdate_state(
+        config, state_delta(state, _TURN_NODES, logged=logged), as_node="ask"
+    )
+    async for chunk in _finish_turn(graph, config, session_id):
+        yield chunk
+
+
+async def _open_turn(
+    graph: Any,
+    config: Dict[str, Any],
+    snapshot: Optional[StateSnapshot],
+    request: InvokeRequest,
+    session_id: str | None,
+) -> Union[List[bytes], AsyncGenerator[bytes, None]]:
+    """What starting (or rejoining) an interview sends: fixed events, or a turn to run."""
+    fresh: Optional[InterviewState] = None
+    if snapshot is None:
+        fresh = state = _new_state(request, config["configurable"]["thread_id"])
+        paused_before: Tuple[str, ...] = ("generate",)
+        if decide_node(state).goto != "select":
+            # Nothing to ask (e.g. every skill warm-started as verified).
+            await graph.aupdate_state(config, state, as_node="decide")
+            paused_before = ()
+    else:
+        state, paused_before = snapshot.values, snapshot.next
+
+    # If interview is already finished per policy, end early
+    if not paused_before:
+        _publish(session_id, state, finished=True)
+        return [
+            _encode_event(
                 "done",
                 {
                     "verified": state.get("verified_skills", []),
                     "inactive": state.get("inactive_skills", []),
-                    "skill_summaries": state.get(
-                        "skill_summaries", summarise_skills(state)
-                    ),
+                    "skill_summaries": _skill_summaries(state),
                     "turn": state.get("turn", 0),
-                    "logs": state.get("logs", [])[-10:],
+                    "spend": spend_report(state),
+                    "logs": log_lines(state.get("logs", []), last=10),
                     "thread_id": state.get("thread_id"),
                 },
             )
-            return
-
-        # If there is already a current question awaiting answer, re-emit it instead of selecting a new one
-        if (
-            state.get("current_question") is not None
-            and (state.get("pending_answer") in (None, ""))
-            and (state.get("last_grade") is None or state.get("turn", 0) == 0)
-        ):
-            yield _encode_event(
-                "message",
-                {
-                    "type": "question",
-                    "skill": state["current_question"].skill,
-                    "text": state["current_question"].text,
-                },
-            )
-            state = ask_node(state)
-            yield b": keep-alive\n\n"
-            yield _encode_event("interrupt", {"schema": {"answer": "string"}})
-            _persist_state(session_id, state)
-            yield _encode_event(
+        ]
+
+    # If there is already a question awaiting an answer, re-emit it instead of selecting a new one
+    if paused_before == ("grade",):
+        return [
+            _encode_event("message", _question_payload(state["current_question"])),
+            b": keep-alive\n\n",
+            _encode_event("interrupt", {"schema": {"answer": "string"}}),
+            _encode_event(
                 "done",
                 {
                     "status": "awaiting_answer",
                     "thread_id": state.get("thread_id"),
                 },
-            )
-            return
-
-        # Otherwise, start a new selection
-        state = await generate_questions_node(state)
-        yield _encode_event("node_end", {"node": "generate"})
-        state = await select_question_node(state)
-        # Emit the next question so the UI can display it to the interviewer/candidate.
-        yield _encode_event(
-            "message",
-            {
-                "type": "question",
-                "skill": state["current_question"].skill,
-                "text": state["current_question"].text,
-            },
-        )
-        state = ask_node(state)
-        yield b": keep-alive\n\n"
-        yield _encode_event("interrupt", {"schema": {"answer": "string"}})
-        _persist_state(session_id, state)
-        yield _encode_event(
-            "done",
-            {"status": "awaiting_answer", "thread_id": state.get("thread_id")},
+            ),
+        ]
+
+    # Otherwise run to the next question
+    return _graph_turn(graph, config, session_id, graph_input=fresh)
+
+
+def _answer_turn(
+    graph: Any,
+    config: Dict[str, Any],
+    snapshot: Optional[StateSnapshot],
+    answer: str,
+    session_id: str | None,
+) -> AsyncGenerator[bytes, None]:
+    """The turn that grades ``answer`` to the pending question and asks the next one."""
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="session not found")
+
+    if snapshot.next != ("grade",):
+        raise HTTPException(
+            status_code=409,
+            detail="no pending question for this session",
         )
 
-    return StreamingResponse(
-        event_gen(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # disable nginx buffering when present
-        },
-    )
+    state = snapshot.values
+    if state.get("pipelined_grading") and can_pipeline(state):
+        state["pending_answer"] = answer
+        return _resume_pipelined(graph, config, state, session_id)
+    return _graph_turn(graph, config, session_id, answer=answer)
 
 
-@app.post("/interviewer/resume")
-async def resume(
+def _publish(session_id: str | None, state: InterviewState, *, finished: bool) -> None:
+    """Expose a session to duplicate detection and the offline jobs.
+
+    The checkpointer holds the live state. Answers are indexed every turn; the
+    ``sessions`` row the jobs and warm starts read is written once it is over.
+    """
+    if not session_id:
+        return
+    if finished:
+        save_state(session_id, state)
+    else:
+        index_session_answers(session_id, state)
+
+
+@app.get("/info")
+async def info() -> Dict[str, Any]:
+    return {
+        "app": settings.app_name,
+        "agents": ["interviewer"],
+        "models": [settings.openai_model],
+        "streaming": "sse",
+        "websocket": "/interviewer/ws",
+    }
+
+
+@app.post("/interviewer/invoke")
+async def invoke(
     request: InvokeRequest,
     x_api_key: str | None = Header(default=None),
     session_id: str | None = Header(default=None),
-) -> StreamingResponse:
-    """Resume an interview once the operator submits the candidate's answer."""
+) -> Response:
+    """Answer the pending question (asking one first if needed) and run to the next one."""
     verify_api_key(x_api_key)
+    graph = await _interview_graph()
+    thread_id = session_id or f"thread-{uuid4()}"
+    config = _thread_config(thread_id)
+
+    snapshot = await _thread_snapshot(graph, config, session_id)
+    if snapshot is None:
+        await graph.ainvoke(_new_state(request, thread_id), config)
+    elif snapshot.next and snapshot.next != ("grade",):
+        await graph.ainvoke(None, config)
+    snapshot = await graph.aget_state(config)
+    if snapshot.next:
+        await graph.aupdate_state(
+            config, {"pending_answer": request.answer or ""}, as_node="ask"
+        )
+        await graph.ainvoke(None, config)
+        snapshot = await graph.aget_state(config)
+
+    state = snapshot.values
+    _publish(session_id, state, finished=not snapshot.next)
+    # One pydantic-core pass straight to bytes, not model_dump + json.dumps.
+    return Response(
+        InvokeResponse(state=state).model_dump_json(), media_type="application/json"
+    )
 
-    async def event_gen() -> AsyncGenerator[bytes, None]:
-        if not session_id:
-            raise HTTPException(status_code=400, detail="session_id header required")
 
-        state = load_state(session_id)
-        if not state:
-            raise HTTPException(status_code=404, detail="session not found")
-        state.setdefault("thread_id", session_id)
+@app.post("/interviewer/stream")
+async def stream(
+    request: InvokeRequest,
+    x_api_key: str | None = Header(default=None),
+    session_id: str | None = Header(default=None),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Kick off a turn and pause once the candidate must respond.
 
-        if state.get("current_question") is None:
-            raise HTTPException(
-                status_code=409,
-                detail="no pending question for this session",
-            )
+    With ``Last-Event-ID`` the events logged after it are replayed instead,
+    following the turn if it is still running. While a turn of the session is
+    running, the request follows it rather than starting another.
+    """
+    verify_api_key(x_api_key)
+    thread_id = session_id or f"thread-{uuid4()}"
+    replayed = _replayed(thread_id, last_event_id)
+    if replayed is not None:
+        return replayed
 
-        state["pending_answer"] = request.answer or ""
-        state = await grade_node(state)
-        grade = state.get("last_grade")
-        if grade is None:
-            raise HTTPException(
-                status_code=500, detail="grading failed to produce a score"
-            )
+    async def open_turn() -> Union[List[bytes], AsyncGenerator[bytes, None]]:
+        graph = await _interview_graph()
+        config = _thread_config(thread_id)
+        snapshot = await _thread_snapshot(graph, config, session_id)
+        return await _open_turn(graph, config, snapshot, request, session_id)
 
-        yield _encode_event(
-            "message",
-            {
-                "type": "grade",
-                "score": grade.score,
-                "reason": grade.reasoning,
-                "aspects": {
-                    name: {"score": detail.score, "notes": detail.notes}
-                    for name, detail in grade.aspects.items()
-                },
-            },
-        )
+    return await _single_flight(thread_id, open_turn)
 
-        state = update_node(state)
 
-        yield _encode_event(
-            "state",
-            {
-                "belief_state": state.get("belief_state", {}),
-                "skill_summaries": state.get(
-                    "skill_summaries", summarise_skills(state)
-                ),
-                "logs": state.get("logs", [])[-50:],
-                "thread_id": state.get("thread_id"),
-            },
+@app.post("/interviewer/resume")
+async def resume(
+    request: InvokeRequest,
+    x_api_key: str | None = Header(default=None),
+    session_id: str | None = Header(default=None),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Resume an interview once the operator submits the candidate's answer.
+
+    A reconnect with ``Last-Event-ID`` replays the turn the answer started
+    rather than submitting the answer again.
+    """
+    verify_api_key(x_api_key)
+    if not session_id:
+        raise HTTPException(status_code=400, detail="session_id header required")
+    replayed = _replayed(session_id, last_event_id)
+    if replayed is not None:
+        return replayed
+
+    async def answer_turn() -> AsyncGenerator[bytes, None]:
+        assert session_id is not None
+        graph = await _interview_graph()
+        config = _thread_config(session_id)
+        snapshot = await _thread_snapshot(graph, config, session_id)
+        return _answer_turn(graph, config, snapshot, request.answer or "", session_id)
+
+    # A duplicate (double click, rerun) follows the turn the first answer started.
+    return await _single_flight(session_id, answer_turn)
+
+
+# Node whose update reproduces a thread paused before the given node (an
+# ended thread is reproduced as ``decide``).
+_PAUSED_AFTER = {
+    "generate": "update",
+    "select": "generate",
+    "ask": "select",
+    "grade": "ask",
+    "update": "grade",
+    "decide": "update",
+}
+
+
+def _paused_after(paused_before: Tuple[str, ...]) -> str:
+    return _PAUSED_AFTER.get(paused_before[0], "update") if paused_before else "decide"
+
+
+class _HeldSession:
+    """Interview state held in memory for the lifetime of a WebSocket connection.
+
+    Turns run on a graph compiled against a connection-local ``InMemorySaver``.
+    The durable checkpointer receives the state every ``ws_flush_turns``
+    answers, when the interview ends and when the connection closes; answers
+    are indexed for duplicate detection at the same points.
+    """
+
+    def __init__(self, thread_id: str, session_id: str | None) -> None:
+        self.session_id = session_id
+        self.config = _thread_config(thread_id)
+        self.graph = build_graph(checkpointer=InMemorySaver(), interrupt_before=["grade"])
+        self._durable: Any = None
+        self._stored = False
+        self._unflushed = 0
+
+    async def load(self) -> Optional[StateSnapshot]:
+        """Copy the session's durable thread, if any, into the connection's graph."""
+        self._durable = await _interview_graph()
+        snapshot = await _thread_snapshot(self._durable, self.config, self.session_id)
+        if snapshot is None:
+            return None
+        self._stored = True
+        await self.graph.aupdate_state(
+            self.config, snapshot.values, as_node=_paused_after(snapshot.next)
         )
+        return await self.graph.aget_state(self.config)
 
-        cmd = decide_node(state)
-        done_payload: Dict[str, Any]
+    async def snapshot(self) -> StateSnapshot:
+        return await self.graph.aget_state(self.config)
 
-        if cmd.goto == "select":
-            seeded = False
-            if not state.get("question_pool"):
-                state = await generate_questions_node(state)
-                seeded = True
+    async def turn_done(self) -> None:
+        self._unflushed += 1
+        snapshot = await self.snapshot()
+        if self._unflushed >= settings.ws_flush_turns or not snapshot.next:
+            await self.flush()
 
-            if seeded:
-                yield _encode_event("node_end", {"node": "generate"})
-            state = await select_question_node(state)
-            yield _encode_event(
-                "message",
-                {
-                    "type": "question",
-                    "skill": state["current_question"].skill,
-                    "text": state["current_question"].text,
-                },
-            )
-            state = ask_node(state)
-            yield b": keep-alive\n\n"
-            yield _encode_event("interrupt", {"schema": {"answer": "string"}})
-            done_payload = {"status": "awaiting_answer", "thread_id": state.get("thread_id")}
+    async def flush(self) -> None:
+        snapshot = await self.snapshot()
+        if not snapshot.values or (self._stored and not self._unflushed):
+            return
+        # Static keys (skills, spans_map, ...) only go out with the first write.
+        # Later writes replace the durable log window with the local one, which
+        # started as a copy of it.
+        if self._stored:
+            values = state_delta(snapshot.values, _TURN_NODES)
+            values["logs"] = Overwrite(snapshot.values.get("logs", []))
         else:
-            done_payload = {
-                "verified": state.get("verified_skills", []),
-                "inactive": state.get("inactive_skills", []),
-                "skill_summaries": state.get(
-                    "skill_summaries", summarise_skills(state)
-                ),
-                "turn": state.get("turn", 0),
-                "logs": state.get("logs", [])[-50:],
-                "thread_id": state.get("thread_id"),
-            }
-
-        _persist_state(session_id, state)
-        yield _encode_event("done", done_payload)
-
-    return StreamingResponse(
-        event_gen(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+            values = snapshot.values
+        await self._durable.aupdate_state(
+            self.config, values, as_node=_paused_after(snapshot.next)
+        )
+        self._stored = True
+        self._unflushed = 0
+        _publish(self.session_id, snapshot.values, finished=not snapshot.next)
+
+
+def _socket_message(chunk: bytes) -> Optional[str]:
+    """An SSE frame as a ``{"event", "data"}`` WebSocket message (None for comments)."""
+    if chunk.startswith(b":"):
+        return None
+    head, _, data = chunk.decode().partition("\ndata: ")
+    return f'{{"event": {json.dumps(head.removeprefix("event: "))}, "data": {data.strip()}}}'
+
+
+async def _send_events(
+    websocket: WebSocket, events: Union[List[bytes], AsyncIterator[bytes]]
+) -> None:
+    if isinstance(events, list):
+        events = _iterate(events)
+    async for chunk in _failed_as_done(events):
+        message = _socket_message(chunk)
+        if message is not None:
+            await websocket.send_text(message)
+
+
+async def _iterate(chunks: List[bytes]) -> AsyncGenerator[bytes, None]:
+    for chunk in chunks:
+        yield chunk
+
+
+@app.websocket("/interviewer/ws")
+async def interview_ws(websocket: WebSocket) -> None:
+    """Run a whole interview over one WebSocket connection.
+
+    The client sends the ``InvokeRequest`` payload first, then one
+    ``{"answer": ...}`` message per question. Events come back as
+    ``{"event", "data"}`` messages with the SSE event names and payloads, so a
+    turn ends with ``done``. Rejected answers get an ``error`` event, and the
+    server closes the connection once the interview is over. ``session-id``
+    and ``x-api-key`` may be sent as headers or as ``session_id`` and
+    ``api_key`` query parameters. Reconnecting with the same session id
+    re-emits the pending question. The connection holds the session's lease
+    while it is open, so a session busy elsewhere is refused with an
+    ``error`` event.
+    """
+    api_key = websocket.headers.get("x-api-key") or websocket.query_params.get("api_key")
+    if settings.api_key and api_key != settings.api_key:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid API key")
+        return
+    await websocket.accept()
+    session_id = websocket.headers.get("session-id") or websocket.query_params.get(
+        "session_id"
     )
+    thread_id = session_id or f"thread-{uuid4()}"
+    token = turns.lease_token()
+    holder = acquire_lease(thread_id, token, "connection", settings.session_lease_seconds)
+    if holder.owner != token:
+        await websocket.send_json(
+            {"event": "error", "data": {"status": 409, "detail": "session is busy"}}
+        )
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+    renewal = asyncio.create_task(turns.keep_lease(thread_id, token))
+    held = _HeldSession(thread_id, session_id)
+    try:
+        request = InvokeRequest.model_validate(await websocket.receive_json())
+        snapshot = await held.load()
+        await _send_events(
+            websocket, await _open_turn(held.graph, held.config, snapshot, request, None)
+        )
+        await held.turn_done()
+        while (await held.snapshot()).next:
+            message = await websocket.receive_json()
+            try:
+                turn = _answer_turn(
+                    held.graph,
+                    held.config,
+                    await held.snapshot(),
+                    str(message.get("answer") or ""),
+                    None,
+                )
+            except HTTPException as exc:
+                await websocket.send_json(
+                    {"event": "error", "data": {"status": exc.status_code, "detail": exc.detail}}
+                )
+                continue
+            await _send_events(websocket, turn)
+            await held.turn_done()
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    except ValidationError as exc:
+        await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA, reason=str(exc)[:120])
+    finally:
+        await held.flush()
+        renewal.cancel()
+        release_lease(thread_id, token)
 
 
 DEFAULT_SIM_PERSONA = (
@@ -356,8 +933,20 @@ async def simulation_answer(
     if hasattr(llm, "with_config"):
         llm = llm.with_config(**run_config)
     try:
-        message = await llm.ainvoke(prompt)
+        with get_usage_metadata_callback() as usage:
+            message = await llm.ainvoke(prompt)
         answer = getattr(message, "content", str(message)).strip()
+        # Simulated answers count against the session's budget too.
+        if session_id:
+            graph = await _interview_graph()
+            config = _thread_config(session_id)
+            snapshot = await graph.aget_state(config)
+            if snapshot.next == ("grade",):
+                state = snapshot.values
+                record_spend(
+                    state, "simulate_answer", call_usage(usage.usage_metadata, prompt, answer)
+                )
+                await graph.aupdate_state(config, {"spend": state["spend"]}, as_node="ask")
     except Exception:
         answer = (
             "I would outline the key steps, explain the reasoning behind them, and "
@@ -0,0 +1,227 @@
+"""Background execution of interview turns.
+
+``/interviewer/stream`` and ``/interviewer/resume`` do not run a turn inside
+the request. They ``submit`` its event stream to a pool of ``turn_workers``
+workers fed by a local queue, and the response follows the turn's events. A
+worker numbers each event with the session's next sequence id, keeps the
+turn's events in memory while it runs, and appends them to the session's
+event log (``app.storage.events``) when it ends.
+
+A dropped stream therefore no longer cancels the turn. A reconnect carrying
+``Last-Event-ID`` replays the events after that id, then keeps following the
+turn if it is still running, without repeating any LLM call.
+
+Workers are bound to the event loop that started them, so a pool is started
+per loop (see ``app.storage.checkpoints``).
+
+A session runs one turn at a time. Requests for it are serialised by a keyed
+lock in this process and by a lease in the store across replicas
+(``app.storage.leases``). A turn holds its lease until it has been logged,
+renewing it while it runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import uuid4
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from app.core.config import get_settings
+from app.storage.events import append_events, last_event_id, load_events
+from app.storage.leases import lease_holder, release_lease, renew_lease
+
+logger = logging.getLogger(__name__)
+
+# Followers send an SSE comment when a turn has been quiet this long, so
+# proxies do not close an idle stream while an LLM call is in flight.
+HEARTBEAT_SECONDS = 15.0
+# How often a follower of a turn running on another replica reads the log.
+REMOTE_POLL_SECONDS = 0.5
+
+_Job = Tuple["Turn", AsyncIterator[bytes]]
+
+_queues: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Queue[_Job]]" = (
+    WeakKeyDictionary()
+)
+# The turn submitted last for each session, until it has been logged.
+_live: Dict[str, "Turn"] = {}
+_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+_PROCESS = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Turn:
+    """Events of one turn, numbered after ``after`` and readable while it runs."""
+
+    def __init__(self, session_id: str, after: int, lease: Optional[str] = None) -> None:
+        self.session_id = session_id
+        self.after = after
+        self.lease = lease
+        self.events: List[Tuple[int, bytes]] = []
+        self.finished = False
+        self._changed = asyncio.Event()
+
+    @property
+    def last_id(self) -> int:
+        return self.events[-1][0] if self.events else self.after
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def record(self, frame: bytes) -> None:
+        """Number and keep an encoded SSE event (comments are not logged)."""
+        if frame.startswith(b":"):
+            return
+        seq = self.last_id + 1
+        self.events.append((seq, b"id: %d\n" % seq + frame))
+        self._notify()
+
+    async def run(self, events: AsyncIterator[bytes]) -> None:
+        renewal: Optional[asyncio.Task] = None
+        if self.lease is not None:
+            renewal = asyncio.create_task(keep_lease(self.session_id, self.lease))
+        try:
+            async for frame in events:
+                self.record(frame)
+        except Exception:
+            logger.exception("turn failed for session %s", self.session_id)
+        finally:
+            append_events(self.session_id, self.events)
+            if self.lease is not None and renewal is not None:
+                renewal.cancel()
+                release_lease(self.session_id, self.lease)
+            self.finished = True
+            if _live.get(self.session_id) is self:
+                del _live[self.session_id]
+            self._notify()
+
+    async def follow(self, after: Optional[int] = None) -> AsyncGenerator[bytes, None]:
+        """Yield the turn's events after ``after`` as they are recorded, until it ends."""
+        position = self.after if after is None else after
+        while True:
+            changed = self._changed
+            # Ids are contiguous from ``after + 1``, so the unseen ones are a slice.
+            fresh = self.events[max(0, position - self.after) :]
+            if fresh:
+                position = fresh[-1][0]
+                for _, frame in fresh:
+                    yield frame
+                continue
+            if self.finished:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+
+
+async def _work(queue: "asyncio.Queue[_Job]") -> None:
+    while True:
+        turn, events = await queue.get()
+        try:
+            await turn.run(events)
+        finally:
+            queue.task_done()
+
+
+def _queue() -> "asyncio.Queue[_Job]":
+    loop = asyncio.get_running_loop()
+    queue = _queues.get(loop)
+    if queue is None:
+        queue = _queues[loop] = asyncio.Queue()
+        for _ in range(max(1, get_settings().turn_workers)):
+            loop.create_task(_work(queue))
+    return queue
+
+
+def submit(
+    session_id: str, events: AsyncIterator[bytes], lease: Optional[str] = None
+) -> Turn:
+    """Queue a turn producing ``events`` (encoded SSE frames) for a worker.
+
+    ``lease`` is handed over to the turn, which releases it once logged.
+    """
+    live = _live.get(session_id)
+    after = max(last_event_id(session_id), live.last_id if live else 0)
+    turn = _live[session_id] = Turn(session_id, after, lease)
+    _queue().put_nowait((turn, events))
+    return turn
+
+
+def replay(session_id: str, after: int) -> Optional[AsyncGenerator[bytes, None]]:
+    """Events after ``after``: logged ones, then the running turn's.
+
+    None when there is nothing to replay, i.e. the client saw the whole log and
+    no turn is running, so the request it retried never started one.
+    """
+    turn = _live.get(session_id)
+    logged = load_events(session_id, after)
+    if turn is None and not logged:
+        return None
+    return _replay(logged, turn, after)
+
+
+async def _replay(
+    logged: List[Tuple[int, bytes]], turn: Optional[Turn], after: int
+) -> AsyncGenerator[bytes, None]:
+    for seq, frame in logged:
+        yield frame
+        after = seq
+    if turn is not None:
+        async for frame in turn.follow(after):
+            yield frame
+
+
+def live(session_id: str) -> Optional[Turn]:
+    """The session's turn running (or queued) in this process, if any."""
+    return _live.get(session_id)
+
+
+def session_lock(session_id: str) -> asyncio.Lock:
+    """The process-wide lock serialising requests that may start a turn for a session."""
+    lock = _locks.get(session_id)
+    if lock is None:
+        lock = _locks[session_id] = asyncio.Lock()
+    return lock
+
+
+def lease_token() -> str:
+    """A fresh lease owner id, naming this process for operators."""
+    return f"{_PROCESS}:{uuid4().hex}"
+
+
+async def keep_lease(session_id: str, token: str) -> None:
+    """Renew a held lease until cancelled (or until it turns out to be lost)."""
+    ttl = get_settings().session_lease_seconds
+    while True:
+        await asyncio.sleep(ttl / 3)
+        if not renew_lease(session_id, token, ttl):
+            logger.warning("lease on session %s lost while held", session_id)
+            return
+
+
+async def follow_elsewhere(session_id: str) -> AsyncGenerator[bytes, None]:
+    """Events of a turn another replica runs, read from the log once it is written.
+
+    The running replica logs a turn when it ends and only then releases the
+    lease, so everything is read once the lease is free.
+    """
+    after = last_event_id(session_id)
+    quiet = 0.0
+    while True:
+        running = lease_holder(session_id) is not None
+        for seq, frame in load_events(session_id, after):
+            yield frame
+            after = seq
+            quiet = 0.0
+        if not running:
+            return
+        await asyncio.sleep(REMOTE_POLL_SECONDS)
+        quiet += REMOTE_POLL_SECONDS
+        if quiet >= HEARTBEAT_SECONDS:
+            quiet = 0.0
+            yield b": keep-alive\n\n"
@@ -0,0 +1,138 @@
+"""Pipelined resume: pick the next question while the last answer is graded.
+
+The sequential resume path runs ``grade → update → decide → select`` before the
+candidate sees anything new. In pipelined mode the service selects the next
+question from the *current* beliefs straight away, grades concurrently, and
+applies the belief update once the grade lands.
+
+Reconciliation once the late grade has been applied:
+
+1. ``decide_node`` says END → the speculative question is withdrawn (returned
+   to the front of ``question_pool``) and the interview finishes as usual.
+2. The speculative question targets an answered skill (no other skill was
+   available) and an answered skill just became verified or inactive → withdraw
+   it and select again with the updated beliefs.
+3. Otherwise the speculative question stands; only the answered skills'
+   beliefs changed, so the selection would not have been affected by the grade.
+
+"Answered skills" are the question's ``skill`` plus any multi-skill ``co_skills``.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from app.agents.interviewer.nodes.grade import grade_node
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.agent_log import log_event
+from app.schema.models import InterviewState, Question
+
+
+# Session counters grade_node may advance on its detached copy of the state.
+_GRADE_COUNTERS = ("extra_grade_budget", "extra_grade_samples", "llm_calls_avoided")
+
+
+def can_pipeline(state: InterviewState) -> bool:
+    """Return True when a speculative next question could still be asked.
+
+    Every graded answer increments ``turn``; if that exhausts ``max_turns`` the
+    interview ends regardless of the grade and there is nothing to prefetch.
+    """
+    return int(state.get("turn", 0)) + 1 < int(state.get("max_turns", 0))
+
+
+def answered_skills(question: Question) -> List[str]:
+    return [question.skill, *question.co_skills]
+
+
+def speculative_exclusions(state: InterviewState, answered: Question) -> List[str]:
+    """Skills to keep out of the speculative pick.
+
+    The answered skills are excluded whenever another undecided skill remains,
+    so the prefetched question does not depend on the grade still in flight.
+    """
+    excluded = answered_skills(answered)
+    decided = set(state.get("inactive_skills", [])) | set(
+        state.get("verified_skills", [])
+    )
+    others = [
+        skill
+        for skill in state.get("skills", [])
+        if skill not in excluded and skill not in decided
+    ]
+    return excluded if others else []
+
+
+def detach_for_grading(state: InterviewState, answered: Question) -> InterviewState:
+    """Shallow copy of the state to grade ``answered`` on.
+
+    Take it before selection runs: selecting replaces ``current_question``
+    without suspending when the pool serves the pick. The ``spend`` ledger is
+    shared, so grading and drafting both book against it.
+    """
+    state.setdefault("spend", {})
+    snapshot: InterviewState = dict(state)  # type: ignore[assignment]
+    snapshot["current_question"] = answered
+    snapshot["logs"] = []
+    return snapshot
+
+
+async def grade_detached(snapshot: InterviewState) -> InterviewState:
+    """Grade a :func:`detach_for_grading` copy while selection mutates the live state."""
+    return await grade_node(snapshot)
+
+
+def _skill_status(state: InterviewState, skill: str) -> str:
+    if skill in state.get("verified_skills", []):
+        return "verified"
+    if skill in state.get("inactive_skills", []):
+        return "inactive"
+    return "probing"
+
+
+def apply_deferred_grade(
+    state: InterviewState, graded: InterviewState, answered: Question
+) -> bool:
+    """Fold a late grade into the live state and run ``update_node`` for it.
+
+    Returns True when an answered skill changed status (verified/inactive).
+    """
+    state["last_grade"] = graded.get("last_grade")
+    state["last_answer"] = graded.get("last_answer")
+    state["pending_answer"] = None
+    for key in _GRADE_COUNTERS:
+        if key in graded:
+            state[key] = graded[key]  # type: ignore[literal-required]
+    state.setdefault("logs", []).extend(graded.get("logs", []))
+
+    skills = answered_skills(answered)
+    before = [_skill_status(state, skill) for skill in skills]
+    speculative = state.get("current_question")
+    history = state.setdefault("question_history", [])
+    # The speculative question was recorded after the answered one; park it so
+    # update_node annotates the right history entry.
+    parked = history.pop() if speculative is not answered and history else None
+    state["current_question"] = answered
+    update_node(state)
+    if parked is not None:
+        history.append(parked)
+    state["current_question"] = speculative
+    return [_skill_status(state, skill) for skill in skills] != before
+
+
+def withdraw_speculative_question(
+    state: InterviewState, answered: Question
+) -> Optional[Question]:
+    """Undo a speculative selection, returning the question to the pool."""
+    speculative = state.get("current_question")
+    if speculative is None or speculative is answered:
+        return None
+    history = state.get("question_history", [])
+    if history and history[-1].get("question") == speculative.text:
+        history.pop()
+    state.setdefault("question_pool", []).insert(0, speculative)
+    state["current_question"] = answered
+    log_event(
+        state, "pipeline", "withdrew speculative question for {skill}", skill=speculative.skill
+    )
+    return speculative
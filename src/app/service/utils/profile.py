@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 def derive_skills_from_profile(profile: Dict) -> List[str]:
@@ -23,3 +23,25 @@ def build_spans_map_from_profile(profile: Dict) -> Dict[str, List[str]]:
         evidence_sources = entry.get("evidence_sources", [])
         spans[skill] = [source.get("span", "") for source in evidence_sources]
     return spans
+
+
+def derive_skill_groups_from_profile(profile: Dict) -> Dict[str, str]:
+    """Map each skill to its taxonomy parent (``"ml/frameworks/pytorch"`` → ``"ml/frameworks"``).
+
+    Skills sharing a parent count as related for multi-skill questions; skills
+    without one are left out.
+    """
+    groups: Dict[str, str] = {}
+    for entry in profile.get("SKILLS", []):
+        taxonomy_id = entry.get("taxonomy_id")
+        if not taxonomy_id or "/" not in taxonomy_id:
+            continue
+        parent, _, leaf = taxonomy_id.lower().rpartition("/")
+        groups[leaf] = parent
+    return groups
+
+
+def candidate_id_from_profile(profile: Dict) -> Optional[str]:
+    """Stable candidate identity used to link sessions (the profile ``ID``)."""
+    candidate_id = profile.get("ID")
+    return str(candidate_id) if candidate_id not in (None, "") else None
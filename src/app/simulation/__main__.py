@@ -0,0 +1,3 @@
+from app.simulation.simulator import main
+
+main()
@@ -0,0 +1,407 @@
+"""Synthetic-candidate simulator driving the production interview nodes.
+
+Each simulated interview runs ``generate → select → ask → grade → update →
+decide`` through the real node functions, with ``app.core.llm.get_llm``
+swapped for ``SimulatedLLM``: question drafts come back canned and grading
+calls return aspect drafts drawn from the candidate model below. Selection,
+Welford updates, verification and stopping are therefore exactly the
+production code — unlike ``src/policy_effectiveness.ipynb``, which carries its
+own copy of the maths.
+
+Candidate model (``Population``), per skill:
+
+- true ability ~ Normal(``ability_mean``, ``ability_sd``), equicorrelated
+  across a candidate's skills with ``ability_correlation``;
+- a persistent grader offset per candidate × skill with standard deviation
+  ``grader_correlation * grader_noise`` (correlated grading errors);
+- each answer's quality = ability + offset + Normal(0, ``answer_noise``);
+  with ``difficulty_effect`` > 0 the ability term becomes the expected grade
+  of a Rasch item at ``b = difficulty_effect * (level - 3)``, so harder
+  questions score lower (ability is the expected grade at level 3);
+- each grading call scores round(quality + ``grader_bias`` + Normal(0,
+  ``grader_noise``)), clipped to 1..5.
+
+A policy's ``skill_graph`` (> 0) links every pair of simulated skills with
+that edge weight, as a hand-authored graph matching ``ability_correlation``
+would.
+
+Reported per policy configuration: average turns, false-verify rate
+(verified skills whose true ability is below ``verify_lcb``, over all such
+skills), miss rate (skills at or above the bar left unverified), LLM calls and cost
+per candidate, and average tokens (estimated, since the scripted model reports
+no usage; ``token_budget`` > 0 caps them per interview). Candidates are split into batches and run across a
+process pool; candidate ``i`` always uses seed ``(seed, i)``, so results do not
+depend on ``--workers``. Thompson sampling draws from an unseeded generator
+inside ``select_question_node`` and is only reproducible in distribution.
+
+Usage::
+
+    python -m app.simulation --candidates 2000 --workers 4 \\
+        --policy ucb1 --policy se:ucb_C=2 --policy thompson \\
+        --grader-noise 0.5 --grader-bias 0.2 --grader-correlation 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+import app.core.llm as llm_module
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.ask import ask_node
+from app.agents.interviewer.nodes.decide import decide_node
+from app.agents.interviewer.nodes.generate import generate_questions_node
+from app.agents.interviewer.nodes.grade import grade_node
+from app.agents.interviewer.nodes.select import select_question_node
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.budget import spend_totals
+from app.schema.models import AspectBreakdown, GradeDraft, Question
+
+_ASPECTS = ("coverage", "technical_depth", "evidence", "communication")
+_BATCH = 50
+
+
+@dataclass(frozen=True)
+class Population:
+    """Synthetic candidates and the grader that scores them (see module docstring)."""
+
+    skills: int = 5
+    ability_mean: float = 3.5
+    ability_sd: float = 0.8
+    ability_correlation: float = 0.3
+    answer_noise: float = 0.5
+    grader_noise: float = 0.4
+    grader_bias: float = 0.0
+    grader_correlation: float = 0.0
+    difficulty_effect: float = 0.0
+
+    def skill_names(self) -> List[str]:
+        return [f"skill-{idx}" for idx in range(self.skills)]
+
+    def sample(self, rng: np.random.Generator) -> "Candidate":
+        names = self.skill_names()
+        rho = min(max(self.ability_correlation, 0.0), 1.0)
+        shared = rng.normal()
+        own = rng.normal(size=len(names))
+        levels = self.ability_mean + self.ability_sd * (
+            np.sqrt(rho) * shared + np.sqrt(1.0 - rho) * own
+        )
+        offsets = rng.normal(0.0, self.grader_correlation * self.grader_noise, len(names))
+        return Candidate(
+            abilities={name: float(np.clip(level, 1.0, 5.0)) for name, level in zip(names, levels)},
+            offsets={name: float(offset) for name, offset in zip(names, offsets)},
+        )
+
+
+class Candidate(NamedTuple):
+    abilities: Dict[str, float]
+    offsets: Dict[str, float]
+
+
+@dataclass(frozen=True)
+class PolicyConfig:
+    """Interview settings for one simulated arm (mirrors ``InvokeRequest``)."""
+
+    selection_policy: str = "ucb1"
+    stopping_rule: str = "lcb"
+    difficulty_policy: str = "nudge"
+    max_turns: int = 12
+    min_q: int = 2
+    verify_lcb: float = 3.75
+    z_value: float = 1.96
+    ucb_C: float = 1.0
+    grading_mode: str = "single"
+    extra_grade_budget: int = 6
+    skill_graph: float = 0.0
+    planner: bool = False
+    token_budget: int = 0
+
+    @property
+    def label(self) -> str:
+        default = PolicyConfig(selection_policy=self.selection_policy)
+        changed = [
+            f"{field.name}={getattr(self, field.name)}"
+            for field in fields(self)
+            if getattr(self, field.name) != getattr(default, field.name)
+        ]
+        return ":".join([self.selection_policy, ",".join(changed)]) if changed else self.selection_policy
+
+
+def parse_policy(spec: str) -> PolicyConfig:
+    """Parse ``"se:ucb_C=2,max_turns=10"`` into a ``PolicyConfig``."""
+    name, _, overrides = spec.partition(":")
+    config = PolicyConfig(selection_policy=name.strip())
+    types = {field.name: type(getattr(config, field.name)) for field in fields(config)}
+    values: Dict[str, Any] = {}
+    for item in filter(None, (part.strip() for part in overrides.split(","))):
+        key, sep, raw = item.partition("=")
+        if not sep or key not in types:
+            raise ValueError(f"invalid policy override {item!r} in {spec!r}")
+        if types[key] is bool:
+            values[key] = raw.strip().lower() in ("1", "true", "yes")
+        else:
+            values[key] = types[key](raw)
+    return replace(config, **values)
+
+
+class SimulatedLLM:
+    """Chat-model stand-in for the nodes' structured-output calls.
+
+    Counts calls per kind; grading draws a fresh grader error per call, so
+    adaptive grading's extra samples disagree the way real ones would.
+    """
+
+    def __init__(self, candidate: Candidate, population: Population, rng: np.random.Generator):
+        self._candidate = candidate
+        self._population = population
+        self._rng = rng
+        self._quality = 0.0
+        self.calls: Counter[str] = Counter()
+
+    def answer(self, skill: str, difficulty: int = 3) -> str:
+        """Draw the quality of the candidate's next answer on ``skill``."""
+        level = self._candidate.abilities[skill]
+        effect = self._population.difficulty_effect
+        if effect > 0:
+            share = min(max((level - 1.0) / 4.0, 0.01), 0.99)
+            theta = math.log(share / (1.0 - share)) - effect * (difficulty - 3)
+            level = 1.0 + 4.0 / (1.0 + math.exp(-theta))
+        self._quality = (
+            level
+            + self._candidate.offsets[skill]
+            + float(self._rng.normal(0.0, self._population.answer_noise))
+        )
+        return f"Simulated answer on {skill}: design trade-offs, failure modes and measurements."
+
+    def with_structured_output(self, schema: type) -> "_StructuredCall":
+        return _StructuredCall(self, schema)
+
+    def respond(self, schema: type) -> Any:
+        if schema is Question:
+            self.calls["question"] += 1
+            return Question(skill="simulated", text="Simulated follow-up question.", difficulty=3)
+        if schema is GradeDraft:
+            self.calls["grade"] += 1
+            raw = self._quality + self._population.grader_bias
+            raw += float(self._rng.normal(0.0, self._population.grader_noise))
+            score = int(np.clip(np.rint(raw), 1, 5))
+            aspect = AspectBreakdown(score=score, notes="simulated")
+            return GradeDraft(reasoning="simulated", **{name: aspect for name in _ASPECTS})
+        raise NotImplementedError(f"simulator has no response for {schema.__name__}")
+
+
+class _StructuredCall:
+    def __init__(self, llm: SimulatedLLM, schema: type):
+        self._llm = llm
+        self._schema = schema
+
+    def with_config(self, **kwargs: Any) -> "_StructuredCall":
+        return self
+
+    async def ainvoke(self, prompt: Any) -> Any:
+        return self._llm.respond(self._schema)
+
+
+@contextmanager
+def _patched_llm(llm: SimulatedLLM) -> Iterator[None]:
+    original = llm_module.get_llm
+    llm_module.get_llm = lambda *args, **kwargs: llm  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        llm_module.get_llm = original  # type: ignore[assignment]
+
+
+async def simulate_candidate(
+    config: PolicyConfig, population: Population, seed: Sequence[int]
+) -> Dict[str, Any]:
+    """Run one synthetic interview through the production nodes."""
+    rng = np.random.default_rng(list(seed))
+    candidate = population.sample(rng)
+    llm = SimulatedLLM(candidate, population, rng)
+    names = population.skill_names()
+    links = (
+        {skill: {other: config.skill_graph for other in names if other != skill} for skill in names}
+        if config.skill_graph > 0
+        else {}
+    )
+    state = build_state(
+        names,
+        config.max_turns,
+        config.min_q,
+        config.verify_lcb,
+        config.z_value,
+        config.ucb_C,
+        {},
+        thread_id=f"sim-{'-'.join(map(str, seed))}",
+        grading_mode=config.grading_mode,
+        extra_grade_budget=config.extra_grade_budget,
+        selection_policy=config.selection_policy,
+        stopping_rule=config.stopping_rule,
+        difficulty_policy=config.difficulty_policy,
+        priors={},
+        skill_links=links,
+        planner=config.planner,
+        token_budget=config.token_budget or None,
+    )
+    with _patched_llm(llm):
+        state = await generate_questions_node(state)
+        while True:
+            state = await select_question_node(state)
+            state = ask_node(state)
+            question = state["current_question"]
+            state["pending_answer"] = llm.answer(question.skill, question.difficulty)
+            state = await grade_node(state)
+            state = update_node(state)
+            if decide_node(state).goto != "select":
+                break
+    return {
+        "turns": state["turn"],
+        "verified": list(state["verified_skills"]),
+        "abilities": candidate.abilities,
+        "calls": dict(llm.calls),
+        "tokens": spend_totals(state)["tokens"],
+    }
+
+
+def _run_batch(
+    config: PolicyConfig, population: Population, seed: int, indices: Sequence[int]
+) -> List[Dict[str, Any]]:
+    """Worker entry point: simulate a batch of candidates in one event loop."""
+
+    async def run() -> List[Dict[str, Any]]:
+        return [await simulate_candidate(config, population, (seed, idx)) for idx in indices]
+
+    return asyncio.run(run())
+
+
+def summarise(
+    config: PolicyConfig,
+    outcomes: Sequence[Dict[str, Any]],
+    *,
+    question_cost: float = 1.0,
+    grade_cost: float = 1.0,
+) -> Dict[str, Any]:
+    """Aggregate per-candidate outcomes into the per-policy report row."""
+    below = false_verified = above = missed = 0
+    for outcome in outcomes:
+        verified = set(outcome["verified"])
+        for skill, ability in outcome["abilities"].items():
+            if ability < config.verify_lcb:
+                below += 1
+                false_verified += skill in verified
+            else:
+                above += 1
+                missed += skill not in verified
+    calls = Counter()
+    for outcome in outcomes:
+        calls.update(outcome["calls"])
+    count = max(len(outcomes), 1)
+    return {
+        "policy": config.label,
+        "config": asdict(config),
+        "candidates": len(outcomes),
+        "avg_turns": round(statistics.fmean(o["turns"] for o in outcomes), 3) if outcomes else 0.0,
+        "false_verify_rate": round(false_verified / below, 4) if below else 0.0,
+        "miss_rate": round(missed / above, 4) if above else 0.0,
+        "llm_calls": round(sum(calls.values()) / count, 3),
+        "grade_calls": round(calls["grade"] / count, 3),
+        "avg_tokens": round(statistics.fmean(o.get("tokens", 0) for o in outcomes), 1) if outcomes else 0.0,
+        "llm_cost": round((calls["question"] * question_cost + calls["grade"] * grade_cost) / count, 4),
+    }
+
+
+def simulate(
+    configs: Sequence[PolicyConfig],
+    population: Population,
+    *,
+    candidates: int,
+    seed: int = 0,
+    workers: int = 1,
+    question_cost: float = 1.0,
+    grade_cost: float = 1.0,
+) -> List[Dict[str, Any]]:
+    """Simulate ``candidates`` interviews per configuration; one report row each.
+
+    Every configuration sees the same candidates (same seeds).
+    """
+    batches = [range(start, min(start + _BATCH, candidates)) for start in range(0, candidates, _BATCH)]
+    outcomes: Dict[int, List[Dict[str, Any]]] = {idx: [] for idx in range(len(configs))}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (idx, pool.submit(_run_batch, config, population, seed, list(batch)))
+                for idx, config in enumerate(configs)
+                for batch in batches
+            ]
+            for idx, future in futures:
+                outcomes[idx].extend(future.result())
+    else:
+        for idx, config in enumerate(configs):
+            for batch in batches:
+                outcomes[idx].extend(_run_batch(config, population, seed, list(batch)))
+    return [
+        summarise(config, outcomes[idx], question_cost=question_cost, grade_cost=grade_cost)
+        for idx, config in enumerate(configs)
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--policy",
+        action="append",
+        default=None,
+        help="NAME[:key=value,...], e.g. 'se:ucb_C=2'. Repeatable (default: ucb1, se, thompson).",
+    )
+    parser.add_argument("--candidates", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    defaults = Population()
+    for field in fields(Population):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(getattr(defaults, field.name)),
+            default=getattr(defaults, field.name),
+        )
+    parser.add_argument("--question-cost", type=float, default=1.0, help="Cost of one question draft.")
+    parser.add_argument("--grade-cost", type=float, default=1.0, help="Cost of one grading call.")
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here.")
+    args = parser.parse_args(argv)
+
+    population = Population(**{field.name: getattr(args, field.name) for field in fields(Population)})
+    configs = [parse_policy(spec) for spec in args.policy or ("ucb1", "se", "thompson")]
+    rows = simulate(
+        configs,
+        population,
+        candidates=args.candidates,
+        seed=args.seed,
+        workers=args.workers,
+        question_cost=args.question_cost,
+        grade_cost=args.grade_cost,
+    )
+    print(
+        f"{'policy':>28} {'turns':>7} {'false_verify':>13} {'miss':>7} {'llm_calls':>10} {'cost':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['policy']:>28} {row['avg_turns']:>7.2f} {row['false_verify_rate']:>13.1%} "
+            f"{row['miss_rate']:>7.1%} {row['llm_calls']:>10.2f} {row['llm_cost']:>8.2f}"
+        )
+    if args.report is not None:
+        args.report.write_text(json.dumps({"population": asdict(population), "policies": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""MinHash/LSH index of graded answers for near-duplicate detection.
+
+Canned answers pasted by several candidates are caught before grading: each
+graded answer is normalised, shingled into word trigrams and reduced to a
+64-value MinHash signature. Signatures are banded (16 bands × 4 rows) into
+per-skill LSH buckets, so a lookup only compares against answers sharing at
+least one band — a handful of vector comparisons instead of a scan.
+
+Signatures are persisted in the ``answer_signatures`` table (with the usual
+in-memory fallback) and added incrementally from ``save_state``. Each process
+loads the table once on first use; answers saved by other processes after
+that are picked up on restart.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import Column, Integer, MetaData, Table, Text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db import get_engine
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+# Short answers ("I used it at work") collide by accident; leave them alone.
+MIN_WORDS = 8
+
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20251012)
+_PERM_A = _rng.integers(1, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+_metadata = MetaData()
+_signatures = Table(
+    "answer_signatures",
+    _metadata,
+    Column("key", Text, primary_key=True),
+    Column("session_id", Text, nullable=False),
+    Column("skill", Text, nullable=False),
+    Column("question_key", Integer, nullable=False),
+    Column("signature", Text, nullable=False),
+    Column("score", Integer, nullable=True),
+    Column("reasoning", Text, nullable=True),
+    Column("aspects", Text, nullable=True),
+)
+
+_memory_rows: Dict[str, Dict[str, Any]] = {}
+
+
+def normalize_answer(text: str) -> str:
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _shingles(words: List[str]) -> Set[str]:
+    if len(words) < SHINGLE_SIZE:
+        return set(words)
+    return {
+        " ".join(words[idx : idx + SHINGLE_SIZE])
+        for idx in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """MinHash signature of an answer, or None when it is too short to index."""
+    words = normalize_answer(text).split()
+    if len(words) < MIN_WORDS:
+        return None
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in _shingles(words)),
+        dtype=np.uint64,
+    ) % _PRIME
+    return ((np.outer(hashes, _PERM_A) + _PERM_B) % _PRIME).min(axis=0)
+
+
+def question_key(question: str) -> int:
+    return zlib.crc32(normalize_answer(question).encode())
+
+
+class DuplicateMatch(NamedTuple):
+    key: str
+    session_id: str
+    similarity: float
+    same_question: bool
+    score: Optional[int]
+    reasoning: Optional[str]
+    aspects: Dict[str, Dict[str, Any]]
+
+
+class _Entry(NamedTuple):
+    key: str
+    session_id: str
+    skill: str
+    question_key: int
+    signature: np.ndarray
+    score: Optional[int]
+    reasoning: Optional[str]
+    aspects: Dict[str, Dict[str, Any]]
+
+
+class AnswerIndex:
+    """In-memory LSH buckets keyed by skill, over MinHash signatures."""
+
+    def __init__(self) -> None:
+        self._entries: List[_Entry] = []
+        self._keys: Set[str] = set()
+        self._buckets: Dict[Tuple[str, int, bytes], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def _bands(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(BANDS):
+            yield band, signature[band * ROWS : (band + 1) * ROWS].tobytes()
+
+    def add_signature(
+        self,
+        key: str,
+        session_id: str,
+        skill: str,
+        q_key: int,
+        signature: np.ndarray,
+        score: Optional[int] = None,
+        reasoning: Optional[str] = None,
+        aspects: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> bool:
+        if key in self._keys:
+            return False
+        entry = _Entry(key, session_id, skill, q_key, signature, score, reasoning, aspects or {})
+        position = len(self._entries)
+        self._entries.append(entry)
+        self._keys.add(key)
+        for band, digest in self._bands(signature):
+            self._buckets.setdefault((skill, band, digest), []).append(position)
+        return True
+
+    def query(
+        self,
+        skill: str,
+        question: str,
+        answer: str,
+        *,
+        threshold: float,
+        exclude_session: Optional[str] = None,
+    ) -> Optional[DuplicateMatch]:
+        """Best previously seen answer for ``skill`` with similarity ≥ ``threshold``."""
+        signature = minhash(answer)
+        if signature is None:
+            return None
+        candidates: Set[int] = set()
+        for band, digest in self._bands(signature):
+            candidates.update(self._buckets.get((skill, band, digest), ()))
+        best: Optional[Tuple[float, _Entry]] = None
+        for position in candidates:
+            entry = self._entries[position]
+            if exclude_session is not None and entry.session_id == exclude_session:
+                continue
+            similarity = float(np.count_nonzero(entry.signature == signature)) / NUM_PERM
+            if similarity >= threshold and (best is None or similarity > best[0]):
+                best = (similarity, entry)
+        if best is None:
+            return None
+        similarity, entry = best
+        return DuplicateMatch(
+            key=entry.key,
+            session_id=entry.session_id,
+            similarity=similarity,
+            same_question=entry.question_key == question_key(question),
+            score=entry.score,
+            reasoning=entry.reasoning,
+            aspects=entry.aspects,
+        )
+
+
+def _load_rows() -> Iterable[Dict[str, Any]]:
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            rows = [dict(row._mapping) for row in conn.execute(_signatures.select())]
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return list(_memory_rows.values())
+    return rows  # pragma: no cover - env dependent
+
+
+def _persist_rows(rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        _memory_rows[row["key"]] = row
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            existing = {
+                key
+                for (key,) in conn.execute(
+                    _signatures.select()
+                    .with_only_columns(_signatures.c.key)
+                    .where(_signatures.c.key.in_([row["key"] for row in rows]))
+                )
+            }
+            fresh = [row for row in rows if row["key"] not in existing]
+            if fresh:
+                conn.execute(_signatures.insert(), fresh)
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+
+
+@lru_cache(maxsize=1)
+def get_answer_index() -> AnswerIndex:
+    """Process-wide index, loaded from storage on first use."""
+    index = AnswerIndex()
+    for row in _load_rows():
+        index.add_signature(
+            row["key"],
+            row["session_id"],
+            row["skill"],
+            int(row["question_key"]),
+            np.asarray(json.loads(row["signature"]), dtype=np.uint64),
+            row.get("score"),
+            row.get("reasoning"),
+            json.loads(row["aspects"]) if row.get("aspects") else {},
+        )
+    return index
+
+
+def index_session_answers(session_id: str, state: Dict[str, Any]) -> int:
+    """Add graded answers from ``question_history`` not yet indexed. Returns the count."""
+    index = get_answer_index()
+    rows: List[Dict[str, Any]] = []
+    for entry in state.get("question_history", []):
+        answer = entry.get("answer")
+        score = entry.get("score")
+        if not answer or score is None:
+            continue
+        key = f"{session_id}:{entry.get('turn')}:{entry.get('skill')}"
+        if key in index:
+            continue
+        signature = minhash(str(answer))
+        if signature is None:
+            continue
+        q_key = question_key(str(entry.get("question", "")))
+        aspects = entry.get("aspects") or {}
+        index.add_signature(
+            key,
+            session_id,
+            str(entry.get("skill")),
+            q_key,
+            signature,
+            int(score),
+            entry.get("reasoning"),
+            aspects,
+        )
+        rows.append(
+            {
+                "key": key,
+                "session_id": session_id,
+                "skill": str(entry.get("skill")),
+                "question_key": q_key,
+                "signature": json.dumps(signature.tolist()),
+                "score": int(score),
+                "reasoning": entry.get("reasoning"),
+                "aspects": json.dumps(aspects),
+            }
+        )
+    if rows:
+        _persist_rows(rows)
+    return len(rows)
@@ -0,0 +1,94 @@
+"""Durable LangGraph checkpointers for the interview graph.
+
+``checkpoint_url`` picks the backend:
+
+- a Postgres URL (the default reuses ``database_url``, SQLAlchemy driver suffix
+  and all) for deployments,
+- ``sqlite:///<path>`` for local runs and tests,
+- ``memory`` for a process-local saver.
+
+Checkpoints are written per graph step and hold only the channels (state keys)
+that step wrote. Like the session store, an unreachable Postgres falls back to
+process memory.
+
+Savers hold connections bound to the event loop that opened them, so one is
+opened per loop: the service runs a single loop, while ``TestClient`` starts one
+per request (use ``memory`` or SQLite there).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional, Set
+from weakref import WeakKeyDictionary
+
+import aiosqlite
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+from sqlalchemy.engine import make_url
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_memory_saver = InMemorySaver()
+_savers: "WeakKeyDictionary[asyncio.AbstractEventLoop, BaseCheckpointSaver]" = (
+    WeakKeyDictionary()
+)
+# URLs that failed to open; later loops go straight to the memory fallback.
+_unavailable: Set[str] = set()
+
+
+def checkpoint_url() -> str:
+    settings = get_settings()
+    return settings.checkpoint_url or settings.database_url
+
+
+async def open_checkpointer(url: str) -> BaseCheckpointSaver:
+    """Open (and set up) the saver ``url`` names."""
+    if url == "memory":
+        return _memory_saver
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        sqlite_saver = AsyncSqliteSaver(await aiosqlite.connect(parsed.database or ":memory:"))
+        await sqlite_saver.setup()
+        return sqlite_saver
+    if parsed.get_backend_name() == "postgresql":
+        conninfo = parsed.set(drivername="postgresql").render_as_string(hide_password=False)
+        timeout = get_settings().checkpoint_connect_timeout
+        # Fail fast when the server is down; the pool itself would keep retrying.
+        probe = await AsyncConnection.connect(conninfo, connect_timeout=max(1, int(timeout)))
+        await probe.close()
+        pool = AsyncConnectionPool(
+            conninfo,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+        await pool.open(wait=True, timeout=timeout)
+        postgres_saver = AsyncPostgresSaver(pool)  # type: ignore[arg-type]
+        await postgres_saver.setup()
+        return postgres_saver
+    raise ValueError(f"unsupported checkpoint_url backend: {parsed.drivername}")
+
+
+async def get_checkpointer() -> BaseCheckpointSaver:
+    """The configured saver for the running event loop (memory when unreachable)."""
+    loop = asyncio.get_running_loop()
+    saver: Optional[BaseCheckpointSaver] = _savers.get(loop)
+    if saver is None:
+        url = checkpoint_url()
+        saver = _memory_saver
+        if url not in _unavailable:
+            try:
+                saver = await open_checkpointer(url)
+            except Exception:  # pragma: no cover - env dependent
+                _unavailable.add(url)
+                logger.warning("checkpointer unavailable; keeping checkpoints in memory")
+        _savers[loop] = saver
+    return saver
@@ -0,0 +1,81 @@
+"""Per-session log of the SSE events streamed for each turn.
+
+Every event gets the next sequence id of its session, sent as the SSE ``id:``
+line. Turns are appended once they end, in one transaction per turn, to the
+``session_events`` table (with the usual in-memory fallback), so a client that
+lost its stream can replay what it missed with ``Last-Event-ID`` from any
+replica. Events of a turn still running are served by the worker running it
+(``app.service.turns``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db import get_engine
+
+_metadata = MetaData()
+_events = Table(
+    "session_events",
+    _metadata,
+    Column("session_id", Text, primary_key=True),
+    Column("seq", Integer, primary_key=True),
+    Column("frame", Text, nullable=False),
+)
+
+# (seq, encoded SSE frame) pairs per session, in sequence order.
+_memory_events: Dict[str, List[Tuple[int, bytes]]] = {}
+
+
+def append_events(session_id: str, events: Sequence[Tuple[int, bytes]]) -> None:
+    """Append a turn's ``(seq, frame)`` events to the session's log."""
+    if not events:
+        return
+    _memory_events.setdefault(session_id, []).extend(events)
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            conn.execute(
+                _events.insert(),
+                [
+                    {"session_id": session_id, "seq": seq, "frame": frame.decode()}
+                    for seq, frame in events
+                ],
+            )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+
+
+def load_events(session_id: str, after: int = 0) -> List[Tuple[int, bytes]]:
+    """Logged ``(seq, frame)`` events of a session with ``seq > after``."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            rows = conn.execute(
+                _events.select()
+                .where((_events.c.session_id == session_id) & (_events.c.seq > after))
+                .order_by(_events.c.seq)
+            )
+            return [(row.seq, row.frame.encode()) for row in rows]  # pragma: no cover
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return [event for event in _memory_events.get(session_id, []) if event[0] > after]
+
+
+def last_event_id(session_id: str) -> int:
+    """Sequence id of the session's latest logged event (0 when there is none)."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(
+                func.max(_events.c.seq).select().where(_events.c.session_id == session_id)
+            ).scalar()
+            return int(latest or 0)  # pragma: no cover - env dependent
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        logged = _memory_events.get(session_id)
+        return logged[-1][0] if logged else 0
@@ -0,0 +1,105 @@
+"""Versioned IRT item calibration (question difficulty on the logit scale).
+
+``app.jobs.calibrate_items`` publishes difficulties for the nominal levels
+(keys ``level:1`` … ``level:5``) and for individual bank questions (keys from
+``irt.item_key``) as a new version. Sessions record the version they started
+with (``item_version``) so a republish never changes a running interview.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db import get_engine
+
+ItemRow = Dict[str, float]
+ItemTable = Tuple[Optional[int], Dict[int, float], Dict[str, float]]
+
+_LEVEL_PREFIX = "level:"
+
+_metadata = MetaData()
+_items = Table(
+    "item_calibration",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("key", Text, primary_key=True),
+    Column("b", Float, nullable=False),
+    Column("responses", Integer, nullable=False),
+    Column("created_at", Text, nullable=False),
+)
+
+_memory_versions: Dict[int, Dict[str, ItemRow]] = {}
+
+
+def publish_items(rows: Dict[str, ItemRow]) -> int:
+    """Store ``rows`` (key → b/responses) as a new calibration version."""
+    created_at = datetime.now(timezone.utc).isoformat()
+    version = max(_memory_versions, default=0) + 1
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(func.max(_items.c.version).select()).scalar()
+            version = max(version, int(latest or 0) + 1)
+            if rows:
+                conn.execute(
+                    _items.insert(),
+                    [
+                        {"version": version, "key": key, "created_at": created_at, **row}
+                        for key, row in rows.items()
+                    ],
+                )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+    _memory_versions[version] = {key: dict(row) for key, row in rows.items()}
+    return version
+
+
+def latest_item_version() -> Optional[int]:
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(func.max(_items.c.version).select()).scalar()
+            if latest is None:
+                raise LookupError("no item calibration in the database")
+            return int(latest)
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return max(_memory_versions, default=None)
+
+
+def _split(rows: Dict[str, ItemRow]) -> Tuple[Dict[int, float], Dict[str, float]]:
+    levels: Dict[int, float] = {}
+    items: Dict[str, float] = {}
+    for key, row in rows.items():
+        if key.startswith(_LEVEL_PREFIX):
+            levels[int(key[len(_LEVEL_PREFIX):])] = float(row["b"])
+        else:
+            items[key] = float(row["b"])
+    return levels, items
+
+
+def level_key(level: int) -> str:
+    return f"{_LEVEL_PREFIX}{level}"
+
+
+def load_items(version: int) -> ItemTable:
+    """Return ``(version, level → b, item key → b)`` for ``version``."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            rows = {
+                row.key: {"b": row.b, "responses": row.responses}
+                for row in conn.execute(_items.select().where(_items.c.version == version))
+            }
+            if not rows:
+                raise LookupError(f"item calibration version {version} not found")
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        rows = _memory_versions.get(version, {})
+    levels, items = _split(rows)
+    return version, levels, items
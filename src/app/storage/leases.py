@@ -0,0 +1,133 @@
+"""Per-session leases, so one holder at a time runs a session's turns.
+
+A lease row (``session_leases``) names its holder (a token per acquisition),
+what it holds the session for (``turn`` or ``connection``) and when it
+expires. Acquiring, renewing and releasing are single transactions, so
+replicas sharing the database agree on the holder. The usual in-memory
+fallback only covers the current process. An expired lease is free: a holder
+that dies without releasing blocks its session for at most the lease TTL.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import Column, Float, MetaData, Table, Text
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .db import get_engine
+
+_metadata = MetaData()
+_leases = Table(
+    "session_leases",
+    _metadata,
+    Column("session_id", Text, primary_key=True),
+    Column("owner", Text, nullable=False),
+    Column("kind", Text, nullable=False),
+    Column("expires_at", Float, nullable=False),
+)
+
+
+class Lease(NamedTuple):
+    owner: str
+    kind: str
+    expires_at: float
+
+
+_memory_leases: Dict[str, Lease] = {}
+
+
+def _memory_acquire(session_id: str, lease: Lease) -> Lease:
+    current = _memory_leases.get(session_id)
+    if current is None or current.owner == lease.owner or current.expires_at <= time.time():
+        _memory_leases[session_id] = current = lease
+    return current
+
+
+def acquire_lease(session_id: str, owner: str, kind: str, ttl: float) -> Lease:
+    """Take (or extend) the session's lease; returns its holder afterwards.
+
+    The lease was acquired when the returned ``owner`` is ``owner``.
+    """
+    now = time.time()
+    lease = Lease(owner, kind, now + ttl)
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            row = conn.execute(
+                _leases.select().where(_leases.c.session_id == session_id).with_for_update()
+            ).first()
+            if row is None:
+                conn.execute(_leases.insert().values(session_id=session_id, **lease._asdict()))
+                return lease  # pragma: no cover - env dependent
+            # Conditional, so two holders taking over an expired lease cannot both win.
+            taken = conn.execute(
+                _leases.update()
+                .where(
+                    (_leases.c.session_id == session_id)
+                    & ((_leases.c.owner == owner) | (_leases.c.expires_at <= now))
+                )
+                .values(**lease._asdict())
+            )
+            if taken.rowcount:  # pragma: no cover - env dependent
+                return lease
+            return Lease(row.owner, row.kind, row.expires_at)  # pragma: no cover
+    except IntegrityError:  # pragma: no cover - env dependent
+        # Another holder inserted the row first; it is there now.
+        return acquire_lease(session_id, owner, kind, ttl)
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return _memory_acquire(session_id, lease)
+
+
+def renew_lease(session_id: str, owner: str, ttl: float) -> bool:
+    """Push back the expiry of a lease ``owner`` holds; False when it was lost."""
+    expires_at = time.time() + ttl
+    current = _memory_leases.get(session_id)
+    if current is not None and current.owner == owner:
+        _memory_leases[session_id] = current._replace(expires_at=expires_at)
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            renewed = conn.execute(
+                _leases.update()
+                .where((_leases.c.session_id == session_id) & (_leases.c.owner == owner))
+                .values(expires_at=expires_at)
+            )
+            return renewed.rowcount > 0  # pragma: no cover - env dependent
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return current is not None and current.owner == owner
+
+
+def release_lease(session_id: str, owner: str) -> None:
+    current = _memory_leases.get(session_id)
+    if current is not None and current.owner == owner:
+        del _memory_leases[session_id]
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            conn.execute(
+                _leases.delete().where(
+                    (_leases.c.session_id == session_id) & (_leases.c.owner == owner)
+                )
+            )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+
+
+def lease_holder(session_id: str) -> Optional[Lease]:
+    """The session's unexpired lease, or None when it is free."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            row = conn.execute(
+                _leases.select().where(_leases.c.session_id == session_id)
+            ).first()
+            lease = Lease(row.owner, row.kind, row.expires_at) if row else None  # pragma: no cover
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        lease = _memory_leases.get(session_id)
+    return lease if lease is not None and lease.expires_at > time.time() else None
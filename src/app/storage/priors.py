@@ -0,0 +1,100 @@
+"""Versioned per-skill prior table.
+
+``app.jobs.fit_priors`` publishes a complete table as a new version; sessions
+started afterwards read the latest version through ``get_prior_table``, which
+is cached per process (``clear_prior_cache`` drops it, publishing does so for
+the current process).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db import get_engine
+
+PriorRow = Dict[str, float]
+PriorTable = Tuple[Optional[int], Dict[str, PriorRow]]
+
+_metadata = MetaData()
+_priors = Table(
+    "skill_priors",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("skill", Text, primary_key=True),
+    Column("mean", Float, nullable=False),
+    Column("variance", Float, nullable=False),
+    Column("strength", Float, nullable=False),
+    Column("sessions", Integer, nullable=False),
+    Column("created_at", Text, nullable=False),
+)
+
+_memory_versions: Dict[int, Dict[str, PriorRow]] = {}
+
+
+def publish_priors(priors: Dict[str, PriorRow]) -> int:
+    """Store ``priors`` (skill → mean/variance/strength/sessions) as a new version."""
+    created_at = datetime.now(timezone.utc).isoformat()
+    version = max(_memory_versions, default=0) + 1
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(func.max(_priors.c.version).select()).scalar()
+            version = max(version, int(latest or 0) + 1)
+            if priors:
+                conn.execute(
+                    _priors.insert(),
+                    [
+                        {"version": version, "skill": skill, "created_at": created_at, **row}
+                        for skill, row in priors.items()
+                    ],
+                )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+    _memory_versions[version] = {skill: dict(row) for skill, row in priors.items()}
+    clear_prior_cache()
+    return version
+
+
+def load_priors(version: Optional[int] = None) -> PriorTable:
+    """Return ``(version, table)`` for ``version`` (default: latest), or ``(None, {})``."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            if version is None:
+                version = conn.execute(func.max(_priors.c.version).select()).scalar()
+            if version is None:
+                raise LookupError("no prior table in the database")
+            rows = conn.execute(_priors.select().where(_priors.c.version == version))
+            table = {
+                row.skill: {
+                    "mean": row.mean,
+                    "variance": row.variance,
+                    "strength": row.strength,
+                    "sessions": row.sessions,
+                }
+                for row in rows
+            }
+            return int(version), table
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        if version is None:
+            version = max(_memory_versions, default=None)
+        if version is None or version not in _memory_versions:
+            return None, {}
+        return version, {skill: dict(row) for skill, row in _memory_versions[version].items()}
+
+
+@lru_cache(maxsize=1)
+def get_prior_table() -> PriorTable:
+    """Latest published prior table, cached for the life of the process."""
+    return load_priors()
+
+
+def clear_prior_cache() -> None:
+    get_prior_table.cache_clear()
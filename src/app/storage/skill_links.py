@@ -0,0 +1,90 @@
+"""Versioned skill-correlation edges learned from logged grades.
+
+``app.jobs.fit_skill_graph`` publishes the complete edge list as a new
+version; sessions started with ``skill_graph: true`` read the latest version
+(plus any hand-authored edges, see ``app.agents.interviewer.utils.skill_graph``)
+and record it as ``skill_graph_version``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db import get_engine
+
+LinkRow = Dict[str, Union[str, float, int]]
+LinkTable = Tuple[Optional[int], List[LinkRow]]
+
+_metadata = MetaData()
+_links = Table(
+    "skill_links",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("skill_a", Text, primary_key=True),
+    Column("skill_b", Text, primary_key=True),
+    Column("weight", Float, nullable=False),
+    Column("sessions", Integer, nullable=False),
+    Column("created_at", Text, nullable=False),
+)
+
+_memory_versions: Dict[int, List[LinkRow]] = {}
+
+
+def publish_links(rows: List[LinkRow]) -> int:
+    """Store ``rows`` (skill_a/skill_b/weight/sessions) as a new version."""
+    created_at = datetime.now(timezone.utc).isoformat()
+    version = max(_memory_versions, default=0) + 1
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(func.max(_links.c.version).select()).scalar()
+            version = max(version, int(latest or 0) + 1)
+            if rows:
+                conn.execute(
+                    _links.insert(),
+                    [{"version": version, "created_at": created_at, **row} for row in rows],
+                )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+    _memory_versions[version] = [dict(row) for row in rows]
+    return version
+
+
+def latest_links_version() -> Optional[int]:
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            latest = conn.execute(func.max(_links.c.version).select()).scalar()
+            if latest is None:
+                raise LookupError("no skill links in the database")
+            return int(latest)
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        return max(_memory_versions, default=None)
+
+
+def load_links(version: int) -> LinkTable:
+    """Return ``(version, rows)`` for ``version``, or ``(version, [])`` if unknown."""
+    try:
+        engine = get_engine()
+        _metadata.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            rows: List[LinkRow] = [
+                {
+                    "skill_a": row.skill_a,
+                    "skill_b": row.skill_b,
+                    "weight": row.weight,
+                    "sessions": row.sessions,
+                }
+                for row in conn.execute(_links.select().where(_links.c.version == version))
+            ]
+            if not rows:
+                raise LookupError(f"skill links version {version} not found")
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        rows = [dict(row) for row in _memory_versions.get(version, [])]
+    return version, rows
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic_core import from_json
 from sqlalchemy import Column, MetaData, Table, Text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
+from typing_extensions import TypedDict
 
-from app.schema.models import Grade, Question
+from app.schema.models import Grade, InterviewState, Question
 
+from .answer_index import index_session_answers
 from .db import get_engine
 
 _metadata = MetaData()
@@ -18,13 +22,23 @@ _sessions = Table(
     Column("id", Text, primary_key=True),
     Column("state", Text, nullable=False),
 )
+# Sessions per candidate identity, for warm-starting later interviews.
+_candidate_sessions = Table(
+    "candidate_sessions",
+    _metadata,
+    Column("candidate_id", Text, primary_key=True),
+    Column("session_id", Text, primary_key=True),
+    Column("updated_at", Text, nullable=False),
+)
 
 
 def _ensure_tables(engine: Engine) -> None:
     _metadata.create_all(engine, checkfirst=True)
 
 
-_memory_store: Dict[str, Dict[str, Any]] = {}
+# Encoded rows (or their parsed dicts), keyed by session id.
+_memory_store: Dict[str, Union[str, Dict[str, Any]]] = {}
+_memory_candidates: Dict[str, Dict[str, str]] = {}
 
 
 def load_state(session_id: str) -> Optional[Dict[str, Any]]:
@@ -39,17 +53,15 @@ def load_state(session_id: str) -> Optional[Dict[str, Any]]:
                 # fall back to memory if present
                 raw = _memory_store.get(session_id)
                 return _deserialize_state(raw) if raw else None
-            raw = json.loads(res._mapping["state"])  # type: ignore[attr-defined]
-            return _deserialize_state(raw)
+            return _deserialize_state(res._mapping["state"])  # type: ignore[attr-defined]
     except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
         raw = _memory_store.get(session_id)
         return _deserialize_state(raw) if raw else None
 
 
 def save_state(session_id: str, state: Dict[str, Any]) -> None:
-    payload_obj = _serialize_state(state)
-    payload = json.dumps(payload_obj)
-    _memory_store[session_id] = payload_obj
+    payload = _encode_state(state)
+    _memory_store[session_id] = payload
     try:
         engine = get_engine()
         _ensure_tables(engine)
@@ -68,30 +80,123 @@ def save_state(session_id: str, state: Dict[str, Any]) -> None:
     except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
         # memory fallback already updated
         pass
+    if state.get("candidate_id"):
+        _link_candidate(str(state["candidate_id"]), session_id)
+    index_session_answers(session_id, state)
+
+
+def _link_candidate(candidate_id: str, session_id: str) -> None:
+    updated_at = datetime.now(timezone.utc).isoformat()
+    _memory_candidates.setdefault(candidate_id, {})[session_id] = updated_at
+    try:
+        engine = get_engine()
+        _ensure_tables(engine)
+        with engine.begin() as conn:
+            key = (_candidate_sessions.c.candidate_id == candidate_id) & (
+                _candidate_sessions.c.session_id == session_id
+            )
+            if conn.execute(_candidate_sessions.select().where(key)).first():
+                conn.execute(
+                    _candidate_sessions.update().where(key).values(updated_at=updated_at)
+                )
+            else:
+                conn.execute(
+                    _candidate_sessions.insert().values(
+                        candidate_id=candidate_id,
+                        session_id=session_id,
+                        updated_at=updated_at,
+                    )
+                )
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        pass
+
+
+def candidate_sessions(
+    candidate_id: str, *, exclude: Optional[str] = None, limit: int = 5
+) -> List[Tuple[str, Dict[str, Any], str]]:
+    """Most recent ``(session_id, state, updated_at)`` rows saved for a candidate."""
+    try:
+        engine = get_engine()
+        _ensure_tables(engine)
+        with engine.begin() as conn:
+            rows = conn.execute(
+                _candidate_sessions.select()
+                .where(_candidate_sessions.c.candidate_id == candidate_id)
+                .order_by(_candidate_sessions.c.updated_at.desc())
+            )
+            links = [(row.session_id, row.updated_at) for row in rows]
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        links = sorted(
+            _memory_candidates.get(candidate_id, {}).items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+    found: List[Tuple[str, Dict[str, Any], str]] = []
+    for session_id, updated_at in links:
+        if session_id == exclude:
+            continue
+        state = load_state(session_id)
+        if state is not None:
+            found.append((session_id, state, updated_at))
+        if len(found) >= limit:
+            break
+    return found
+
+
+def iter_sessions(batch_size: int = 100) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream ``(session_id, state)`` pairs without loading the table at once."""
+    try:
+        engine = get_engine()
+        _ensure_tables(engine)
+    except (SQLAlchemyError, Exception):  # pragma: no cover - env dependent
+        for session_id in sorted(_memory_store):
+            yield session_id, _deserialize_state(_memory_store[session_id])
+        return
+    with engine.connect() as conn:  # pragma: no cover - env dependent
+        result = conn.execution_options(yield_per=batch_size).execute(
+            _sessions.select().order_by(_sessions.c.id)
+        )
+        for row in result:
+            yield row.id, _deserialize_state(row.state)
+
+
+# Stored rows decode in one pass through pydantic-core: ``question_pool``,
+# ``current_question`` and ``last_grade`` come back as models, everything else
+# exactly as written (``Any``, so ints stay ints and unknown keys are kept).
+_MODEL_FIELDS: Dict[str, Any] = {
+    "question_pool": List[Question],
+    "current_question": Optional[Question],
+    "last_grade": Optional[Grade],
+}
+_StoredState = TypedDict(  # type: ignore[misc]
+    "_StoredState",
+    {key: _MODEL_FIELDS.get(key, Any) for key in InterviewState.__annotations__},
+    total=False,
+)
+_StoredState.__pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[attr-defined]
+_state_adapter: TypeAdapter[Dict[str, Any]] = TypeAdapter(_StoredState)
 
 
 def _serialize_state(state: Dict[str, Any]) -> Dict[str, Any]:
-    def serialize_question(q: Any) -> Any:
-        if isinstance(q, Question):
-            return q.model_dump()
-        return q
+    return _state_adapter.dump_python(state, mode="json", warnings=False)
 
-    def serialize_grade(g: Any) -> Any:
-        if isinstance(g, Grade):
-            return g.model_dump()
-        return g
 
-    s = dict(state)
-    if "current_question" in s and s["current_question"] is not None:
-        s["current_question"] = serialize_question(s["current_question"])
-    if "question_pool" in s and isinstance(s["question_pool"], list):
-        s["question_pool"] = [serialize_question(q) for q in s["question_pool"]]
-    if "last_grade" in s and s["last_grade"] is not None:
-        s["last_grade"] = serialize_grade(s["last_grade"])
-    return s
+def _encode_state(state: Dict[str, Any]) -> str:
+    return _state_adapter.dump_json(state, warnings=False).decode()
+
+
+def _deserialize_state(state: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Decode a stored row (JSON text or its parsed dict) into a live state."""
+    # ``from_json`` shares repeated strings (skill names, sources, log keys).
+    raw = from_json(state) if isinstance(state, str) else state
+    try:
+        return _state_adapter.validate_python(raw)
+    except ValidationError:
+        # Rows with a malformed question or grade keep it as a plain dict.
+        return _deserialize_lenient(raw)
 
 
-def _deserialize_state(state: Dict[str, Any]) -> Dict[str, Any]:
+def _deserialize_lenient(state: Dict[str, Any]) -> Dict[str, Any]:
     def to_question(obj: Any) -> Any:
         if isinstance(obj, dict) and {"skill", "text", "difficulty"}.issubset(
             obj.keys()
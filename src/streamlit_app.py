@@ -26,8 +26,26 @@ def init_session_state():
         st.session_state["session_started"] = False
 
 
-def handle_stream_event(event: str, data: str, log=None) -> Optional[str]:
-    """Process a single SSE event. Returns a control token when the caller should pause."""
+def render_partial(payload: dict, live) -> None:
+    """Render an in-flight question or grade into a placeholder element."""
+    if payload.get("type") == "question_delta":
+        live.markdown(payload.get("text", ""))
+    elif payload.get("type") == "grade_partial":
+        aspects = payload.get("aspects") or {}
+        bits = ", ".join(
+            f"{name}: {details.get('score')}"
+            for name, details in aspects.items()
+            if isinstance(details, dict)
+        )
+        live.caption(f"Grading… {bits}" if bits else "Grading…")
+
+
+def handle_stream_event(event: str, data: str, log=None, live=None) -> Optional[str]:
+    """Process a single SSE event. Returns a control token when the caller should pause.
+
+    ``live`` is an optional ``st.empty()`` placeholder used to render partial
+    question/grade output while the model is still streaming.
+    """
 
     try:
         payload = json.loads(data) if data else {}
@@ -35,6 +53,12 @@ def handle_stream_event(event: str, data: str, log=None) -> Optional[str]:
         payload = {}
 
     if event == "message" and isinstance(payload, dict):
+        if payload.get("type") in {"question_delta", "grade_partial"}:
+            if live is not None:
+                render_partial(payload, live)
+            return None
+        if live is not None:
+            live.empty()
         if payload.get("type") == "question":
             st.session_state["current_question"] = payload
             st.session_state["chat"].append(
@@ -48,8 +72,21 @@ def handle_stream_event(event: str, data: str, log=None) -> Optional[str]:
                 if isinstance(details, dict) and "score" in details
             )
             detail_suffix = f" | {aspect_bits}" if aspect_bits else ""
+            co_grades = payload.get("co_grades") or {}
+            if co_grades:
+                detail_suffix += " | also " + ", ".join(
+                    f"{skill}: {details.get('score')}" for skill, details in co_grades.items()
+                )
             text = f"Grade: {payload.get('score')} — {payload.get('reason', '')}{detail_suffix}"
             st.session_state["chat"].append({"role": "assistant", "content": text})
+        elif payload.get("type") == "question_withdrawn":
+            # Pipelined grading asked ahead of the grade; drop the prefetched question.
+            chat = st.session_state["chat"]
+            for idx in range(len(chat) - 1, -1, -1):
+                entry = chat[idx]
+                if entry.get("role") == "assistant" and entry.get("content") == payload.get("text"):
+                    del chat[idx]
+                    break
         return None
 
     if event == "state":
@@ -87,6 +124,11 @@ def handle_done_event(payload: Optional[dict]) -> str:
         st.session_state["session_started"] = False
         return "done"
 
+    if payload.get("error") == "turn_failed":
+        st.error(f"The interview turn failed: {payload.get('detail', 'unknown error')}")
+        st.session_state["session_started"] = False
+        return "done"
+
     if payload.get("status") == "awaiting_answer":
         st.session_state["awaiting_answer"] = True
         st.session_state["session_started"] = True
@@ -100,6 +142,10 @@ def handle_done_event(payload: Optional[dict]) -> str:
         verified = ", ".join(payload.get("verified", [])) or "None"
         inactive = ", ".join(payload.get("inactive", [])) or "None"
         summary = f"Session complete. Verified: {verified}. Inactive: {inactive}."
+        spend = payload.get("spend") or {}
+        if spend.get("tokens"):
+            limit = f" of {spend['token_budget']}" if spend.get("token_budget") else ""
+            summary += f" Spent {spend['tokens']}{limit} tokens (${spend.get('cost', 0.0):.4f})."
         st.session_state["chat"].append({"role": "assistant", "content": summary})
     st.balloons()
     return "done"
@@ -197,6 +243,62 @@ with st.sidebar:
         step=0.1,
         help="Exploration coefficient for UCB selection (higher explores more).",
     )
+    selection_policy = st.selectbox(
+        "Selection policy",
+        options=["ucb1", "se", "thompson"],
+        index=0,
+        help="How the next skill is picked. 'thompson' samples from a Normal-Inverse-Gamma posterior.",
+    )
+    stopping_rule = st.selectbox(
+        "Stopping rule",
+        options=["lcb", "sprt"],
+        index=0,
+        help="'sprt' verifies or rejects each skill at sequential-test boundaries.",
+    )
+    difficulty_policy = st.selectbox(
+        "Difficulty",
+        options=["nudge", "irt"],
+        index=0,
+        help="'irt' picks the question difficulty that tells the most about the candidate.",
+    )
+    adaptive_grading = st.checkbox(
+        "Adaptive grading",
+        value=False,
+        help="Draw extra grading samples only when a grade is close to the verification bar.",
+    )
+    pipelined = st.checkbox(
+        "Pipelined grading",
+        value=False,
+        help="Show the next question while the previous answer is still being graded.",
+    )
+    multi_skill = st.checkbox(
+        "Multi-skill questions",
+        value=False,
+        help="Let one question cover two related skills that still need answers.",
+    )
+    warm_start = st.checkbox(
+        "Warm start",
+        value=False,
+        help="Start from the candidate's earlier interviews (matched by profile ID).",
+    )
+    skill_graph = st.checkbox(
+        "Skill graph",
+        value=False,
+        help="Let an answer on one skill also inform correlated skills.",
+    )
+    planner = st.checkbox(
+        "Lookahead planner",
+        value=False,
+        help="Skip skills that can no longer verify in the turns left, and stop when none can.",
+    )
+    token_budget = st.number_input(
+        "Token budget",
+        min_value=0,
+        value=0,
+        step=1000,
+        help="LLM tokens the interview may spend (0 = unlimited). Near the limit it "
+        "reuses pooled questions, skips extra grading samples and then stops.",
+    )
 
     st.divider()
     st.subheader("Session")
@@ -235,6 +337,16 @@ with st.sidebar:
                     "verify_lcb": verify_lcb,
                     "z_value": z_value,
                     "ucb_C": ucb_C,
+                    "pipelined": pipelined,
+                    "grading_mode": "adaptive" if adaptive_grading else "single",
+                    "multi_skill": multi_skill,
+                    "selection_policy": selection_policy,
+                    "stopping_rule": stopping_rule,
+                    "difficulty_policy": difficulty_policy,
+                    "warm_start": warm_start,
+                    "skill_graph": skill_graph,
+                    "planner": planner,
+                    "token_budget": int(token_budget) or None,
                 }
                 sid = st.session_state.get("session_id")
                 if sid:
@@ -387,6 +499,16 @@ base_payload = {
     "verify_lcb": verify_lcb,
     "z_value": z_value,
     "ucb_C": ucb_C,
+    "pipelined": pipelined,
+    "grading_mode": "adaptive" if adaptive_grading else "single",
+    "multi_skill": multi_skill,
+    "selection_policy": selection_policy,
+    "stopping_rule": stopping_rule,
+    "difficulty_policy": difficulty_policy,
+    "warm_start": warm_start,
+    "skill_graph": skill_graph,
+    "planner": planner,
+    "token_budget": int(token_budget) or None,
 }
 resume_payload_base = {"profile": profile_data}
 simulation_persona = st.session_state.get(
@@ -403,8 +525,9 @@ if (
         client = AgentClient(base_url=base_url)
         payload = dict(base_payload)
         session_id = st.session_state.get("session_id")
+        live = st.empty()
         for evt in client.stream(payload, session_id=session_id):
-            signal = handle_stream_event(evt.get("event"), evt.get("data"))
+            signal = handle_stream_event(evt.get("event"), evt.get("data"), live=live)
             if signal:
                 break
         st.session_state["auto_resumed"] = True
@@ -437,8 +560,9 @@ if show_start_button:
         st.session_state["session_id"] = session_id
 
         try:
+            live = st.empty()
             for evt in client.stream(payload, session_id=session_id):
-                signal = handle_stream_event(evt.get("event"), evt.get("data"))
+                signal = handle_stream_event(evt.get("event"), evt.get("data"), live=live)
                 if signal in {"interrupt", "done"}:
                     break
         except Exception:
@@ -463,8 +587,9 @@ if st.session_state.get("awaiting_answer"):
         session_id = st.session_state.get("session_id") or f"session-{uuid.uuid4()}"
         st.session_state["session_id"] = session_id
         try:
+            live = st.empty()
             for evt in client.resume(payload, session_id=session_id):
-                signal = handle_stream_event(evt.get("event"), evt.get("data"))
+                signal = handle_stream_event(evt.get("event"), evt.get("data"), live=live)
                 if signal in {"interrupt", "done"}:
                     break
         except Exception:
@@ -501,8 +626,11 @@ if st.session_state.get("awaiting_answer"):
             session_id = st.session_state.get("session_id") or f"session-{uuid.uuid4()}"
             st.session_state["session_id"] = session_id
             try:
+                live = st.empty()
                 for evt in client.resume(payload, session_id=session_id):
-                    signal = handle_stream_event(evt.get("event"), evt.get("data"))
+                    signal = handle_stream_event(
+                        evt.get("event"), evt.get("data"), live=live
+                    )
                     if signal in {"interrupt", "done"}:
                         break
             except Exception:
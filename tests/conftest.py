@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
@@ -14,3 +16,75 @@ if root_str not in sys.path:
 
 if src_str not in sys.path:
     sys.path.insert(0, src_str)
+
+
+@pytest.fixture
+def make_state():
+    """Build an interview state with test defaults; keywords override them."""
+    from app.agents.interviewer.graph import build_state
+
+    def make(skills=("python",), **overrides):
+        params = dict(
+            max_turns=20,
+            min_q=2,
+            verify_lcb=3.75,
+            z_value=1.96,
+            ucb_C=1.0,
+            spans_map={},
+            priors={},
+        )
+        params.update(overrides)
+        return build_state(list(skills), **params)
+
+    return make
+
+
+@pytest.fixture
+def answer():
+    """Ask ``skill`` a question, grade the answer ``score`` and run ``update_node``.
+
+    ``co`` maps co-skills to their grades for a multi-skill question.
+    """
+    from app.agents.interviewer.nodes.update import update_node
+    from app.agents.interviewer.utils.state import record_question
+    from app.schema.models import Grade, Question
+
+    def answer_(state, skill, score, text=None, difficulty=3, co=None):
+        question = Question(
+            skill=skill,
+            text=text or f"Explain {skill} in depth.",
+            difficulty=difficulty,
+            co_skills=list(co or {}),
+        )
+        record_question(state, question, "fixture")
+        state["last_answer"] = f"An answer about {skill}."
+        state["last_grade"] = Grade(
+            score=score,
+            reasoning="fixture",
+            co_grades={name: Grade(score=value) for name, value in (co or {}).items()},
+        )
+        update_node(state)
+
+    return answer_
+
+
+@pytest.fixture
+def memory_stores(monkeypatch):
+    """Empty in-memory sessions, candidates and versioned tables, with their caches cleared."""
+    import app.storage.items as items_module
+    import app.storage.priors as priors_module
+    import app.storage.skill_links as links_module
+    import app.storage.store as store_module
+    from app.agents.interviewer.utils.irt import clear_calibration_cache
+    from app.agents.interviewer.utils.skill_graph import clear_skill_graph_cache
+
+    monkeypatch.setattr(store_module, "_memory_store", {})
+    monkeypatch.setattr(store_module, "_memory_candidates", {})
+    for module in (priors_module, links_module, items_module):
+        monkeypatch.setattr(module, "_memory_versions", {})
+    caches = (priors_module.clear_prior_cache, clear_skill_graph_cache, clear_calibration_cache)
+    for clear in caches:
+        clear()
+    yield
+    for clear in caches:
+        clear()
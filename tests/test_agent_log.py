@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.select import pick_skill
+from app.agents.interviewer.utils.agent_log import (
+    DEBUG,
+    INFO,
+    WARNING,
+    log_event,
+    log_lines,
+)
+from app.core.config import get_settings
+
+
+def _state():
+    return build_state(
+        ["python", "sql"],
+        max_turns=8,
+        min_q=2,
+        verify_lcb=3.75,
+        z_value=1.96,
+        ucb_C=1.0,
+        spans_map={},
+        priors={},
+    )
+
+
+def test_events_render_only_when_viewed():
+    state = {"logs": ["legacy → plain line"], "turn": 2}
+    log_event(state, "grade_aspects", "{aspects!j}", level=DEBUG, aspects={"coverage": 4})
+    log_event(state, "update", "{skill}: mean={mean:.2f}", skill="sql", mean=3.456)
+    log_event(state, "generate", "failed for {skills!j}", level=WARNING, skills=["a", "b"])
+
+    entry = state["logs"][2]
+    assert entry["fields"] == {"skill": "sql", "mean": 3.456} and entry["turn"] == 2
+    assert log_lines(state["logs"]) == [
+        "legacy → plain line",
+        "grade_aspects → coverage:4",
+        "update → sql: mean=3.46",
+        "generate → failed for a, b",
+    ]
+    assert log_lines(state["logs"], level=INFO, last=2) == [
+        "update → sql: mean=3.46",
+        "generate → failed for a, b",
+    ]
+
+
+def test_levels_and_sampling_drop_selection_traces(monkeypatch):
+    settings = get_settings()
+    state = _state()
+    pick_skill(state)
+    debug_lines = [line for line in log_lines(state["logs"]) if "UCB[" in line]
+    assert len(debug_lines) == 2
+
+    monkeypatch.setattr(settings, "agent_log_level", "info")
+    state = _state()
+    pick_skill(state)
+    lines = log_lines(state["logs"])
+    assert not any("UCB[" in line for line in lines)
+    assert any(line.startswith("select_ucb → select ") for line in lines)
+
+    monkeypatch.setattr(settings, "agent_log_level", "debug")
+    monkeypatch.setattr(settings, "agent_log_debug_sample", 0.0)
+    state = _state()
+    pick_skill(state)
+    assert not any(entry["level"] == DEBUG for entry in state["logs"])
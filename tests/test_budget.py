@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.decide import end_reason
+from app.agents.interviewer.nodes.select import pick_skill
+from app.agents.interviewer.utils.budget import (
+    Usage,
+    affordable_turns,
+    budget_tight,
+    call_usage,
+    record_spend,
+    spend_recorder,
+    spend_report,
+)
+from app.agents.interviewer.utils.streaming import StructuredLLM
+from app.schema.models import Question
+from app.simulation.simulator import PolicyConfig, Population, simulate_candidate
+
+
+class _Structured:
+    async def ainvoke(self, prompt):
+        return Question(skill="python", text="How do generators work?", difficulty=3)
+
+
+class _LLM:
+    def with_structured_output(self, schema):
+        return _Structured()
+
+
+def _state(**budget):
+    return build_state(
+        ["python", "sql"],
+        max_turns=8,
+        min_q=2,
+        verify_lcb=3.75,
+        z_value=1.96,
+        ucb_C=1.0,
+        spans_map={},
+        priors={},
+        **budget,
+    )
+
+
+def test_calls_are_metered_from_usage_metadata_or_estimated():
+    state = _state()
+    llm = StructuredLLM(_LLM(), Question, {}, on_usage=spend_recorder(state, "question"))
+
+    asyncio.run(llm.ainvoke("x" * 400))
+
+    row = state["spend"]["question"]
+    assert row["calls"] == 1 and row["estimated"] == 1
+    assert row["input_tokens"] == 100 and row["output_tokens"] > 0
+    reported = {"gpt-4o-mini": {"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}}
+    assert call_usage(reported, "prompt", "answer") == Usage(120, 30)
+
+
+def test_budget_prefers_pooled_questions_then_stops():
+    state = _state(token_budget=5000)
+    state["question_pool"] = [Question(skill="sql", text="Explain a LEFT JOIN.", difficulty=3)]
+    assert affordable_turns(state) == 3 and not budget_tight(state)  # 1600 tokens a turn
+
+    record_spend(state, "question", Usage(2000, 400))
+    assert budget_tight(state)
+    skill, pool = pick_skill(state)
+    assert skill == "sql" and set(pool) == {"sql"}
+    assert end_reason(state) is None
+
+    record_spend(state, "grade", Usage(1800, 200))
+    assert end_reason(state) == "budget exhausted"
+    report = spend_report(state)
+    assert report["tokens"] == 4400 and report["tokens_left"] == 600
+    assert report["by_kind"]["grade"]["calls"] == 1 and report["cost"] > 0
+
+
+def test_simulated_interviews_stay_near_the_token_budget():
+    population = Population(skills=3)
+    free = asyncio.run(simulate_candidate(PolicyConfig(max_turns=12), population, (0, 1)))
+    capped = asyncio.run(
+        simulate_candidate(PolicyConfig(max_turns=12, token_budget=3000), population, (0, 1))
+    )
+
+    assert free["tokens"] > 3000
+    assert capped["turns"] < free["turns"]
+    assert capped["tokens"] <= 3000 * 1.2
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import app.storage.answer_index as answer_index
+from app.agents.interviewer.nodes.grade import grade_answer
+from app.agents.interviewer.utils.agent_log import log_lines
+from app.core.config import get_settings
+from app.schema.models import Question
+from app.storage.answer_index import AnswerIndex, index_session_answers
+
+QUESTION = "How would you debug a slow PyTorch DataLoader?"
+CANNED = (
+    "First I would profile the input pipeline with the PyTorch profiler, then raise "
+    "num_workers, enable pin_memory and move heavy augmentations to the GPU so the "
+    "training loop is never starved waiting on batches."
+)
+PARAPHRASE = (
+    "first i would profile the input pipeline with the pytorch profiler then raise "
+    "num_workers enable pin_memory and move heavy augmentations to the GPU so the "
+    "training loop is never starved waiting on the batches"
+)
+UNRELATED = (
+    "I would check the learning rate schedule, plot the loss curves for both splits "
+    "and look for overfitting before touching the model architecture at all."
+)
+
+
+@pytest.fixture
+def index(monkeypatch):
+    fresh = AnswerIndex()
+    monkeypatch.setattr(answer_index, "_memory_rows", {})
+    monkeypatch.setattr(answer_index, "get_answer_index", lambda: fresh)
+    monkeypatch.setattr("app.agents.interviewer.nodes.grade.get_answer_index", lambda: fresh)
+    return fresh
+
+
+def _graded_session(answer: str) -> dict:
+    return {
+        "question_history": [
+            {
+                "skill": "pytorch",
+                "question": QUESTION,
+                "difficulty": 3,
+                "turn": 0,
+                "answer": answer,
+                "score": 4,
+                "reasoning": "Covers the usual bottlenecks.",
+                "aspects": {"coverage": {"score": 4, "notes": "Solid list."}},
+            },
+            {"skill": "pytorch", "question": QUESTION, "turn": 1, "answer": None, "score": None},
+        ]
+    }
+
+
+def test_index_matches_near_duplicates_per_skill(index):
+    assert index_session_answers("sess-a", _graded_session(CANNED)) == 1
+    # Saving the same session again is a no-op.
+    assert index_session_answers("sess-a", _graded_session(CANNED)) == 0
+
+    match = index.query("pytorch", QUESTION, PARAPHRASE, threshold=0.8)
+    assert match is not None
+    assert match.key == "sess-a:0:pytorch"
+    assert match.same_question and match.score == 4
+
+    assert index.query("pytorch", QUESTION, UNRELATED, threshold=0.8) is None
+    assert index.query("ml", QUESTION, PARAPHRASE, threshold=0.8) is None
+    assert (
+        index.query("pytorch", QUESTION, PARAPHRASE, threshold=0.8, exclude_session="sess-a")
+        is None
+    )
+    assert len(answer_index._memory_rows) == 1
+
+
+def test_grade_answer_reuses_duplicate_grade(index, monkeypatch):
+    def _fail():
+        raise AssertionError("LLM should not be called for a reused grade")
+
+    monkeypatch.setattr("app.core.llm.get_llm", _fail)
+    monkeypatch.setattr(get_settings(), "dedup_mode", "reuse")
+    index_session_answers("sess-a", _graded_session(CANNED))
+    state = {"thread_id": "sess-b", "turn": 2, "logs": [], "llm_calls_avoided": 0}
+
+    grade = asyncio.run(
+        grade_answer(state, Question(skill="pytorch", text=QUESTION, difficulty=3), PARAPHRASE)
+    )
+
+    assert grade.score == 4
+    assert grade.aspects["coverage"].score == 4
+    assert state["llm_calls_avoided"] == 1
+    assert state["flagged_answers"][0]["duplicate_of"] == "sess-a:0:pytorch"
+    assert any(entry.startswith("dedup →") for entry in log_lines(state["logs"]))
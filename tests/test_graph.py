@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import inspect
+from collections import Counter
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+import app.simulation.simulator as simulator
+from app.agents.interviewer.graph import NODE_WRITES, build_graph, build_state
+from app.core.config import get_settings
+from app.schema.models import AspectBreakdown, GradeDraft, Question
+from app.simulation.simulator import PolicyConfig, Population, simulate_candidate
+from app.storage.checkpoints import open_checkpointer
+
+
+class _StubStructuredLLM:
+    def __init__(self, model_cls):
+        self._model_cls = model_cls
+
+    async def ainvoke(self, prompt):
+        if self._model_cls is Question:
+            return Question(skill="python", text="How do generators work?", difficulty=3)
+        detail = AspectBreakdown(score=4, notes="stub")
+        return GradeDraft(
+            reasoning="stub",
+            coverage=detail,
+            technical_depth=detail,
+            evidence=detail,
+            communication=detail,
+        )
+
+    def with_config(self, **kwargs):
+        return self
+
+
+class _StubLLM:
+    def with_structured_output(self, model_cls):
+        return _StubStructuredLLM(model_cls)
+
+    def with_config(self, **kwargs):
+        return self
+
+
+def _state(skills, thread_id="t"):
+    return build_state(
+        skills, 6, 2, 3.5, 1.0, 0.5, {}, thread_id=thread_id, priors={}
+    )
+
+
+def _changed(before, after):
+    return {key for key in set(before) | set(after) if before.get(key) != after.get(key)}
+
+
+def test_nodes_write_only_declared_keys(monkeypatch):
+    written = {}
+
+    def watch(node, fn):
+        def record(before, after):
+            written.setdefault(node, set()).update(_changed(before, after))
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def run_async(state, *args, **kwargs):
+                before = copy.deepcopy(dict(state))
+                result = await fn(state, *args, **kwargs)
+                record(before, result)
+                return result
+
+            return run_async
+
+        def run(state, *args, **kwargs):
+            before = copy.deepcopy(dict(state))
+            result = fn(state, *args, **kwargs)
+            record(before, state)
+            return result
+
+        return run
+
+    for attr, node in [
+        ("generate_questions_node", "generate"),
+        ("select_question_node", "select"),
+        ("ask_node", "ask"),
+        ("grade_node", "grade"),
+        ("update_node", "update"),
+        ("decide_node", "decide"),
+    ]:
+        monkeypatch.setattr(simulator, attr, watch(node, getattr(simulator, attr)))
+
+    configs = [
+        PolicyConfig(max_turns=8),
+        PolicyConfig(selection_policy="thompson", stopping_rule="sprt", max_turns=8),
+        PolicyConfig(difficulty_policy="irt", max_turns=8),
+        PolicyConfig(grading_mode="adaptive", max_turns=8),
+        PolicyConfig(skill_graph=0.5, planner=True, max_turns=8),
+        PolicyConfig(token_budget=3000, max_turns=12),
+    ]
+
+    async def run():
+        for config in configs:
+            for idx in range(2):
+                await simulate_candidate(config, Population(skills=3), (7, idx))
+
+    asyncio.run(run())
+
+    for node, keys in written.items():
+        # pending_answer is set by the simulated candidate between ask and grade.
+        assert keys - {"pending_answer"} <= set(NODE_WRITES[node]), node
+
+
+def test_graph_checkpoints_deltas_and_resumes_from_sqlite(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _StubLLM())
+    url = f"sqlite:///{tmp_path / 'checkpoints.sqlite'}"
+    config = {"configurable": {"thread_id": "t"}}
+
+    async def ask_first():
+        saver = await open_checkpointer(url)
+        graph = build_graph(checkpointer=saver, interrupt_before=["grade"])
+        await graph.ainvoke(_state(["python"]), config)
+        await saver.conn.close()
+
+    async def answer():
+        # A new saver, as in a fresh request or process.
+        saver = await open_checkpointer(url)
+        graph = build_graph(checkpointer=saver, interrupt_before=["grade"])
+        paused = await graph.aget_state(config)
+        await graph.aupdate_state(config, {"pending_answer": "Lazily."}, as_node="ask")
+        await graph.ainvoke(None, config)
+        resumed = await graph.aget_state(config)
+        await saver.conn.close()
+        return paused, resumed
+
+    asyncio.run(ask_first())
+    paused, resumed = asyncio.run(answer())
+
+    assert paused.next == ("grade",)
+    assert paused.values["current_question"].text == "How do generators work?"
+    assert resumed.next == ("grade",)
+    assert resumed.values["turn"] == 1
+    assert resumed.values["last_grade"].score == 4
+    assert resumed.values["question_history"][0]["answer"] == "Lazily."
+
+
+def test_graph_stores_each_key_only_when_a_step_writes_it(monkeypatch):
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _StubLLM())
+    saver = InMemorySaver()
+    graph = build_graph(checkpointer=saver, interrupt_before=["grade"])
+    config = {"configurable": {"thread_id": "t"}}
+
+    async def run():
+        await graph.ainvoke(_state(["python", "sql"]), config)
+        for _ in range(3):
+            await graph.aupdate_state(config, {"pending_answer": "An answer."}, as_node="ask")
+            await graph.ainvoke(None, config)
+
+    asyncio.run(run())
+
+    versions = Counter(channel for _, _, channel, _ in saver.blobs)
+    assert versions["skills"] == 1
+    assert versions["spans_map"] == 1
+    assert versions["belief_state"] == 1 + 3
+    assert versions["logs"] > versions["belief_state"]
+
+
+def test_logs_channel_appends_each_event_once_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _StubLLM())
+    graph = build_graph(checkpointer=InMemorySaver(), interrupt_before=["grade"])
+
+    async def run(thread_id):
+        config = {"configurable": {"thread_id": thread_id}}
+        await graph.ainvoke(_state(["python", "sql"], thread_id=thread_id), config)
+        for _ in range(2):
+            await graph.aupdate_state(config, {"pending_answer": "An answer."}, as_node="ask")
+            await graph.ainvoke(None, config)
+        return (await graph.aget_state(config)).values["logs"]
+
+    logs = asyncio.run(run("full"))
+    assert [entry["turn"] for entry in logs if entry["node"] == "ask"] == [0, 1]
+    assert [entry["turn"] for entry in logs if entry["node"] == "update"] == [0, 1]
+
+    monkeypatch.setattr(get_settings(), "agent_log_max_events", 5)
+    capped = asyncio.run(run("capped"))
+    assert len(capped) == 5
+    assert capped == logs[-5:]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from app.agents.interviewer.utils import irt
+from app.jobs.calibrate_items import run_calibration
+from app.storage.store import save_state
+
+
+def test_hard_questions_count_for_more_than_easy_ones(make_state, answer):
+    hard, easy = make_state(difficulty_policy="irt"), make_state(difficulty_policy="irt")
+    for idx in range(3):
+        answer(hard, "python", 4, text=f"Hard question {idx}?", difficulty=5)
+        answer(easy, "python", 4, text=f"Easy question {idx}?", difficulty=1)
+
+    hard_belief = hard["belief_state"]["python"]
+    easy_belief = easy["belief_state"]["python"]
+    assert hard_belief["theta"] > easy_belief["theta"]
+    assert hard_belief["lcb"] > easy_belief["lcb"]
+    assert len(hard_belief["irt_obs"]) == 3
+
+
+def test_best_level_follows_the_ability_estimate(make_state):
+    belief = make_state(difficulty_policy="irt")["belief_state"]["python"]
+    assert irt.best_level(belief, irt.NOMINAL)[0] == 3
+
+    for _ in range(3):
+        irt.irt_update(belief, irt.NOMINAL.levels[3], 5, 1.96)
+    assert irt.best_level(belief, irt.NOMINAL)[0] == 5
+
+
+def test_calibration_ranks_items_and_is_pinned_per_session(memory_stores, make_state, answer):
+    for idx in range(30):
+        state = make_state(difficulty_policy="irt")
+        answer(state, "python", 2, text="Explain the GIL.")
+        answer(state, "python", 5, text="What does len() return?")
+        save_state(f"s{idx}", state)
+
+    report = run_calibration(min_responses=5)
+
+    calibration = irt.calibration_for(report["version"])
+    hard = calibration.items[irt.item_key("python", "Explain the GIL.")]
+    easy = calibration.items[irt.item_key("python", "What does len() return?")]
+    assert hard > easy
+    assert set(calibration.levels) == set(irt.LEVELS)
+    assert report["items"] == 2
+    assert make_state(difficulty_policy="irt")["item_version"] == report["version"]
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import asyncio
 
+from app.agents.interviewer.graph import build_state
 from app.agents.interviewer.nodes.generate import generate_questions_node
 from app.agents.interviewer.nodes.grade import grade_node
 from app.agents.interviewer.nodes.select import select_question_node
-from app.agents.interviewer.utils.stats import ensure_prior
-from app.schema.models import AspectBreakdown, Grade, GradeDraft, Question
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.agent_log import log_lines
+from app.agents.interviewer.utils.stats import effective_sample_count, ensure_prior
+from app.schema.models import (
+    AspectBreakdown,
+    Grade,
+    GradeDraft,
+    MultiSkillGradeDraft,
+    Question,
+    SkillGradeDraft,
+)
 
 
 class _StubStructuredLLM:
@@ -57,7 +67,7 @@ def test_generate_questions_node_seeds_question(monkeypatch):
     seeded = updated["question_pool"][0]
     assert seeded.skill == "python"
     assert "Describe your Python project" in seeded.text
-    assert "generate_questions" in updated["logs"][-1]
+    assert "generate_questions" in log_lines(updated["logs"])[-1]
 
 
 def test_grade_node_persists_grade(monkeypatch):
@@ -83,7 +93,7 @@ def test_grade_node_persists_grade(monkeypatch):
     assert updated["last_grade"].score == 5
     assert updated["last_answer"].startswith("They ensure")
     assert updated["pending_answer"] is None
-    assert any(entry.startswith("grade → 5") for entry in updated["logs"])
+    assert any(entry.startswith("grade → 5") for entry in log_lines(updated["logs"]))
 
 
 def test_grade_node_caps_on_factual_error(monkeypatch):
@@ -170,3 +180,253 @@ def test_select_question_node_calls_llm_when_pool_empty(monkeypatch):
 
     assert updated["current_question"].text == "Walk me through type hints."
     assert updated["question_history"][-1]["skill"] == "python"
+
+
+class _StubChunk:
+    def __init__(self, args: str):
+        self.content = ""
+        self.tool_call_chunks = [{"args": args}]
+
+
+class _StubStreamingLLM(_StubLLM):
+    """Streams a tool call's JSON arguments in small fragments."""
+
+    def __init__(self, result, fragment: int = 7):
+        super().__init__(result)
+        self._fragment = fragment
+
+    def bind_tools(self, tools, tool_choice=None):
+        return self
+
+    async def astream(self, prompt):
+        raw = self._result.model_dump_json()
+        for start in range(0, len(raw), self._fragment):
+            yield _StubChunk(raw[start : start + self._fragment])
+
+
+def test_grade_node_streams_partial_aspects(monkeypatch):
+    from app.agents.interviewer.utils.streaming import stream_writer
+
+    draft = GradeDraft(
+        reasoning="Solid answer.",
+        coverage=AspectBreakdown(score=4, notes="Covered the question."),
+        technical_depth=AspectBreakdown(score=4, notes="Named the hooks."),
+        evidence=AspectBreakdown(score=3, notes="One example."),
+        communication=AspectBreakdown(score=4, notes="Clear."),
+    )
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _StubStreamingLLM(draft))
+    state = {
+        "current_question": Question(skill="python", text="Explain context managers.", difficulty=3),
+        "pending_answer": "They wrap setup and teardown.",
+        "last_answer": None,
+        "logs": [],
+        "thread_id": "thread-test",
+    }
+
+    events = []
+    with stream_writer(events.append):
+        updated = asyncio.run(grade_node(state))
+
+    partials = [evt for evt in events if evt["type"] == "grade_partial"]
+    assert partials
+    aspect_counts = [len(evt["aspects"]) for evt in partials]
+    assert aspect_counts == sorted(aspect_counts)
+    assert partials[-1]["aspects"]["evidence"]["score"] == 3
+    assert updated["last_grade"].score == 4
+
+
+class _TruncatedStreamLLM(_StubStreamingLLM):
+    """Stops the tool-call stream after ``coverage``, as a max-tokens cut-off does."""
+
+    async def astream(self, prompt):
+        raw = self._result.model_dump_json()
+        raw = raw[: raw.index(',"technical_depth"')]
+        for start in range(0, len(raw), self._fragment):
+            yield _StubChunk(raw[start : start + self._fragment])
+        chunk = _StubChunk("")
+        chunk.response_metadata = {"finish_reason": "length"}
+        yield chunk
+
+
+def test_grade_node_falls_back_when_tool_call_stream_is_truncated(monkeypatch):
+    from app.agents.interviewer.utils.streaming import stream_writer
+
+    draft = _uniform_draft(4)
+    # Cut at a field boundary the partial object validates, with defaults of 1.
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _TruncatedStreamLLM(draft))
+    state = {
+        "current_question": Question(skill="python", text="Explain context managers.", difficulty=3),
+        "pending_answer": "They wrap setup and teardown.",
+        "last_answer": None,
+        "logs": [],
+        "thread_id": "thread-test",
+    }
+
+    events = []
+    with stream_writer(events.append):
+        updated = asyncio.run(grade_node(state))
+
+    assert any(evt["type"] == "grade_partial" for evt in events)
+    assert updated["last_grade"].score == 4
+
+
+def test_select_question_node_streams_question_deltas(monkeypatch):
+    from app.agents.interviewer.utils.streaming import stream_writer
+
+    generated = Question(skill="python", text="How do you profile slow Python code?", difficulty=3)
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _StubStreamingLLM(generated, fragment=5))
+    belief = {}
+    ensure_prior(belief)
+    state = {
+        "skills": ["python"],
+        "belief_state": {"python": belief},
+        "question_pool": [],
+        "inactive_skills": [],
+        "verified_skills": [],
+        "ucb_C": 0.5,
+        "logs": [],
+        "question_history": [],
+        "spans_map": {"python": []},
+        "last_grade": None,
+        "current_question": None,
+        "last_answer": "",
+        "turn": 0,
+        "thread_id": "thread-test",
+    }
+
+    events = []
+    with stream_writer(events.append):
+        updated = asyncio.run(select_question_node(state))
+
+    deltas = [evt for evt in events if evt["type"] == "question_delta"]
+    assert len(deltas) > 1
+    assert "".join(evt["delta"] for evt in deltas) == generated.text
+    assert updated["current_question"].text == generated.text
+
+
+def _uniform_draft(score: int) -> GradeDraft:
+    return GradeDraft(
+        reasoning=f"Uniform {score}.",
+        coverage=AspectBreakdown(score=score, notes="c"),
+        technical_depth=AspectBreakdown(score=score, notes="t"),
+        evidence=AspectBreakdown(score=score, notes="e"),
+        communication=AspectBreakdown(score=score, notes="m"),
+    )
+
+
+class _SequenceLLM:
+    """Returns a fixed sequence of drafts, one per structured call."""
+
+    def __init__(self, drafts):
+        self._drafts = list(drafts)
+        self.calls = 0
+
+    def with_structured_output(self, model_cls):
+        return self
+
+    def with_config(self, **kwargs):
+        return self
+
+    async def ainvoke(self, prompt):
+        draft = self._drafts[min(self.calls, len(self._drafts) - 1)]
+        self.calls += 1
+        return draft
+
+
+def _adaptive_state(threshold: float) -> dict:
+    belief = {}
+    ensure_prior(belief)
+    return {
+        "current_question": Question(skill="python", text="Explain context managers.", difficulty=3),
+        "pending_answer": "They wrap setup and teardown.",
+        "last_answer": None,
+        "logs": [],
+        "thread_id": "thread-test",
+        "belief_state": {"python": belief},
+        "verification_threshold": threshold,
+        "z_value": 1.0,
+        "grading_mode": "adaptive",
+        "extra_grade_budget": 6,
+        "extra_grade_samples": 0,
+    }
+
+
+def test_adaptive_grading_samples_near_threshold(monkeypatch):
+    llm = _SequenceLLM([_uniform_draft(5), _uniform_draft(3), _uniform_draft(3)])
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: llm)
+    # A single 5 would project an LCB of ~2.94, right at the bar.
+    state = _adaptive_state(threshold=3.0)
+
+    updated = asyncio.run(grade_node(state))
+
+    assert llm.calls == 3
+    assert updated["last_grade"].score == 3
+    assert updated["extra_grade_budget"] == 4
+    assert updated["extra_grade_samples"] == 2
+    assert any(entry.startswith("grade_samples →") for entry in log_lines(updated["logs"]))
+
+
+def test_adaptive_grading_skips_extra_calls_when_confident(monkeypatch):
+    llm = _SequenceLLM([_uniform_draft(5)])
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: llm)
+    state = _adaptive_state(threshold=1.0)
+
+    updated = asyncio.run(grade_node(state))
+
+    assert llm.calls == 1
+    assert updated["last_grade"].score == 5
+    assert updated["extra_grade_budget"] == 6
+
+
+class _SchemaLLM(_StubLLM):
+    """Return a canned result per structured-output schema."""
+
+    def __init__(self, results):
+        super().__init__(None)
+        self._results = results
+
+    def with_structured_output(self, model_cls):
+        return _StubStructuredLLM(self._results[model_cls])
+
+
+def test_multi_skill_turn_updates_both_skills(monkeypatch):
+    pair_question = Question(skill="pytorch", text="How do PyTorch and Lightning fit together?", difficulty=3)
+    multi_draft = MultiSkillGradeDraft(
+        grades=[
+            SkillGradeDraft(skill=skill, **_uniform_draft(score).model_dump())
+            for skill, score in (("pytorch", 4), ("lightning", 3))
+        ]
+    )
+    monkeypatch.setattr(
+        "app.core.llm.get_llm",
+        lambda: _SchemaLLM({Question: pair_question, MultiSkillGradeDraft: multi_draft}),
+    )
+    state = build_state(
+        ["pytorch", "lightning", "sql"],
+        max_turns=6,
+        min_q=2,
+        verify_lcb=3.5,
+        z_value=1.96,
+        ucb_C=1.0,
+        spans_map={},
+        multi_skill_questions=True,
+        skill_groups={"pytorch": "ml/frameworks", "lightning": "ml/frameworks", "sql": "data"},
+    )
+    # Make pytorch the UCB pick so its only sibling becomes the partner.
+    state["belief_state"]["pytorch"]["mean"] = 4.0
+
+    state = asyncio.run(select_question_node(state))
+    question = state["current_question"]
+    assert (question.skill, question.co_skills) == ("pytorch", ["lightning"])
+
+    state["pending_answer"] = "I wrap the nn.Module in a LightningModule and let the Trainer run the loop."
+    state = asyncio.run(grade_node(state))
+    assert state["last_grade"].score == 4
+    assert state["last_grade"].co_grades["lightning"].score == 3
+
+    state = update_node(state)
+    assert state["turn"] == 1
+    assert effective_sample_count(state["belief_state"]["pytorch"]) == 1
+    assert effective_sample_count(state["belief_state"]["lightning"]) == 1
+    assert effective_sample_count(state["belief_state"]["sql"]) == 0
+    assert state["question_history"][-1]["co_scores"] == {"lightning": 3}
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+
+from app.agents.interviewer.nodes.decide import end_reason
+from app.agents.interviewer.nodes.select import pick_skill
+from app.agents.interviewer.utils.planner import rollout_plan
+from app.agents.interviewer.utils.stats import ensure_prior, welford_update
+
+
+def _belief(*scores):
+    belief: dict = {}
+    ensure_prior(belief)
+    for score in scores:
+        welford_update(belief, float(score))
+    return belief
+
+
+def test_rollouts_separate_promising_and_hopeless_skills():
+    beliefs = {"strong": _belief(5, 4, 5), "weak": _belief(2, 2, 3)}
+
+    plan = rollout_plan(
+        beliefs, remaining=6, threshold=3.75, z=1.96, min_q=2, rng=np.random.default_rng(0)
+    )
+
+    assert plan["strong"].p_verify > 0.3 and plan["strong"].needed <= 6
+    assert plan["weak"].p_verify < 0.05
+    assert beliefs["strong"]["n"] == 4  # beliefs are not modified
+    empty = rollout_plan(
+        beliefs, remaining=0, threshold=3.75, z=1.96, min_q=2, rng=np.random.default_rng(0)
+    )
+    assert empty["strong"].p_verify == 0.0
+
+
+def test_planner_skips_hopeless_skills_and_stops_when_none_can_verify(make_state, answer):
+    state = make_state(["python", "sql"], max_turns=8, planner=True)
+    for score in (2, 3, 2):
+        answer(state, "sql", score)
+    answer(state, "python", 4)
+
+    assert "sql" not in state["inactive_skills"]
+    assert pick_skill(state)[0] == "python"
+
+    for score in (2, 2):
+        answer(state, "python", score)
+    assert end_reason(state) == "nothing left to verify"
+
+    greedy = make_state(["python", "sql"], max_turns=8)
+    for skill, score in [("sql", 2), ("sql", 3), ("sql", 2), ("python", 2), ("python", 2)]:
+        answer(greedy, skill, score)
+    assert end_reason(greedy) is None
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from app.agents.interviewer.nodes.grade import grade_node
+from app.agents.interviewer.utils.agent_log import log_lines
+from app.agents.interviewer.utils.pregrade import pregrade_answer
+from app.schema.models import Question
+
+FIXTURES = Path(__file__).parent / "fixtures" / "pregrade_labels.json"
+
+
+def _load_cases():
+    return json.loads(FIXTURES.read_text())
+
+
+def test_pregrade_has_full_precision_on_labeled_fixtures():
+    cases = _load_cases()
+    rejected = []
+    for case in cases:
+        question = Question(skill=case["skill"], text=case["question"], difficulty=3)
+        result = pregrade_answer(question, case["answer"], case["evidence"])
+        if result is not None:
+            rejected.append(case)
+            assert result.grade.score == 1
+            assert all(detail.notes for detail in result.grade.aspects.values())
+
+    false_rejections = [case["answer"] for case in rejected if case["label"] != "reject"]
+    assert false_rejections == []
+
+    expected = [case for case in cases if case["label"] == "reject"]
+    recall = len(rejected) / len(expected)
+    assert recall >= 0.9
+
+
+def test_grade_node_skips_llm_for_empty_answer(monkeypatch):
+    def _fail():
+        raise AssertionError("LLM should not be called for an empty answer")
+
+    monkeypatch.setattr("app.core.llm.get_llm", _fail)
+    state = {
+        "current_question": Question(skill="python", text="Explain context managers.", difficulty=3),
+        "pending_answer": "",
+        "last_answer": None,
+        "logs": [],
+        "thread_id": "thread-test",
+        "llm_calls_avoided": 0,
+    }
+
+    updated = asyncio.run(grade_node(state))
+
+    assert updated["last_grade"].score == 1
+    assert updated["llm_calls_avoided"] == 1
+    assert any(entry.startswith("pregrade →") for entry in log_lines(updated["logs"]))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+import app.storage.store as store_module
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.utils.stats import effective_sample_count
+from app.jobs.fit_priors import run_fit, session_evidence
+
+
+@pytest.fixture
+def completed_session(make_state, answer):
+    """Play ``(skill, score)`` turns until the session reaches ``max_turns``."""
+
+    def play(turns):
+        state = make_state(
+            sorted({skill for skill, _ in turns}), max_turns=len(turns), verify_lcb=3.5
+        )
+        for skill, score in turns:
+            answer(state, skill, score)
+        return state
+
+    return play
+
+
+def test_session_evidence_recovers_real_grades(completed_session):
+    state = completed_session([("sql", 4), ("sql", 2), ("sql", 5)])
+
+    count, mean, ss = session_evidence(state["belief_state"]["sql"])
+
+    assert count == 3
+    assert math.isclose(mean, 11 / 3)
+    assert math.isclose(ss, sum((x - 11 / 3) ** 2 for x in (4, 2, 5)))
+
+
+def test_fit_priors_publishes_versioned_table_used_by_new_sessions(
+    memory_stores, completed_session
+):
+    rng = random.Random(3)
+    for idx in range(8):
+        hard_level = rng.choice([1.6, 2.0, 2.4])
+        turns = []
+        for _ in range(3):
+            turns.append(("kubernetes", max(1, min(5, round(hard_level + rng.uniform(-0.6, 0.6))))))
+            turns.append(("python", rng.choice([4, 5])))
+        store_module.save_state(f"sess-{idx}", completed_session(turns))
+
+    report = run_fit(min_sessions=5)
+
+    assert report["version"] == 1
+    assert report["sessions"] == 8
+    hard = report["priors"]["kubernetes"]
+    assert hard["mean"] < 2.6 < report["priors"]["python"]["mean"]
+    assert 0.5 <= hard["strength"] <= 10
+    replay = report["turns_to_verification"]
+    assert replay["after"]["verified"] > replay["before"]["verified"]
+
+    state = build_state(["kubernetes", "go"], 6, 2, 3.5, 1.96, 1.0, {})
+    assert state["prior_version"] == 1
+    belief = state["belief_state"]["kubernetes"]
+    assert belief["mean"] == hard["mean"]
+    assert belief["prior_n"] == hard["strength"]
+    assert effective_sample_count(belief) == 0
+    # Skills without a fitted prior keep the global one.
+    assert "prior_n" not in state["belief_state"]["go"]
+
+    assert run_fit(min_sessions=5)["version"] == 2
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from app.agents.interviewer.graph import build_state
+from app.jobs import regrade
+from app.schema.models import AspectBreakdown, GradeDraft, MultiSkillGradeDraft, SkillGradeDraft
+from app.storage import store as store_module
+
+
+class _FixedGrader:
+    """Structured LLM stub that scores every answer (and every skill of one) the same."""
+
+    def __init__(self, score: int, skills=("python", "sql")):
+        self._score = score
+        self._skills = skills
+        self._model_cls = GradeDraft
+        self.calls = 0
+
+    def with_structured_output(self, model_cls):
+        self._model_cls = model_cls
+        return self
+
+    def with_config(self, **kwargs):
+        return self
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        detail = AspectBreakdown(score=self._score, notes="stub")
+        aspects = dict(
+            coverage=detail, technical_depth=detail, evidence=detail, communication=detail
+        )
+        if self._model_cls is MultiSkillGradeDraft:
+            return MultiSkillGradeDraft(
+                grades=[
+                    SkillGradeDraft(skill=skill, reasoning="stub", **aspects)
+                    for skill in self._skills
+                ]
+            )
+        return GradeDraft(reasoning="stub", **aspects)
+
+
+def _stored_session(scores, co_skill=None):
+    skills = ["python", co_skill] if co_skill else ["python"]
+    state = build_state(skills, 8, 2, 3.0, 1.0, 1.0, {skill: [] for skill in skills}, thread_id="s")
+    state["question_history"] = [
+        {
+            "skill": "python",
+            "question": f"Question number {idx} about Python?",
+            "difficulty": 3,
+            "source": "select_question",
+            "turn": idx,
+            "answer": "I used generators and context managers to stream files.",
+            "score": score,
+            "reasoning": "old rubric",
+        }
+        for idx, score in enumerate(scores)
+    ]
+    if co_skill:
+        for entry in state["question_history"]:
+            entry["co_skills"] = [co_skill]
+            entry["co_scores"] = {co_skill: entry["score"]}
+    return state
+
+
+def test_regrade_reports_verification_changes_and_resumes(memory_stores, monkeypatch, tmp_path):
+    store_module._memory_store["sess-a"] = store_module._serialize_state(_stored_session([5, 5, 5]))
+    store_module._memory_store["sess-b"] = store_module._serialize_state(_stored_session([2, 2]))
+    grader = _FixedGrader(score=3)
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: grader)
+    report = tmp_path / "report.jsonl"
+
+    summary = asyncio.run(regrade.run_regrade(report, concurrency=2, workers=1))
+
+    assert summary == {"skipped": 0, "processed": 2, "changed": 1, "failed": 0}
+    rows = {row["session_id"]: row for row in map(json.loads, report.read_text().splitlines())}
+    assert rows["sess-a"]["no_longer_verified"] == ["python"]
+    assert len(rows["sess-a"]["changed_scores"]) == 3
+    assert rows["sess-b"]["verification_changed"] is False
+    assert grader.calls == 5
+
+    rerun = asyncio.run(regrade.run_regrade(report, concurrency=2, workers=1))
+    assert rerun["skipped"] == 2 and rerun["processed"] == 0
+    assert grader.calls == 5
+
+
+def test_regrade_replays_co_skill_grades(memory_stores, monkeypatch, tmp_path):
+    store_module._memory_store["sess-m"] = store_module._serialize_state(
+        _stored_session([5, 5, 5], co_skill="sql")
+    )
+    monkeypatch.setattr("app.core.llm.get_llm", lambda: _FixedGrader(score=3))
+    report = tmp_path / "report.jsonl"
+
+    asyncio.run(regrade.run_regrade(report, concurrency=2, workers=1))
+
+    row = json.loads(report.read_text())
+    assert row["verified_before"] == ["python", "sql"]
+    assert row["no_longer_verified"] == ["python", "sql"]
+    assert [change["skill"] for change in row["changed_scores"]] == ["python", "sql"] * 3
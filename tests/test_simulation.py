@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.simulation.simulator import (
+    PolicyConfig,
+    Population,
+    parse_policy,
+    simulate,
+    simulate_candidate,
+)
+
+
+def test_parse_policy_overrides_fields():
+    config = parse_policy("se:ucb_C=2,max_turns=10")
+
+    assert config == PolicyConfig(selection_policy="se", ucb_C=2.0, max_turns=10)
+    assert config.label == "se:max_turns=10,ucb_C=2.0"
+    with pytest.raises(ValueError):
+        parse_policy("ucb1:unknown=1")
+
+
+def test_noiseless_strong_candidate_is_verified_through_real_nodes():
+    population = Population(skills=2, ability_mean=5.0, ability_sd=0.0, answer_noise=0.0, grader_noise=0.0)
+
+    outcome = asyncio.run(simulate_candidate(PolicyConfig(max_turns=10), population, (0, 0)))
+
+    assert sorted(outcome["verified"]) == ["skill-0", "skill-1"]
+    assert outcome["turns"] < 10
+    # One draft per skill for the pool, then one grading call per turn.
+    assert outcome["calls"]["grade"] == outcome["turns"]
+
+
+def test_simulate_reports_per_policy_and_matches_across_workers():
+    population = Population(skills=3, grader_bias=0.5)
+    configs = [PolicyConfig(), parse_policy("se:ucb_C=2")]
+
+    serial = simulate(configs, population, candidates=6, seed=1)
+    parallel = simulate(configs, population, candidates=6, seed=1, workers=2)
+
+    assert [row["policy"] for row in serial] == ["ucb1", "se:ucb_C=2.0"]
+    assert serial == parallel
+    for row in serial:
+        assert row["candidates"] == 6
+        assert 0.0 <= row["false_verify_rate"] <= 1.0
+        assert row["llm_cost"] == pytest.approx(row["llm_calls"], abs=1e-3)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from app.agents.interviewer.utils import skill_graph
+from app.agents.interviewer.utils.stats import real_sample_count, session_evidence
+from app.jobs.fit_skill_graph import run_fit
+from app.storage.store import save_state
+
+
+def test_sparse_graph_neighbours_and_session_subgraph():
+    graph = skill_graph.SkillGraph.from_edges(
+        [("pytorch", "pytorch-lightning", 0.8), ("pytorch", "numpy", 0.4), ("numpy", "pytorch", 0.5)]
+    )
+
+    assert len(graph) == 2
+    assert graph.neighbors("pytorch") == [("numpy", 0.5), ("pytorch-lightning", 0.8)]
+    assert graph.links_for(["pytorch", "pytorch-lightning", "sql"]) == {
+        "pytorch": {"pytorch-lightning": 0.8},
+        "pytorch-lightning": {"pytorch": 0.8},
+    }
+    with pytest.raises(ValueError):
+        skill_graph.SkillGraph.from_edges([("a", "b", 1.5)])
+
+
+def test_answer_shares_evidence_without_verifying_the_neighbour(make_state, answer):
+    links = {"pytorch": {"lightning": 0.8}, "lightning": {"pytorch": 0.8}}
+    state = make_state(["pytorch", "lightning", "sql"], skill_links=links)
+    mean_before = state["belief_state"]["lightning"]["mean"]
+
+    answer(state, "pytorch", 5)
+    answer(state, "pytorch", 5)
+
+    neighbour = state["belief_state"]["lightning"]
+    assert neighbour["borrowed_n"] == pytest.approx(2 * 0.5 * 0.8**2)
+    assert neighbour["mean"] > mean_before
+    assert "sql" not in state["belief_state"] or "borrowed_n" not in state["belief_state"]["sql"]
+    assert "lightning" not in state["verified_skills"]
+    assert session_evidence(neighbour) is None
+    summary = {row["skill"]: row for row in state["skill_summaries"]}
+    assert summary["lightning"]["n"] == 0
+    assert summary["lightning"]["borrowed_n"] == pytest.approx(0.64)
+
+
+def test_borrowed_evidence_does_not_count_toward_min_questions(make_state, answer):
+    state = make_state(["a", "b"], skill_links={"a": {"b": 1.0}, "b": {"a": 1.0}})
+    for _ in range(8):
+        answer(state, "a", 5)
+    answer(state, "b", 5)
+
+    neighbour = state["belief_state"]["b"]
+    assert neighbour["borrowed_n"] == pytest.approx(4.0)
+    assert real_sample_count(neighbour) == 1
+    assert neighbour["lcb"] >= state["verification_threshold"]
+    assert "b" not in state["verified_skills"]
+
+    answer(state, "b", 5)
+    assert "b" in state["verified_skills"]
+
+
+def test_learned_graph_links_co_varying_skills(memory_stores, make_state, answer):
+    for idx in range(25):
+        level = 1 + idx % 5
+        # Four answers end the session, so the fit counts it as completed.
+        state = make_state(["python", "django", "sql"], max_turns=4)
+        answer(state, "python", level)
+        answer(state, "django", level)
+        answer(state, "sql", 1 + idx // 5)
+        answer(state, "sql", 1 + idx // 5)
+        save_state(f"s{idx}", state)
+
+    report = run_fit(min_sessions=10, min_weight=0.3)
+
+    assert [(link["skill_a"], link["skill_b"]) for link in report["links"]] == [
+        ("django", "python")
+    ]
+    fresh = make_state(["python", "django"], skill_graph=True)
+    assert fresh["skill_graph_version"] == report["version"]
+    assert fresh["skill_links"]["python"] == {"django": pytest.approx(1.0)}
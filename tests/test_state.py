@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+
+from app.agents.interviewer.utils.state import (
+    MAX_HISTORY,
+    MAX_SKILL_HISTORY,
+    history_snippet,
+    summarise_skills,
+)
+
+
+def test_history_snippet_survives_many_other_skills(make_state, answer):
+    skills = [f"skill-{idx}" for idx in range(MAX_HISTORY + 5)]
+    state = make_state(skills, max_turns=100, verify_lcb=3.5)
+    answer(state, skills[0], 4, text="What is a closure?")
+    for skill in skills[1:]:
+        answer(state, skill, 3)
+
+    assert all(entry["skill"] != skills[0] for entry in state["question_history"])
+    snippet = history_snippet(state, skills[0])
+    assert snippet == "Q: What is a closure? | A: An answer about skill-0. | score=4"
+
+
+def test_skill_history_is_bounded_per_skill_and_indexes_co_skills(make_state, answer):
+    state = make_state(["python", "sql"], max_turns=100, verify_lcb=3.5)
+    for turn in range(MAX_SKILL_HISTORY + 2):
+        answer(state, "python", 3, text=f"Python question number {turn}?", co={"sql": 5})
+
+    assert len(state["skill_history"]["python"]) == MAX_SKILL_HISTORY
+    assert state["skill_history"]["python"][0]["question"] == "Python question number 2?"
+    assert history_snippet(state, "sql", limit=1).endswith("score=5")
+
+
+def test_history_snippet_indexes_states_stored_without_index(make_state, answer):
+    state = make_state(["python", "sql"], max_turns=100, verify_lcb=3.5)
+    answer(state, "python", 4, co={"sql": 2})
+    legacy = copy.deepcopy(state)
+    del legacy["skill_history"]
+
+    assert history_snippet(legacy, "sql") == history_snippet(state, "sql")
+    answer(legacy, "sql", 5)
+    assert [record["score"] for record in legacy["skill_history"]["sql"]] == [2, 5]
+
+
+def test_incremental_summaries_match_full_rebuild(make_state, answer):
+    skills = ["python", "sql", "docker"]
+    state = make_state(skills, max_turns=100, verify_lcb=3.5)
+    state["skill_links"] = {"python": {"sql": 0.8}, "sql": {"python": 0.8}}
+    for skill, score in [("python", 5), ("docker", 1), ("python", 5), ("sql", 4)]:
+        answer(state, skill, score)
+        assert state["skill_summaries"] == summarise_skills(state)
+
+    legacy = copy.deepcopy(state)
+    del legacy["skill_rows"]
+    answer(legacy, "sql", 3)
+    assert legacy["skill_rows"] == {"python": 0, "sql": 1, "docker": 2}
+    assert legacy["skill_summaries"] == summarise_skills(legacy)
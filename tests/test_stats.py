@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import copy
 import math
+import random
 
+import numpy as np
+
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.agent_log import log_lines
 from app.agents.interviewer.utils import stats as stats_utils
+from app.agents.interviewer.utils.belief_store import BeliefStore
+from app.agents.interviewer.utils.sequential import sprt_bounds, sprt_decision
+from app.schema.models import Grade, Question
 
 
 def test_compute_uncertainty_sets_bounds():
@@ -48,3 +58,141 @@ def test_verify_status_respects_threshold():
 
     assert stats_utils.verify_status(belief, threshold=2.9, min_real_samples=2)
     assert not stats_utils.verify_status(belief, threshold=3.5, min_real_samples=4)
+
+
+def _random_beliefs(count: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    beliefs = {}
+    for idx in range(count):
+        belief = {}
+        stats_utils.ensure_prior(belief)
+        for _ in range(rng.randint(0, 4)):
+            stats_utils.welford_update(belief, float(rng.randint(1, 5)))
+        stats_utils.compute_uncertainty(belief, z=1.96)
+        beliefs[f"skill-{idx}"] = belief
+    return beliefs
+
+
+def test_belief_store_round_trips_losslessly():
+    beliefs = _random_beliefs(20)
+    beliefs["fresh"] = {}
+    beliefs["tagged"] = {"n": 1, "mean": 3.0, "m2": 0.25, "source": "profile"}
+    original = copy.deepcopy(beliefs)
+
+    store = BeliefStore.from_dict(beliefs)
+
+    assert store.to_dict() == original
+    assert beliefs == original
+    assert store.total_effective == stats_utils.total_effective_questions(_random_beliefs(20))
+
+
+def test_belief_store_matches_scalar_statistics():
+    beliefs = _random_beliefs(80)
+    store = BeliefStore.from_dict(beliefs)
+    store.update("skill-3", 5.0)
+    stats_utils.welford_update(beliefs["skill-3"], 5.0)
+    store.refresh(z=1.96)
+    for belief in beliefs.values():
+        stats_utils.compute_uncertainty(belief, z=1.96)
+
+    exported = store.to_dict()
+    for skill, belief in beliefs.items():
+        for key in ("n", "mean", "m2", "se", "lcb", "ucb"):
+            assert math.isclose(exported[skill][key], belief[key], abs_tol=1e-12)
+    assert store.total_effective == stats_utils.total_effective_questions(beliefs)
+
+    # The vectorized selector (≥ VECTORIZE_MIN_SKILLS) agrees with the scalar loop.
+    scalar_best = max(
+        beliefs,
+        key=lambda skill: beliefs[skill]["mean"]
+        + 0.7
+        * math.sqrt(
+            math.log(max(2, stats_utils.total_effective_questions(beliefs) + 1))
+            / max(stats_utils.effective_sample_count(beliefs[skill]), 1)
+        ),
+    )
+    skill, logs = stats_utils.select_skill_ucb_with_log(beliefs, exploration_c=0.7)
+    assert skill == scalar_best
+    assert "(vectorized)" in logs[0]
+
+
+def test_nig_posterior_matches_conjugate_update():
+    scores = [4.0, 5.0, 3.0, 4.0]
+    belief = {}
+    stats_utils.ensure_prior(belief)
+    for score in scores:
+        stats_utils.welford_update(belief, score)
+
+    mu, kappa, alpha, beta = stats_utils.nig_posterior(belief)
+
+    mu0, kappa0 = stats_utils.PRIOR_MEAN, stats_utils.NIG_KAPPA0
+    alpha0 = stats_utils.NIG_ALPHA0
+    beta0 = stats_utils.PRIOR_VARIANCE * (alpha0 - 1)
+    n = len(scores)
+    xbar = sum(scores) / n
+    ss = sum((score - xbar) ** 2 for score in scores)
+    assert math.isclose(mu, (kappa0 * mu0 + n * xbar) / (kappa0 + n))
+    assert (kappa, alpha) == (kappa0 + n, alpha0 + n / 2)
+    expected_beta = beta0 + 0.5 * ss + kappa0 * n * (xbar - mu0) ** 2 / (2 * (kappa0 + n))
+    assert math.isclose(beta, expected_beta)
+
+    # Cornish-Fisher t quantiles against tabulated 97.5% values.
+    for dof, exact in ((3, 3.182), (5, 2.571), (10, 2.228)):
+        assert abs(stats_utils.student_t_quantile(1.96, dof) - exact) < 0.03
+
+    stats_utils.compute_uncertainty(belief, z=1.96, model="nig")
+    assert belief["lcb"] < mu < belief["ucb"]
+
+
+def test_thompson_selection_favours_strong_posterior():
+    strong, weak = {}, {}
+    stats_utils.ensure_prior(strong)
+    stats_utils.ensure_prior(weak)
+    for _ in range(6):
+        stats_utils.welford_update(strong, 5.0)
+        stats_utils.welford_update(weak, 2.0)
+
+    rng = np.random.default_rng(0)
+    picks = [
+        stats_utils.select_skill_thompson_with_log({"weak": weak, "strong": strong}, rng)[0]
+        for _ in range(200)
+    ]
+
+    assert picks.count("strong") > 190
+
+
+def test_sprt_bounds_follow_wald_approximation():
+    bounds = sprt_bounds(0.05, 0.10)
+
+    assert math.isclose(bounds.efficacy, math.log(0.90 / 0.05))
+    assert math.isclose(bounds.futility, math.log(0.10 / 0.95))
+
+
+def test_sprt_decision_waits_for_min_samples_then_crosses_boundaries():
+    strong: dict = {}
+    stats_utils.welford_update(strong, 5.0)
+    assert sprt_decision(strong, 3.75, 2)[0] is None
+    stats_utils.welford_update(strong, 5.0)
+    assert sprt_decision(strong, 3.75, 2)[0] == "verify"
+
+    weak: dict = {}
+    for score in (3.0, 2.0, 3.0):
+        stats_utils.welford_update(weak, score)
+    assert sprt_decision(weak, 3.75, 2)[0] == "reject"
+
+
+def test_sprt_stopping_rejects_failing_skill_and_ends_interview():
+    state = build_state(
+        ["sql"], 10, 2, 3.75, 1.96, 1.0, {}, priors={}, stopping_rule="sprt"
+    )
+    for score in (3, 2, 3):
+        state["current_question"] = Question(skill="sql", text="Explain indexes.", difficulty=3)
+        state["last_grade"] = Grade(score=score, reasoning="weak")
+        update_node(state)
+        if state["inactive_skills"]:
+            break
+
+    # No single grade fell below 2, yet the futility boundary rejects the skill.
+    assert state["inactive_skills"] == ["sql"]
+    assert state["turn"] < 10
+    assert any(line.startswith("sprt → sql") and line.endswith("reject") for line in log_lines(state["logs"]))
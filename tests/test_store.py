@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+
+import app.storage.store as store_module
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.update import update_node
+from app.agents.interviewer.utils.state import record_question
+from app.schema.models import AspectBreakdown, Grade, Question
+
+
+def _played_state():
+    state = build_state(["python", "sql"], 8, 2, 3.5, 1.96, 1.0, {}, thread_id="t", priors={})
+    question = Question(skill="python", text="How do generators work?", difficulty=3)
+    state["question_pool"] = [question]
+    record_question(state, question, "select_question")
+    state["last_answer"] = "They yield values lazily."
+    state["last_grade"] = Grade(
+        score=4,
+        reasoning="Solid.",
+        aspects={"coverage": AspectBreakdown(score=4, notes="ok")},
+        co_grades={"sql": Grade(score=3)},
+    )
+    update_node(state)
+    return state
+
+
+def test_state_round_trips_through_the_store(memory_stores):
+    state = _played_state()
+    store_module.save_state("sess", state)
+    loaded = store_module.load_state("sess")
+
+    assert isinstance(store_module._memory_store["sess"], str)
+    assert loaded == state
+    assert isinstance(loaded["current_question"], Question)
+    assert loaded["last_grade"].co_grades["sql"].score == 3
+    assert isinstance(loaded["belief_state"]["sql"]["n"], int)
+
+
+def test_rows_written_by_the_dict_codec_still_load(memory_stores):
+    state = _played_state()
+    row = dict(state, future_key={"kept": True})
+    row["current_question"] = state["current_question"].model_dump()
+    row["question_pool"] = [question.model_dump() for question in state["question_pool"]]
+    row["last_grade"] = state["last_grade"].model_dump()
+    store_module._memory_store["legacy"] = row
+
+    loaded = store_module.load_state("legacy")
+
+    assert loaded["current_question"] == state["current_question"]
+    assert loaded["last_grade"] == state["last_grade"]
+    assert loaded["future_key"] == {"kept": True}
+    assert loaded["belief_state"] == state["belief_state"]
+
+
+def test_malformed_question_is_kept_as_a_dict():
+    row = json.loads(store_module._encode_state(_played_state()))
+    row["question_pool"].append({"skill": "sql", "text": "?", "difficulty": 9})
+
+    loaded = store_module._deserialize_state(json.dumps(row))
+
+    assert isinstance(loaded["question_pool"][0], Question)
+    assert loaded["question_pool"][1] == {"skill": "sql", "text": "?", "difficulty": 9}
+    assert isinstance(loaded["last_grade"], Grade)
@@ -160,3 +160,179 @@ def _exercise_stream() -> None:
 
 def test_stream_round_trip() -> None:
     _exercise_stream()
+
+
+def _pipelined_payload(skills: List[str], **overrides: Any) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "profile": {
+            "ID": "123",
+            "NAME": "Candidate",
+            "SKILLS": [
+                {
+                    "taxonomy_id": f"ML/Frameworks/{skill}",
+                    "evidence_sources": [{"source": "cv", "span": f"Used {skill}."}],
+                }
+                for skill in skills
+            ],
+        },
+        "max_turns": 4,
+        "min_q": 2,
+        "verify_lcb": 4.5,
+        "z_value": 1.0,
+        "ucb_C": 0.5,
+        "pipelined": True,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_resume_pipelined_emits_question_before_grade() -> None:
+    payload = _pipelined_payload(["PyTorch", "Pandas"])
+    session_id = f"session-{uuid.uuid4()}"
+
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        first_pass = _collect_events("/interviewer/stream", payload, session_id)
+        asked = next(body for evt, body in first_pass if body.get("type") == "question")
+        second_pass = _collect_events(
+            "/interviewer/resume", dict(payload, answer="I trained models."), session_id
+        )
+
+    kinds = [body.get("type") or evt for evt, body in second_pass]
+    assert kinds.index("question") < kinds.index("grade") < kinds.index("state")
+    follow_up = next(body for evt, body in second_pass if body.get("type") == "question")
+    assert follow_up["skill"] != asked["skill"]
+    assert second_pass[-1][1].get("status") == "awaiting_answer"
+
+
+class _GradePromptRecorder(_StubLLM):
+    def __init__(self):
+        super().__init__()
+        self.grade_prompts: List[str] = []
+        self.questions = 0
+
+    def with_structured_output(self, model_cls: type[Any]) -> _StubStructuredLLM:
+        structured = _StubStructuredLLM(model_cls)
+        answer = structured.ainvoke
+
+        async def record(prompt: Any) -> Any:
+            result = await answer(prompt)
+            if model_cls is Question:
+                # Numbered, so the answered and speculative questions differ.
+                self.questions += 1
+                return result.model_copy(update={"text": f"Question {self.questions}."})
+            self.grade_prompts.append(
+                prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+            )
+            return result
+
+        structured.ainvoke = record  # type: ignore[method-assign]
+        return structured
+
+
+def test_resume_pipelined_grades_the_answered_question(monkeypatch) -> None:
+    import app.service.service as service
+
+    payload = _pipelined_payload(["PyTorch", "Pandas"])
+    session_id = f"session-{uuid.uuid4()}"
+    llm = _GradePromptRecorder()
+    grade_detached = service.grade_detached
+
+    async def start_late(snapshot: Any) -> Any:
+        # Let selection serve the speculative pick from the pool first.
+        for _ in range(20):
+            await asyncio.sleep(0)
+        return await grade_detached(snapshot)
+
+    monkeypatch.setattr(service, "grade_detached", start_late)
+    with patch("app.core.llm.get_llm", return_value=llm):
+        first_pass = _collect_events("/interviewer/stream", payload, session_id)
+        asked = next(body for evt, body in first_pass if body.get("type") == "question")
+        second_pass = _collect_events(
+            "/interviewer/resume", dict(payload, answer="I trained models."), session_id
+        )
+
+    follow_up = next(body for evt, body in second_pass if body.get("type") == "question")
+    assert follow_up["skill"] != asked["skill"]
+    assert llm.grade_prompts
+    for prompt in llm.grade_prompts:
+        assert asked["text"] in prompt
+        assert follow_up["text"] not in prompt
+
+
+def test_resume_pipelined_withdraws_question_when_interview_ends() -> None:
+    payload = _pipelined_payload(["PyTorch"], min_q=1, verify_lcb=1.0)
+    session_id = f"session-{uuid.uuid4()}"
+
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        _collect_events("/interviewer/stream", payload, session_id)
+        events = _collect_events(
+            "/interviewer/resume", dict(payload, answer="I trained models."), session_id
+        )
+
+    assert any(body.get("type") == "question_withdrawn" for _, body in events)
+    assert not any(evt == "interrupt" for evt, _ in events)
+    assert events[-1][0] == "done"
+    assert events[-1][1].get("verified") == ["pytorch"]
+
+
+class _StubToolStream:
+    def __init__(self, model_cls: type[Any]):
+        self._structured = _StubStructuredLLM(model_cls)
+
+    def with_config(self, **kwargs):
+        return self
+
+    async def astream(self, prompt: Any):
+        result = await self._structured.ainvoke(prompt)
+        raw = result.model_dump_json()
+        for start in range(0, len(raw), 6):
+            yield type(
+                "StubChunk", (), {"content": "", "tool_call_chunks": [{"args": raw[start : start + 6]}]}
+            )()
+
+
+class _StubStreamingLLM(_StubLLM):
+    def bind_tools(self, tools, tool_choice=None):
+        return _StubToolStream(tools[0])
+
+
+def test_resume_streams_partial_grade_and_question_deltas() -> None:
+    payload = _pipelined_payload(["PyTorch", "Pandas"], pipelined=False)
+    session_id = f"session-{uuid.uuid4()}"
+
+    with patch("app.core.llm.get_llm", return_value=_StubStreamingLLM()):
+        _collect_events("/interviewer/stream", payload, session_id)
+        events = _collect_events(
+            "/interviewer/resume", dict(payload, answer="I trained models."), session_id
+        )
+
+    kinds = [body.get("type") for evt, body in events if evt == "message"]
+    assert "grade_partial" in kinds and "question_delta" in kinds
+    assert kinds.index("grade_partial") < kinds.index("grade")
+    assert kinds.index("question_delta") < kinds.index("question")
+
+
+def test_resume_imports_session_stored_before_checkpoints(monkeypatch) -> None:
+    from app.agents.interviewer.graph import build_state
+    from app.agents.interviewer.utils.state import record_question
+    from app.storage import store as store_module
+
+    monkeypatch.setattr(store_module, "_memory_store", {})
+    session_id = f"session-{uuid.uuid4()}"
+    state = build_state(
+        ["pytorch", "pandas"], 4, 1, 4.5, 1.0, 0.5, {}, thread_id=session_id, priors={}
+    )
+    question = Question(skill="pytorch", text="Tell me about pytorch.", difficulty=3)
+    record_question(state, question, "select_question")
+    store_module._memory_store[session_id] = store_module._encode_state(state)
+
+    payload = dict(_pipelined_payload(["PyTorch", "Pandas"], pipelined=False), answer="I did.")
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        events = _collect_events("/interviewer/resume", payload, session_id)
+        again = _collect_events("/interviewer/stream", payload, session_id)
+
+    assert any(body.get("type") == "grade" for _, body in events)
+    assert events[-1][1].get("status") == "awaiting_answer"
+    follow_up = next(body for evt, body in events if body.get("type") == "question")
+    # The paused thread re-emits its question rather than selecting another.
+    assert next(body for evt, body in again if body.get("type") == "question") == follow_up
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from app.jobs.tune_policy import grid_configs, pareto_frontier, run_search
+from app.storage.store import save_state
+
+
+@pytest.fixture
+def stored_sessions(memory_stores, make_state, answer):
+    for idx in range(6):
+        state = make_state(["python", "sql"], max_turns=6, verify_lcb=3.0)
+        for turn in range(6):
+            skill = ("python", "sql")[turn % 2]
+            score = 5 if skill == "python" else 2 + (idx + turn) % 3
+            answer(state, skill, score, text=f"Question {turn}?")
+        save_state(f"s{idx}", state)
+
+
+def test_pareto_frontier_drops_dominated_settings():
+    rows = [
+        {"params": {"a": 1}, "avg_turns": 5.0, "agreement": 0.9},
+        {"params": {"a": 2}, "avg_turns": 4.0, "agreement": 0.8},
+        {"params": {"a": 3}, "avg_turns": 6.0, "agreement": 0.85},
+    ]
+
+    assert [row["params"]["a"] for row in pareto_frontier(rows)] == [2, 1]
+    assert grid_configs({"z_value": [1.0, 2.0], "min_q": [1]}) == [
+        {"min_q": 1, "z_value": 1.0},
+        {"min_q": 1, "z_value": 2.0},
+    ]
+
+
+def test_counterfactual_search_reports_turns_and_agreement(stored_sessions):
+    report = run_search([{"max_turns": 2}, {"verify_lcb": 4.9}], replicates=2, seed=3)
+
+    assert report["sessions"] == 6
+    baseline, short, strict = report["results"]
+    assert baseline["params"] == {}
+    assert short["avg_turns"] <= 2 < baseline["avg_turns"]
+    assert baseline["agreement"] > 0.5
+    assert strict["miss_rate"] > 0 and strict["false_verify_rate"] == 0
+    assert report["frontier"]
+    assert run_search([{"max_turns": 2}, {"verify_lcb": 4.9}], replicates=2, seed=3) == report
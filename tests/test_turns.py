@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import app.storage.events as events_module
+import app.storage.leases as leases_module
+from app.schema.models import AspectBreakdown, GradeDraft, Question
+from app.service import turns
+from app.service.service import app
+
+PAYLOAD: Dict[str, Any] = {
+    "profile": {
+        "ID": "123",
+        "NAME": "Candidate",
+        "SKILLS": [
+            {
+                "taxonomy_id": f"ML/Frameworks/{skill}",
+                "evidence_sources": [{"source": "cv", "span": f"Used {skill}."}],
+            }
+            for skill in ("PyTorch", "Pandas")
+        ],
+    },
+    "max_turns": 4,
+    "min_q": 2,
+    "verify_lcb": 4.5,
+    "z_value": 1.0,
+    "ucb_C": 0.5,
+}
+
+
+@pytest.fixture(autouse=True)
+def event_log(monkeypatch):
+    monkeypatch.setattr(events_module, "_memory_events", {})
+
+
+class _CountingStructuredLLM:
+    def __init__(self, llm: "_CountingLLM", model_cls: type[Any]):
+        self._llm = llm
+        self._model_cls = model_cls
+
+    async def ainvoke(self, prompt: Any) -> Any:
+        self._llm.calls += 1
+        if self._model_cls is Question:
+            return Question(skill="pytorch", text="Tell me about pytorch.", difficulty=3)
+        detail = AspectBreakdown(score=4, notes="stub")
+        return GradeDraft(
+            reasoning="stub",
+            coverage=detail,
+            technical_depth=detail,
+            evidence=detail,
+            communication=detail,
+        )
+
+    def with_config(self, **kwargs):
+        return self
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def with_structured_output(self, model_cls: type[Any]) -> _CountingStructuredLLM:
+        return _CountingStructuredLLM(self, model_cls)
+
+    def with_config(self, **kwargs):
+        return self
+
+
+def _frames(
+    endpoint: str, payload: Dict[str, Any], session_id: str, last_event_id: Optional[str] = None
+) -> Tuple[List[Tuple[Optional[str], str, Dict[str, Any]]], Any]:
+    headers = {"session-id": session_id}
+    if last_event_id is not None:
+        headers["Last-Event-ID"] = last_event_id
+    response = TestClient(app).post(endpoint, json=payload, headers=headers)
+    response.raise_for_status()
+    frames = []
+    for block in response.text.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if not line.startswith(":")
+        )
+        if "event" in fields:
+            frames.append((fields.get("id"), fields["event"], json.loads(fields["data"])))
+    return frames, response.headers
+
+
+def test_reconnect_replays_turn_without_new_llm_calls() -> None:
+    payload = dict(PAYLOAD)
+    session_id = f"session-{uuid.uuid4()}"
+    llm = _CountingLLM()
+
+    with patch("app.core.llm.get_llm", return_value=llm):
+        asked, _ = _frames("/interviewer/stream", payload, session_id)
+        answered, headers = _frames(
+            "/interviewer/resume", dict(payload, answer="I trained models."), session_id
+        )
+        calls = llm.calls
+        # Dropped after the first event, and before any event at all.
+        rest, _ = _frames(
+            "/interviewer/resume", payload, session_id, last_event_id=answered[0][0]
+        )
+        whole, _ = _frames(
+            "/interviewer/resume", payload, session_id, last_event_id=headers["x-last-event-id"]
+        )
+
+    ids = [int(event_id) for event_id, _, _ in asked + answered]
+    assert ids == list(range(1, len(ids) + 1))
+    assert headers["x-last-event-id"] == asked[-1][0]
+    assert rest == answered[1:]
+    assert whole == answered
+    assert whole[-1][2].get("status") == "awaiting_answer"
+    assert llm.calls == calls
+
+
+def test_last_event_id_with_nothing_missed_runs_the_request() -> None:
+    payload = dict(PAYLOAD)
+    session_id = f"session-{uuid.uuid4()}"
+
+    with patch("app.core.llm.get_llm", return_value=_CountingLLM()):
+        asked, _ = _frames("/interviewer/stream", payload, session_id)
+        answered, _ = _frames(
+            "/interviewer/resume",
+            dict(payload, answer="I trained models."),
+            session_id,
+            last_event_id=asked[-1][0],
+        )
+
+    assert any(body.get("type") == "grade" for _, _, body in answered)
+    assert int(answered[0][0]) == int(asked[-1][0]) + 1
+
+
+def test_turn_keeps_running_after_its_follower_disconnects() -> None:
+    async def run():
+        gate = asyncio.Event()
+
+        async def events():
+            yield b"event: message\ndata: {}\n\n"
+            await gate.wait()
+            yield b'event: done\ndata: {"status": "awaiting_answer"}\n\n'
+
+        turn = turns.submit("s", events())
+        follower = turn.follow()
+        first = await follower.__anext__()
+        await follower.aclose()
+        gate.set()
+        while not turn.finished:
+            await asyncio.sleep(0)
+        replayed = turns.replay("s", 1)
+        assert replayed is not None
+        return first, [frame async for frame in replayed], turns.replay("s", 2)
+
+    first, rest, nothing = asyncio.run(run())
+
+    assert first == b"id: 1\nevent: message\ndata: {}\n\n"
+    assert rest == [b'id: 2\nevent: done\ndata: {"status": "awaiting_answer"}\n\n']
+    assert nothing is None
+    assert events_module.last_event_id("s") == 2
+
+
+class _SlowLLM(_CountingLLM):
+    def with_structured_output(self, model_cls: type[Any]) -> _CountingStructuredLLM:
+        structured = super().with_structured_output(model_cls)
+        answer = structured.ainvoke
+
+        async def slow(prompt: Any) -> Any:
+            await asyncio.sleep(0.05)
+            return await answer(prompt)
+
+        structured.ainvoke = slow  # type: ignore[method-assign]
+        return structured
+
+
+async def _post(
+    client: httpx.AsyncClient, endpoint: str, payload: Dict[str, Any], session_id: str
+) -> List[str]:
+    response = await client.post(endpoint, json=payload, headers={"session-id": session_id})
+    response.raise_for_status()
+    return [block for block in response.text.split("\n\n") if block.startswith("id: ")]
+
+
+def test_duplicate_requests_follow_the_turn_in_flight() -> None:
+    session_id = f"session-{uuid.uuid4()}"
+    llm = _SlowLLM()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            opened = await asyncio.gather(
+                *(_post(client, "/interviewer/stream", PAYLOAD, session_id) for _ in range(3))
+            )
+            asking = llm.calls
+            answer = dict(PAYLOAD, answer="I trained models.")
+            answered = await asyncio.gather(
+                *(_post(client, "/interviewer/resume", answer, session_id) for _ in range(3))
+            )
+        return opened, asking, answered
+
+    with patch("app.core.llm.get_llm", return_value=llm):
+        opened, asking, answered = asyncio.run(run())
+
+    assert opened[0] == opened[1] == opened[2]
+    assert answered[0] == answered[1] == answered[2]
+    # One question drafted per skill, then one grade and one follow-up question.
+    assert asking == 2
+    assert llm.calls == asking + 2
+    assert any('"type": "grade"' in block for block in answered[0])
+
+
+def test_turn_running_on_another_replica_is_followed_through_the_log(monkeypatch) -> None:
+    monkeypatch.setattr(leases_module, "_memory_leases", {})
+    monkeypatch.setattr(turns, "REMOTE_POLL_SECONDS", 0.01)
+    session_id = f"session-{uuid.uuid4()}"
+    frame = b'id: 1\nevent: done\ndata: {"status": "awaiting_answer"}\n\n'
+    llm = _CountingLLM()
+
+    async def other_replica():
+        await asyncio.sleep(0.05)
+        events_module.append_events(session_id, [(1, frame)])
+        leases_module.release_lease(session_id, "replica-b")
+
+    async def run():
+        leases_module.acquire_lease(session_id, "replica-b", "turn", 60)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            followed, _ = await asyncio.gather(
+                _post(client, "/interviewer/stream", PAYLOAD, session_id), other_replica()
+            )
+        return followed
+
+    with patch("app.core.llm.get_llm", return_value=llm):
+        followed = asyncio.run(run())
+
+    assert followed == [frame.decode().rstrip("\n")]
+    assert llm.calls == 0
+
+
+def test_websocket_is_refused_while_a_turn_holds_the_session(monkeypatch) -> None:
+    monkeypatch.setattr(leases_module, "_memory_leases", {})
+    session_id = f"session-{uuid.uuid4()}"
+    leases_module.acquire_lease(session_id, "replica-b", "turn", 60)
+
+    with TestClient(app).websocket_connect(f"/interviewer/ws?session_id={session_id}") as ws:
+        refused = ws.receive_json()
+
+    assert refused == {"event": "error", "data": {"status": 409, "detail": "session is busy"}}
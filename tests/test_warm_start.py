@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+import app.storage.store as store_module
+from app.agents.interviewer.graph import build_state
+from app.agents.interviewer.nodes.decide import end_reason
+from app.agents.interviewer.utils.agent_log import log_lines
+from app.agents.interviewer.utils.stats import session_evidence
+from app.agents.interviewer.utils.warm_start import PastSession, carried_evidence
+
+
+@pytest.fixture
+def session(make_state, answer):
+    """Play ``(skill, score)`` turns on a python/sql session."""
+
+    def play(turns, **kwargs):
+        state = make_state(["python", "sql"], max_turns=8, verify_lcb=3.5, **kwargs)
+        for skill, score in turns:
+            answer(state, skill, score)
+        return state
+
+    return play
+
+
+def test_carried_evidence_decays_with_age(session):
+    belief = session([("sql", 4), ("sql", 5)])["belief_state"]["sql"]
+
+    fresh = carried_evidence([PastSession("a", {"sql": belief}, 0.0)], half_life_days=90, weight=0.5)
+    old = carried_evidence([PastSession("a", {"sql": belief}, 90.0)], half_life_days=90, weight=0.5)
+
+    assert math.isclose(fresh["sql"][0], 1.0)
+    assert math.isclose(old["sql"][0], 0.5)
+    assert math.isclose(fresh["sql"][1], 4.5)
+
+
+def test_warm_start_seeds_beliefs_and_predecides_confident_skills(memory_stores, session):
+    for idx in range(3):
+        earlier = session(
+            [("python", 5), ("sql", 1), ("python", 5), ("python", 5), ("sql", 1)],
+            candidate_id="cand-1",
+        )
+        store_module.save_state(f"earlier-{idx}", earlier)
+    store_module.save_state("other", session([("python", 1)], candidate_id="cand-2"))
+
+    state = build_state(
+        ["python", "sql"], 8, 2, 3.5, 1.96, 1.0, {},
+        thread_id="new", priors={}, candidate_id="cand-1", warm_start=True,
+    )
+
+    assert sorted(state["warm_started_from"]) == ["earlier-0", "earlier-1", "earlier-2"]
+    assert state["verified_skills"] == ["python"]
+    assert state["inactive_skills"] == ["sql"]
+    # Both skills are decided before a single new question is asked.
+    assert end_reason(state) == "all decided"
+    summary = {row["skill"]: row for row in state["skill_summaries"]}
+    assert summary["python"]["status"] == "verified"
+    assert summary["python"]["n"] == 0
+    assert summary["python"]["carried_n"] == pytest.approx(4.5)
+    # The carried pseudo-observations are subtracted out again, so the
+    # session's own evidence (and the prior fit) never double-counts them.
+    assert session_evidence(state["belief_state"]["python"]) is None
+    assert any(line.startswith("warm_start → python") for line in log_lines(state["logs"]))
+
+
+def test_new_answers_stack_on_carried_evidence(memory_stores, session):
+    store_module.save_state("earlier", session([("python", 4), ("python", 5)], candidate_id="cand-3"))
+
+    state = session([("python", 4)], candidate_id="cand-3", warm_start=True, thread_id="new")
+
+    count, mean, _ = session_evidence(state["belief_state"]["python"])
+    assert count == 1 and mean == pytest.approx(4.0)
+    summary = {row["skill"]: row for row in state["skill_summaries"]}
+    assert summary["python"]["n"] == 1
+    assert summary["python"]["carried_n"] == pytest.approx(1.0)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+import app.service.service as service
+from app.schema.models import AspectBreakdown, GradeDraft, Question
+from app.service.service import app
+
+PAYLOAD: Dict[str, Any] = {
+    "profile": {
+        "ID": "123",
+        "NAME": "Candidate",
+        "SKILLS": [
+            {
+                "taxonomy_id": f"ML/Frameworks/{skill}",
+                "evidence_sources": [{"source": "cv", "span": f"Used {skill}."}],
+            }
+            for skill in ("PyTorch", "Pandas")
+        ],
+    },
+    "max_turns": 4,
+    "min_q": 2,
+    "verify_lcb": 4.5,
+    "z_value": 1.0,
+    "ucb_C": 0.5,
+}
+
+
+class _StubStructuredLLM:
+    def __init__(self, model_cls: type[Any]):
+        self._model_cls = model_cls
+
+    async def ainvoke(self, prompt: Any) -> Any:
+        if self._model_cls is Question:
+            return Question(skill="pytorch", text="Tell me about pytorch.", difficulty=3)
+        detail = AspectBreakdown(score=4, notes="stub")
+        return GradeDraft(
+            reasoning="stub",
+            coverage=detail,
+            technical_depth=detail,
+            evidence=detail,
+            communication=detail,
+        )
+
+    def with_config(self, **kwargs):
+        return self
+
+
+class _StubLLM:
+    def with_structured_output(self, model_cls: type[Any]) -> _StubStructuredLLM:
+        return _StubStructuredLLM(model_cls)
+
+    def with_config(self, **kwargs):
+        return self
+
+
+def _until_done(ws) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    while True:
+        message = ws.receive_json()
+        events.append((message["event"], message["data"]))
+        if message["event"] in ("done", "error"):
+            return events
+
+
+def _durable_values(session_id: str) -> Dict[str, Any]:
+    async def read():
+        graph = await service._interview_graph()
+        snapshot = await graph.aget_state(service._thread_config(session_id))
+        return snapshot.values
+
+    return asyncio.run(read())
+
+
+def _durable_turn(session_id: str) -> Optional[int]:
+    return _durable_values(session_id).get("turn")
+
+
+def test_interview_over_one_connection_flushes_on_close(monkeypatch) -> None:
+    monkeypatch.setattr(service.settings, "ws_flush_turns", 100)
+    session_id = f"session-{uuid.uuid4()}"
+    client = TestClient(app)
+
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        with client.websocket_connect(f"/interviewer/ws?session_id={session_id}") as ws:
+            ws.send_json(PAYLOAD)
+            opened = _until_done(ws)
+            ws.send_json({"answer": "I trained models."})
+            answered = _until_done(ws)
+            held_turn = _durable_turn(session_id)
+        again = client.post(
+            "/interviewer/stream", json=PAYLOAD, headers={"session-id": session_id}
+        )
+
+    assert [event for event, _ in opened][-2:] == ["interrupt", "done"]
+    assert opened[-1][1]["status"] == "awaiting_answer"
+    kinds = [body.get("type") or event for event, body in answered]
+    assert kinds.index("grade") < kinds.index("state") < kinds.index("question")
+    # State stays on the connection until it closes.
+    assert held_turn is None
+    assert _durable_turn(session_id) == 1
+    asked = next(body for event, body in reversed(answered) if body.get("type") == "question")
+    reemitted = next(
+        json.loads(line.removeprefix("data: "))
+        for line in again.text.splitlines()
+        if line.startswith("data: ") and '"question"' in line
+    )
+    assert reemitted == asked
+
+
+def test_connection_closes_once_the_interview_ends() -> None:
+    session_id = f"session-{uuid.uuid4()}"
+    payload = dict(PAYLOAD, max_turns=1)
+
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        with TestClient(app).websocket_connect(
+            "/interviewer/ws", headers={"session-id": session_id}
+        ) as ws:
+            ws.send_json(payload)
+            _until_done(ws)
+            ws.send_json({"answer": "I trained models."})
+            finished = _until_done(ws)
+            with pytest.raises(WebSocketDisconnect):
+                ws.receive_json()
+
+    assert finished[-1][0] == "done"
+    assert finished[-1][1]["turn"] == 1
+    assert _durable_turn(session_id) == 1
+
+
+def test_each_flush_stores_the_connection_log_once(monkeypatch) -> None:
+    monkeypatch.setattr(service.settings, "ws_flush_turns", 1)
+    session_id = f"session-{uuid.uuid4()}"
+
+    with patch("app.core.llm.get_llm", return_value=_StubLLM()):
+        with TestClient(app).websocket_connect(
+            "/interviewer/ws", headers={"session-id": session_id}
+        ) as ws:
+            ws.send_json(PAYLOAD)
+            _until_done(ws)
+            for _ in range(2):
+                ws.send_json({"answer": "I trained models."})
+                _until_done(ws)
+
+    logs = _durable_values(session_id)["logs"]
+    assert [entry["turn"] for entry in logs if entry["node"] == "update"] == [0, 1]